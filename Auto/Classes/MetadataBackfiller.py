@@ -0,0 +1,114 @@
+"""
+The module provides the job which completes the thumbnail and the channel uniform resource locator of the YouTube records stored before those columns existed.
+
+Author:
+    Darkness4869
+"""
+from concurrent.futures import ThreadPoolExecutor
+from sys import path
+from typing import Dict, List, Union
+from os.path import abspath, join, dirname
+
+
+path.append(abspath(join(dirname(__file__), "../../")))
+from Models.YouTubeDownloader import YouTube_Downloader, Database_Handler, Extractio_Logger
+from Models.YouTubeModel import YouTube
+
+
+class Metadata_Backfiller:
+    """
+    It extracts the missing metadata of the stored YouTube records in batches with a bounded pool of workers, each extraction storing the missing columns of its record.
+    """
+    __database_handler: Database_Handler
+    """
+    The database handler that will communicate with the database
+    server.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger that will all the action of the application.
+    """
+    __batch_size: int
+    """
+    The amount of records retrieved per batch.
+    """
+    __workers: int
+    """
+    The maximum amount of concurrent extractions.
+    """
+
+    def __init__(self, batch_size: int = 50, workers: int = 4) -> None:
+        """
+        Initializing the backfiller.
+
+        Args:
+            batch_size (int): The amount of records retrieved per batch.
+            workers (int): The maximum amount of concurrent extractions.
+        """
+        self.setLogger(Extractio_Logger(__name__))
+        self.setDatabaseHandler(Database_Handler())
+        self.setBatchSize(batch_size)
+        self.setWorkers(workers)
+
+    def getDatabaseHandler(self) -> Database_Handler:
+        return self.__database_handler
+
+    def setDatabaseHandler(self, database_handler: Database_Handler) -> None:
+        self.__database_handler = database_handler
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    def getBatchSize(self) -> int:
+        return self.__batch_size
+
+    def setBatchSize(self, batch_size: int) -> None:
+        self.__batch_size = batch_size
+
+    def getWorkers(self) -> int:
+        return self.__workers
+
+    def setWorkers(self, workers: int) -> None:
+        self.__workers = workers
+
+    def run(self) -> int:
+        """
+        Completing the incomplete records batch by batch until none is left or a batch does not make any progress, which happens when the remaining media are no longer available.
+
+        Returns:
+            int: The amount of records which have been completed.
+        """
+        completed: int = 0
+        attempted: List[str] = []
+        while True:
+            records: List[YouTube] = [record for record in YouTube.getIncomplete(self.getDatabaseHandler(), self.getBatchSize() + len(attempted)) if str(record.identifier) not in attempted] # type: ignore
+            if not records:
+                break
+            records = records[:self.getBatchSize()]
+            attempted += [str(record.identifier) for record in records] # type: ignore
+            with ThreadPoolExecutor(max_workers=min(len(records), self.getWorkers())) as executor:
+                responses: List[bool] = list(executor.map(self.__complete, records))
+            completed += sum(responses)
+            self.getLogger().inform(f"A batch of YouTube records has been backfilled. - Completed: {sum(responses)} - Batch: {len(records)}")
+        self.getLogger().inform(f"The YouTube records have been backfilled. - Completed: {completed} - Attempted: {len(attempted)}")
+        return completed
+
+    def __complete(self, record: YouTube) -> bool:
+        """
+        Extracting the metadata of a record, which stores its missing columns.
+
+        Args:
+            record (YouTube): The incomplete record.
+
+        Returns:
+            bool: True if the metadata has been extracted, otherwise False.
+        """
+        try:
+            metadata: Dict[str, Union[str, int, None]] = YouTube_Downloader(str(record.uniform_resource_locator), int(record.media_identifier)).search() # type: ignore
+            return bool(metadata)
+        except Exception as error:
+            self.getLogger().error(f"The metadata of the record cannot be extracted. - Identifier: {record.identifier} - Error: {error}") # type: ignore
+            return False
@@ -0,0 +1,4 @@
+from Classes.MetadataBackfiller import Metadata_Backfiller
+
+
+Metadata_Backfiller().run()
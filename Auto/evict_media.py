@@ -0,0 +1,10 @@
+from sys import argv, path
+from os.path import abspath, join, dirname
+
+
+path.append(abspath(join(dirname(__file__), "../")))
+from Models.MediaEvictor import Media_Evictor
+
+
+quotas: list = [int(argument) for argument in argv[1:] if argument.isdigit()]
+Media_Evictor(quota=quotas[0] if quotas else None, is_dry_run="--dry-run" in argv[1:]).evict()
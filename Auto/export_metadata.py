@@ -0,0 +1,9 @@
+from sys import argv, path
+from os.path import abspath, join, dirname
+
+
+path.append(abspath(join(dirname(__file__), "../")))
+from Models.MetadataCache import Metadata_Cache, Environment
+
+
+Metadata_Cache.getInstance().exportJsonFiles(argv[1] if len(argv) > 1 else f"{Environment().getDirectory()}/Cache/Media/Export")
@@ -0,0 +1,10 @@
+from sys import argv, path
+from os.path import abspath, join, dirname
+
+
+path.append(abspath(join(dirname(__file__), "../")))
+from Models.StorageReconciler import Storage_Reconciler
+
+
+shards: list = [argument for argument in argv[1:] if argument != "--dry-run"]
+Storage_Reconciler(is_dry_run="--dry-run" in argv[1:]).reconcile(shards or None)
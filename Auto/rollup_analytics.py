@@ -0,0 +1,9 @@
+from sys import path
+from os.path import abspath, join, dirname
+
+
+path.append(abspath(join(dirname(__file__), "../")))
+from Models.AnalyticsRollup import Analytics_Rollup
+
+
+Analytics_Rollup().run()
@@ -0,0 +1,12 @@
+from sys import path
+from os.path import abspath, join, dirname
+
+
+path.append(abspath(join(dirname(__file__), "../")))
+from Models.SessionSweeper import Session_Sweeper
+
+
+sweeper: Session_Sweeper = Session_Sweeper()
+while sweeper.sweep() >= sweeper.getBatchSize():
+    pass
+sweeper.getLogger().inform(f"The session sweep has been completed. - Statistics: {sweeper.getStatistics()}")
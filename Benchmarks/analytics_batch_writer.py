@@ -0,0 +1,132 @@
+"""
+Benchmarking the throughput of the batch writer of the analytics against the size of its batches.
+
+For every batch size, it stores page views through the writer in the database configured for the application and prints the amount of events stored per second.  The throughput is expected to grow with the batch size as the statements and the commits are shared by the events of a batch.  The rows of the benchmark are deleted afterwards.
+
+Usage:
+    python3 Benchmarks/analytics_batch_writer.py
+
+Author:
+    Darkness4869
+"""
+from sys import path
+from os.path import abspath, join, dirname
+from time import perf_counter, time
+from typing import Any, Dict, List
+
+
+path.append(abspath(join(dirname(__file__), "../")))
+from Models.AnalyticsBatchWriter import Analytics_Batch_Writer
+from Models.DimensionResolver import Dimension_Resolver
+from Models.DatabaseHandler import Database_Handler
+from Models.DeviceModel import Device
+from Models.EventTypesModel import Event_Types
+from Models.NetworkLocationModel import Network_Location
+from Models.PageViewModel import Page_View
+
+
+UNIFORM_RESOURCE_LOCATOR: str = "/Benchmarks/analytics_batch_writer"
+"""
+The uniform resource locator identifying the events of the benchmark.
+"""
+
+
+def resolveDimensions(database_handler: Database_Handler) -> Dict[str, int]:
+    """
+    Resolving the dimensions shared by the events of the benchmark.
+
+    Parameters:
+        database_handler (Database_Handler): The database handler.
+
+    Returns:
+        Dict[str, int]: The identifier of each dimension.
+    """
+    resolver: Dimension_Resolver = Dimension_Resolver.getInstance()
+    device: Device = Device(database_handler, user_agent="Benchmark", browser="Benchmark", browser_version="0", operating_system="Benchmark", operating_system_version=None, device="Desktop", screen_resolution="1920x1080", width=1920, height=1080, aspect_ratio=1920 / 1080)
+    event_type: Event_Types = Event_Types(database_handler, name="page_view")
+    network_location: Network_Location = Network_Location(database_handler, ip_address="127.0.0.1", hostname=None, latitude=0.0, longitude=0.0, city="Benchmark", region="Benchmark", country="Benchmark", timezone="UTC", location="ST_GeomFromText(POINT(0 0))")
+    return {
+        "Device": resolver.resolve(device, ("user_agent", "screen_resolution"))["identifier"],
+        "EventType": resolver.resolve(event_type, ("name",))["identifier"],
+        "NetworkLocation": resolver.resolve(network_location, ("ip_address", "latitude", "longitude"))["identifier"]
+    }
+
+
+def buildRecords(database_handler: Database_Handler, dimensions: Dict[str, int], amount: int) -> List[Dict[str, Any]]:
+    """
+    Building the records of page views.
+
+    Parameters:
+        database_handler (Database_Handler): The database handler.
+        dimensions (Dict[str, int]): The identifier of each dimension.
+        amount (int): The amount of records.
+
+    Returns:
+        List[Dict[str, Any]]
+    """
+    return [
+        {
+            "event": {
+                "uniform_resource_locator": UNIFORM_RESOURCE_LOCATOR,
+                "referrer": None,
+                "timestamp": int(time()),
+                **dimensions
+            },
+            "detail": Page_View(database_handler, loading_time=index / 1000),
+            "detail_field": "PageView"
+        } for index in range(amount)
+    ]
+
+
+def measure(writer: Analytics_Batch_Writer, records: List[Dict[str, Any]]) -> float:
+    """
+    Measuring the amount of events stored per second by writing the records batch by batch.
+
+    Parameters:
+        writer (Analytics_Batch_Writer): The batch writer.
+        records (List[Dict[str, Any]]): The records.
+
+    Returns:
+        float
+    """
+    start: float = perf_counter()
+    for offset in range(0, len(records), writer.getBatchSize()):
+        if not writer.write(records[offset:offset + writer.getBatchSize()]):
+            raise RuntimeError("The batch cannot be stored.")
+    return len(records) / (perf_counter() - start)
+
+
+def cleanUp(database_handler: Database_Handler) -> None:
+    """
+    Deleting the events of the benchmark and their page views.
+
+    Parameters:
+        database_handler (Database_Handler): The database handler.
+    """
+    rows = database_handler.getData("SELECT PageView FROM Events WHERE uniform_resource_locator = %s", (UNIFORM_RESOURCE_LOCATOR,))
+    page_views: List[int] = [int(row["PageView"]) for row in rows if row["PageView"] is not None] # type: ignore
+    database_handler.deleteData("DELETE FROM Events WHERE uniform_resource_locator = %s", (UNIFORM_RESOURCE_LOCATOR,))
+    for offset in range(0, len(page_views), 500):
+        chunk: List[int] = page_views[offset:offset + 500]
+        database_handler.deleteData(f"DELETE FROM PageView WHERE identifier IN ({', '.join(['%s'] * len(chunk))})", tuple(chunk))
+
+
+def main() -> None:
+    """
+    Running the benchmark for every batch size.
+    """
+    database_handler: Database_Handler = Database_Handler()
+    dimensions: Dict[str, int] = resolveDimensions(database_handler)
+    try:
+        print(f"{'Batch Size':>10} | {'Events/s':>10}")
+        for batch_size in [1, 10, 50, 100, 500]:
+            writer: Analytics_Batch_Writer = Analytics_Batch_Writer(Database_Handler(), batch_size=batch_size)
+            amount: int = max(200, batch_size * 10)
+            measure(writer, buildRecords(database_handler, dimensions, batch_size))
+            print(f"{batch_size:>10} | {measure(writer, buildRecords(database_handler, dimensions, amount)):>10.0f}")
+    finally:
+        cleanUp(database_handler)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmarking the request path of the Session Management System against the size of the session store.
+
+For every amount of stored sessions, it measures the latency of looking up the session of a random user and renewing it, which is what `GET /Session/` and `PUT /Session/` do, and prints the median and the 99th percentile.  The latency is expected to stay flat from 10 to 100,000 sessions.
+
+Usage:
+    python3 Benchmarks/session_store.py
+
+Author:
+    Darkness4869
+"""
+from sys import path
+from os.path import abspath, join, dirname
+from tempfile import mkdtemp
+from shutil import rmtree
+from time import perf_counter, time
+from random import randrange
+from typing import List, Tuple
+
+
+path.append(abspath(join(dirname(__file__), "../")))
+from Models.SessionStore import Session_Store
+
+
+def populate(store: Session_Store, amount: int) -> None:
+    """
+    Filling the store with sessions of distinct IP Addresses.
+
+    Parameters:
+        store (Session_Store): The session store.
+        amount (int): The amount of sessions to store.
+    """
+    now: int = int(time())
+    rows: List[Tuple[str, str, str, int, str]] = [(f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}", "None", "None", now - randrange(7200), "light") for index in range(amount)]
+    connection = store.getConnection()
+    with connection:
+        connection.execute("DELETE FROM Sessions")
+        connection.executemany("INSERT INTO Sessions (ip_address, http_client_ip_address, proxy_ip_address, timestamp, color_scheme) VALUES (?, ?, ?, ?, ?)", rows)
+
+
+def measure(store: Session_Store, amount: int, iterations: int) -> List[float]:
+    """
+    Measuring the latency of a lookup followed by a renewal of a random session.
+
+    Parameters:
+        store (Session_Store): The session store.
+        amount (int): The amount of stored sessions.
+        iterations (int): The amount of requests to simulate.
+
+    Returns:
+        List[float]: The sorted latencies in microseconds.
+    """
+    latencies: List[float] = []
+    for _ in range(iterations):
+        index: int = randrange(amount)
+        ip_address: str = f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}"
+        start: float = perf_counter()
+        client = store.get(ip_address)
+        if client is not None:
+            client["timestamp"] = int(time())
+            store.put(client)
+        latencies.append((perf_counter() - start) * 1_000_000)
+    return sorted(latencies)
+
+
+def main() -> None:
+    """
+    Running the benchmark for every size of the store.
+    """
+    directory: str = mkdtemp()
+    try:
+        store: Session_Store = Session_Store(join(directory, "Sessions.sqlite3"))
+        print(f"{'Sessions':>10} | {'Median (us)':>12} | {'P99 (us)':>10}")
+        for amount in [10, 100, 1_000, 10_000, 100_000]:
+            populate(store, amount)
+            measure(store, amount, 200)
+            latencies: List[float] = measure(store, amount, 2_000)
+            print(f"{amount:>10} | {latencies[len(latencies) // 2]:>12.1f} | {latencies[int(len(latencies) * 0.99)]:>10.1f}")
+    finally:
+        rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
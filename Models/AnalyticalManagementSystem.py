@@ -1,16 +1,19 @@
 """
 The module that has the Analytical Management System.
 """
-from typing import Dict, Union
+from typing import Dict, Optional, Union
 from urllib import response
 from Models.ClickModel import Click, Database_Handler, List
 from Models.SearchSubmittedModel import Search_Submitted
 from Models.ColorSchemeUpdatedModel import Color_Scheme_Updated
-from Models.EventsModel import Event
 from Models.PageViewModel import Page_View
 from Models.NetworkLocationModel import Network_Location
 from Models.EventTypesModel import Event_Types
 from Models.DeviceModel import Device
+from Models.GeolocationProvider import Geolocation_Provider
+from Models.LeastRecentlyUsedCache import Least_Recently_Used_Cache
+from Models.DimensionResolver import Dimension_Resolver, Table_Model
+from Models.AnalyticsBatchWriter import Analytics_Batch_Writer
 from Models.DatabaseHandler import Extractio_Logger, Relational_Database_Error as DatabaseHandlerError, Tuple, Any
 from time import mktime
 from datetime import datetime
@@ -20,9 +23,6 @@ from re import match
 from ipaddress import IPv4Address, IPv6Address, ip_address
 from socket import gethostbyname, gaierror
 from subprocess import run
-from requests import get, Response
-from requests.exceptions import RequestException
-from json import JSONDecodeError
 
 
 class AnalyticalManagementSystem:
@@ -115,9 +115,9 @@ class AnalyticalManagementSystem:
     """
     The host name of the IP Address.
     """
-    __ip_information_api: str
+    __geolocation_provider: Geolocation_Provider
     """
-    The API to be used for retrieving data from the IP Address.
+    The provider of the geolocation of the IP Address.
     """
     not_found: int = 404
     """
@@ -168,17 +168,46 @@ class AnalyticalManagementSystem:
     The uniform resource locator on which the user to be
     forwarded on.
     """
+    __user_agent_cache: Least_Recently_Used_Cache = Least_Recently_Used_Cache(1024)
+    """
+    The parsed browser, browser version, operating system,
+    operating system version and device of the User Agents,
+    shared by every event of the process.
+    """
+    __screen_resolution_cache: Least_Recently_Used_Cache = Least_Recently_Used_Cache(256)
+    """
+    The parsed width, height and aspect ratio of the screen
+    resolutions, shared by every event of the process.
+    """
 
-    def __init__(self):
+    def __init__(self, geolocation_provider: Optional[Geolocation_Provider] = None):
         """
         Initializing the management system and injecting any
         dependency needed.
+
+        Parameters:
+            geolocation_provider: Geolocation_Provider | None: The provider of the geolocation of the IP Address, which defaults to the provider shared by the application.
         """
         self.setDatabaseHandler(Database_Handler())
         self.setLogger(Extractio_Logger(__name__))
-        self.setIpInformationApi("https://ipinfo.io")
+        self.setGeolocationProvider(geolocation_provider or Geolocation_Provider.getInstance())
         self.getLogger().inform("Analytical Management System has been initialized.")
 
+    @classmethod
+    def getCacheStatistics(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieving the statistics of the caches of the User Agents,
+        the screen resolutions and the dimensions.
+
+        Returns:
+            {user_agent: {hits: int, misses: int, evictions: int, hit_rate: float, ...}, screen_resolution: {...}, dimensions: {table: {...}}}
+        """
+        return {
+            "user_agent": cls.__user_agent_cache.getStatistics(),
+            "screen_resolution": cls.__screen_resolution_cache.getStatistics(),
+            "dimensions": Dimension_Resolver.getInstance().getStatistics()
+        }
+
     def getForwardedUniformResourceLocator(self) -> str:
         return self.__forwarded_uniform_resource_locator
 
@@ -233,11 +262,11 @@ class AnalyticalManagementSystem:
     def setLatitude(self, latitude: float) -> None:
         self.__latitude = latitude
 
-    def getIpInformationApi(self) -> str:
-        return self.__ip_information_api
+    def getGeolocationProvider(self) -> Geolocation_Provider:
+        return self.__geolocation_provider
 
-    def setIpInformationApi(self, ip_information_api: str) -> None:
-        self.__ip_information_api = ip_information_api
+    def setGeolocationProvider(self, geolocation_provider: Geolocation_Provider) -> None:
+        self.__geolocation_provider = geolocation_provider
 
     def getHostname(self) -> Union[str, None]:
         return self.__hostname
@@ -353,562 +382,158 @@ class AnalyticalManagementSystem:
     def setIpAddress(self, ip_address: str) -> None:
         self.__ip_address = ip_address
 
-    def processEvent(self, data: Dict[str, Union[str, float]]) -> int:
+    @staticmethod
+    def validateEvent(data: Dict[str, Union[str, float]], logger: Extractio_Logger) -> int:
         """
-        Processing an incoming event by validating its data and executing the corresponding handler.
+        Validating the data of an incoming event without enriching it, so that it can be checked before being queued.
 
         This function:
         - Verifies that all required keys are present.
         - Checks if the event name is allowed.
+        - Checks that the timestamp is well-formed.
         - Logs an error and returns `503` if validation fails.
-        - Sets internal attributes such as event name, timestamp, user agent, screen resolution, referrer, and IP address.
-        - Performs additional data sanitization and enrichment.
-        - Calls the appropriate event processing function based on the event name.
-        - Logs an error and returns `503` if the event name is invalid.
 
         Parameters:
             data (Dict[str, Union[str, float]]): A dictionary containing event data.
+            logger (Extractio_Logger): The logger of the caller.
 
         Returns:
             int
+
+        Raises:
+            ValueError: If the timestamp is not well-formed.
         """
         required_keys: List[str] = ["event_name", "page_url", "timestamp", "user_agent", "screen_resolution"]
         allowed_events: List[str] = ["page_view", "search_submitted", "color_scheme_updated", "click"]
         if not all(key in data for key in required_keys):
-            self.getLogger().error(f"This request is forged as the required keys are missing and the required data will be logged. - IP Address: {data['ip_address']}")
-            return self.service_unavailable
+            logger.error(f"This request is forged as the required keys are missing and the required data will be logged. - IP Address: {data['ip_address']}")
+            return AnalyticalManagementSystem.service_unavailable
         if data["event_name"] not in allowed_events:
-            self.getLogger().error(f"This request is forged as this event is not allowed and the required data will be logged. - IP Address: {data['ip_address']}")
-            return self.service_unavailable
-        self.setEventName(str(data["event_name"]))
-        self.setUniformResourceLocator(str(data["page_url"]))
-        self.setTimestamp(int(mktime(datetime.strptime(str(data["timestamp"]), "%Y/%m/%d %H:%M:%S").timetuple())))
-        self.setUserAgent(str(data["user_agent"]))
-        self.setScreenResolution(str(data["screen_resolution"]))
-        self.setReferrer(str(data["referrer"]) if "referrer" in data and data["referrer"] != "" else None)
-        self.setIpAddress("omnitechbros.ddns.net" if data["ip_address"] == "127.0.0.1" or str(data["ip_address"]).startswith("192.168.") else str(data["ip_address"]))
-        status: int = self.getUserAgentData()
-        status = self.getScreenResolutionData() if status == self.ok else status
-        status = self.setDeviceType() if status == self.ok else status
-        status = self.sanitizeIpAddress() if status == self.ok else status
-        status = self.getGeolocationData() if status == self.ok else status
-        if self.getEventName() == "page_view":
-            status = self.processPageView(data, status)
-        if self.getEventName() == "color_scheme_updated":
-            status = self.processColorSchemeUpdated(data, status)
-        if self.getEventName() == "search_submitted":
-            status = self.processSearchSubmitted(data, status)
-        if self.getEventName() == "click":
-            status = self.processClick(data, status)
-        return status
+            logger.error(f"This request is forged as this event is not allowed and the required data will be logged. - IP Address: {data['ip_address']}")
+            return AnalyticalManagementSystem.service_unavailable
+        datetime.strptime(str(data["timestamp"]), "%Y/%m/%d %H:%M:%S")
+        return AnalyticalManagementSystem.ok
 
-    def processClick(self, data: Dict[str, Union[str, float]], status: int) -> int:
-        """
-        Processing click events.
-
-        Args:
-            data: {event_name: string, page_url: string, timestamp: string, user_agent: string, screen_resolution: string, uniform_resource_locator: string}: The data that will be processed.
-            status: int: The status of the previous processing.
-
-        Returns:
-            int
-        """
-        self.setForwardedUniformResourceLocator(str(data["uniform_resource_locator"]))
-        device_response: Dict[str, int] = self.manageDevice(status)
-        status = int(device_response["status"])
-        device_identifier: int = int(device_response["identifier"])
-        event_type_response: Dict[str, int] = self.manageEventType(status)
-        status = int(event_type_response["status"])
-        event_type_identifier: int = int(event_type_response["identifier"])
-        network_location_response: Dict[str, int] = self.manageNetworkLocation(status)
-        status = int(network_location_response["status"])
-        network_location_identifier: int = int(network_location_response["identifier"])
-        click_response: Dict[str, int] = self.manageClick(status)
-        status = int(click_response["status"])
-        click_identifier: int = int(click_response["identifier"])
-        return self.postEvent(
-            status=status,
-            device=device_identifier,
-            event_type=event_type_identifier,
-            network_location=network_location_identifier,
-            click=click_identifier
-        )
-
-    def manageClick(self, status: int) -> Dict[str, int]:
+    def processEvent(self, data: Dict[str, Union[str, float]]) -> int:
         """
-        Managing the click of the event.
+        Processing an incoming event synchronously by enriching it,
+        building its record and writing it immediately.
 
         Parameters:
-            status: int: The status of the previous processing.
-
-        Returns:
-            {status: int, identifier: int}
-        """
-        if status != self.ok and status != self.created:
-            return {
-                "status": status,
-                "identifier": 0
-            }
-        return self.postClick()
-
-    def postClick(self) -> Dict[str, int]:
-        """
-        Inserting a new click event into the `"Click"` table of the database.
-
-        Steps:
-            - Retrieves the forwarded URL.
-            - Attempts to save the click event.
-            - Logs appropriate messages.
-            - Returns status and identifier.
-
-        Returns:
-            Dict[str, int]: A dictionary with the HTTP-like status code and the inserted row's identifier.
-        """
-        click: Click = Click(
-            self.getDatabaseHandler(),
-            uniform_resource_locator=self.getForwardedUniformResourceLocator()
-        )
-        response: bool = click.save()
-        status: int = self.created if response else self.service_unavailable
-        message: str = "The data has been successfully inserted in the Click table." if response else "An error occurred while inserting data in the Click table."
-        if response:
-            self.getLogger().inform(f"{message} - Status: {status}")
-        else:
-            self.getLogger().error(f"{message} - Status: {status}")
-        identifier: int = Click.getLastRowIdentifier(self.getDatabaseHandler()) if response else 0
-        return {
-            "status": status,
-            "identifier": identifier
-        }
-
-    def processSearchSubmitted(self, data: Dict[str, Union[str, float]], status: int) -> int:
-        """
-        Processing search submitted events.
-
-        Args:
-            data: {event_name: string, page_url: string, timestamp: string, user_agent: string, screen_resolution: string, search_term: string}: The data that will be processed.
-            status: int: The status of the previous processing.
+            data (Dict[str, Union[str, float]]): A dictionary containing event data.
 
         Returns:
             int
         """
-        self.setSearchTerm(str(data["search_term"]))
-        device_response: Dict[str, int] = self.manageDevice(status)
-        status = int(device_response["status"])
-        device_identifier: int = int(device_response["identifier"])
-        event_type_response: Dict[str, int] = self.manageEventType(status)
-        status = int(event_type_response["status"])
-        event_type_identifier: int = int(event_type_response["identifier"])
-        network_location_response: Dict[str, int] = self.manageNetworkLocation(status)
-        status = int(network_location_response["status"])
-        network_location_identifier: int = int(network_location_response["identifier"])
-        search_submitted_response: Dict[str, int] = self.manageSearchSubmitted(status)
-        status = int(search_submitted_response["status"])
-        search_submitted_identifier: int = int(search_submitted_response["identifier"])
-        return self.postEvent(
-            status=status,
-            device=device_identifier,
-            event_type=event_type_identifier,
-            network_location=network_location_identifier,
-            search_submitted=search_submitted_identifier
-        )
-
-    def manageSearchSubmitted(self, status: int) -> Dict[str, int]:
-        """
-        Managing the insertion or retrieval of a search submission event.
-
-        This method:
-            - Checks if the prior operation was successful based on the given status.
-            - If successful, attempts to retrieve the most recent `Search_Submitted` entry.
-            - If retrieval succeeds, returns its identifier.
-            - If retrieval fails or the prior operation was not successful, inserts a new record.
-
-        Args:
-            status (int): The status of the previous processing.
-
-        Returns:
-            Dict[str, int]: A dictionary containing:
-                - 'status': the final HTTP-like status code.
-                - 'identifier': the ID of the relevant `Search_Submitted` row (or 0 if failed).
-        """
-        if status not in (self.ok, self.created):
-            return {
-                "status": status,
-                "identifier": 0
-            }
-        database_response: Dict[str, Union[int, List[Search_Submitted]]] = self.getSearchSubmitted()
-        if database_response["status"] == self.ok:
-            latest_entry: Search_Submitted = database_response["data"][-1] # type: ignore
-            return {
-                "status": int(database_response["status"]), # type: ignore
-                "identifier": latest_entry.identifier # type: ignore
-            }
-        return self.postSearchSubmitted()
-
-    def postSearchSubmitted(self) -> Dict[str, int]:
-        """
-        Inserting a new search submission event into the `"SearchSubmitted"` table.
-
-        Process:
-            - Retrieves the user's search term.
-            - Attempts to insert it into the database.
-            - Logs a message based on the outcome.
-            - Returns a dictionary containing the operation status and the inserted row's ID.
-
-        Returns:
-            Dict[str, int]: A dictionary with keys:
-                - `"status"`: HTTP-like status code (e.g., 201 or 503)
-                - `"identifier"`: The ID of the newly inserted row (or 0 if failed)
-        """
-        search_submitted: Search_Submitted = Search_Submitted(
-            self.getDatabaseHandler(),
-            search_term=self.getSearchTerm()
-        )
-        response: bool = search_submitted.save()
-        status: int = self.created if response else self.service_unavailable
-        message: str = "The data has been successfully inserted in the Search Submitted table." if response else "An error occurred while inserting data in the Search Submitted table."
-        if response:
-            self.getLogger().inform(f"{message} - Status: {status}")
-        else:
-            self.getLogger().error(f"{message} - Status: {status}")
-        identifier: int = Search_Submitted.getLastRowIdentifier(self.getDatabaseHandler()) if response else 0
-        return {
-            "status": status,
-            "identifier": identifier
-        }
-
-    def getSearchSubmitted(self) -> Dict[str, Union[int, List[Search_Submitted]]]:
-        """
-        Retrieving search submission entries from the `"SearchSubmitted"` table matching the current search term.
-
-        This method:
-            - Queries the database for entries matching `search_term`.
-            - Returns a dictionary containing:
-                - A status code: `200` if entries found, otherwise `204`.
-                - A list of `Search_Submitted` model instances, or an empty list if none are found.
+        status: int = self.enrichEvent(data)
+        if status != self.ok:
+            return status
+        response: Dict[str, Any] = self.buildRecord(data)
+        if response["status"] != self.ok:
+            return int(response["status"])
+        return self.created if Analytics_Batch_Writer(self.getDatabaseHandler()).write([response["data"]]) else self.service_unavailable
 
-        Returns:
-            Dict[str, Union[int, List[Search_Submitted]]]: Response with status and model data.
+    def enrichEvent(self, data: Dict[str, Union[str, float]]) -> int:
         """
-        data: List[Search_Submitted] = Search_Submitted.getBySearchTerm(self.getDatabaseHandler(), self.getSearchTerm())
-        status: int = self.ok if len(data) > 0 else self.no_content
-        return {
-            "status": status,
-            "data": data
-        }
+        Enriching an incoming event by validating its data and
+        deriving its client, device and geolocation data.
 
-    def processColorSchemeUpdated(self, data: Dict[str, Union[str, float]], status: int) -> int:
-        """
-        Processing color scheme updated events.
+        This function:
+        - Validates the event.
+        - Sets internal attributes such as event name, timestamp, user agent, screen resolution, referrer, and IP address.
+        - Performs additional data sanitization and enrichment.
 
-        Args:
-            data: {event_name: string, page_url: string, timestamp: string, user_agent: string, screen_resolution: string, color_scheme: string}: The data that will be processed.
-            status: int: The status of the previous processing.
+        Parameters:
+            data (Dict[str, Union[str, float]]): A dictionary containing event data.
 
         Returns:
             int
         """
-        self.setColorScheme(str(data["color_scheme"]))
-        device_response: Dict[str, int] = self.manageDevice(status)
-        status = int(device_response["status"])
-        device_identifier: int = int(device_response["identifier"])
-        event_type_response: Dict[str, int] = self.manageEventType(status)
-        status = int(event_type_response["status"])
-        event_type_identifier: int = int(event_type_response["identifier"])
-        network_location_response: Dict[str, int] = self.manageNetworkLocation(status)
-        status = int(network_location_response["status"])
-        network_location_identifier: int = int(network_location_response["identifier"])
-        color_scheme_updated_response: Dict[str, int] = self.manageColorSchemeUpdated(status)
-        status = int(color_scheme_updated_response["status"])
-        color_scheme_updated_identifier: int = int(color_scheme_updated_response["identifier"])
-        return self.postEvent(
-            status=status,
-            device=device_identifier,
-            event_type=event_type_identifier,
-            network_location=network_location_identifier,
-            color_scheme=color_scheme_updated_identifier
-        )
+        status: int = self.validateEvent(data, self.getLogger())
+        if status != self.ok:
+            return status
+        self.setEventName(str(data["event_name"]))
+        self.setUniformResourceLocator(str(data["page_url"]))
+        self.setTimestamp(int(mktime(datetime.strptime(str(data["timestamp"]), "%Y/%m/%d %H:%M:%S").timetuple())))
+        self.setUserAgent(str(data["user_agent"]))
+        self.setScreenResolution(str(data["screen_resolution"]))
+        self.setReferrer(str(data["referrer"]) if "referrer" in data and data["referrer"] != "" else None)
+        self.setIpAddress("omnitechbros.ddns.net" if data["ip_address"] == "127.0.0.1" or str(data["ip_address"]).startswith("192.168.") else str(data["ip_address"]))
+        status = self.getUserAgentData()
+        status = self.getScreenResolutionData() if status == self.ok else status
+        status = self.setDeviceType() if status == self.ok else status
+        status = self.sanitizeIpAddress() if status == self.ok else status
+        status = self.getGeolocationData() if status == self.ok else status
+        return status
 
-    def manageColorSchemeUpdated(self, status: int) -> Dict[str, int]:
+    def buildRecord(self, data: Dict[str, Union[str, float]]) -> Dict[str, Any]:
         """
-        Managing the color scheme updated of the event.
+        Building the record of an enriched event, which contains
+        the columns of its row in the Events table with the
+        identifiers of its dimensions, and the row of its detail
+        table, if any.
+
+        The dimensions, which are the device, the event type, the
+        network location and the search term, are resolved by the
+        dimension resolver, while the detail rows, which are the
+        click, the color scheme update and the page view, are left
+        to the batch writer.
 
         Parameters:
-            status: int: The status of the previous processing.
+            data (Dict[str, Union[str, float]]): A dictionary containing event data.
 
         Returns:
-            {status: int, identifier: int}
+            {status: int, data: {event: {uniform_resource_locator: string, referrer: string | null, timestamp: int, Device: int, EventType: int, NetworkLocation: int, SearchSubmitted?: int}, detail: Table_Model | null, detail_field: string | null}}
         """
+        status: int = self.ok
+        identifiers: Dict[str, int] = {}
+        for field, manage in [("Device", self.manageDevice), ("EventType", self.manageEventType), ("NetworkLocation", self.manageNetworkLocation)]:
+            response: Dict[str, int] = manage(status)
+            status = int(response["status"])
+            identifiers[field] = int(response["identifier"])
+        detail: Optional[Table_Model] = None
+        detail_field: Optional[str] = None
+        if self.getEventName() == "search_submitted":
+            self.setSearchTerm(str(data["search_term"]))
+            response = self.manageSearchSubmitted(status)
+            status = int(response["status"])
+            identifiers["SearchSubmitted"] = int(response["identifier"])
+        if self.getEventName() == "click":
+            self.setForwardedUniformResourceLocator(str(data["uniform_resource_locator"]))
+            detail = Click(self.getDatabaseHandler(), uniform_resource_locator=self.getForwardedUniformResourceLocator())
+            detail_field = "Click"
+        if self.getEventName() == "color_scheme_updated":
+            self.setColorScheme(str(data["color_scheme"]))
+            detail = Color_Scheme_Updated(self.getDatabaseHandler(), color_scheme=self.getColorScheme())
+            detail_field = "ColorSchemeUpdated"
+        if self.getEventName() == "page_view":
+            self.setLoadingTime(float(data["loading_time"]) / 1000)
+            detail = Page_View(self.getDatabaseHandler(), loading_time=self.getLoadingTime())
+            detail_field = "PageView"
         if status != self.ok and status != self.created:
             return {
                 "status": status,
-                "identifier": 0
+                "data": None
             }
-        return self.postColorSchemeUpdated()
-
-    def postColorSchemeUpdated(self) -> Dict[str, int]:
-        """
-        Inserting a new color scheme update event into the `"ColorSchemeUpdated"` table of the database.
-
-        This method:
-            - Retrieves the updated color scheme.
-            - Attempts to insert the color scheme into the database's `"ColorSchemeUpdated"` table.
-            - Logs success or failure messages.
-            - Returns a dictionary containing the status code and the last inserted row's identifier.
-
-        Returns:
-            Dict[str, int]: A dictionary with keys:
-                - "status": HTTP-style status code indicating result (201 or 503).
-                - "identifier": ID of the inserted row or 0 if failed.
-        """
-        color_scheme_updated: Color_Scheme_Updated = Color_Scheme_Updated(
-            self.getDatabaseHandler(),
-            color_scheme=self.getColorScheme()
-        )
-        response: bool = color_scheme_updated.save()
-        status: int = self.created if response else self.service_unavailable
-        identifier: int = Color_Scheme_Updated.getLastRowIdentifier(self.getDatabaseHandler()) if response else 0
-        if response:
-            self.getLogger().inform(f"The data has been successfully inserted in the Color Scheme table. - Status: {self.created}")
-        else:
-            self.getLogger().error(f"An error occurred while inserting data in the Color Scheme table. - Status: {self.service_unavailable}")
         return {
-            "status": status,
-            "identifier": identifier
+            "status": self.ok,
+            "data": {
+                "event": {
+                    "uniform_resource_locator": self.getUniformResourceLocator(),
+                    "referrer": self.getReferrer(),
+                    "timestamp": self.getTimestamp(),
+                    **identifiers
+                },
+                "detail": detail,
+                "detail_field": detail_field
+            }
         }
 
-    def processPageView(self, data: Dict[str, Union[str, float]], status: int) -> int:
-        """
-        Processing page view events.
-
-        Args:
-            data: {event_name: string, page_url: string, timestamp: string, user_agent: string, screen_resolution: string, referrer: string, loading_time: float, ip_address: string}: The data that will be processed.
-            status: int: The status of the previous processing.
-
-        Returns:
-            int
-        """
-        self.setLoadingTime(float(data["loading_time"]) / 1000)
-        device_response: Dict[str, int] = self.manageDevice(status)
-        status = int(device_response["status"])
-        device_identifier: int = int(device_response["identifier"])
-        event_type_response: Dict[str, int] = self.manageEventType(status)
-        status = int(event_type_response["status"])
-        event_type_identifier: int = int(event_type_response["identifier"])
-        network_location_response: Dict[str, int] = self.manageNetworkLocation(status)
-        status = int(network_location_response["status"])
-        network_location_identifier: int = int(network_location_response["identifier"])
-        page_view_response: Dict[str, int] = self.managePageView(status)
-        status = int(page_view_response["status"])
-        page_view_identifier: int = int(page_view_response["identifier"])
-        return self.postEvent(
-            status=status,
-            device=device_identifier,
-            event_type=event_type_identifier,
-            network_location=network_location_identifier,
-            page_view=page_view_identifier
-        )
-
-    def postEvent(self, status: int, device: int, event_type: int, network_location: int, page_view: int = 0, color_scheme: int = 0, search_submitted: int = 0, click: int = 0) -> int:
-        """
-        Posting an event based on the given parameters to the appropriate event handler.
-
-        This function checks the status and other parameters to determine which specific event function should be triggered.  If the event is successfully processed, it will return a corresponding status, otherwise, it will return the status code indicating an error or an unavailable service.
-
-        Parameters:
-            status (int): The status of the event.
-            device (int): The device identifier.
-            event_type (int): The type of the event.
-            network_location (int): The network location identifier.
-            page_view (int, optional): The page view event identifier.
-            color_scheme (int, optional): The color scheme event identifier.
-            search_submitted (int, optional): The search submission event identifier.
-            click (int, optional): The click event identifier.
-
-        Returns:
-            int
-        """
-        if status != self.ok and status != self.created:
-            return status
-        if page_view != 0:
-            return self.postEventPageView(device, event_type, network_location, page_view)
-        if color_scheme != 0:
-            return self.postEventColorSchemeUpdated(device, event_type, network_location, color_scheme)
-        if search_submitted != 0:
-            return self.postEventSearchSubmitted(device, event_type, network_location, search_submitted)
-        if click != 0:
-            return self.postEventClick(device, event_type, network_location, click)
-        return self.service_unavailable
-
-    def postEventClick(
-        self,
-        device: int,
-        event_type: int,
-        network_location: int,
-        click: int
-    ) -> int:
-        """
-        Inserting a new event click record into the `"Events"` table of the database.
-
-        This method:
-            - Inserts data related to the click event into the `"Events"` table.
-            - Logs success or failure messages.
-            - Returns a status code representing the result of the operation.
-
-        Parameters:
-            device (int): The device identifier where the event occurred.
-            event_type (int): The type of the event.
-            network_location (int): The network location identifier.
-            click (int): The identifier for the event.
-
-        Returns:
-            int: The status code indicating success (self.created) or failure (self.service_unavailable).
-        """
-        event: Event = Event(
-            self.getDatabaseHandler(),
-            uniform_resource_locator=self.getUniformResourceLocator(),
-            referrer=self.getReferrer(),
-            timestamp=self.getTimestamp(),
-            Device=device,
-            EventType=event_type,
-            NetworkLocation=network_location,
-            Click=click
-        )
-        response: bool = event.save()
-        if response:
-            self.getLogger().inform(f"The data has been successfully inserted in the Event table. - Status: {self.created}")
-        else:
-            self.getLogger().error(f"An error occurred while inserting data in the Event table. - Status: {self.service_unavailable}")
-        return self.created if response else self.service_unavailable
-
-    def postEventSearchSubmitted(
-        self,
-        device: int,
-        event_type: int,
-        network_location: int,
-        search_submitted: int
-    ) -> int:
-        """
-        Inserting a new event record indicating a search submission into the `"Events"` table.
-
-        This method:
-            - Constructs an `Event` model with relevant search submission data.
-            - Persists it to the database using the `save()` method.
-            - Logs the result of the operation.
-            - Returns a corresponding HTTP-style status code.
-
-        Parameters:
-            device (int): Identifier of the device where the search was submitted.
-            event_type (int): The type of event (e.g., "SearchSubmitted").
-            network_location (int): Network location or IP context of the request.
-            search_submitted (int): Identifier or flag indicating search submission details.
-
-        Returns:
-            int: Status code indicating success (`self.created`) or failure (`self.service_unavailable`).
-        """
-        event: Event = Event(
-            self.getDatabaseHandler(),
-            uniform_resource_locator=self.getUniformResourceLocator(),
-            referrer=self.getReferrer(),
-            timestamp=self.getTimestamp(),
-            Device=device,
-            EventType=event_type,
-            NetworkLocation=network_location,
-            SearchSubmitted=search_submitted
-        )
-        response: bool = event.save()
-        if response:
-            self.getLogger().inform(f"The data has been successfully inserted in the Event table. - Status: {self.created}")
-        else:
-            self.getLogger().error(f"An error occurred while inserting data in the Event table. - Status: {self.service_unavailable}")
-        return self.created if response else self.service_unavailable
-
-    def postEventColorSchemeUpdated(
-        self,
-        device: int,
-        event_type: int,
-        network_location: int,
-        color_scheme: int
-    ) -> int:
-        """
-        Inserting a new event color scheme updated record into the `"Events"` table of the database.
-
-        This method:
-            - Inserts data related to the color scheme updated event into the `"Events"` table.
-            - Logs success or failure messages.
-            - Returns a status code representing the result of the operation.
-
-        Parameters:
-            device (int): The device identifier where the event occurred.
-            event_type (int): The type of the event.
-            network_location (int): The network location identifier.
-            color_scheme (int): The color scheme identifier.
-
-        Returns:
-            int: Status code indicating success (`self.created`) or failure (`self.service_unavailable`).
-        """
-        event: Event = Event(
-            self.getDatabaseHandler(),
-            uniform_resource_locator=self.getUniformResourceLocator(),
-            referrer=self.getReferrer(),
-            timestamp=self.getTimestamp(),
-            Device=device,
-            EventType=event_type,
-            NetworkLocation=network_location,
-            ColorSchemeUpdated=color_scheme
-        )
-        response: bool = event.save()
-        if response:
-            self.getLogger().inform(f"The data has been successfully inserted in the Event table. - Status: {self.created}")
-        else:
-            self.getLogger().error(f"An error occurred while inserting data in the Event table. - Status: {self.service_unavailable}")
-        return self.created if response else self.service_unavailable
-
-    def postEventPageView(
-        self,
-        device: int,
-        event_type: int,
-        network_location: int,
-        page_view: int
-    ) -> int:
-        """
-        Inserting a new page view event record into the `"Events"` table of the database.
-
-        This method:
-            - Creates an `Event` instance populated with page view event data.
-            - Saves the event record to the database.
-            - Logs success or failure messages accordingly.
-            - Returns an HTTP-style status code representing the result.
-
-        Parameters:
-            device (int): The device identifier where the event occurred.
-            event_type (int): The type of the event.
-            network_location (int): The network location identifier.
-            page_view (int): The page view identifier.
-
-        Returns:
-            int: Status code indicating success (`self.created`) or failure (`self.service_unavailable`).
-        """
-        event: Event = Event(
-            self.getDatabaseHandler(),
-            uniform_resource_locator=self.getUniformResourceLocator(),
-            referrer=self.getReferrer(),
-            timestamp=self.getTimestamp(),
-            Device=device,
-            EventType=event_type,
-            NetworkLocation=network_location,
-            PageView=page_view
-        )
-        response: bool = event.save()
-        if response:
-            self.getLogger().inform(f"The data has been successfully inserted in the Event table. - Status: {self.created}")
-        else:
-            self.getLogger().error(f"An error occurred while inserting data in the Event table. - Status: {self.service_unavailable}")
-        return self.created if response else self.service_unavailable
-
-    def managePageView(self, status: int) -> Dict[str, int]:
+    def manageSearchSubmitted(self, status: int) -> Dict[str, int]:
         """
-        Managing the page view of the event.
+        Managing the search term of the event, which is resolved by
+        the dimension resolver as the submissions of a same search
+        term share their row.
 
         Parameters:
             status: int: The status of the previous processing.
@@ -916,46 +541,21 @@ class AnalyticalManagementSystem:
         Returns:
             {status: int, identifier: int}
         """
-        if status != self.ok and status != self.created:
+        if status not in (self.ok, self.created):
             return {
                 "status": status,
                 "identifier": 0
             }
-        return self.postPageView()
-
-    def postPageView(self) -> Dict[str, int]:
-        """
-        Inserting a new page view record into the `"PageView"` table of the database.
-
-        This method:
-            - Inserts the page loading time into the `"PageView"` table in the database.
-            - Logs success or failure messages based on whether the insertion is successful.
-            - Returns a dictionary with the status code and the identifier of the inserted record.
-
-        Returns:
-            Dict[str, int]: A dictionary containing:
-                - "status" (int): HTTP-like status code for operation success or failure.
-                - "identifier" (int): The last inserted row's identifier, or 0 if failed.
-        """
-        page_view: Page_View = Page_View(
+        search_submitted: Search_Submitted = Search_Submitted(
             self.getDatabaseHandler(),
-            loading_time=self.getLoadingTime()
+            search_term=self.getSearchTerm()
         )
-        response: bool = page_view.save()
-        identifier: int = Page_View.getLastRowIdentifier(self.getDatabaseHandler()) if response else 0
-        status: int = self.created if response else self.service_unavailable
-        if response:
-            self.getLogger().inform(f"The data has been successfully inserted in the Page View table. - Status: {self.created}")
-        else:
-            self.getLogger().error(f"An error occurred while inserting data in the Page View table. - Status: {self.service_unavailable}")
-        return {
-            "status": status,
-            "identifier": identifier
-        }
+        return self.__resolveDimension(search_submitted, ("search_term",), "Search Submitted")
 
     def manageNetworkLocation(self, status: int) -> Dict[str, int]:
         """
-        Managing the network and location of the event.
+        Managing the network and location of the event, which is
+        resolved by the dimension resolver.
 
         Parameters:
             status: int: The status of the previous processing.
@@ -968,48 +568,6 @@ class AnalyticalManagementSystem:
                 "status": status,
                 "identifier": 0
             }
-        database_response: Dict[str, Union[int, List[Network_Location]]] = self.getDatabaseNetworkLocation()
-        if database_response["status"] == self.ok:
-            network_location: Dict[str, Union[int, str, float]] = database_response["data"][-1] # type: ignore
-            return {
-                "status": int(database_response["status"]), # type: ignore
-                "identifier": int(network_location.identifier) # type: ignore
-            }
-        return self.postNetworkLocation()
-
-    def getDatabaseNetworkLocation(self) -> Dict[str, Union[int, List[Network_Location]]]:
-        """
-        Fetching network location data from the database based on the current instance's IP address and coordinates.
-
-        Returns:
-            Dict[str, Union[int, List[Network_Location]]]: 
-                A dictionary containing:
-                - 'status': An integer status code (`self.ok` if data is found, otherwise `self.no_content`)
-                - 'data': A list of `Network_Location` instances if found, otherwise an empty list.
-        """
-        data: List[Network_Location] = Network_Location.getByIpAndLocation(
-            self.getDatabaseHandler(),
-            self.getIpAddress(),
-            [
-                self.getLatitude(),
-                self.getLongitude()
-            ]
-        )
-        has_data: bool = len(data) > 0
-        return {
-            "status": self.ok if has_data else self.no_content,
-            "data": data if has_data else []
-        }
-
-    def postNetworkLocation(self) -> Dict[str, int]:
-        """
-        Inserting the current IP and location information into the Network_Location table.
-
-        Returns:
-            Dict[str, int]: A dictionary containing:
-                - 'status': HTTP-like status code (`self.created` if inserted, else `self.service_unavailable`)
-                - 'identifier': The last inserted row ID from the Network_Location table.
-        """
         network_location: Network_Location = Network_Location(
             database_handler=self.getDatabaseHandler(),
             ip_address=self.getIpAddress(),
@@ -1022,21 +580,12 @@ class AnalyticalManagementSystem:
             timezone=self.getTimezone(),
             location=f"ST_GeomFromText(POINT({self.getLatitude()} {self.getLongitude()}))"
         )
-        response: bool = network_location.save()
-        status: int = self.created if response else self.service_unavailable
-        identifier: int = Network_Location.getLastRowIdentifier(self.getDatabaseHandler())
-        if response:
-            self.getLogger().inform(f"The data has been successfully inserted in the Network and Location table. - Status: {status}")
-        else:
-            self.getLogger().error(f"An error occurred while inserting data in the Network and Location table. - Status: {status}")
-        return {
-            "status": status,
-            "identifier": identifier
-        }
+        return self.__resolveDimension(network_location, ("ip_address", "latitude", "longitude"), "Network and Location")
 
     def manageEventType(self, status: int) -> Dict[str, int]:
         """
-        Managing the type of the event.
+        Managing the type of the event, which is resolved by the
+        dimension resolver.
 
         Parameters:
             status: int: The status of the previous processing.
@@ -1049,61 +598,16 @@ class AnalyticalManagementSystem:
                 "status": status,
                 "identifier": 0
             }
-        database_response: Dict[str, Union[int, List[Event_Types]]] = self.getDatabaseEventType()
-        if database_response["status"] == self.ok:
-            event_type: Event_Types = database_response["data"][-1] # type: ignore
-            return {
-                "status": int(database_response["status"]), # type: ignore
-                "identifier": int(event_type.identifier) # type: ignore
-            }
-        return self.postEventType()
-
-    def getDatabaseEventType(self) -> Dict[str, Union[int, List[Event_Types]]]:
-        """
-        Fetching event type data from the database based on the current instance's event name.
-
-        Returns:
-            Dict[str, Union[int, List[Event_Types]]]: A dictionary with:
-                - 'status': An integer representing the result status (`self.ok` if data is found, else `self.no_content`).
-                - 'data': A list of Event_Types instances if available, otherwise an empty list.
-        """
-        data: List[Event_Types] = Event_Types.getByName(self.getDatabaseHandler(), self.getEventName())
-        has_data: bool = len(data) > 0
-        return {
-            "status": self.ok if has_data else self.no_content,
-            "data": data if has_data else []
-        }
-
-    def postEventType(self) -> Dict[str, int]:
-        """
-        Inserting event type data into the `"EventTypes"` table.
-
-        This method:
-        - Inserts a new event type into the `"EventTypes"` table, using the event name.
-        - Returns a dictionary containing the status of the operation and the identifier of the inserted record.
-
-        Returns:
-            Dict[str, int]
-        """
         event_types: Event_Types = Event_Types(
             database_handler=self.getDatabaseHandler(),
             name=self.getEventName()
         )
-        response: bool = event_types.save()
-        status: int = self.created if response else self.service_unavailable
-        identifier: int = Event_Types.getLastRowIdentifier(self.getDatabaseHandler())
-        if response:
-            self.getLogger().inform(f"The data has been successfully inserted in the Event Types table. - Status: {status}")
-        else:
-            self.getLogger().error(f"An error occurred while inserting data in the Event Types table. - Status: {status}")
-        return {
-            "status": status,
-            "identifier": identifier
-        }
+        return self.__resolveDimension(event_types, ("name",), "Event Types")
 
     def manageDevice(self, status: int) -> Dict[str, int]:
         """
-        Managing the device of the event.
+        Managing the device of the event, which is resolved by the
+        dimension resolver.
 
         Parameters:
             status: int: The status of the previous processing.
@@ -1116,24 +620,6 @@ class AnalyticalManagementSystem:
                 "status": status,
                 "identifier": 0
             }
-        database_response: Dict[str, Union[int, List[Device]]] = self.getDatabaseDevice()
-        if database_response["status"] == self.ok:
-            device: Dict[str, Union[int, str, None, float]] = database_response["data"][-1] # type: ignore
-            return {
-                "status": int(database_response["status"]), # type: ignore
-                "identifier": int(device.identifier) # type: ignore
-            }
-        return self.postDevice()
-
-    def postDevice(self) -> Dict[str, int]:
-        """
-        Inserting the current device information into the Devices table in the database.
-
-        Returns:
-            Dict[str, int]: A dictionary containing:
-                - 'status': HTTP-like status code indicating creation success (`self.created`) or failure (`self.service_unavailable`).
-                - 'identifier': The last inserted row ID from the Devices table.
-        """
         device: Device = Device(
             database_handler=self.getDatabaseHandler(),
             user_agent=self.getUserAgent(),
@@ -1147,37 +633,32 @@ class AnalyticalManagementSystem:
             height=self.getHeight(),
             aspect_ratio=self.getAspectRatio()
         )
-        response: bool = device.save()
-        status: int = self.created if response else self.service_unavailable
-        identifier: int = Device.getLastRowIdentifier(self.getDatabaseHandler())
-        if response:
-            self.getLogger().inform(f"The data has been successfully inserted in the Devices table. - Status: {status}")
-        else:
-            self.getLogger().error(f"An error occurred while inserting data in the Devices table. - Status: {status}")
-        return {
-            "status": status,
-            "identifier": identifier
-        }
+        return self.__resolveDimension(device, ("user_agent", "screen_resolution"), "Devices")
 
-    def getDatabaseDevice(self) -> Dict[str, Union[int, List[Device]]]:
+    def __resolveDimension(self, dimension: Table_Model, natural_key: Tuple[str, ...], name: str) -> Dict[str, int]:
         """
-        Retrieving device records from the database based on the current instance's user agent and screen resolution.
+        Resolving the identifier of a dimension of the event through
+        the dimension resolver shared by the process.
+
+        Parameters:
+            dimension: Table_Model: The model instance of the dimension.
+            natural_key: (string, ...): The columns identifying the dimension.
+            name: string: The name of the table used in the logs.
 
         Returns:
-            Dict[str, Union[int, List[Device]]]: 
-                A dictionary containing:
-                - 'status': Integer status code (`self.ok` if records are found, otherwise `self.no_content`).
-                - 'data': A list of Device instances if any match the criteria, otherwise an empty list.
+            {status: int, identifier: int}
         """
-        data: List[Device] = Device.getByDeviceType(self.getDatabaseHandler(), self.getUserAgent(), self.getScreenResolution())
-        return {
-            "status": self.ok if data else self.no_content,
-            "data": data or []
-        }
+        response: Dict[str, int] = Dimension_Resolver.getInstance().resolve(dimension, natural_key)
+        if response["status"] == self.created:
+            self.getLogger().inform(f"The data has been successfully inserted in the {name} table. - Status: {response['status']}")
+        if response["status"] == self.service_unavailable:
+            self.getLogger().error(f"An error occurred while inserting data in the {name} table. - Status: {response['status']}")
+        return response
 
     def getGeolocationData(self) -> int:
         """
-        Retrieving geolocation data from the IP address.
+        Retrieving geolocation data from the IP address through
+        the geolocation provider.
 
         Returns:
             int
@@ -1185,27 +666,17 @@ class AnalyticalManagementSystem:
         if not self.getIpAddress():
             self.getLogger().error("The Analytical Management System cannot retrieve data from the IP Address.")
             return self.service_unavailable
-        try:
-            route: str = f"{self.getIpInformationApi()}/{self.getIpAddress()}/json"
-            response: Response = get(route)
-            response.raise_for_status()
-            geolocation_data: Any = response.json()
-            self.setLatitude(float(str(geolocation_data.get("loc")).split(",")[0]))
-            self.setLongitude(float(str(geolocation_data.get("loc")).split(",")[1]))
-            self.setCity(str(geolocation_data.get("city")))
-            self.setRegion(str(geolocation_data.get("region")))
-            self.setCountry(str(geolocation_data.get("country")))
-            self.setTimezone(str(geolocation_data.get("timezone")))
-            return self.ok
-        except RequestException as error:
-            self.getLogger().error(f"The Analytical Management System cannot retrieve data from the IP Address. - Error: {error}")
-            return self.service_unavailable
-        except JSONDecodeError as error:
-            self.getLogger().error(f"The Analytical Management System cannot decode the JSON response. - Error: {error}")
-            return self.service_unavailable
-        except Exception as error:
-            self.getLogger().error(f"A general error occurred: {error}")
+        geolocation_data: Optional[Dict[str, Union[str, float]]] = self.getGeolocationProvider().lookup(self.getIpAddress())
+        if geolocation_data is None:
+            self.getLogger().error(f"The Analytical Management System cannot retrieve the geolocation of the IP Address. - IP Address: {self.getIpAddress()}")
             return self.service_unavailable
+        self.setLatitude(float(geolocation_data["latitude"]))
+        self.setLongitude(float(geolocation_data["longitude"]))
+        self.setCity(str(geolocation_data["city"]))
+        self.setRegion(str(geolocation_data["region"]))
+        self.setCountry(str(geolocation_data["country"]))
+        self.setTimezone(str(geolocation_data["timezone"]))
+        return self.ok
 
     def sanitizeRealIpAddress(self) -> int:
         """
@@ -1298,6 +769,12 @@ class AnalyticalManagementSystem:
         if not self.getScreenResolution():
             self.getLogger().error("The Analytical Management System cannot retrieve the screen resolution data.")
             return self.service_unavailable
+        parsed_screen_resolution: Optional[Tuple[int, int, Optional[float]]] = self.__screen_resolution_cache.get(self.getScreenResolution())
+        if parsed_screen_resolution is not None:
+            self.setWidth(parsed_screen_resolution[0])
+            self.setHeight(parsed_screen_resolution[1])
+            self.setAspectRatio(parsed_screen_resolution[2])
+            return self.ok
         resolution_pattern_match = match(r"(\d+)x(\d+)", self.getScreenResolution())
         if not resolution_pattern_match:
             self.getLogger().error("The Analytical Management System cannot parse the screen resolution data.")
@@ -1306,6 +783,7 @@ class AnalyticalManagementSystem:
             self.setWidth(int(resolution_pattern_match.group(1)))
             self.setHeight(int(resolution_pattern_match.group(2)))
             self.setAspectRatio(self.getWidth() / self.getHeight() if self.getHeight() != 0 else None)
+            self.__screen_resolution_cache.set(self.getScreenResolution(), (self.getWidth(), self.getHeight(), self.getAspectRatio()))
             return self.ok
         except ValueError as error:
             self.getLogger().error(f"The Analytical Management System cannot parse the screen resolution data. - Error: {error}")
@@ -1313,18 +791,29 @@ class AnalyticalManagementSystem:
 
     def getUserAgentData(self) -> int:
         """
-        Retrieving the data of the user agent.
+        Retrieving the data of the user agent, which is only parsed
+        the first time the process sees it.
 
         Returns:
             int
         """
         try:
-            user_agent: UserAgent = parse(self.getUserAgent())
-            self.setBrowser(str(user_agent.browser.family))
-            self.setBrowserVersion(str(user_agent.browser.version_string))
-            self.setOperatingSystem(str(user_agent.os.family))
-            self.setOperatingSystemVersion(str(user_agent.os.version_string) if user_agent.os.version_string != "" else None)
-            self.setDevice(str(user_agent.device.family))
+            parsed_user_agent: Optional[Tuple[str, str, str, Optional[str], str]] = self.__user_agent_cache.get(self.getUserAgent())
+            if parsed_user_agent is None:
+                user_agent: UserAgent = parse(self.getUserAgent())
+                parsed_user_agent = (
+                    str(user_agent.browser.family),
+                    str(user_agent.browser.version_string),
+                    str(user_agent.os.family),
+                    str(user_agent.os.version_string) if user_agent.os.version_string != "" else None,
+                    str(user_agent.device.family)
+                )
+                self.__user_agent_cache.set(self.getUserAgent(), parsed_user_agent)
+            self.setBrowser(parsed_user_agent[0])
+            self.setBrowserVersion(parsed_user_agent[1])
+            self.setOperatingSystem(parsed_user_agent[2])
+            self.setOperatingSystemVersion(parsed_user_agent[3])
+            self.setDevice(parsed_user_agent[4])
             self.getLogger().inform("The Analytical Management System has successfully parsed the data from the User Agent.")
             return self.ok
         except Exception as error:
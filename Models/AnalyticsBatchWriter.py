@@ -0,0 +1,367 @@
+"""
+The module provides the batch writer of the analytics, which stores the records of the events in the star schema with multi-row inserts.
+
+Author:
+    Darkness4869
+"""
+from Models.EventsModel import Event
+from Models.TableModel import Table_Model
+from Models.DatabaseHandler import Database_Handler, Extractio_Logger
+from Models.BackgroundWorker import Background_Worker
+from threading import Event as Thread_Event, Lock
+from atexit import register
+from time import monotonic, perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+
+class Analytics_Batch_Writer(Background_Worker):
+    """
+    A writer which accumulates the records of the events and stores them once `batch_size` records are waiting or once the oldest one has waited for `flush_interval` seconds, whichever comes first.
+
+    A record contains the columns of its row in the Events table, whose dimensions are already resolved, and the row of its detail table, if any.  A batch is stored in a single transaction: the detail rows of each table are inserted with multi-row inserts, then the rows of the Events table referencing them.  A batch which cannot be stored is split in halves which are stored separately, hence, an invalid record only drops itself rather than the whole batch.  The remaining records are flushed when the process exits.
+
+    Attributes:
+        __instance (Optional[Analytics_Batch_Writer]): The writer shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared writer.
+        __database_handler (Database_Handler): The database handler used to store the batches.
+        __batch_size (int): The amount of waiting records which triggers a flush.
+        __flush_interval (float): The maximum amount of seconds a record waits before being stored.
+        __records (List[Dict[str, Any]]): The records waiting to be stored.
+        __oldest_record_time (float): The monotonic time at which the oldest waiting record has been added.
+        __lock (Lock): The lock protecting the waiting records and the counters.
+        __write_lock (Lock): The lock serializing the use of the database handler.
+        __stop_event (Thread_Event): The event which stops the thread.
+        __statistics (Dict[str, Union[int, float]]): The counters of the writer.
+        __logger (Extractio_Logger): The logger of the writer.
+        detail_fields (List[str]): The columns of the Events table referencing a detail table, in the order in which the detail tables are inserted.
+
+    Methods:
+        getInstance() -> Analytics_Batch_Writer: Retrieving the writer shared by the whole process.
+        add(record: Dict[str, Any]) -> None: Adding a record to the waiting records.
+        flush() -> bool: Storing the waiting records.
+        write(records: List[Dict[str, Any]]) -> bool: Storing records in a single transaction.
+        getStatistics() -> Dict[str, Union[int, float]]: Retrieving the counters of the writer.
+    """
+    __instance: Optional["Analytics_Batch_Writer"] = None
+    """
+    The writer shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared writer.
+    """
+    __database_handler: Database_Handler
+    """
+    The database handler used to store the batches.
+    """
+    __batch_size: int
+    """
+    The amount of waiting records which triggers a flush.
+    """
+    __flush_interval: float
+    """
+    The maximum amount of seconds a record waits before being stored.
+    """
+    __records: List[Dict[str, Any]]
+    """
+    The records waiting to be stored.
+    """
+    __oldest_record_time: float
+    """
+    The monotonic time at which the oldest waiting record has been added.
+    """
+    __lock: Lock
+    """
+    The lock protecting the waiting records and the counters.
+    """
+    __write_lock: Lock
+    """
+    The lock serializing the use of the database handler.
+    """
+    __stop_event: Thread_Event
+    """
+    The event which stops the thread.
+    """
+    __statistics: Dict[str, Union[int, float]]
+    """
+    The counters of the writer.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the writer.
+    """
+    detail_fields: List[str] = ["PageView", "ColorSchemeUpdated", "Click"]
+    """
+    The columns of the Events table referencing a detail table, in the order in which the detail tables are inserted.
+    """
+
+    def __init__(self, database_handler: Optional[Database_Handler] = None, batch_size: int = 100, flush_interval: float = 0.5):
+        """
+        Initializing the writer, its thread being started on the first record.
+
+        Args:
+            database_handler (Optional[Database_Handler]): The database handler used to store the batches.
+            batch_size (int): The amount of waiting records which triggers a flush.
+            flush_interval (float): The maximum amount of seconds a record waits before being stored.
+        """
+        super().__init__("Analytics_Batch_Writer")
+        self.setDatabaseHandler(database_handler or Database_Handler())
+        self.setBatchSize(batch_size)
+        self.setFlushInterval(flush_interval)
+        self.setRecords([])
+        self.setOldestRecordTime(0.0)
+        self.setLock(Lock())
+        self.setWriteLock(Lock())
+        self.setStopEvent(Thread_Event())
+        self.setStatistics({
+            "written": 0,
+            "failed": 0,
+            "batches": 0,
+            "retries": 0,
+            "last_batch_size": 0,
+            "last_duration": 0.0,
+            "total_duration": 0.0
+        })
+        self.setLogger(Extractio_Logger(__name__))
+
+    def getDatabaseHandler(self) -> Database_Handler:
+        return self.__database_handler
+
+    def setDatabaseHandler(self, database_handler: Database_Handler) -> None:
+        self.__database_handler = database_handler
+
+    def getBatchSize(self) -> int:
+        return self.__batch_size
+
+    def setBatchSize(self, batch_size: int) -> None:
+        self.__batch_size = batch_size
+
+    def getFlushInterval(self) -> float:
+        return self.__flush_interval
+
+    def setFlushInterval(self, flush_interval: float) -> None:
+        self.__flush_interval = flush_interval
+
+    def getRecords(self) -> List[Dict[str, Any]]:
+        return self.__records
+
+    def setRecords(self, records: List[Dict[str, Any]]) -> None:
+        self.__records = records
+
+    def getOldestRecordTime(self) -> float:
+        return self.__oldest_record_time
+
+    def setOldestRecordTime(self, oldest_record_time: float) -> None:
+        self.__oldest_record_time = oldest_record_time
+
+    def getLock(self) -> Lock:
+        return self.__lock
+
+    def setLock(self, lock: Lock) -> None:
+        self.__lock = lock
+
+    def getWriteLock(self) -> Lock:
+        return self.__write_lock
+
+    def setWriteLock(self, write_lock: Lock) -> None:
+        self.__write_lock = write_lock
+
+    def getStopEvent(self) -> Thread_Event:
+        return self.__stop_event
+
+    def setStopEvent(self, stop_event: Thread_Event) -> None:
+        self.__stop_event = stop_event
+
+    def getStatistics(self) -> Dict[str, Union[int, float]]:
+        with self.getLock():
+            statistics: Dict[str, Union[int, float]] = dict(self.__statistics)
+            statistics["pending"] = len(self.getRecords())
+        statistics["events_per_second"] = statistics["written"] / statistics["total_duration"] if statistics["total_duration"] else 0.0
+        return statistics
+
+    def setStatistics(self, statistics: Dict[str, Union[int, float]]) -> None:
+        self.__statistics = statistics
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    @classmethod
+    def getInstance(cls) -> "Analytics_Batch_Writer":
+        """
+        Retrieving the writer shared by the whole process, creating it on the first call and registering its flush at exit.
+
+        Returns:
+            Analytics_Batch_Writer: The writer shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls()
+                register(cls.__instance.stop)
+            return cls.__instance
+
+    def prepare(self) -> None:
+        """
+        Resetting the event which stops the thread flushing the records which have waited for too long.
+        """
+        self.getStopEvent().clear()
+
+    def work(self) -> None:
+        """
+        Flushing the waiting records once the oldest one has waited for the flush interval, until the writer is stopped.
+        """
+        while not self.getStopEvent().wait(self.getFlushInterval() / 2):
+            with self.getLock():
+                is_due: bool = bool(self.getRecords()) and monotonic() - self.getOldestRecordTime() >= self.getFlushInterval()
+            if is_due:
+                self.flush()
+
+    def stop(self) -> None:
+        """
+        Stopping the thread of the writer and storing the remaining records.
+        """
+        self.getStopEvent().set()
+        self.flush()
+        self.getLogger().inform(f"The analytics batch writer has been stopped. - Statistics: {self.getStatistics()}")
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """
+        Adding a record to the waiting records, the records being stored once the batch is full.
+
+        Args:
+            record (Dict[str, Any]): The record of the event.
+        """
+        self.startWorkers()
+        with self.getLock():
+            if not self.getRecords():
+                self.setOldestRecordTime(monotonic())
+            self.getRecords().append(record)
+            is_full: bool = len(self.getRecords()) >= self.getBatchSize()
+        if is_full:
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Storing the waiting records.
+
+        Returns:
+            bool: True if the records have been stored, otherwise False.
+        """
+        with self.getLock():
+            records: List[Dict[str, Any]] = self.getRecords()
+            self.setRecords([])
+        return self.write(records) if records else True
+
+    def write(self, records: List[Dict[str, Any]]) -> bool:
+        """
+        Storing records in a single transaction, the batch being split in halves which are stored separately if the transaction fails, until the records which cannot be stored are isolated.
+
+        Args:
+            records (List[Dict[str, Any]]): The records of the events.
+
+        Returns:
+            bool: True if every record has been stored, otherwise False.
+        """
+        start: float = perf_counter()
+        with self.getWriteLock():
+            written: int = self.__write(records)
+        duration: float = perf_counter() - start
+        with self.getLock():
+            self.__statistics["batches"] += 1
+            self.__statistics["last_batch_size"] = len(records)
+            self.__statistics["last_duration"] = duration
+            self.__statistics["total_duration"] += duration
+            self.__statistics["written"] += written
+            self.__statistics["failed"] += len(records) - written
+        if written < len(records):
+            self.getLogger().error(f"The batch of events cannot be stored entirely. - Amount: {len(records)} - Failed: {len(records) - written}")
+            return False
+        self.getLogger().debug(f"The batch of events has been stored. - Amount: {len(records)} - Duration: {duration:.3f} s")
+        return True
+
+    def __write(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Storing records in a single transaction or, if it fails, storing each half of them separately.
+
+        Args:
+            records (List[Dict[str, Any]]): The records of the events.
+
+        Returns:
+            int: The amount of records which have been stored.
+        """
+        if not records:
+            return 0
+        if self.__insert(records):
+            return len(records)
+        if len(records) == 1:
+            self.getLogger().error(f"The event cannot be stored. - Uniform Resource Locator: {records[0]['event'].get('uniform_resource_locator')} - Detail: {records[0]['detail_field']}")
+            return 0
+        with self.getLock():
+            self.__statistics["retries"] += 1
+        middle: int = len(records) // 2
+        return self.__write(records[:middle]) + self.__write(records[middle:])
+
+    def __insert(self, records: List[Dict[str, Any]]) -> bool:
+        """
+        Storing records in a single transaction, the detail rows being inserted before the rows of the Events table referencing them.
+
+        Args:
+            records (List[Dict[str, Any]]): The records of the events.
+
+        Returns:
+            bool: True if the transaction has been committed, otherwise False.
+        """
+        statements: List[Tuple[str, Callable[[List[List[int]]], List[Tuple[Any, ...]]]]] = []
+        detail_indexes: Dict[str, List[int]] = {}
+        for detail_field in self.detail_fields:
+            indexes: List[int] = [index for index, record in enumerate(records) if record["detail_field"] == detail_field]
+            if not indexes:
+                continue
+            detail_indexes[detail_field] = indexes
+            statements.append(self.__buildDetailStatement([records[index]["detail"] for index in indexes]))
+        statements.append(self.__buildEventStatement(records, detail_indexes))
+        return self.getDatabaseHandler().postManyInTransaction(statements, self.getBatchSize()) is not None
+
+    def __buildDetailStatement(self, details: List[Table_Model]) -> Tuple[str, Callable[[List[List[int]]], List[Tuple[Any, ...]]]]:
+        """
+        Building the insert query of the rows of a detail table.
+
+        Args:
+            details (List[Table_Model]): The model instances of the detail rows, which belong to the same table.
+
+        Returns:
+            Tuple[str, Callable[[List[List[int]]], List[Tuple[Any, ...]]]]: The insert query for a single row and the function building the rows.
+        """
+        model: Table_Model = details[0]
+        fields: List[str] = [field for field in model.getFields() if field != model.getPrimaryField()]
+        query: str = f"INSERT INTO {model.getTableName()} ({', '.join(fields)}) VALUES ({', '.join(['%s'] * len(fields))})"
+        return query, lambda _: [tuple(getattr(detail, field, None) for field in fields) for detail in details]
+
+    def __buildEventStatement(self, records: List[Dict[str, Any]], detail_indexes: Dict[str, List[int]]) -> Tuple[str, Callable[[List[List[int]]], List[Tuple[Any, ...]]]]:
+        """
+        Building the insert query of the rows of the Events table, which reference the detail rows inserted before them.
+
+        Args:
+            records (List[Dict[str, Any]]): The records of the events.
+            detail_indexes (Dict[str, List[int]]): The indexes of the records having a detail row for each detail table, in the order in which the detail tables are inserted.
+
+        Returns:
+            Tuple[str, Callable[[List[List[int]]], List[Tuple[Any, ...]]]]: The insert query for a single row and the function building the rows.
+        """
+        model: Event = Event(self.getDatabaseHandler())
+        fields: List[str] = [field for field in model.getFields() if field != model.getPrimaryField()]
+        query: str = f"INSERT INTO {model.getTableName()} ({', '.join(fields)}) VALUES ({', '.join(['%s'] * len(fields))})"
+
+        def buildRows(generated_identifiers: List[List[int]]) -> List[Tuple[Any, ...]]:
+            columns: List[Dict[str, Any]] = [dict(record["event"]) for record in records]
+            for (detail_field, indexes), identifiers in zip(detail_indexes.items(), generated_identifiers):
+                if len(identifiers) != len(indexes):
+                    raise ValueError(f"The identifiers of the detail rows cannot be retrieved. - Table: {detail_field}")
+                for index, identifier in zip(indexes, identifiers):
+                    columns[index][detail_field] = identifier
+            return [tuple(column.get(field) for field in fields) for column in columns]
+        return query, buildRows
@@ -0,0 +1,270 @@
+"""
+The module provides the ingestion queue of the analytics, which decouples the tracking requests from the enrichment and the storage of their events.
+
+Author:
+    Darkness4869
+"""
+from Models.AnalyticalManagementSystem import AnalyticalManagementSystem, Analytics_Batch_Writer, Extractio_Logger
+from Models.BackgroundWorker import Background_Worker
+from queue import Empty, Full, Queue
+from threading import Lock
+from atexit import register
+from os import getpid
+from time import monotonic
+from typing import Any, Dict, List, Optional, Union
+
+
+class Analytics_Queue(Background_Worker):
+    """
+    A bounded queue of the raw events of the analytics drained by a pool of worker threads.
+
+    The tracking requests only enqueue their event, hence, they return as soon as it has been validated.  Each worker takes the events in batches and processes them with its own Analytical Management System.  When the queue is full, the incoming event is dropped and counted so that a burst of beacons never holds the workers of the application.  The remaining events are flushed when the process exits.
+
+    Attributes:
+        __instance (Optional[Analytics_Queue]): The queue shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared queue.
+        __queue (Queue): The events waiting to be processed.
+        __batch_size (int): The maximum amount of events taken by a worker at once.
+        __flush_timeout (float): The maximum amount of seconds spent flushing the queue at exit.
+        __lock (Lock): The lock protecting the counters.
+        __statistics (Dict[str, int]): The counters of the queue.
+        __logger (Extractio_Logger): The logger of the queue.
+        accepted (int): The status code for accepted.
+        service_unavailable (int): The status code for the service unavailable.
+
+    Methods:
+        getInstance() -> Analytics_Queue: Retrieving the queue shared by the whole process.
+        put(event: Dict[str, Union[str, float]]) -> int: Enqueuing an event.
+        flush() -> None: Processing the remaining events before the process exits.
+        getStatistics() -> Dict[str, int]: Retrieving the counters of the queue.
+    """
+    __instance: Optional["Analytics_Queue"] = None
+    """
+    The queue shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared queue.
+    """
+    __queue: "Queue[Optional[Dict[str, Union[str, float]]]]"
+    """
+    The events waiting to be processed.
+    """
+    __batch_size: int
+    """
+    The maximum amount of events taken by a worker at once.
+    """
+    __flush_timeout: float
+    """
+    The maximum amount of seconds spent flushing the queue at exit.
+    """
+    __lock: Lock
+    """
+    The lock protecting the counters.
+    """
+    __statistics: Dict[str, int]
+    """
+    The counters of the queue.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the queue.
+    """
+    accepted: int = 202
+    """
+    The status code for accepted.
+    """
+    service_unavailable: int = 503
+    """
+    The status code for the service unavailable.
+    """
+
+    def __init__(self, maximum_size: int = 10000, workers: int = 2, batch_size: int = 100, flush_timeout: float = 10.0):
+        """
+        Initializing the queue, the worker threads being started on the first event.
+
+        Args:
+            maximum_size (int): The maximum amount of events waiting to be processed.
+            workers (int): The amount of worker threads.
+            batch_size (int): The maximum amount of events taken by a worker at once.
+            flush_timeout (float): The maximum amount of seconds spent flushing the queue at exit.
+        """
+        super().__init__("Analytics_Queue", workers)
+        self.setQueue(Queue(maxsize=maximum_size))
+        self.setBatchSize(batch_size)
+        self.setFlushTimeout(flush_timeout)
+        self.setLock(Lock())
+        self.setStatistics({
+            "enqueued": 0,
+            "dropped": 0,
+            "processed": 0,
+            "failed": 0,
+            "batches": 0
+        })
+        self.setLogger(Extractio_Logger(__name__))
+
+    def getQueue(self) -> "Queue[Optional[Dict[str, Union[str, float]]]]":
+        return self.__queue
+
+    def setQueue(self, queue: "Queue[Optional[Dict[str, Union[str, float]]]]") -> None:
+        self.__queue = queue
+
+    def getBatchSize(self) -> int:
+        return self.__batch_size
+
+    def setBatchSize(self, batch_size: int) -> None:
+        self.__batch_size = batch_size
+
+    def getFlushTimeout(self) -> float:
+        return self.__flush_timeout
+
+    def setFlushTimeout(self, flush_timeout: float) -> None:
+        self.__flush_timeout = flush_timeout
+
+    def getLock(self) -> Lock:
+        return self.__lock
+
+    def setLock(self, lock: Lock) -> None:
+        self.__lock = lock
+
+    def getStatistics(self) -> Dict[str, int]:
+        with self.getLock():
+            statistics: Dict[str, int] = dict(self.__statistics)
+        statistics["pending"] = self.getQueue().qsize()
+        return statistics
+
+    def setStatistics(self, statistics: Dict[str, int]) -> None:
+        self.__statistics = statistics
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    @classmethod
+    def getInstance(cls) -> "Analytics_Queue":
+        """
+        Retrieving the queue shared by the whole process, creating it on the first call and registering its flush at exit.
+
+        Returns:
+            Analytics_Queue: The queue shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls()
+                register(cls.__instance.flush)
+            return cls.__instance
+
+    def __count(self, name: str, amount: int = 1) -> None:
+        """
+        Incrementing a counter of the queue.
+
+        Args:
+            name (str): The name of the counter.
+            amount (int): The amount to add.
+        """
+        with self.getLock():
+            self.__statistics[name] += amount
+
+    def put(self, event: Dict[str, Union[str, float]]) -> int:
+        """
+        Enqueuing an event without blocking, the event being dropped if the queue is full.
+
+        Args:
+            event (Dict[str, Union[str, float]]): The validated event.
+
+        Returns:
+            int
+        """
+        self.startWorkers()
+        try:
+            self.getQueue().put_nowait(event)
+        except Full:
+            self.__count("dropped")
+            self.getLogger().warn(f"The analytics queue is full, hence, the event has been dropped. - Event Name: {event.get('event_name')} - IP Address: {event.get('ip_address')}")
+            return self.service_unavailable
+        self.__count("enqueued")
+        return self.accepted
+
+    def __takeBatch(self) -> Optional[List[Dict[str, Union[str, float]]]]:
+        """
+        Waiting for an event and taking it with the events already waiting, up to the size of a batch.
+
+        Returns:
+            Optional[List[Dict[str, Union[str, float]]]]: The batch, or None if the worker has to stop.
+        """
+        event: Optional[Dict[str, Union[str, float]]] = self.getQueue().get()
+        if event is None:
+            self.getQueue().task_done()
+            return None
+        batch: List[Dict[str, Union[str, float]]] = [event]
+        while len(batch) < self.getBatchSize():
+            try:
+                event = self.getQueue().get_nowait()
+            except Empty:
+                break
+            if event is None:
+                self.getQueue().task_done()
+                self.getQueue().put(None)
+                break
+            batch.append(event)
+        return batch
+
+    def work(self) -> None:
+        """
+        Processing the batches of events until the worker is stopped.
+        """
+        system: AnalyticalManagementSystem = AnalyticalManagementSystem()
+        while True:
+            batch: Optional[List[Dict[str, Union[str, float]]]] = self.__takeBatch()
+            if batch is None:
+                return
+            self.process(system, batch)
+            for _ in batch:
+                self.getQueue().task_done()
+
+    def process(self, system: AnalyticalManagementSystem, batch: List[Dict[str, Union[str, float]]]) -> None:
+        """
+        Processing a batch of events by enriching them and handing their records over to the batch writer, a failing event never preventing the others from being processed.
+
+        Args:
+            system (AnalyticalManagementSystem): The Analytical Management System of the worker.
+            batch (List[Dict[str, Union[str, float]]]): The events.
+        """
+        writer: Analytics_Batch_Writer = Analytics_Batch_Writer.getInstance()
+        failed: int = 0
+        for event in batch:
+            try:
+                status: int = system.enrichEvent(event)
+                response: Dict[str, Any] = system.buildRecord(event) if status == system.ok else {"status": status}
+                if response["status"] == system.ok:
+                    writer.add(response["data"])
+                    continue
+            except Exception as error:
+                self.getLogger().error(f"The event cannot be processed. - Event Name: {event.get('event_name')} - Error: {error}")
+            failed += 1
+        with self.getLock():
+            self.__statistics["batches"] += 1
+            self.__statistics["processed"] += len(batch) - failed
+            self.__statistics["failed"] += failed
+
+    def flush(self) -> None:
+        """
+        Processing the remaining events before the process exits, by stopping the worker threads once the queue has been drained and then the batch writer.
+        """
+        if self.getProcessIdentifier() != getpid():
+            return
+        for _ in self.getThreads():
+            try:
+                self.getQueue().put(None, timeout=self.getFlushTimeout())
+            except Full:
+                break
+        deadline: float = monotonic() + self.getFlushTimeout()
+        for thread in self.getThreads():
+            thread.join(timeout=max(0.0, deadline - monotonic()))
+        Analytics_Batch_Writer.getInstance().stop()
+        statistics: Dict[str, Any] = self.getStatistics()
+        self.getLogger().inform(f"The analytics queue has been flushed. - Statistics: {statistics} - Caches: {AnalyticalManagementSystem.getCacheStatistics()}")
@@ -0,0 +1,211 @@
+"""
+The module provides the rollups of the analytics, which pre-aggregate the events into hourly and daily buckets, and the reports answered from them.
+
+Author:
+    Darkness4869
+"""
+from Models.DatabaseHandler import Database_Handler, Extractio_Logger, RowType
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+class Analytics_Rollup:
+    """
+    The rollups of the analytics, which count the events and sum their loading time per hourly and daily bucket, event type, page, device type and country.
+
+    The rollup job is incremental: it only aggregates the events whose identifier is greater than its watermark, chunk by chunk, and each chunk is added to the rollups and advances the watermark in a single transaction.  The watermark is only advanced from the value the job has read, hence, two jobs running concurrently never aggregate the same events twice.  As the identifiers of the events can be committed out of order, each run records the identifier of the last event committed as its horizon and only aggregates up to the horizon recorded by the previous run, hence, an event committed late behind a greater identifier has a whole interval between two runs to be committed before it can be skipped.
+
+    Attributes:
+        __database_handler (Database_Handler): The database handler that will communicate with the database server.
+        __logger (Extractio_Logger): The logger of the rollups.
+        granularities (Dict[str, int]): The size in seconds of the buckets of each granularity.
+        dimensions (Dict[str, str]): The column of each dimension a report can be grouped by.
+        watermark (str): The name of the watermark of the rollup job.
+        horizon (str): The name of the identifier of the last event committed when the rollup job has last run.
+
+    Methods:
+        create() -> bool: Creating the tables of the rollups.
+        getWatermark() -> int: Retrieving the identifier of the last event aggregated.
+        run(chunk_size: int = 50000) -> int: Aggregating the events which have not been aggregated yet.
+        getReport(granularity: str, start: int, end: int, group_by: List[str], is_timeline: bool, limit: int) -> List[Dict[str, Any]]: Retrieving the aggregated events of a period.
+    """
+    __database_handler: Database_Handler
+    """
+    The database handler that will communicate with the database
+    server.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the rollups.
+    """
+    granularities: Dict[str, int] = {
+        "hour": 3600,
+        "day": 86400
+    }
+    """
+    The size in seconds of the buckets of each granularity.
+    """
+    dimensions: Dict[str, str] = {
+        "event_type": "event_type",
+        "page": "uniform_resource_locator",
+        "device": "device",
+        "country": "country"
+    }
+    """
+    The column of each dimension a report can be grouped by.
+    """
+    watermark: str = "AnalyticsRollups"
+    """
+    The name of the watermark of the rollup job.
+    """
+    horizon: str = "AnalyticsRollupsHorizon"
+    """
+    The name of the identifier of the last event committed when
+    the rollup job has last run, up to which the next run
+    aggregates the events.
+    """
+
+    def __init__(self, database_handler: Optional[Database_Handler] = None):
+        """
+        Initializing the rollups.
+
+        Args:
+            database_handler (Optional[Database_Handler]): The database handler that will communicate with the database server.
+        """
+        self.setDatabaseHandler(database_handler or Database_Handler())
+        self.setLogger(Extractio_Logger(__name__))
+
+    def getDatabaseHandler(self) -> Database_Handler:
+        return self.__database_handler
+
+    def setDatabaseHandler(self, database_handler: Database_Handler) -> None:
+        self.__database_handler = database_handler
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    def create(self) -> bool:
+        """
+        Creating the table of the rollups and the table of the watermarks if they do not exist.  The page is part of the primary key through the hash of its uniform resource locator.
+
+        Returns:
+            bool
+        """
+        rollups_query: str = "CREATE TABLE IF NOT EXISTS `AnalyticsRollups` (granularity VARCHAR(8) NOT NULL, bucket INT NOT NULL, event_type VARCHAR(64) NOT NULL, uniform_resource_locator_hash BINARY(16) NOT NULL, uniform_resource_locator VARCHAR(512) NOT NULL, device VARCHAR(64) NOT NULL, country VARCHAR(64) NOT NULL, events INT NOT NULL, loading_time_sum DOUBLE NOT NULL, loading_time_count INT NOT NULL, PRIMARY KEY (granularity, bucket, event_type, uniform_resource_locator_hash, device, country))"
+        watermarks_query: str = "CREATE TABLE IF NOT EXISTS `AnalyticsWatermarks` (name VARCHAR(64) PRIMARY KEY, `value` INT NOT NULL)"
+        if not self.getDatabaseHandler().createTable(rollups_query, None) or not self.getDatabaseHandler().createTable(watermarks_query, None):
+            return False
+        return self.getDatabaseHandler().postData("INSERT IGNORE INTO `AnalyticsWatermarks` (name, `value`) VALUES (%s, 0), (%s, 0)", (self.watermark, self.horizon))
+
+    def getWatermark(self) -> int:
+        """
+        Retrieving the identifier of the last event aggregated.
+
+        Returns:
+            int
+        """
+        return self.__getValue(self.watermark)
+
+    def __getValue(self, name: str) -> int:
+        """
+        Retrieving the value of a watermark.
+
+        Args:
+            name (str): The name of the watermark.
+
+        Returns:
+            int
+        """
+        response: List[RowType] = self.getDatabaseHandler().getData("SELECT `value` FROM `AnalyticsWatermarks` WHERE name = %s", (name,))
+        return int(response[0]["value"]) if response else 0 # type: ignore
+
+    def __getLastEvent(self) -> int:
+        """
+        Retrieving the identifier of the last event committed.
+
+        Returns:
+            int
+        """
+        response: List[RowType] = self.getDatabaseHandler().getData("SELECT COALESCE(MAX(identifier), 0) AS identifier FROM Events")
+        return int(response[0]["identifier"]) if response else 0 # type: ignore
+
+    def __buildRollupQuery(self) -> str:
+        """
+        Building the query adding the events of a range of identifiers to the rollups of a granularity.
+
+        Returns:
+            string
+        """
+        return "INSERT INTO `AnalyticsRollups` (granularity, bucket, event_type, uniform_resource_locator_hash, uniform_resource_locator, device, country, events, loading_time_sum, loading_time_count) SELECT %s, Events.timestamp - MOD(Events.timestamp, %s) AS bucket, EventTypes.name, UNHEX(MD5(Events.uniform_resource_locator)), Events.uniform_resource_locator, Devices.device, NetworkLocation.country, COUNT(*), COALESCE(SUM(PageView.loading_time), 0), COUNT(PageView.loading_time) FROM Events INNER JOIN EventTypes ON EventTypes.identifier = Events.EventType INNER JOIN Devices ON Devices.identifier = Events.Device INNER JOIN NetworkLocation ON NetworkLocation.identifier = Events.NetworkLocation LEFT JOIN PageView ON PageView.identifier = Events.PageView WHERE Events.identifier > %s AND Events.identifier <= %s GROUP BY bucket, EventTypes.name, Events.uniform_resource_locator, Devices.device, NetworkLocation.country ON DUPLICATE KEY UPDATE events = events + VALUES(events), loading_time_sum = loading_time_sum + VALUES(loading_time_sum), loading_time_count = loading_time_count + VALUES(loading_time_count)"
+
+    def run(self, chunk_size: int = 50000) -> int:
+        """
+        Aggregating the events which have not been aggregated yet up to the horizon recorded by the previous run, chunk by chunk, each chunk being added to the rollups of every granularity and advancing the watermark in a single transaction, then recording the identifier of the last event committed as the horizon of the next run.
+
+        Args:
+            chunk_size (int): The maximum amount of event identifiers aggregated per transaction.
+
+        Returns:
+            int: The amount of event identifiers which have been aggregated.
+        """
+        if not self.create():
+            self.getLogger().error("The tables of the analytics rollups cannot be created.")
+            return 0
+        horizon: int = self.__getValue(self.horizon)
+        last_event: int = self.__getLastEvent()
+        query: str = self.__buildRollupQuery()
+        aggregated: int = 0
+        watermark: int = self.getWatermark()
+        while watermark < horizon:
+            upper_bound: int = min(horizon, watermark + chunk_size)
+            statements: List[Tuple[str, Optional[Tuple[Any, ...]], bool]] = [("UPDATE `AnalyticsWatermarks` SET `value` = %s WHERE name = %s AND `value` = %s", (upper_bound, self.watermark, watermark), True)]
+            statements += [(query, (granularity, size, watermark, upper_bound), False) for granularity, size in self.granularities.items()]
+            if not self.getDatabaseHandler().executeInTransaction(statements):
+                self.getLogger().warn(f"The analytics rollup has stopped as the chunk cannot be aggregated. - Watermark: {watermark}")
+                break
+            aggregated += upper_bound - watermark
+            watermark = upper_bound
+        if not self.getDatabaseHandler().postData("UPDATE `AnalyticsWatermarks` SET `value` = GREATEST(`value`, %s) WHERE name = %s", (last_event, self.horizon)):
+            self.getLogger().warn(f"The horizon of the analytics rollup cannot be recorded. - Horizon: {last_event}")
+        self.getLogger().inform(f"The analytics rollup has been completed. - Aggregated: {aggregated} - Watermark: {watermark} - Horizon: {last_event}")
+        return aggregated
+
+    def getReport(self, granularity: str, start: int, end: int, group_by: List[str], is_timeline: bool = False, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Retrieving the amount of events and the average loading time of a period from the rollups, grouped by the given dimensions and, for a timeline, by bucket.
+
+        Args:
+            granularity (str): The granularity of the buckets, either `hour` or `day`.
+            start (int): The UNIX time from which the period starts.
+            end (int): The UNIX time at which the period ends, excluded.
+            group_by (List[str]): The dimensions to group by among `event_type`, `page`, `device` and `country`.
+            is_timeline (bool): Whether the events are also grouped by bucket.
+            limit (int): The maximum amount of rows.
+
+        Returns:
+            List[Dict[str, Any]]
+
+        Raises:
+            ValueError: If the granularity or a dimension is not supported.
+        """
+        if granularity not in self.granularities:
+            raise ValueError(f"The granularity is not supported. - Granularity: {granularity}")
+        unsupported_dimensions: List[str] = [dimension for dimension in group_by if dimension not in self.dimensions]
+        if unsupported_dimensions:
+            raise ValueError(f"The dimensions are not supported. - Dimensions: {unsupported_dimensions}")
+        columns: List[str] = (["bucket"] if is_timeline else []) + [f"{self.dimensions[dimension]} AS {dimension}" for dimension in group_by]
+        groups: List[str] = (["bucket"] if is_timeline else []) + [self.dimensions[dimension] for dimension in group_by]
+        select_clause: str = ", ".join(columns + ["SUM(events) AS events", "SUM(loading_time_sum) / NULLIF(SUM(loading_time_count), 0) AS average_loading_time"])
+        group_clause: str = f" GROUP BY {', '.join(groups)}" if groups else ""
+        order_clause: str = " ORDER BY bucket" if is_timeline else " ORDER BY events DESC"
+        query: str = f"SELECT {select_clause} FROM `AnalyticsRollups` WHERE granularity = %s AND bucket >= %s AND bucket < %s{group_clause}{order_clause} LIMIT %s"
+        response: List[RowType] = self.getDatabaseHandler().getData(query, (granularity, start, end, limit))
+        return [
+            {
+                **dict(row), # type: ignore
+                "events": int(row["events"] or 0), # type: ignore
+                "average_loading_time": float(row["average_loading_time"]) if row["average_loading_time"] is not None else None # type: ignore
+            } for row in response
+        ]
@@ -0,0 +1,121 @@
+"""
+The module provides the base of the components of the application which run their work in background threads started lazily in each process.
+
+Author:
+    Darkness4869
+"""
+from abc import ABC, abstractmethod
+from threading import Lock, Thread
+from os import getpid
+from typing import List
+
+
+class Background_Worker(ABC):
+    """
+    The base of a component whose work runs in daemon threads which are started on its first use in each process.
+
+    The threads are started again in a forked process, as the threads of a parent process do not survive a fork.  Right before they are started, the component is prepared, hence, the state left behind by the threads of the parent process can be reset.
+
+    Attributes:
+        __worker_name (str): The name of the threads.
+        __workers (int): The amount of threads.
+        __threads (List[Thread]): The threads of the current process.
+        __process_identifier (int): The identifier of the process which has started the threads.
+        __start_lock (Lock): The lock protecting the start of the threads.
+
+    Methods:
+        startWorkers() -> None: Starting the threads if they are not running in the current process.
+        prepare() -> None: Preparing the component before its threads are started.
+        work() -> None: Running the work of a thread.
+    """
+    __worker_name: str
+    """
+    The name of the threads.
+    """
+    __workers: int
+    """
+    The amount of threads.
+    """
+    __threads: List[Thread]
+    """
+    The threads of the current process.
+    """
+    __process_identifier: int
+    """
+    The identifier of the process which has started the threads.
+    """
+    __start_lock: Lock
+    """
+    The lock protecting the start of the threads.
+    """
+
+    def __init__(self, worker_name: str, workers: int = 1):
+        """
+        Initializing the component, its threads being started on its first use.
+
+        Args:
+            worker_name (str): The name of the threads.
+            workers (int): The amount of threads.
+        """
+        self.setWorkerName(worker_name)
+        self.setWorkers(workers)
+        self.setThreads([])
+        self.setProcessIdentifier(0)
+        self.setStartLock(Lock())
+
+    def getWorkerName(self) -> str:
+        return self.__worker_name
+
+    def setWorkerName(self, worker_name: str) -> None:
+        self.__worker_name = worker_name
+
+    def getWorkers(self) -> int:
+        return self.__workers
+
+    def setWorkers(self, workers: int) -> None:
+        self.__workers = workers
+
+    def getThreads(self) -> List[Thread]:
+        return self.__threads
+
+    def setThreads(self, threads: List[Thread]) -> None:
+        self.__threads = threads
+
+    def getProcessIdentifier(self) -> int:
+        return self.__process_identifier
+
+    def setProcessIdentifier(self, process_identifier: int) -> None:
+        self.__process_identifier = process_identifier
+
+    def getStartLock(self) -> Lock:
+        return self.__start_lock
+
+    def setStartLock(self, start_lock: Lock) -> None:
+        self.__start_lock = start_lock
+
+    def startWorkers(self) -> None:
+        """
+        Starting the threads if they are not running in the current process, the component being prepared beforehand.
+        """
+        if self.getProcessIdentifier() == getpid():
+            return
+        with self.getStartLock():
+            if self.getProcessIdentifier() == getpid():
+                return
+            self.prepare()
+            names: List[str] = [self.getWorkerName()] if self.getWorkers() == 1 else [f"{self.getWorkerName()}-{index}" for index in range(self.getWorkers())]
+            self.setThreads([Thread(target=self.work, name=name, daemon=True) for name in names])
+            for thread in self.getThreads():
+                thread.start()
+            self.setProcessIdentifier(getpid())
+
+    def prepare(self) -> None:
+        """
+        Preparing the component before its threads are started in the current process.
+        """
+
+    @abstractmethod
+    def work(self) -> None:
+        """
+        Running the work of a thread.
+        """
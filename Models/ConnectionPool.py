@@ -0,0 +1,386 @@
+"""
+The module provides a process-wide pool of MySQL connections which is shared by every database handler of a worker process.
+
+Author:
+    Darkness4869
+"""
+from mysql.connector.connection import MySQLConnection
+from mysql.connector import connect, Error as Relational_Database_Error
+from Models.Logger import Extractio_Logger
+from Environment import Environment
+from threading import Condition, Lock
+from collections import deque
+from time import monotonic
+from os import getenv, getpid
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+class Connection_Pool:
+    """
+    A thread-safe pool of MySQL connections that database handlers borrow from and return to instead of opening and closing a connection for every statement.
+
+    The pool keeps up to `size` idle connections.  When all of them are checked out, up to `overflow` extra connections can be opened; those are closed instead of being kept once they are returned.  Idle connections which have not been used for longer than `idle_timeout` seconds are discarded, and every connection is health-checked when it is checked out.
+
+    Attributes:
+        __logger (Extractio_Logger): A logger instance for logging the operations of the pool.
+        __env (Environment): An instance of the Environment class to retrieve database connection parameters.
+        __size (int): The maximum amount of idle connections kept by the pool.
+        __overflow (int): The amount of connections that can be opened on top of the size of the pool.
+        __idle_timeout (float): The amount of seconds after which an idle connection is discarded.
+        __timeout (float): The amount of seconds to wait for a connection when the pool is exhausted.
+        __idle_connections (Deque[Tuple[MySQLConnection, float]]): The idle connections along with the time at which they have been returned.
+        __checked_out (int): The amount of connections currently borrowed from the pool.
+        __condition (Condition): The condition used to synchronize the borrowers of the pool.
+        __process_identifier (int): The identifier of the process that owns the connections of the pool.
+
+    Methods:
+        getInstance(environment: Optional[Environment] = None) -> Connection_Pool: Retrieving the pool shared by the whole process.
+        acquire() -> MySQLConnection: Borrowing a healthy connection from the pool.
+        release(connection: MySQLConnection) -> None: Returning a connection to the pool.
+        close() -> None: Closing all the idle connections of the pool.
+        getStatistics() -> Dict[str, int]: Retrieving the current state of the pool.
+    """
+    __instance: Optional["Connection_Pool"] = None
+    """
+    The pool shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared pool.
+    """
+    __logger: Extractio_Logger
+    """
+    A logger instance for logging the operations of the pool.
+    """
+    __env: Environment
+    """
+    An instance of the Environment class to retrieve database connection parameters.
+    """
+    __size: int
+    """
+    The maximum amount of idle connections kept by the pool.
+    """
+    __overflow: int
+    """
+    The amount of connections that can be opened on top of the size of the pool.
+    """
+    __idle_timeout: float
+    """
+    The amount of seconds after which an idle connection is discarded.
+    """
+    __timeout: float
+    """
+    The amount of seconds to wait for a connection when the pool is exhausted.
+    """
+    __idle_connections: Deque[Tuple[MySQLConnection, float]]
+    """
+    The idle connections along with the time at which they have been returned.
+    """
+    __checked_out: int
+    """
+    The amount of connections currently borrowed from the pool.
+    """
+    __condition: Condition
+    """
+    The condition used to synchronize the borrowers of the pool.
+    """
+    __process_identifier: int
+    """
+    The identifier of the process that owns the connections of the pool.
+    """
+
+    def __init__(
+        self,
+        environment: Optional[Environment] = None,
+        logger: Optional[Extractio_Logger] = None,
+        size: int = 5,
+        overflow: int = 10,
+        idle_timeout: float = 300.0,
+        timeout: float = 10.0
+    ):
+        """
+        Initializing the connection pool.
+
+        Args:
+            environment (Optional[Environment]): Environment instance for DB config.
+            logger (Optional[Extractio_Logger]): Logger instance.
+            size (int): The maximum amount of idle connections kept by the pool.
+            overflow (int): The amount of connections that can be opened on top of the size of the pool.
+            idle_timeout (float): The amount of seconds after which an idle connection is discarded.
+            timeout (float): The amount of seconds to wait for a connection when the pool is exhausted.
+
+        Raises:
+            ValueError: If the size, overflow or timeouts are invalid.
+        """
+        if size < 1 or overflow < 0 or idle_timeout <= 0 or timeout <= 0:
+            raise ValueError("The configuration of the connection pool is invalid.")
+        self.setLogger(logger or Extractio_Logger(__name__))
+        self.setEnv(environment or Environment())
+        self.setSize(size)
+        self.setOverflow(overflow)
+        self.setIdleTimeout(idle_timeout)
+        self.setTimeout(timeout)
+        self.setIdleConnections(deque())
+        self.setCheckedOut(0)
+        self.setCondition(Condition())
+        self.setProcessIdentifier(getpid())
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    def getEnv(self) -> Environment:
+        return self.__env
+
+    def setEnv(self, env: Environment) -> None:
+        self.__env = env
+
+    def getSize(self) -> int:
+        return self.__size
+
+    def setSize(self, size: int) -> None:
+        self.__size = size
+
+    def getOverflow(self) -> int:
+        return self.__overflow
+
+    def setOverflow(self, overflow: int) -> None:
+        self.__overflow = overflow
+
+    def getIdleTimeout(self) -> float:
+        return self.__idle_timeout
+
+    def setIdleTimeout(self, idle_timeout: float) -> None:
+        self.__idle_timeout = idle_timeout
+
+    def getTimeout(self) -> float:
+        return self.__timeout
+
+    def setTimeout(self, timeout: float) -> None:
+        self.__timeout = timeout
+
+    def getIdleConnections(self) -> Deque[Tuple[MySQLConnection, float]]:
+        return self.__idle_connections
+
+    def setIdleConnections(self, idle_connections: Deque[Tuple[MySQLConnection, float]]) -> None:
+        self.__idle_connections = idle_connections
+
+    def getCheckedOut(self) -> int:
+        return self.__checked_out
+
+    def setCheckedOut(self, checked_out: int) -> None:
+        self.__checked_out = checked_out
+
+    def getCondition(self) -> Condition:
+        return self.__condition
+
+    def setCondition(self, condition: Condition) -> None:
+        self.__condition = condition
+
+    def getProcessIdentifier(self) -> int:
+        return self.__process_identifier
+
+    def setProcessIdentifier(self, process_identifier: int) -> None:
+        self.__process_identifier = process_identifier
+
+    @classmethod
+    def getInstance(cls, environment: Optional[Environment] = None) -> "Connection_Pool":
+        """
+        Retrieving the pool shared by every database handler of the process, creating it on the first call with the size, the overflow and the timeouts set in the environment of the application, which are `DATABASE_POOL_SIZE`, `DATABASE_POOL_OVERFLOW`, `DATABASE_POOL_IDLE_TIMEOUT` and `DATABASE_POOL_TIMEOUT`.
+
+        Args:
+            environment (Optional[Environment]): Environment instance for DB config, only used when the pool is created.
+
+        Returns:
+            Connection_Pool: The pool shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                environment = environment or Environment()
+                cls.__instance = cls(
+                    environment,
+                    size=int(getenv("DATABASE_POOL_SIZE", "5")),
+                    overflow=int(getenv("DATABASE_POOL_OVERFLOW", "10")),
+                    idle_timeout=float(getenv("DATABASE_POOL_IDLE_TIMEOUT", "300")),
+                    timeout=float(getenv("DATABASE_POOL_TIMEOUT", "10"))
+                )
+            return cls.__instance
+
+    def __create(self) -> MySQLConnection:
+        """
+        Establishing a new connection to the MySQL database using the provided environment configuration.
+
+        Returns:
+            MySQLConnection: The established MySQL connection object.
+
+        Raises:
+            Relational_Database_Error: If the connection to the database fails.
+        """
+        try:
+            connection: MySQLConnection = connect(
+                host=self.getEnv().getDatabaseHost(),
+                user=self.getEnv().getDatabaseUsername(),
+                password=self.getEnv().getDatabasePassword(),
+                database=self.getEnv().getDatabaseSchema()
+            ) # type: ignore
+            self.getLogger().inform("The connection pool has successfully opened a new connection to the database.")
+            return connection
+        except Relational_Database_Error as error:
+            self.getLogger().error(f"The connection pool has failed to connect to the database. - Error: {error}")
+            raise error
+
+    def __isHealthy(self, connection: MySQLConnection) -> bool:
+        """
+        Checking that a connection is still usable by pinging the database server.
+
+        Args:
+            connection (MySQLConnection): The connection to check.
+
+        Returns:
+            bool: True if the connection is usable, otherwise False.
+        """
+        try:
+            return connection.is_connected()
+        except Relational_Database_Error as error:
+            self.getLogger().warn(f"The connection has failed its health check. - Error: {error}")
+            return False
+
+    def __discard(self, connections: List[MySQLConnection]) -> None:
+        """
+        Closing connections that are no longer kept by the pool.
+
+        Args:
+            connections (List[MySQLConnection]): The connections to close.
+        """
+        for connection in connections:
+            try:
+                connection.close()
+            except Relational_Database_Error as error:
+                self.getLogger().warn(f"The connection pool has failed to close a connection. - Error: {error}")
+
+    def __verifyProcess(self) -> None:
+        """
+        Forgetting the connections inherited from a parent process.
+
+        The sockets of a forked worker are shared with its parent, hence, they are dropped without being closed so that the parent can keep on using them.  It must be called while holding the condition.
+        """
+        if self.getProcessIdentifier() == getpid():
+            return
+        self.setIdleConnections(deque())
+        self.setCheckedOut(0)
+        self.setProcessIdentifier(getpid())
+
+    def __pruneIdleConnections(self) -> List[MySQLConnection]:
+        """
+        Removing the idle connections which have exceeded the idle timeout.  It must be called while holding the condition.
+
+        Returns:
+            List[MySQLConnection]: The expired connections which have to be closed.
+        """
+        expired: List[MySQLConnection] = []
+        deadline: float = monotonic() - self.getIdleTimeout()
+        while self.getIdleConnections() and self.getIdleConnections()[0][1] < deadline:
+            expired.append(self.getIdleConnections().popleft()[0])
+        return expired
+
+    def acquire(self) -> MySQLConnection:
+        """
+        Borrowing a healthy connection from the pool.
+
+        The most recently returned idle connection is preferred.  If there is none and the pool has not reached its size and overflow, a new connection is opened.  Otherwise, the caller waits for a connection to be returned.
+
+        Returns:
+            MySQLConnection: The borrowed connection.
+
+        Raises:
+            Relational_Database_Error: If the pool is exhausted for longer than the timeout or the connection cannot be established.
+        """
+        deadline: float = monotonic() + self.getTimeout()
+        connection: Optional[MySQLConnection] = None
+        expired: List[MySQLConnection] = []
+        with self.getCondition():
+            self.__verifyProcess()
+            while True:
+                expired += self.__pruneIdleConnections()
+                if self.getIdleConnections():
+                    connection = self.getIdleConnections().pop()[0]
+                    self.setCheckedOut(self.getCheckedOut() + 1)
+                    break
+                if self.getCheckedOut() < self.getSize() + self.getOverflow():
+                    self.setCheckedOut(self.getCheckedOut() + 1)
+                    break
+                remaining: float = deadline - monotonic()
+                if remaining <= 0:
+                    self.getLogger().error(f"The connection pool has been exhausted. - Checked Out: {self.getCheckedOut()}")
+                    raise Relational_Database_Error("The connection pool has been exhausted.")
+                self.getCondition().wait(remaining)
+        self.__discard(expired)
+        if connection is not None and self.__isHealthy(connection):
+            return connection
+        if connection is not None:
+            self.__discard([connection])
+        try:
+            return self.__create()
+        except Relational_Database_Error as error:
+            with self.getCondition():
+                self.setCheckedOut(self.getCheckedOut() - 1)
+                self.getCondition().notify()
+            raise error
+
+    def release(self, connection: MySQLConnection) -> None:
+        """
+        Returning a connection to the pool.
+
+        Any pending transaction is rolled back and any unread result is consumed so that the next borrower receives a clean session.  Overflow connections and connections which cannot be cleaned are closed.
+
+        Args:
+            connection (MySQLConnection): The connection to return.
+        """
+        is_reusable: bool = True
+        try:
+            if connection.unread_result:
+                connection.consume_results()
+            if connection.in_transaction:
+                connection.rollback()
+        except Relational_Database_Error as error:
+            self.getLogger().warn(f"The connection cannot be cleaned before being returned to the pool. - Error: {error}")
+            is_reusable = False
+        with self.getCondition():
+            if self.getProcessIdentifier() != getpid():
+                return
+            self.setCheckedOut(max(self.getCheckedOut() - 1, 0))
+            is_reusable = is_reusable and len(self.getIdleConnections()) < self.getSize()
+            if is_reusable:
+                self.getIdleConnections().append((connection, monotonic()))
+            self.getCondition().notify()
+        if not is_reusable:
+            self.__discard([connection])
+
+    def close(self) -> None:
+        """
+        Closing all the idle connections of the pool.  Borrowed connections are closed once they are returned.
+        """
+        with self.getCondition():
+            connections: List[MySQLConnection] = [connection for connection, _ in self.getIdleConnections()]
+            self.getIdleConnections().clear()
+        self.__discard(connections)
+        self.getLogger().inform(f"The connection pool has been closed. - Closed Connections: {len(connections)}")
+
+    def getStatistics(self) -> Dict[str, int]:
+        """
+        Retrieving the current state of the pool for monitoring purposes.
+
+        Returns:
+            Dict[str, int]: The amount of idle and checked out connections along with the limits of the pool.
+        """
+        with self.getCondition():
+            return {
+                "idle": len(self.getIdleConnections()),
+                "checked_out": self.getCheckedOut(),
+                "size": self.getSize(),
+                "overflow": self.getOverflow()
+            }
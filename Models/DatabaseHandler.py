@@ -10,9 +10,10 @@ from mysql.connector.cursor import MySQLCursor
 from Models.Logger import Extractio_Logger
 from Environment import Environment
 from mysql.connector.types import RowType
-from typing import Tuple, Any, List, Optional
+from typing import Tuple, Any, Callable, Iterator, List, Optional
 from mysql.connector import connect, Error as Relational_Database_Error
 from Models.DataSanitizer import Data_Sanitizer
+from Models.ConnectionPool import Connection_Pool
 
 
 class Database_Handler:
@@ -22,20 +23,27 @@ class Database_Handler:
     Attributes:
         __logger (Extractio_Logger): A logger instance for logging database operations and errors.
         __env (Environment): An instance of the Environment class to retrieve database connection parameters.
-        __connection (MySQLConnection): The MySQL connection object used to interact with the database.
+        __connection (Optional[MySQLConnection]): The MySQL connection object used to interact with the database.  In pooled mode, it is only set while a connection is borrowed from the pool.
         __cursor (Optional[MySQLCursor]): The MySQL cursor object used to execute database queries.
         __sanitizer (Data_Sanitizer): An instance of Data_Sanitizer for sanitizing user input data to prevent SQL injection attacks and ensure safe string usage.
+        __pool (Optional[Connection_Pool]): The pool the connections are borrowed from, or None when the handler owns a dedicated connection.
 
     Methods:
         __connect() -> MySQLConnection: Establishes a connection to the MySQL database.
         _execute(query: str, parameters: Optional[Tuple[Any, ...]] = None) -> None: Executes a SQL query with optional parameters.
         _closeCursor() -> None: Closes the current cursor if it exists.
         _commit() -> None: Commits the current transaction to the database.
+        _rollback() -> None: Rolls back the current transaction.
         _fetchAll() -> List[RowType]: Fetches all rows from the last executed query.
-        _closeConnection() -> None: Closes the database connection.
+        _closeConnection() -> None: Closes the database connection or returns it to the pool.
+        _abort() -> None: Releasing the cursor and the connection after a failed operation.
         __sanitizeParameters(parameters: Optional[Tuple[Any, ...]]) -> Optional[Tuple[Any, ...]]: Sanitizes the parameters using the Data_Sanitizer instance.
         getData(query: str, parameters: Optional[Tuple[Any, ...]] = None) -> List[RowType]: Fetches data from the database by executing a query with optional parameters.
+        streamData(query: str, parameters: Optional[Tuple[Any, ...]] = None, batch_size: int = 1000) -> Iterator[RowType]: Streams the rows of a query in batches.
         postData(query: str, parameters: Optional[Tuple[Any, ...]] = None) -> bool: Posts data to the database by executing a query with optional parameters.
+        postMany(query: str, rows: List[Tuple[Any, ...]], chunk_size: int = 500) -> Optional[List[int]]: Posts many rows to the database with multi-row inserts in a single transaction.
+        postManyInTransaction(statements: List[Tuple[str, Callable[[List[List[int]]], List[Tuple[Any, ...]]]]], chunk_size: int = 500) -> Optional[List[List[int]]]: Posts the rows of several insert queries in a single transaction.
+        executeInTransaction(statements: List[Tuple[str, Optional[Tuple[Any, ...]], bool]]) -> bool: Executes several queries in a single transaction.
         updateData(query: str, parameters: Optional[Tuple[Any, ...]] = None) -> bool: Updates data in the database by executing a query with optional parameters.
         deleteData(query: str, parameters: Optional[Tuple[Any, ...]] = None) -> bool: Deletes data from the database by executing a query with optional parameters.
         createTable(query: str, parameters: Optional[Tuple[Any, ...]] = None) -> bool: Creates a table in the database by executing a query with optional parameters.
@@ -48,9 +56,9 @@ class Database_Handler:
     """
     An instance of the Environment class to retrieve database connection parameters.
     """
-    __connection: MySQLConnection
+    __connection: Optional[MySQLConnection]
     """
-    The MySQL connection object used to interact with the database.
+    The MySQL connection object used to interact with the database.  In pooled mode, it is only set while a connection is borrowed from the pool.
     """
     __cursor: Optional[MySQLCursor]
     """
@@ -60,27 +68,38 @@ class Database_Handler:
     """
     An instance of Data_Sanitizer for sanitizing user input data to prevent SQL injection attacks and ensure safe string usage.
     """
+    __pool: Optional[Connection_Pool]
+    """
+    The pool the connections are borrowed from, or None when the handler owns a dedicated connection.
+    """
 
     def __init__(
         self,
         logger: Optional[Extractio_Logger] = None,
         environment: Optional[Environment] = None,
-        sanitizer: Optional[Data_Sanitizer] = None
+        sanitizer: Optional[Data_Sanitizer] = None,
+        pool: Optional[Connection_Pool] = None,
+        pooled: bool = True
     ):
         """
         Initializing the database handler.
 
+        In pooled mode, which is the default, no connection is opened here: a connection is borrowed from the process-wide pool when the first query is executed and is returned to it once the operation is done.
+
         Args:
             logger (ExtractioLogger): Logger instance.
             environment (Environment): Environment instance for DB config.
             sanitizer (Data_Sanitizer): Data sanitizer instance for sanitizing user input data.
+            pool (Optional[Connection_Pool]): The pool to borrow the connections from.  The process-wide pool is used when it is not provided.
+            pooled (bool): Whether the connections are borrowed from a pool instead of being dedicated to the handler.
 
         Raises:
             RelationalDatabaseError: If the database connection fails.
         """
         self.setLogger(logger or Extractio_Logger(__name__))
         self.setEnv(environment or Environment())
-        self.setConnection(self.__connect())
+        self.setPool((pool or Connection_Pool.getInstance(self.getEnv())) if pooled else None)
+        self.setConnection(None if pooled else self.__connect())
         self.setCursor(None)
         self.setSanitizer(sanitizer or Data_Sanitizer())
 
@@ -96,10 +115,10 @@ class Database_Handler:
     def setEnv(self, env: Environment) -> None:
         self.__env = env
 
-    def getConnection(self) -> MySQLConnection:
+    def getConnection(self) -> Optional[MySQLConnection]:
         return self.__connection
 
-    def setConnection(self, connection: MySQLConnection) -> None:
+    def setConnection(self, connection: Optional[MySQLConnection]) -> None:
         self.__connection = connection
 
     def getCursor(self) -> Optional[MySQLCursor]:
@@ -114,6 +133,12 @@ class Database_Handler:
     def setSanitizer(self, sanitizer: Data_Sanitizer) -> None:
         self.__sanitizer = sanitizer
 
+    def getPool(self) -> Optional[Connection_Pool]:
+        return self.__pool
+
+    def setPool(self, pool: Optional[Connection_Pool]) -> None:
+        self.__pool = pool
+
     def __sanitizeParameters(self, parameters: Optional[Tuple[Any, ...]]) -> Optional[Tuple[Any, ...]]:
         """
         Sanitizing the parameters using the Data_Sanitizer instance.
@@ -166,8 +191,10 @@ class Database_Handler:
         Raises:
             Relational_Database_Error: If the query execution fails.
         """
-        if not self.getConnection().is_connected():
-            self.getConnection().connect()
+        if self.getPool() is not None and self.getConnection() is None:
+            self.setConnection(self.getPool().acquire()) # type: ignore
+        elif self.getPool() is None and not self.getConnection().is_connected(): # type: ignore
+            self.getConnection().connect() # type: ignore
         if self.getCursor() is None:
             self.setCursor(
                 self.getConnection().cursor( # type: ignore
@@ -208,13 +235,29 @@ class Database_Handler:
             Relational_Database_Error: If the commit operation fails.
         """
         try:
-            self.getConnection().commit()
+            self.getConnection().commit() # type: ignore
             self.getLogger().inform("The transaction has been successfully committed.")
         except Relational_Database_Error as error:
-            self.getConnection().rollback()
+            self.getConnection().rollback() # type: ignore
             self.getLogger().error(f"The database handler has failed to commit the transaction, hence, the trasaction will roolback. - Error: {error}")
             raise error
 
+    def _rollback(self) -> None:
+        """
+        Rolling back the current database transaction.
+
+        Raises:
+            Relational_Database_Error: If the rollback operation fails.
+        """
+        if self.getConnection() is None:
+            return
+        try:
+            self.getConnection().rollback() # type: ignore
+            self.getLogger().inform("The transaction has been successfully rolled back.")
+        except Relational_Database_Error as error:
+            self.getLogger().error(f"The database handler has failed to roll back the transaction. - Error: {error}")
+            raise error
+
     def _fetchAll(self) -> List[RowType]:
         """
         Fetching all rows from the last executed query.
@@ -240,21 +283,39 @@ class Database_Handler:
         """
         Closing the database connection.
 
-        This method closes the established database connection.  If the connection is already closed, it logs a warning message.
+        This method closes the established database connection.  If the connection is already closed, it logs a warning message.  In pooled mode, the connection is returned to the pool instead of being closed.
 
         Raises:
             Relational_Database_Error: If the connection closing operation fails.
         """
-        if not self.getConnection().is_connected():
+        if self.getPool() is not None:
+            if self.getConnection() is not None:
+                self.getPool().release(self.getConnection()) # type: ignore
+                self.setConnection(None)
+            return
+        if not self.getConnection().is_connected(): # type: ignore
             self.getLogger().warn("The database connection is already closed.")
             return
         try:
-            self.getConnection().close()
+            self.getConnection().close() # type: ignore
             self.getLogger().inform("The database handler has successfully closed the connection.")
         except Relational_Database_Error as error:
             self.getLogger().error(f"The database handler has failed to close the connection. - Error: {error}")
             raise error
 
+    def _abort(self) -> None:
+        """
+        Releasing the cursor and the connection after a failed operation so that a borrowed connection is never leaked from the pool.  The pool rolls back any pending transaction when the connection is returned.
+        """
+        try:
+            self._closeCursor()
+        except Relational_Database_Error:
+            self.setCursor(None)
+        try:
+            self._closeConnection()
+        except Relational_Database_Error:
+            self.setConnection(None if self.getPool() is not None else self.getConnection())
+
     def getData(
         self,
         query: str,
@@ -281,8 +342,49 @@ class Database_Handler:
             return response
         except Relational_Database_Error as error:
             self.getLogger().error(f"The database handler has failed to get data. - Query: {query} - Parameters: {parameters} - Error: {error}")
+            self._abort()
             return []
 
+    def streamData(
+        self,
+        query: str,
+        parameters: Optional[Tuple[Any, ...]] = None,
+        batch_size: int = 1000
+    ) -> Iterator[RowType]:
+        """
+        Streaming the rows of a query by fetching them in batches, so that the memory used does not depend on the amount of rows.  The connection is held until the rows have all been read or the iteration is stopped.
+
+        Unlike the other operations, a failure is raised, as a partial result cannot be told apart from a complete one.
+
+        Args:
+            query (str): The SQL query to execute.
+            parameters (Optional[Tuple[Any, ...]]): Parameters for the SQL query.
+            batch_size (int): The maximum amount of rows fetched at once.
+
+        Returns:
+            Iterator[RowType]: The rows returned by the executed query.
+
+        Raises:
+            Relational_Database_Error: If the execution or fetching of data fails.
+        """
+        is_complete: bool = False
+        try:
+            self._execute(query, parameters)
+            while True:
+                rows: List[RowType] = self.getCursor().fetchmany(batch_size) # type: ignore
+                if not rows:
+                    break
+                yield from rows
+            is_complete = True
+            self._closeCursor()
+            self._closeConnection()
+        except Relational_Database_Error as error:
+            self.getLogger().error(f"The database handler has failed to stream data. - Query: {query} - Parameters: {parameters} - Error: {error}")
+            raise error
+        finally:
+            if not is_complete:
+                self._abort()
+
     def postData(
         self,
         query: str,
@@ -306,6 +408,160 @@ class Database_Handler:
             return True
         except Relational_Database_Error as error:
             self.getLogger().error(f"The database handler has failed to post data. - Query: {query} - Parameters: {parameters} - Error: {error}")
+            self._abort()
+            return False
+
+    def __expandValues(self, query: str, amount: int) -> str:
+        """
+        Repeating the row of the `VALUES` clause of an insert query so that it inserts many rows at once.
+
+        Args:
+            query (str): The insert query containing a single row, for example `INSERT INTO Visitor (timestamp, client) VALUES (%s, %s)`.
+            amount (int): The amount of rows to insert.
+
+        Returns:
+            str: The insert query containing the rows.
+
+        Raises:
+            ValueError: If the query does not have a `VALUES` clause.
+        """
+        start: int = query.upper().find("VALUES")
+        opening: int = query.find("(", start)
+        if start == -1 or opening == -1:
+            raise ValueError(f"The query does not have a VALUES clause. - Query: {query}")
+        depth: int = 0
+        for index in range(opening, len(query)):
+            depth += 1 if query[index] == "(" else -1 if query[index] == ")" else 0
+            if depth == 0:
+                row: str = query[opening:index + 1]
+                return f"{query[:opening]}{', '.join([row] * amount)}{query[index + 1:]}"
+        raise ValueError(f"The VALUES clause of the query is not closed. - Query: {query}")
+
+    def postMany(
+        self,
+        query: str,
+        rows: List[Tuple[Any, ...]],
+        chunk_size: int = 500
+    ) -> Optional[List[int]]:
+        """
+        Posting many rows to the database by expanding the single row of an insert query into multi-row inserts of `chunk_size` rows which are all executed in a single transaction.
+
+        The generated identifiers are derived from the identifier of the first row of each chunk, which is only reliable when the auto-increment values of a multi-row insert are consecutive, that is, with `innodb_autoinc_lock_mode` set to 0 or 1, or with 2 when no other insert runs concurrently on the table.
+
+        Args:
+            query (str): The insert query for a single row.
+            rows (List[Tuple[Any, ...]]): The parameters of each row.
+            chunk_size (int): The maximum amount of rows inserted by a single statement.
+
+        Returns:
+            Optional[List[int]]: The generated identifiers in the order of the rows, an empty list if the table does not generate identifiers, or None if the operation failed, in which case, nothing has been inserted.
+        """
+        if not rows:
+            return []
+        try:
+            identifiers: List[int] = self.__insertMany(query, rows, chunk_size)
+            self._commit()
+            self._closeCursor()
+            self._closeConnection()
+            return identifiers
+        except (Relational_Database_Error, ValueError) as error:
+            self.getLogger().error(f"The database handler has failed to post many rows. - Query: {query} - Rows: {len(rows)} - Error: {error}")
+            try:
+                self._rollback()
+            except Relational_Database_Error:
+                pass
+            self._abort()
+            return None
+
+    def __insertMany(self, query: str, rows: List[Tuple[Any, ...]], chunk_size: int) -> List[int]:
+        """
+        Executing multi-row inserts of `chunk_size` rows without committing them.
+
+        Args:
+            query (str): The insert query for a single row.
+            rows (List[Tuple[Any, ...]]): The parameters of each row.
+            chunk_size (int): The maximum amount of rows inserted by a single statement.
+
+        Returns:
+            List[int]: The generated identifiers in the order of the rows, or an empty list if the table does not generate identifiers.
+
+        Raises:
+            Relational_Database_Error: If the execution fails.
+        """
+        identifiers: List[int] = []
+        for offset in range(0, len(rows), chunk_size):
+            chunk: List[Tuple[Any, ...]] = rows[offset:offset + chunk_size]
+            parameters: Tuple[Any, ...] = tuple(value for row in chunk for value in row)
+            self._execute(self.__expandValues(query, len(chunk)), parameters)
+            first_identifier: int = int(self.getCursor().lastrowid or 0) # type: ignore
+            identifiers += [first_identifier + index for index in range(len(chunk))] if first_identifier else []
+            self._closeCursor()
+        return identifiers
+
+    def postManyInTransaction(
+        self,
+        statements: List[Tuple[str, Callable[[List[List[int]]], List[Tuple[Any, ...]]]]],
+        chunk_size: int = 500
+    ) -> Optional[List[List[int]]]:
+        """
+        Posting the rows of several insert queries with multi-row inserts which are all executed in a single transaction, in order, so that the rows of a query can reference the identifiers generated by the previous ones.
+
+        Args:
+            statements (List[Tuple[str, Callable[[List[List[int]]], List[Tuple[Any, ...]]]]]): The insert query for a single row of each table along with the function building its rows from the identifiers generated by the previous queries.
+            chunk_size (int): The maximum amount of rows inserted by a single statement.
+
+        Returns:
+            Optional[List[List[int]]]: The generated identifiers of each query, or None if the operation failed, in which case, nothing has been inserted.
+        """
+        generated_identifiers: List[List[int]] = []
+        try:
+            for query, build_rows in statements:
+                rows: List[Tuple[Any, ...]] = build_rows(generated_identifiers)
+                generated_identifiers.append(self.__insertMany(query, rows, chunk_size) if rows else [])
+            self._commit()
+            self._closeCursor()
+            self._closeConnection()
+            return generated_identifiers
+        except (Relational_Database_Error, ValueError) as error:
+            self.getLogger().error(f"The database handler has failed to post the rows in a transaction. - Statements: {len(statements)} - Error: {error}")
+            try:
+                self._rollback()
+            except Relational_Database_Error:
+                pass
+            self._abort()
+            return None
+
+    def executeInTransaction(self, statements: List[Tuple[str, Optional[Tuple[Any, ...]], bool]]) -> bool:
+        """
+        Executing several queries in a single transaction, which is rolled back if any of them fails or if a required query does not affect any row.
+
+        Args:
+            statements (List[Tuple[str, Optional[Tuple[Any, ...]], bool]]): The queries along with their parameters and whether they must affect a row for the transaction to be committed.
+
+        Returns:
+            bool: True if the transaction has been committed, otherwise False.
+        """
+        try:
+            for query, parameters, is_required in statements:
+                self._execute(query, parameters)
+                affected_rows: int = int(self.getCursor().rowcount) # type: ignore
+                self._closeCursor()
+                if is_required and affected_rows < 1:
+                    self.getLogger().warn(f"The transaction is rolled back as a required query has not affected any row. - Query: {query}")
+                    self._rollback()
+                    self._closeConnection()
+                    return False
+            self._commit()
+            self._closeCursor()
+            self._closeConnection()
+            return True
+        except Relational_Database_Error as error:
+            self.getLogger().error(f"The database handler has failed to execute the transaction. - Statements: {len(statements)} - Error: {error}")
+            try:
+                self._rollback()
+            except Relational_Database_Error:
+                pass
+            self._abort()
             return False
 
     def updateData(
@@ -331,6 +587,7 @@ class Database_Handler:
             return True
         except Relational_Database_Error as error:
             self.getLogger().error(f"The database handler has failed to update data. - Query: {query} - Parameters: {parameters} - Error: {error}")
+            self._abort()
             return False
 
     def deleteData(
@@ -356,6 +613,7 @@ class Database_Handler:
             return True
         except Relational_Database_Error as error:
             self.getLogger().error(f"The database handler has failed to delete data. - Query: {query} - Parameters: {parameters} - Error: {error}")
+            self._abort()
             return False
 
     def createTable(
@@ -381,4 +639,5 @@ class Database_Handler:
             return True
         except Relational_Database_Error as error:
             self.getLogger().error(f"The database handler has failed to create the table. - Query: {query} - Parameters: {parameters} - Error: {error}")
+            self._abort()
             return False
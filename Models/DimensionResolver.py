@@ -0,0 +1,254 @@
+"""
+The module provides the resolver of the dimensions of the analytics, which maps the natural key of a dimension to its surrogate identifier.
+
+Author:
+    Darkness4869
+"""
+from Models.TableModel import Table_Model, Database_Handler, RowType
+from Models.LeastRecentlyUsedCache import Least_Recently_Used_Cache
+from Models.Logger import Extractio_Logger
+from threading import Lock
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+
+class Dimension_Resolver:
+    """
+    A resolver which caches the identifier of the rows of the dimension tables of the analytics, such as the event types, the devices and the network locations, by their natural key.
+
+    A cached dimension costs no query.  On a miss, the identifier is selected by the natural key and, if the row does not exist, it is inserted with `INSERT ... ON DUPLICATE KEY UPDATE identifier = LAST_INSERT_ID(identifier)`, whose identifier is read from the cursor of the same connection.  When the natural key has a unique index, concurrent workers inserting the same dimension therefore resolve to the same row.
+
+    Attributes:
+        __instance (Optional[Dimension_Resolver]): The resolver shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared resolver.
+        __caches (Dict[str, Least_Recently_Used_Cache]): The cache of the identifiers of each table.
+        __maximum_size (int): The maximum amount of identifiers cached per table.
+        __time_to_live (Optional[float]): The amount of seconds during which an identifier is cached.
+        __lock (Lock): The lock protecting the creation of the caches.
+        __logger (Extractio_Logger): The logger of the resolver.
+        ok (int): The status code for ok.
+        created (int): The status code for created.
+        service_unavailable (int): The status code for the service unavailable.
+
+    Methods:
+        getInstance() -> Dimension_Resolver: Retrieving the resolver shared by the whole process.
+        resolve(dimension: Table_Model, natural_key: Tuple[str, ...]) -> Dict[str, int]: Resolving the identifier of a dimension.
+        prefetch(dimension: Table_Model, natural_key: Tuple[str, ...]) -> int: Caching the identifiers of every row of a dimension table.
+        getStatistics() -> Dict[str, Dict[str, Any]]: Retrieving the statistics of the cache of each table.
+    """
+    __instance: Optional["Dimension_Resolver"] = None
+    """
+    The resolver shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared resolver.
+    """
+    __caches: Dict[str, Least_Recently_Used_Cache]
+    """
+    The cache of the identifiers of each table.
+    """
+    __maximum_size: int
+    """
+    The maximum amount of identifiers cached per table.
+    """
+    __time_to_live: Optional[float]
+    """
+    The amount of seconds during which an identifier is cached.
+    """
+    __lock: Lock
+    """
+    The lock protecting the creation of the caches.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the resolver.
+    """
+    ok: int = 200
+    """
+    The status code for ok.
+    """
+    created: int = 201
+    """
+    The status code for created.
+    """
+    service_unavailable: int = 503
+    """
+    The status code for the service unavailable.
+    """
+
+    def __init__(self, maximum_size: int = 4096, time_to_live: Optional[float] = 3600):
+        """
+        Initializing the resolver.
+
+        Args:
+            maximum_size (int): The maximum amount of identifiers cached per table.
+            time_to_live (Optional[float]): The amount of seconds during which an identifier is cached.
+        """
+        self.setCaches({})
+        self.setMaximumSize(maximum_size)
+        self.setTimeToLive(time_to_live)
+        self.setLock(Lock())
+        self.setLogger(Extractio_Logger(__name__))
+
+    def getCaches(self) -> Dict[str, Least_Recently_Used_Cache]:
+        return self.__caches
+
+    def setCaches(self, caches: Dict[str, Least_Recently_Used_Cache]) -> None:
+        self.__caches = caches
+
+    def getMaximumSize(self) -> int:
+        return self.__maximum_size
+
+    def setMaximumSize(self, maximum_size: int) -> None:
+        self.__maximum_size = maximum_size
+
+    def getTimeToLive(self) -> Optional[float]:
+        return self.__time_to_live
+
+    def setTimeToLive(self, time_to_live: Optional[float]) -> None:
+        self.__time_to_live = time_to_live
+
+    def getLock(self) -> Lock:
+        return self.__lock
+
+    def setLock(self, lock: Lock) -> None:
+        self.__lock = lock
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    @classmethod
+    def getInstance(cls) -> "Dimension_Resolver":
+        """
+        Retrieving the resolver shared by the whole process, creating it on the first call.
+
+        Returns:
+            Dimension_Resolver: The resolver shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls()
+            return cls.__instance
+
+    def getCache(self, table_name: str) -> Least_Recently_Used_Cache:
+        """
+        Retrieving the cache of the identifiers of a table, creating it on the first call.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            Least_Recently_Used_Cache
+        """
+        cache: Optional[Least_Recently_Used_Cache] = self.getCaches().get(table_name)
+        if cache is not None:
+            return cache
+        with self.getLock():
+            if table_name not in self.getCaches():
+                self.getCaches()[table_name] = Least_Recently_Used_Cache(self.getMaximumSize(), self.getTimeToLive())
+            return self.getCaches()[table_name]
+
+    def resolve(self, dimension: Table_Model, natural_key: Tuple[str, ...]) -> Dict[str, int]:
+        """
+        Resolving the identifier of a dimension from the cache, from the database or by inserting it.
+
+        Args:
+            dimension (Table_Model): The model instance of the dimension containing the values of its columns.
+            natural_key (Tuple[str, ...]): The columns identifying the dimension.
+
+        Returns:
+            {status: int, identifier: int}
+        """
+        cache: Least_Recently_Used_Cache = self.getCache(dimension.getTableName())
+        key: Hashable = tuple(getattr(dimension, field) for field in natural_key)
+        identifier: Optional[int] = cache.get(key)
+        if identifier is not None:
+            return {
+                "status": self.ok,
+                "identifier": identifier
+            }
+        identifier = self.__select(dimension, natural_key, key) # type: ignore
+        status: int = self.ok
+        if identifier is None:
+            identifier = self.__insert(dimension)
+            status = self.created
+        if identifier is None:
+            return {
+                "status": self.service_unavailable,
+                "identifier": 0
+            }
+        cache.set(key, identifier)
+        return {
+            "status": status,
+            "identifier": identifier
+        }
+
+    def __select(self, dimension: Table_Model, natural_key: Tuple[str, ...], key: Tuple[Any, ...]) -> Optional[int]:
+        """
+        Selecting the identifier of a dimension by its natural key.
+
+        Args:
+            dimension (Table_Model): The model instance of the dimension.
+            natural_key (Tuple[str, ...]): The columns identifying the dimension.
+            key (Tuple[Any, ...]): The values of the natural key.
+
+        Returns:
+            Optional[int]: The identifier, or None if the dimension does not exist.
+        """
+        conditions: str = " AND ".join([f"{field} = %s" for field in natural_key])
+        query: str = f"SELECT {dimension.getPrimaryField()} AS identifier FROM {dimension.getTableName()} WHERE {conditions} ORDER BY {dimension.getPrimaryField()} LIMIT 1"
+        response: List[RowType] = dimension.getDatabaseHandler().getData(query, key)
+        return int(response[0]["identifier"]) if response else None # type: ignore
+
+    def __insert(self, dimension: Table_Model) -> Optional[int]:
+        """
+        Inserting a dimension, the identifier of the existing row being returned if the natural key has a unique index and the dimension already exists.
+
+        Args:
+            dimension (Table_Model): The model instance of the dimension.
+
+        Returns:
+            Optional[int]: The identifier, or None if the insertion has failed.
+        """
+        primary_field: str = dimension.getPrimaryField()
+        fields: List[str] = [field for field in dimension.getFields() if field != primary_field]
+        placeholders: str = ", ".join(["%s"] * len(fields))
+        query: str = f"INSERT INTO {dimension.getTableName()} ({', '.join(fields)}) VALUES ({placeholders}) ON DUPLICATE KEY UPDATE {primary_field} = LAST_INSERT_ID({primary_field})"
+        identifiers: Optional[List[int]] = dimension.getDatabaseHandler().postMany(query, [tuple(getattr(dimension, field, None) for field in fields)], 1)
+        if not identifiers:
+            self.getLogger().error(f"The dimension cannot be inserted. - Table: {dimension.getTableName()}")
+            return None
+        return identifiers[0]
+
+    def prefetch(self, dimension: Table_Model, natural_key: Tuple[str, ...]) -> int:
+        """
+        Caching the identifiers of every row of a small dimension table.
+
+        Args:
+            dimension (Table_Model): A model instance of the dimension table.
+            natural_key (Tuple[str, ...]): The columns identifying the dimension.
+
+        Returns:
+            int: The amount of identifiers which have been cached.
+        """
+        cache: Least_Recently_Used_Cache = self.getCache(dimension.getTableName())
+        query: str = f"SELECT {dimension.getPrimaryField()} AS identifier, {', '.join(natural_key)} FROM {dimension.getTableName()}"
+        response: List[RowType] = dimension.getDatabaseHandler().getData(query)
+        for row in response:
+            cache.set(tuple(row[field] for field in natural_key), int(row["identifier"])) # type: ignore
+        self.getLogger().inform(f"The dimension has been prefetched. - Table: {dimension.getTableName()} - Amount: {len(response)}")
+        return len(response)
+
+    def getStatistics(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        Retrieving the statistics of the cache of each table.
+
+        Returns:
+            Dict[str, Dict[str, Union[int, float]]]
+        """
+        return {table_name: cache.getStatistics() for table_name, cache in list(self.getCaches().items())}
@@ -0,0 +1,342 @@
+"""
+The module provides the coordinator of the downloads, which ensures that a media file is only downloaded once at a time across the workers of the application.
+
+Author:
+    Darkness4869
+"""
+from Models.Logger import Extractio_Logger
+from Environment import Environment
+from threading import Lock
+from time import sleep, time
+from os import fstat, makedirs, remove, replace, stat
+from os.path import exists, isfile, join, splitext
+from fcntl import flock, LOCK_EX, LOCK_NB, LOCK_UN
+from typing import Callable, Dict, IO, Optional
+
+
+class Download_Coordinator:
+    """
+    A coordinator of the downloads of the media files, based on a lease file per media file.
+
+    The lease of a media file is an exclusive lock on its lease file, which the operating system releases when its holder dies.  The holder of the lease downloads the media in a partial file which is renamed to the media file once it is complete, hence, the media file is never seen partially written.  The other requesters wait for the lease and, once they hold it, attach to the result of the download if the media file exists or download it themselves if the download has failed.  The lease file is removed by its holder before the lease is released, hence, the lease files do not accumulate, and a requester which has locked a lease file that has been removed in the meantime opens the current one again.
+
+    Attributes:
+        __instance (Optional[Download_Coordinator]): The coordinator shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared coordinator.
+        __directory (str): The directory of the lease files.
+        __timeout (float): The amount of seconds a requester waits for the download of another requester.
+        __poll_interval (float): The amount of seconds between two attempts to acquire a lease.
+        __lock (Lock): The lock protecting the counters.
+        __downloads (int): The amount of downloads.
+        __attachments (int): The amount of requests which have been served by the download of another requester.
+        __logger (Extractio_Logger): The logger of the coordinator.
+
+    Methods:
+        getInstance() -> Download_Coordinator: Retrieving the coordinator shared by the whole process.
+        getPartialFilePath(file_path: str) -> str: Retrieving the path of the partial file of a media file.
+        isLeased(file_path: str) -> bool: Verifying whether a media file is being downloaded.
+        download(file_path: str, function: Callable[[str], None], on_complete: Optional[Callable[[str], None]]) -> str: Downloading a media file unless it is downloaded by another requester.
+        getStatistics() -> Dict[str, int]: Retrieving the counters of the coordinator.
+    """
+    __instance: Optional["Download_Coordinator"] = None
+    """
+    The coordinator shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared coordinator.
+    """
+    __directory: str
+    """
+    The directory of the lease files.
+    """
+    __timeout: float
+    """
+    The amount of seconds a requester waits for the download of another requester.
+    """
+    __poll_interval: float
+    """
+    The amount of seconds between two attempts to acquire a lease.
+    """
+    __lock: Lock
+    """
+    The lock protecting the counters.
+    """
+    __downloads: int
+    """
+    The amount of downloads.
+    """
+    __attachments: int
+    """
+    The amount of requests which have been served by the download of another requester.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the coordinator.
+    """
+
+    def __init__(self, directory: str, timeout: float = 1800.0, poll_interval: float = 0.5):
+        """
+        Initializing the coordinator.
+
+        Args:
+            directory (str): The directory of the lease files.
+            timeout (float): The amount of seconds a requester waits for the download of another requester.
+            poll_interval (float): The amount of seconds between two attempts to acquire a lease.
+        """
+        self.setDirectory(directory)
+        self.setTimeout(timeout)
+        self.setPollInterval(poll_interval)
+        self.setLock(Lock())
+        self.setDownloads(0)
+        self.setAttachments(0)
+        self.setLogger(Extractio_Logger(__name__))
+        if not exists(directory):
+            makedirs(directory, exist_ok=True)
+
+    def getDirectory(self) -> str:
+        return self.__directory
+
+    def setDirectory(self, directory: str) -> None:
+        self.__directory = directory
+
+    def getTimeout(self) -> float:
+        return self.__timeout
+
+    def setTimeout(self, timeout: float) -> None:
+        self.__timeout = timeout
+
+    def getPollInterval(self) -> float:
+        return self.__poll_interval
+
+    def setPollInterval(self, poll_interval: float) -> None:
+        self.__poll_interval = poll_interval
+
+    def getLock(self) -> Lock:
+        return self.__lock
+
+    def setLock(self, lock: Lock) -> None:
+        self.__lock = lock
+
+    def getDownloads(self) -> int:
+        return self.__downloads
+
+    def setDownloads(self, downloads: int) -> None:
+        self.__downloads = downloads
+
+    def getAttachments(self) -> int:
+        return self.__attachments
+
+    def setAttachments(self, attachments: int) -> None:
+        self.__attachments = attachments
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    @classmethod
+    def getInstance(cls) -> "Download_Coordinator":
+        """
+        Retrieving the coordinator shared by the whole process, creating it on the first call with its lease files in the cache directory of the application.
+
+        Returns:
+            Download_Coordinator: The coordinator shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls(f"{Environment().getDirectory()}/Cache/Downloads")
+            return cls.__instance
+
+    def getPartialFilePath(self, file_path: str) -> str:
+        """
+        Retrieving the path of the partial file of a media file, which keeps its extension so that the downloader produces the same container.
+
+        Args:
+            file_path (str): The path of the media file.
+
+        Returns:
+            str
+        """
+        root, extension = splitext(file_path)
+        return f"{root}.partial{extension}"
+
+    def __getLeaseFilePath(self, file_path: str) -> str:
+        """
+        Retrieving the path of the lease file of a media file, which is named after the last directories of the media file so that the audio, the video and the shorts of the same media have their own lease.
+
+        Args:
+            file_path (str): The path of the media file.
+
+        Returns:
+            str
+        """
+        name: str = "_".join(file_path.replace("\\", "/").split("/")[-3:])
+        return join(self.getDirectory(), f"{name}.lease")
+
+    def __acquire(self, file: IO[str], deadline: float) -> bool:
+        """
+        Acquiring the lease of a media file, waiting until the deadline.
+
+        Args:
+            file (IO[str]): The lease file.
+            deadline (float): The UNIX time until which the lease is awaited.
+
+        Returns:
+            bool
+        """
+        while True:
+            try:
+                flock(file.fileno(), LOCK_EX | LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time() >= deadline:
+                    return False
+                sleep(self.getPollInterval())
+
+    def __isCurrent(self, file: IO[str], lease_file_path: str) -> bool:
+        """
+        Verifying whether a lease file which has been opened is still the one at its path, as it may have been removed by its previous holder while its lock was awaited.
+
+        Args:
+            file (IO[str]): The lease file.
+            lease_file_path (str): The path of the lease file.
+
+        Returns:
+            bool
+        """
+        try:
+            opened = fstat(file.fileno())
+            current = stat(lease_file_path)
+        except FileNotFoundError:
+            return False
+        return opened.st_ino == current.st_ino and opened.st_dev == current.st_dev
+
+    def __open(self, file_path: str) -> IO[str]:
+        """
+        Opening the lease file of a media file and acquiring its lease, waiting until the timeout.
+
+        Args:
+            file_path (str): The path of the media file.
+
+        Returns:
+            IO[str]: The lease file whose lease is held.
+
+        Raises:
+            TimeoutError: If the lease has not been acquired before the timeout.
+        """
+        lease_file_path: str = self.__getLeaseFilePath(file_path)
+        deadline: float = time() + self.getTimeout()
+        is_logged: bool = False
+        while True:
+            file: IO[str] = open(lease_file_path, "a")
+            is_waiting: bool = not self.__acquire(file, 0.0)
+            if is_waiting and not is_logged:
+                self.getLogger().inform(f"The media file is being downloaded by another requester. - File Path: {file_path}")
+                is_logged = True
+            if is_waiting and not self.__acquire(file, deadline):
+                file.close()
+                self.getLogger().error(f"The download of the media file has timed out. - File Path: {file_path} - Timeout: {self.getTimeout()}")
+                raise TimeoutError(f"The download of the media file has timed out. - File Path: {file_path}")
+            if self.__isCurrent(file, lease_file_path):
+                return file
+            flock(file.fileno(), LOCK_UN)
+            file.close()
+
+    def __release(self, file: IO[str], file_path: str) -> None:
+        """
+        Removing the lease file of a media file and releasing its lease.
+
+        Args:
+            file (IO[str]): The lease file whose lease is held.
+            file_path (str): The path of the media file.
+        """
+        try:
+            remove(self.__getLeaseFilePath(file_path))
+        except FileNotFoundError:
+            pass
+        finally:
+            flock(file.fileno(), LOCK_UN)
+            file.close()
+
+    def isLeased(self, file_path: str) -> bool:
+        """
+        Verifying whether a media file is being downloaded, without creating its lease file.
+
+        Args:
+            file_path (str): The path of the media file.
+
+        Returns:
+            bool
+        """
+        try:
+            file: IO[str] = open(self.__getLeaseFilePath(file_path), "r")
+        except FileNotFoundError:
+            return False
+        with file:
+            if not self.__acquire(file, 0.0):
+                return True
+            flock(file.fileno(), LOCK_UN)
+            return False
+
+    def download(self, file_path: str, function: Callable[[str], None], on_complete: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Downloading a media file under its lease, unless it has been downloaded by another requester while the lease was awaited.
+
+        Args:
+            file_path (str): The path of the media file.
+            function (Callable[[str], None]): The download of the media in the partial file whose path is given.
+            on_complete (Optional[Callable[[str], None]]): The callback called under the lease with the path of the media file once it has been downloaded, which is not called when the requester has attached to another download.
+
+        Returns:
+            str: The path of the media file.
+
+        Raises:
+            TimeoutError: If the lease has not been acquired before the timeout.
+        """
+        file: IO[str] = self.__open(file_path)
+        try:
+            if isfile(file_path):
+                with self.getLock():
+                    self.setAttachments(self.getAttachments() + 1)
+                self.getLogger().inform(f"The media file has been downloaded by another requester. - File Path: {file_path}")
+                return file_path
+            self.__download(file_path, function)
+            if on_complete is not None:
+                on_complete(file_path)
+            return file_path
+        finally:
+            self.__release(file, file_path)
+
+    def __download(self, file_path: str, function: Callable[[str], None]) -> None:
+        """
+        Downloading a media file in its partial file and renaming it once it is complete.  The partial file left by an interrupted download is removed beforehand as the downloader would consider it complete.
+
+        Args:
+            file_path (str): The path of the media file.
+            function (Callable[[str], None]): The download of the media in the partial file whose path is given.
+        """
+        partial_file_path: str = self.getPartialFilePath(file_path)
+        if isfile(partial_file_path):
+            self.getLogger().warn(f"The partial file of an interrupted download has been removed. - File Path: {partial_file_path}")
+            remove(partial_file_path)
+        function(partial_file_path)
+        replace(partial_file_path, file_path)
+        with self.getLock():
+            self.setDownloads(self.getDownloads() + 1)
+
+    def getStatistics(self) -> Dict[str, int]:
+        """
+        Retrieving the counters of the coordinator.
+
+        Returns:
+            Dict[str, int]
+        """
+        with self.getLock():
+            return {
+                "downloads": self.getDownloads(),
+                "attachments": self.getAttachments()
+            }
@@ -0,0 +1,487 @@
+"""
+The module provides the queue of the download jobs, which decouples the download requests from the downloads and the merges of the media.
+
+Author:
+    Darkness4869
+"""
+from Models.DownloadJobStore import Download_Job_Store, Extractio_Logger
+from Models.DownloadProgressRegistry import Download_Progress_Registry
+from Models.Media import Media
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Event, Lock, Thread
+from functools import partial
+from atexit import register
+from multiprocessing import get_context
+from os import getpid
+from os.path import getsize, isfile
+from socket import gethostname
+from time import monotonic, time
+from urllib.parse import urlparse
+from typing import Any, Dict, List, Optional, Union
+
+
+def runDownloadJob(request: Dict[str, Union[str, None]]) -> Dict[str, Union[int, Dict[str, Union[str, int, None]]]]:
+    """
+    Running a download job in a worker process through the Media Management System.
+
+    Parameters:
+        request (Dict[str, Union[str, None]]): The request of the download.
+
+    Returns:
+        Dict[str, Union[int, Dict[str, Union[str, int, None]]]]
+    """
+    return Media(request).verifyPlatform()
+
+
+class Download_Job_Queue:
+    """
+    A queue of the download jobs executed by a bounded pool of worker processes, so that the downloads neither hold the workers of the application nor contend for the interpreter lock.
+
+    The download requests are persisted in the job store and answered with the identifier of their job.  The dispatcher thread claims the jobs from the store while the pool has a free worker, within the maximum amount of running jobs overall and per host of the media, and renews the leases of its running jobs.  The jobs left running by a dispatcher which has stopped are queued again once their lease expires, hence, a restart never loses a job.
+
+    Attributes:
+        __instance (Optional[Download_Job_Queue]): The queue shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared queue.
+        __store (Download_Job_Store): The persistent store of the download jobs.
+        __workers (int): The amount of worker processes.
+        __maximum_running (int): The maximum amount of running download jobs across the application.
+        __maximum_running_per_host (int): The maximum amount of running download jobs per host of the media.
+        __maximum_attempts (int): The maximum amount of attempts of a download job.
+        __lease_time (float): The amount of seconds a download job is leased before it must be renewed.
+        __poll_interval (float): The amount of seconds the dispatcher waits for a new download job.
+        __retention (float): The amount of seconds a completed or failed download job is kept.
+        __owner (str): The name of the dispatcher in the store.
+        __pool (Optional[ProcessPoolExecutor]): The pool of worker processes.
+        __running (Dict[str, Future]): The running download jobs of the dispatcher.
+        __thread (Optional[Thread]): The dispatcher thread.
+        __process_identifier (int): The identifier of the process which has started the dispatcher.
+        __wake_up (Event): The event waking the dispatcher up.
+        __stopping (Event): The event stopping the dispatcher.
+        __lock (Lock): The lock protecting the dispatcher and the running download jobs.
+        __logger (Extractio_Logger): The logger of the queue.
+        accepted (int): The status code for accepted.
+
+    Methods:
+        getInstance() -> Download_Job_Queue: Retrieving the queue shared by the whole process.
+        submit(request: Dict[str, Union[str, None]]) -> Dict[str, Any]: Queuing a download.
+        getJob(identifier: str) -> Optional[Dict[str, Any]]: Retrieving the state of a download job.
+        start() -> None: Starting the dispatcher.
+        stop() -> None: Stopping the dispatcher.
+    """
+    __instance: Optional["Download_Job_Queue"] = None
+    """
+    The queue shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared queue.
+    """
+    __store: Download_Job_Store
+    """
+    The persistent store of the download jobs.
+    """
+    __workers: int
+    """
+    The amount of worker processes.
+    """
+    __maximum_running: int
+    """
+    The maximum amount of running download jobs across the application.
+    """
+    __maximum_running_per_host: int
+    """
+    The maximum amount of running download jobs per host of the media.
+    """
+    __maximum_attempts: int
+    """
+    The maximum amount of attempts of a download job.
+    """
+    __lease_time: float
+    """
+    The amount of seconds a download job is leased before it must be renewed.
+    """
+    __poll_interval: float
+    """
+    The amount of seconds the dispatcher waits for a new download job.
+    """
+    __retention: float
+    """
+    The amount of seconds a completed or failed download job is kept.
+    """
+    __owner: str
+    """
+    The name of the dispatcher in the store.
+    """
+    __pool: Optional[ProcessPoolExecutor]
+    """
+    The pool of worker processes.
+    """
+    __running: Dict[str, Future]
+    """
+    The running download jobs of the dispatcher.
+    """
+    __thread: Optional[Thread]
+    """
+    The dispatcher thread.
+    """
+    __process_identifier: int
+    """
+    The identifier of the process which has started the dispatcher.
+    """
+    __wake_up: Event
+    """
+    The event waking the dispatcher up.
+    """
+    __stopping: Event
+    """
+    The event stopping the dispatcher.
+    """
+    __lock: Lock
+    """
+    The lock protecting the dispatcher and the running download jobs.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the queue.
+    """
+    accepted: int = 202
+    """
+    The status code for accepted.
+    """
+
+    def __init__(
+        self,
+        store: Optional[Download_Job_Store] = None,
+        workers: int = 2,
+        maximum_running: int = 4,
+        maximum_running_per_host: int = 2,
+        maximum_attempts: int = 3,
+        lease_time: float = 120.0,
+        poll_interval: float = 1.0,
+        retention: float = 86400.0
+    ):
+        """
+        Initializing the queue.
+
+        Args:
+            store (Optional[Download_Job_Store]): The persistent store of the download jobs.
+            workers (int): The amount of worker processes.
+            maximum_running (int): The maximum amount of running download jobs across the application.
+            maximum_running_per_host (int): The maximum amount of running download jobs per host of the media.
+            maximum_attempts (int): The maximum amount of attempts of a download job.
+            lease_time (float): The amount of seconds a download job is leased before it must be renewed.
+            poll_interval (float): The amount of seconds the dispatcher waits for a new download job.
+            retention (float): The amount of seconds a completed or failed download job is kept.
+        """
+        self.setStore(store or Download_Job_Store.getInstance())
+        self.setWorkers(workers)
+        self.setMaximumRunning(maximum_running)
+        self.setMaximumRunningPerHost(maximum_running_per_host)
+        self.setMaximumAttempts(maximum_attempts)
+        self.setLeaseTime(lease_time)
+        self.setPollInterval(poll_interval)
+        self.setRetention(retention)
+        self.setOwner(f"{gethostname()}:{getpid()}")
+        self.setPool(None)
+        self.setRunning({})
+        self.setThread(None)
+        self.setProcessIdentifier(getpid())
+        self.setWakeUp(Event())
+        self.setStopping(Event())
+        self.setLock(Lock())
+        self.setLogger(Extractio_Logger(__name__))
+
+    def getStore(self) -> Download_Job_Store:
+        return self.__store
+
+    def setStore(self, store: Download_Job_Store) -> None:
+        self.__store = store
+
+    def getWorkers(self) -> int:
+        return self.__workers
+
+    def setWorkers(self, workers: int) -> None:
+        self.__workers = workers
+
+    def getMaximumRunning(self) -> int:
+        return self.__maximum_running
+
+    def setMaximumRunning(self, maximum_running: int) -> None:
+        self.__maximum_running = maximum_running
+
+    def getMaximumRunningPerHost(self) -> int:
+        return self.__maximum_running_per_host
+
+    def setMaximumRunningPerHost(self, maximum_running_per_host: int) -> None:
+        self.__maximum_running_per_host = maximum_running_per_host
+
+    def getMaximumAttempts(self) -> int:
+        return self.__maximum_attempts
+
+    def setMaximumAttempts(self, maximum_attempts: int) -> None:
+        self.__maximum_attempts = maximum_attempts
+
+    def getLeaseTime(self) -> float:
+        return self.__lease_time
+
+    def setLeaseTime(self, lease_time: float) -> None:
+        self.__lease_time = lease_time
+
+    def getPollInterval(self) -> float:
+        return self.__poll_interval
+
+    def setPollInterval(self, poll_interval: float) -> None:
+        self.__poll_interval = poll_interval
+
+    def getRetention(self) -> float:
+        return self.__retention
+
+    def setRetention(self, retention: float) -> None:
+        self.__retention = retention
+
+    def getOwner(self) -> str:
+        return self.__owner
+
+    def setOwner(self, owner: str) -> None:
+        self.__owner = owner
+
+    def getPool(self) -> Optional[ProcessPoolExecutor]:
+        return self.__pool
+
+    def setPool(self, pool: Optional[ProcessPoolExecutor]) -> None:
+        self.__pool = pool
+
+    def getRunning(self) -> Dict[str, Future]:
+        return self.__running
+
+    def setRunning(self, running: Dict[str, Future]) -> None:
+        self.__running = running
+
+    def getThread(self) -> Optional[Thread]:
+        return self.__thread
+
+    def setThread(self, thread: Optional[Thread]) -> None:
+        self.__thread = thread
+
+    def getProcessIdentifier(self) -> int:
+        return self.__process_identifier
+
+    def setProcessIdentifier(self, process_identifier: int) -> None:
+        self.__process_identifier = process_identifier
+
+    def getWakeUp(self) -> Event:
+        return self.__wake_up
+
+    def setWakeUp(self, wake_up: Event) -> None:
+        self.__wake_up = wake_up
+
+    def getStopping(self) -> Event:
+        return self.__stopping
+
+    def setStopping(self, stopping: Event) -> None:
+        self.__stopping = stopping
+
+    def getLock(self) -> Lock:
+        return self.__lock
+
+    def setLock(self, lock: Lock) -> None:
+        self.__lock = lock
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    @classmethod
+    def getInstance(cls) -> "Download_Job_Queue":
+        """
+        Retrieving the queue shared by the whole process, creating it on the first call.
+
+        Returns:
+            Download_Job_Queue: The queue shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls()
+                register(cls.__instance.stop)
+            return cls.__instance
+
+    def getHost(self, search: str) -> str:
+        """
+        Retrieving the host of a media, which the concurrency of the download jobs is limited by.
+
+        Args:
+            search (str): The uniform resource locator of the media.
+
+        Returns:
+            str
+        """
+        host: str = str(urlparse(search).hostname or "")
+        return host[len("www."):] if host.startswith("www.") else host
+
+    def submit(self, request: Dict[str, Union[str, None]]) -> Dict[str, Any]:
+        """
+        Queuing a download, the download job of the same media being returned if it is already queued or running.
+
+        Args:
+            request (Dict[str, Union[str, None]]): The request of the download, containing the referer, the search, the platform, the IP address and the port.
+
+        Returns:
+            Dict[str, Any]: The download job.
+        """
+        job: Dict[str, Any] = self.getStore().enqueue(request, self.getHost(str(request["search"])))
+        self.getLogger().inform(f"The download job has been queued. - Identifier: {job['identifier']} - Search: {job['search']} - Status: {job['status']}")
+        self.start()
+        self.getWakeUp().set()
+        return job
+
+    def getJob(self, identifier: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieving the state of a download job.
+
+        Args:
+            identifier (str): The identifier of the download job.
+
+        Returns:
+            Optional[Dict[str, Any]]
+        """
+        return self.getStore().get(identifier)
+
+    def __createPool(self) -> ProcessPoolExecutor:
+        """
+        Creating the pool of worker processes, which are spawned rather than forked as the process holds running threads, locks and connections which would be copied in an inconsistent state.
+
+        Returns:
+            ProcessPoolExecutor
+        """
+        return ProcessPoolExecutor(max_workers=self.getWorkers(), mp_context=get_context("spawn"))
+
+    def start(self) -> None:
+        """
+        Starting the dispatcher and its pool of worker processes, unless they are already running in the current process.
+
+        Returns:
+            void
+        """
+        with self.getLock():
+            if self.getProcessIdentifier() == getpid() and self.getThread() is not None and self.getThread().is_alive(): # type: ignore
+                return
+            self.setProcessIdentifier(getpid())
+            self.setOwner(f"{gethostname()}:{getpid()}")
+            self.setRunning({})
+            self.setPool(self.__createPool())
+            self.getStopping().clear()
+            self.setThread(Thread(target=self.__dispatch, name="Download_Job_Dispatcher", daemon=True))
+            self.getThread().start() # type: ignore
+        self.getLogger().inform(f"The download job dispatcher has been started. - Owner: {self.getOwner()} - Workers: {self.getWorkers()}")
+
+    def stop(self) -> None:
+        """
+        Stopping the dispatcher and its pool of worker processes.  The running download jobs are left to their lease so that they are queued again once it expires.
+
+        Returns:
+            void
+        """
+        self.getStopping().set()
+        self.getWakeUp().set()
+        thread: Optional[Thread] = self.getThread()
+        if thread is not None and thread.is_alive() and self.getProcessIdentifier() == getpid():
+            thread.join(self.getPollInterval() * 5)
+        pool: Optional[ProcessPoolExecutor] = self.getPool()
+        if pool is not None and self.getProcessIdentifier() == getpid():
+            pool.shutdown(wait=False, cancel_futures=True)
+        self.setPool(None)
+
+    def __dispatch(self) -> None:
+        """
+        Claiming the download jobs while the pool has a free worker process, renewing the leases of the running download jobs and purging the old download jobs and their progress until the dispatcher is stopped.
+
+        Returns:
+            void
+        """
+        last_renewal: float = monotonic()
+        last_purge: float = 0.0
+        while not self.getStopping().is_set():
+            try:
+                if monotonic() - last_renewal >= self.getLeaseTime() / 3:
+                    with self.getLock():
+                        identifiers: List[str] = list(self.getRunning().keys())
+                    self.getStore().renew(identifiers, self.getOwner(), self.getLeaseTime())
+                    last_renewal = monotonic()
+                if monotonic() - last_purge >= 3600:
+                    self.getStore().purge(time() - self.getRetention())
+                    Download_Progress_Registry.getInstance().purge(time() - self.getRetention())
+                    last_purge = monotonic()
+                while len(self.getRunning()) < self.getWorkers() and not self.getStopping().is_set():
+                    job: Optional[Dict[str, Any]] = self.getStore().claim(self.getOwner(), self.getLeaseTime(), self.getMaximumRunning(), self.getMaximumRunningPerHost(), self.getMaximumAttempts())
+                    if job is None:
+                        break
+                    self.__run(job)
+            except Exception as error:
+                self.getLogger().error(f"The download job dispatcher has failed. - Error: {error}")
+            self.getWakeUp().wait(self.getPollInterval())
+            self.getWakeUp().clear()
+
+    def __run(self, job: Dict[str, Any]) -> None:
+        """
+        Running a download job in the pool of worker processes.
+
+        Args:
+            job (Dict[str, Any]): The download job claimed.
+
+        Returns:
+            void
+        """
+        request: Dict[str, Union[str, None]] = {
+            "referer": job["referer"],
+            "search": job["search"],
+            "platform": job["platform"],
+            "ip_address": job["ip_address"],
+            "port": job["port"]
+        }
+        try:
+            future: Future = self.getPool().submit(runDownloadJob, request) # type: ignore
+        except (BrokenProcessPool, RuntimeError) as error:
+            self.getLogger().error(f"The pool of worker processes is broken and will be replaced. - Error: {error}")
+            self.setPool(self.__createPool())
+            future = self.getPool().submit(runDownloadJob, request) # type: ignore
+        with self.getLock():
+            self.getRunning()[job["identifier"]] = future
+        self.getLogger().inform(f"The download job has been started. - Identifier: {job['identifier']} - Attempt: {job['attempts']}")
+        future.add_done_callback(partial(self.__complete, str(job["identifier"])))
+
+    def __complete(self, identifier: str, future: Future) -> None:
+        """
+        Recording the result of a download job once its worker process has returned.
+
+        Args:
+            identifier (str): The identifier of the download job.
+            future (Future): The execution of the download job.
+
+        Returns:
+            void
+        """
+        with self.getLock():
+            self.getRunning().pop(identifier, None)
+        if future.cancelled():
+            self.getLogger().warn(f"The download job has been cancelled and will be queued again once its lease expires. - Identifier: {identifier}")
+            return
+        try:
+            response: Dict[str, Union[int, Dict[str, Union[str, int, None]]]] = future.result()
+            status: int = int(str(response["status"]))
+            data: Dict[str, Union[str, int, None]] = response["data"] # type: ignore
+            if status < 200 or status > 299 or not data:
+                self.getStore().fail(identifier, self.getOwner(), f"The media cannot be downloaded. - Status: {status}")
+                self.getLogger().error(f"The download job has failed. - Identifier: {identifier} - Status: {status}")
+            else:
+                files: List[str] = [str(data[field]) for field in ("audio", "video") if data.get(field) and isfile(str(data[field]))]
+                self.getStore().complete(identifier, self.getOwner(), data, sum(getsize(file) for file in files))
+                self.getLogger().inform(f"The download job has been completed. - Identifier: {identifier}")
+        except Exception as error:
+            self.getStore().fail(identifier, self.getOwner(), str(error))
+            self.getLogger().error(f"The download job has failed. - Identifier: {identifier} - Error: {error}")
+        self.getWakeUp().set()
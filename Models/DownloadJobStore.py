@@ -0,0 +1,265 @@
+"""
+The module provides the persistent store of the download jobs, which is a SQLite database shared by every worker of the application.
+
+Author:
+    Darkness4869
+"""
+from Models.Logger import Extractio_Logger
+from Environment import Environment
+from Models.SQLiteDatabase import SQLite_Database
+from sqlite3 import Connection, Row
+from threading import Lock
+from json import dumps, loads
+from time import time
+from uuid import uuid4
+from typing import Any, Dict, List, Optional, Union
+
+
+class Download_Job_Store:
+    """
+    A persistent store of the download jobs, whose state survives the restarts of the application.
+
+    A job is `queued` until a dispatcher claims it, `running` while the dispatcher holds its lease, and `completed` or `failed` once it is done.  Claiming a job is done in an immediate transaction which enforces the maximum amount of running jobs, overall and per host of the media, across every process sharing the database.  A running job whose lease has expired, because its dispatcher has died, is queued again until it runs out of attempts.
+
+    Attributes:
+        __instance (Optional[Download_Job_Store]): The store shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared store.
+        __database (SQLite_Database): The SQLite database of the store.
+        __logger (Extractio_Logger): The logger of the store.
+
+    Methods:
+        getInstance() -> Download_Job_Store: Retrieving the store shared by the whole process.
+        enqueue(request: Dict[str, Union[str, None]], host: str) -> Dict[str, Any]: Queuing a download job.
+        get(identifier: str) -> Optional[Dict[str, Any]]: Retrieving a download job.
+        claim(owner: str, lease_time: float, maximum_running: int, maximum_running_per_host: int, maximum_attempts: int) -> Optional[Dict[str, Any]]: Claiming the oldest download job which can run.
+        renew(identifiers: List[str], owner: str, lease_time: float) -> None: Extending the leases of running download jobs.
+        complete(identifier: str, owner: str, result: Dict[str, Union[str, int, None]], total_bytes: int) -> bool: Marking a download job as completed.
+        fail(identifier: str, owner: str, error: str) -> bool: Marking a download job as failed.
+        purge(deadline: float) -> int: Deleting the download jobs done before a deadline.
+    """
+    __instance: Optional["Download_Job_Store"] = None
+    """
+    The store shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared store.
+    """
+    __database: SQLite_Database
+    """
+    The SQLite database of the store.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the store.
+    """
+    fields: str = "identifier, search, platform, referer, ip_address, port, host, status, attempts, owner, leased_until, downloaded_bytes, total_bytes, result, error, created_at, updated_at"
+    """
+    The columns of a download job.
+    """
+
+    def __init__(self, path: str, logger: Optional[Extractio_Logger] = None):
+        """
+        Initializing the store and creating its table if it does not exist.
+
+        Args:
+            path (str): The path of the SQLite database.
+            logger (Optional[Extractio_Logger]): The logger of the store.
+        """
+        self.setDatabase(SQLite_Database(path, 10.0))
+        self.setLogger(logger or Extractio_Logger(__name__))
+        connection: Connection = self.getConnection()
+        with connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS DownloadJobs (identifier TEXT PRIMARY KEY, search TEXT NOT NULL, platform TEXT NOT NULL, referer TEXT, ip_address TEXT NOT NULL, port TEXT, host TEXT NOT NULL, status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, owner TEXT, leased_until REAL, downloaded_bytes INTEGER NOT NULL DEFAULT 0, total_bytes INTEGER, result TEXT, error TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS DownloadJobs_status ON DownloadJobs (status, created_at)")
+            connection.execute("CREATE INDEX IF NOT EXISTS DownloadJobs_search ON DownloadJobs (search, status)")
+
+    def getDatabase(self) -> SQLite_Database:
+        return self.__database
+
+    def setDatabase(self, database: SQLite_Database) -> None:
+        self.__database = database
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    @classmethod
+    def getInstance(cls) -> "Download_Job_Store":
+        """
+        Retrieving the store shared by the whole process, creating it on the first call in the cache directory of the application.
+
+        Returns:
+            Download_Job_Store: The store shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls(f"{Environment().getDirectory()}/Cache/Downloads/Jobs.sqlite3")
+            return cls.__instance
+
+    def getConnection(self) -> Connection:
+        """
+        Retrieving the connection of the current thread to the database.
+
+        Returns:
+            Connection
+        """
+        return self.getDatabase().getConnection()
+
+    def __toJob(self, row: Row) -> Dict[str, Any]:
+        """
+        Converting a row of the table into a download job.
+
+        Args:
+            row (Row): The row of the download job.
+
+        Returns:
+            Dict[str, Any]
+        """
+        job: Dict[str, Any] = dict(row)
+        job["result"] = loads(job["result"]) if job["result"] else None
+        return job
+
+    def enqueue(self, request: Dict[str, Union[str, None]], host: str) -> Dict[str, Any]:
+        """
+        Queuing a download job, unless a download job of the same media is already queued or running, in which case the latter is returned.
+
+        Args:
+            request (Dict[str, Union[str, None]]): The request of the download, containing the referer, the search, the platform, the IP address and the port.
+            host (str): The host of the media.
+
+        Returns:
+            Dict[str, Any]
+        """
+        connection: Connection = self.getConnection()
+        now: float = time()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row: Optional[Row] = connection.execute(f"SELECT {self.fields} FROM DownloadJobs WHERE search = ? AND status IN ('queued', 'running') ORDER BY created_at LIMIT 1", (request["search"],)).fetchone()
+            if row is not None:
+                return self.__toJob(row)
+            identifier: str = uuid4().hex
+            connection.execute(
+                "INSERT INTO DownloadJobs (identifier, search, platform, referer, ip_address, port, host, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, 'queued', ?, ?)",
+                (identifier, request["search"], request["platform"], request["referer"], request["ip_address"], request.get("port"), host, now, now)
+            )
+            row = connection.execute(f"SELECT {self.fields} FROM DownloadJobs WHERE identifier = ?", (identifier,)).fetchone()
+        return self.__toJob(row) # type: ignore
+
+    def get(self, identifier: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieving a download job.
+
+        Args:
+            identifier (str): The identifier of the download job.
+
+        Returns:
+            Optional[Dict[str, Any]]
+        """
+        row: Optional[Row] = self.getConnection().execute(f"SELECT {self.fields} FROM DownloadJobs WHERE identifier = ?", (identifier,)).fetchone()
+        return self.__toJob(row) if row is not None else None
+
+    def claim(self, owner: str, lease_time: float, maximum_running: int, maximum_running_per_host: int, maximum_attempts: int) -> Optional[Dict[str, Any]]:
+        """
+        Claiming the oldest queued download job whose host has not reached its maximum amount of running jobs, provided that the maximum amount of running jobs has not been reached.  The running jobs whose lease has expired are queued again beforehand, or failed if they have run out of attempts.
+
+        Args:
+            owner (str): The dispatcher claiming the download job.
+            lease_time (float): The amount of seconds the download job is leased.
+            maximum_running (int): The maximum amount of running download jobs.
+            maximum_running_per_host (int): The maximum amount of running download jobs per host.
+            maximum_attempts (int): The maximum amount of attempts of a download job.
+
+        Returns:
+            Optional[Dict[str, Any]]: The download job claimed, or None if there is none to run.
+        """
+        connection: Connection = self.getConnection()
+        now: float = time()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("UPDATE DownloadJobs SET status = 'failed', owner = NULL, leased_until = NULL, error = 'The download job has run out of attempts.', updated_at = ? WHERE status = 'running' AND leased_until < ? AND attempts >= ?", (now, now, maximum_attempts))
+            requeued: int = connection.execute("UPDATE DownloadJobs SET status = 'queued', owner = NULL, leased_until = NULL, updated_at = ? WHERE status = 'running' AND leased_until < ?", (now, now)).rowcount
+            if requeued > 0:
+                self.getLogger().warn(f"The download jobs whose lease has expired have been queued again. - Amount: {requeued}")
+            running: int = int(connection.execute("SELECT COUNT(*) FROM DownloadJobs WHERE status = 'running'").fetchone()[0])
+            if running >= maximum_running:
+                return None
+            row: Optional[Row] = connection.execute(
+                f"SELECT {self.fields} FROM DownloadJobs WHERE status = 'queued' AND host NOT IN (SELECT host FROM DownloadJobs WHERE status = 'running' GROUP BY host HAVING COUNT(*) >= ?) ORDER BY created_at LIMIT 1",
+                (maximum_running_per_host,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE DownloadJobs SET status = 'running', owner = ?, leased_until = ?, attempts = attempts + 1, updated_at = ? WHERE identifier = ?", (owner, now + lease_time, now, row["identifier"]))
+            row = connection.execute(f"SELECT {self.fields} FROM DownloadJobs WHERE identifier = ?", (row["identifier"],)).fetchone()
+        return self.__toJob(row) # type: ignore
+
+    def renew(self, identifiers: List[str], owner: str, lease_time: float) -> None:
+        """
+        Extending the leases of the running download jobs of a dispatcher.
+
+        Args:
+            identifiers (List[str]): The identifiers of the download jobs.
+            owner (str): The dispatcher running the download jobs.
+            lease_time (float): The amount of seconds the download jobs are leased from now.
+        """
+        if not identifiers:
+            return
+        connection: Connection = self.getConnection()
+        now: float = time()
+        with connection:
+            connection.executemany("UPDATE DownloadJobs SET leased_until = ?, updated_at = ? WHERE identifier = ? AND owner = ? AND status = 'running'", [(now + lease_time, now, identifier, owner) for identifier in identifiers])
+
+    def complete(self, identifier: str, owner: str, result: Dict[str, Union[str, int, None]], total_bytes: int) -> bool:
+        """
+        Marking a download job as completed along with its result.
+
+        Args:
+            identifier (str): The identifier of the download job.
+            owner (str): The dispatcher which has run the download job.
+            result (Dict[str, Union[str, int, None]]): The metadata of the media downloaded.
+            total_bytes (int): The size of the media files.
+
+        Returns:
+            bool: Whether the download job was still leased by the dispatcher.
+        """
+        connection: Connection = self.getConnection()
+        with connection:
+            return connection.execute(
+                "UPDATE DownloadJobs SET status = 'completed', owner = NULL, leased_until = NULL, result = ?, downloaded_bytes = ?, total_bytes = ?, error = NULL, updated_at = ? WHERE identifier = ? AND owner = ? AND status = 'running'",
+                (dumps(result, default=str), total_bytes, total_bytes, time(), identifier, owner)
+            ).rowcount > 0
+
+    def fail(self, identifier: str, owner: str, error: str) -> bool:
+        """
+        Marking a download job as failed along with its error.
+
+        Args:
+            identifier (str): The identifier of the download job.
+            owner (str): The dispatcher which has run the download job.
+            error (str): The error of the download job.
+
+        Returns:
+            bool: Whether the download job was still leased by the dispatcher.
+        """
+        connection: Connection = self.getConnection()
+        with connection:
+            return connection.execute("UPDATE DownloadJobs SET status = 'failed', owner = NULL, leased_until = NULL, error = ?, updated_at = ? WHERE identifier = ? AND owner = ? AND status = 'running'", (error, time(), identifier, owner)).rowcount > 0
+
+    def purge(self, deadline: float) -> int:
+        """
+        Deleting the download jobs which have been completed or failed before a deadline.
+
+        Args:
+            deadline (float): The UNIX time before which the download jobs are deleted.
+
+        Returns:
+            int: The amount of download jobs deleted.
+        """
+        connection: Connection = self.getConnection()
+        with connection:
+            return connection.execute("DELETE FROM DownloadJobs WHERE status IN ('completed', 'failed') AND updated_at < ?", (deadline,)).rowcount
@@ -0,0 +1,277 @@
+"""
+The module provides the registry of the progress of the downloads, which is fed by the progress hooks of yt-dlp in the worker processes and read by the workers of the application.
+
+Author:
+    Darkness4869
+"""
+from Models.Logger import Extractio_Logger
+from Environment import Environment
+from Models.SQLiteDatabase import SQLite_Database
+from sqlite3 import Connection, Row
+from threading import Lock
+from time import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+
+class Download_Progress_Registry:
+    """
+    A registry of the progress of the downloads keyed by the identifier of the media.
+
+    The progress hooks of yt-dlp are called for every chunk downloaded, hence, the progress of a media is only written once per interval unless its phase or its file changes.  It is stored in a SQLite database in write-ahead logging mode, as the downloads run in worker processes while the progress is streamed by the workers of the application.
+
+    Attributes:
+        __instance (Optional[Download_Progress_Registry]): The registry shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared registry.
+        __database (SQLite_Database): The SQLite database of the registry.
+        __interval (float): The minimum amount of seconds between two writes of the progress of a media.
+        __last_published (Dict[str, Dict[str, Any]]): The last progress written of each media by the current process.
+        __lock (Lock): The lock protecting the last progress written.
+        __logger (Extractio_Logger): The logger of the registry.
+
+    Methods:
+        getInstance() -> Download_Progress_Registry: Retrieving the registry shared by the whole process.
+        publish(identifier: str, progress: Dict[str, Any], is_forced: bool) -> bool: Recording the progress of a download.
+        get(identifier: str) -> Optional[Dict[str, Any]]: Retrieving the progress of a download.
+        createProgressHook(identifier: str, file: str) -> Callable[[Dict[str, Any]], None]: Creating the progress hook of a download.
+        createPostprocessorHook(identifier: str, file: str) -> Callable[[Dict[str, Any]], None]: Creating the post-processor hook of a download.
+        finish(identifier: str, file: str) -> None: Recording the end of the download of a file.
+        purge(deadline: float) -> int: Deleting the progress not updated since a deadline.
+    """
+    __instance: Optional["Download_Progress_Registry"] = None
+    """
+    The registry shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared registry.
+    """
+    __database: SQLite_Database
+    """
+    The SQLite database of the registry.
+    """
+    __interval: float
+    """
+    The minimum amount of seconds between two writes of the progress of a media.
+    """
+    __last_published: Dict[str, Dict[str, Any]]
+    """
+    The last progress written of each media by the current process.
+    """
+    __lock: Lock
+    """
+    The lock protecting the last progress written.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the registry.
+    """
+    fields: str = "identifier, phase, file, format, downloaded_bytes, total_bytes, speed, eta, started_at, updated_at"
+    """
+    The columns of the progress of a download.
+    """
+
+    def __init__(self, path: str, interval: float = 0.5, logger: Optional[Extractio_Logger] = None):
+        """
+        Initializing the registry and creating its table if it does not exist.
+
+        Args:
+            path (str): The path of the SQLite database.
+            interval (float): The minimum amount of seconds between two writes of the progress of a media.
+            logger (Optional[Extractio_Logger]): The logger of the registry.
+        """
+        self.setDatabase(SQLite_Database(path))
+        self.setInterval(interval)
+        self.setLastPublished({})
+        self.setLock(Lock())
+        self.setLogger(logger or Extractio_Logger(__name__))
+        connection: Connection = self.getConnection()
+        with connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS Progress (identifier TEXT PRIMARY KEY, phase TEXT NOT NULL, file TEXT NOT NULL, format TEXT, downloaded_bytes INTEGER NOT NULL, total_bytes INTEGER, speed REAL, eta REAL, started_at REAL NOT NULL, updated_at REAL NOT NULL)")
+
+    def getDatabase(self) -> SQLite_Database:
+        return self.__database
+
+    def setDatabase(self, database: SQLite_Database) -> None:
+        self.__database = database
+
+    def getInterval(self) -> float:
+        return self.__interval
+
+    def setInterval(self, interval: float) -> None:
+        self.__interval = interval
+
+    def getLastPublished(self) -> Dict[str, Dict[str, Any]]:
+        return self.__last_published
+
+    def setLastPublished(self, last_published: Dict[str, Dict[str, Any]]) -> None:
+        self.__last_published = last_published
+
+    def getLock(self) -> Lock:
+        return self.__lock
+
+    def setLock(self, lock: Lock) -> None:
+        self.__lock = lock
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    @classmethod
+    def getInstance(cls) -> "Download_Progress_Registry":
+        """
+        Retrieving the registry shared by the whole process, creating it on the first call in the cache directory of the application.
+
+        Returns:
+            Download_Progress_Registry: The registry shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls(f"{Environment().getDirectory()}/Cache/Downloads/Progress.sqlite3")
+            return cls.__instance
+
+    def getConnection(self) -> Connection:
+        """
+        Retrieving the connection of the current thread to the database.
+
+        Returns:
+            Connection
+        """
+        return self.getDatabase().getConnection()
+
+    def publish(self, identifier: str, progress: Dict[str, Any], is_forced: bool = False) -> bool:
+        """
+        Recording the progress of a download, unless the progress of the same phase and file has been written less than an interval ago.
+
+        Args:
+            identifier (str): The identifier of the media.
+            progress (Dict[str, Any]): The phase, the file, the format, the amount of bytes downloaded, the total amount of bytes, the speed and the estimated time of arrival of the download.
+            is_forced (bool): Whether the progress is written regardless of the interval.
+
+        Returns:
+            bool: Whether the progress has been written.
+        """
+        now: float = time()
+        with self.getLock():
+            last: Optional[Dict[str, Any]] = self.getLastPublished().get(identifier)
+            is_same_step: bool = last is not None and last["phase"] == progress["phase"] and last["file"] == progress["file"]
+            if not is_forced and is_same_step and now - last["updated_at"] < self.getInterval(): # type: ignore
+                return False
+            started_at: float = last["started_at"] if last is not None else now
+            self.getLastPublished()[identifier] = {**progress, "started_at": started_at, "updated_at": now}
+        connection: Connection = self.getConnection()
+        with connection:
+            connection.execute(
+                "INSERT INTO Progress (identifier, phase, file, format, downloaded_bytes, total_bytes, speed, eta, started_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (identifier) DO UPDATE SET phase = excluded.phase, file = excluded.file, format = excluded.format, downloaded_bytes = excluded.downloaded_bytes, total_bytes = excluded.total_bytes, speed = excluded.speed, eta = excluded.eta, updated_at = excluded.updated_at",
+                (identifier, progress["phase"], progress["file"], progress.get("format"), int(progress.get("downloaded_bytes") or 0), progress.get("total_bytes"), progress.get("speed"), progress.get("eta"), started_at, now)
+            )
+        return True
+
+    def get(self, identifier: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieving the progress of a download.
+
+        Args:
+            identifier (str): The identifier of the media.
+
+        Returns:
+            Optional[Dict[str, Any]]
+        """
+        row: Optional[Row] = self.getConnection().execute(f"SELECT {self.fields} FROM Progress WHERE identifier = ?", (identifier,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def createProgressHook(self, identifier: str, file: str) -> Callable[[Dict[str, Any]], None]:
+        """
+        Creating the progress hook of yt-dlp which records the amount of bytes downloaded, the speed and the estimated time of arrival of a file.  The amount of bytes is accumulated over the streams of the file, such as the video and audio streams which are merged.
+
+        Args:
+            identifier (str): The identifier of the media.
+            file (str): The file being downloaded, either `audio` or `video`.
+
+        Returns:
+            Callable[[Dict[str, Any]], None]
+        """
+        completed_bytes: List[int] = [0]
+        def hook(status: Dict[str, Any]) -> None:
+            if status.get("status") not in ("downloading", "finished"):
+                return
+            downloaded_bytes: int = int(status.get("downloaded_bytes") or 0)
+            total_bytes: Optional[Union[int, float]] = status.get("total_bytes") or status.get("total_bytes_estimate")
+            try:
+                self.publish(
+                    identifier,
+                    {
+                        "phase": "downloading",
+                        "file": file,
+                        "format": str((status.get("info_dict") or {}).get("format_id") or ""),
+                        "downloaded_bytes": completed_bytes[0] + downloaded_bytes,
+                        "total_bytes": completed_bytes[0] + int(total_bytes) if total_bytes else None,
+                        "speed": status.get("speed"),
+                        "eta": status.get("eta")
+                    },
+                    status.get("status") == "finished"
+                )
+            except Exception as error:
+                self.getLogger().warn(f"The progress of the download cannot be recorded. - Identifier: {identifier} - Error: {error}")
+            if status.get("status") == "finished":
+                completed_bytes[0] += downloaded_bytes
+        return hook
+
+    def createPostprocessorHook(self, identifier: str, file: str) -> Callable[[Dict[str, Any]], None]:
+        """
+        Creating the post-processor hook of yt-dlp which records the merge of the audio and video streams.
+
+        Args:
+            identifier (str): The identifier of the media.
+            file (str): The file being downloaded, either `audio` or `video`.
+
+        Returns:
+            Callable[[Dict[str, Any]], None]
+        """
+        def hook(status: Dict[str, Any]) -> None:
+            if status.get("status") != "started" or status.get("postprocessor") != "Merger":
+                return
+            try:
+                with self.getLock():
+                    downloaded_bytes: int = int(self.getLastPublished().get(identifier, {}).get("downloaded_bytes") or 0)
+                self.publish(identifier, {"phase": "merging", "file": file, "downloaded_bytes": downloaded_bytes, "total_bytes": downloaded_bytes}, True)
+            except Exception as error:
+                self.getLogger().warn(f"The progress of the download cannot be recorded. - Identifier: {identifier} - Error: {error}")
+        return hook
+
+    def finish(self, identifier: str, file: str) -> None:
+        """
+        Recording the end of the download of a file and logging its throughput.
+
+        Args:
+            identifier (str): The identifier of the media.
+            file (str): The file which has been downloaded, either `audio` or `video`.
+        """
+        with self.getLock():
+            last: Dict[str, Any] = self.getLastPublished().pop(identifier, None) or {}
+        downloaded_bytes: int = int(last.get("downloaded_bytes") or 0)
+        duration: float = time() - float(last.get("started_at") or time())
+        try:
+            self.publish(identifier, {"phase": "finished", "file": file, "downloaded_bytes": downloaded_bytes, "total_bytes": downloaded_bytes}, True)
+        except Exception as error:
+            self.getLogger().warn(f"The progress of the download cannot be recorded. - Identifier: {identifier} - Error: {error}")
+        with self.getLock():
+            self.getLastPublished().pop(identifier, None)
+        self.getLogger().inform(f"The file has been downloaded. - Identifier: {identifier} - File: {file} - Duration: {duration:.2f}s - Throughput: {downloaded_bytes / duration if duration > 0 else 0:.0f} B/s")
+
+    def purge(self, deadline: float) -> int:
+        """
+        Deleting the progress of the downloads which has not been updated since a deadline.
+
+        Args:
+            deadline (float): The UNIX time before which the progress is deleted.
+
+        Returns:
+            int: The amount of progress deleted.
+        """
+        connection: Connection = self.getConnection()
+        with connection:
+            return connection.execute("DELETE FROM Progress WHERE updated_at < ?", (deadline,)).rowcount
@@ -0,0 +1,293 @@
+"""
+The module provides a cache of the information extracted by YoutubeDL so that the same media is not extracted again on every search, related content or download.
+
+Author:
+    Darkness4869
+"""
+from Models.LeastRecentlyUsedCache import Least_Recently_Used_Cache
+from Models.Logger import Extractio_Logger
+from Environment import Environment
+from threading import Lock
+from time import time
+from json import dump, load, JSONDecodeError
+from os import getenv, makedirs, replace, remove, getpid
+from os.path import join, exists
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class Extraction_Cache:
+    """
+    A two-tier cache of the extracted information of the media, keyed by the sanitized identifier of the media.
+
+    Each field has its own time to live: the static metadata lives long, the amount of views is refreshed regularly and the formats expire quickly as their signed uniform resource locators expire.  The fields are kept in an in-memory least recently used cache and, optionally, in a JSON file per media so that the other workers and the crawler benefit from them.  As the on-disk tier is never pruned, it is disabled unless `EXTRACTION_CACHE_ON_DISK` is enabled in the environment of the application.
+
+    Attributes:
+        __instance (Optional[Extraction_Cache]): The cache shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared cache.
+        __memory (Least_Recently_Used_Cache): The in-memory tier containing the fields of the media along with their expiry time.
+        __directory (Optional[str]): The directory of the on-disk tier, or None if it is disabled.
+        __field_time_to_live (Dict[str, float]): The amount of seconds each cached field lives.
+        __logger (Extractio_Logger): The logger of the cache.
+        __lock (Lock): The lock protecting the counters.
+        __hits (int): The amount of lookups served by the cache.
+        __misses (int): The amount of lookups which required an extraction.
+
+    Methods:
+        getInstance() -> Extraction_Cache: Retrieving the cache shared by the whole process.
+        get(identifier: str, fields: List[str]) -> Optional[Dict[str, Any]]: Retrieving the cached information of a media.
+        set(identifier: str, information: Dict[str, Any]) -> None: Caching the information of a media.
+        invalidate(identifier: str) -> None: Removing the information of a media from the cache.
+        getStatistics() -> Dict[str, Any]: Retrieving the counters of the cache.
+    """
+    __instance: Optional["Extraction_Cache"] = None
+    """
+    The cache shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared cache.
+    """
+    __memory: Least_Recently_Used_Cache
+    """
+    The in-memory tier containing the fields of the media along with their expiry time.
+    """
+    __directory: Optional[str]
+    """
+    The directory of the on-disk tier, or None if it is disabled.
+    """
+    __field_time_to_live: Dict[str, float]
+    """
+    The amount of seconds each cached field lives.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the cache.
+    """
+    __lock: Lock
+    """
+    The lock protecting the counters.
+    """
+    __hits: int
+    """
+    The amount of lookups served by the cache.
+    """
+    __misses: int
+    """
+    The amount of lookups which required an extraction.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        maximum_size: int = 512,
+        static_time_to_live: float = 86400.0,
+        views_time_to_live: float = 3600.0,
+        formats_time_to_live: float = 1800.0
+    ):
+        """
+        Initializing the extraction cache.
+
+        Args:
+            directory (Optional[str]): The directory of the on-disk tier, or None to only keep the information in memory.
+            maximum_size (int): The maximum amount of media kept in memory.
+            static_time_to_live (float): The amount of seconds the static metadata lives.
+            views_time_to_live (float): The amount of seconds the amount of views lives.
+            formats_time_to_live (float): The amount of seconds the formats live, which must be shorter than the expiry of their signed uniform resource locators.
+        """
+        static_fields: List[str] = [
+            "id", "title", "fulltitle", "uploader", "uploader_id", "uploader_url", "channel", "channel_url",
+            "duration", "upload_date", "thumbnail", "extractor", "extractor_key", "webpage_url",
+            "original_url", "webpage_url_basename", "webpage_url_domain", "display_id", "live_status", "is_live", "was_live"
+        ]
+        self.setMemory(Least_Recently_Used_Cache(maximum_size, max(static_time_to_live, views_time_to_live, formats_time_to_live)))
+        self.setDirectory(directory)
+        self.setFieldTimeToLive({
+            **{field: static_time_to_live for field in static_fields},
+            "view_count": views_time_to_live,
+            "formats": formats_time_to_live
+        })
+        self.setLogger(Extractio_Logger(__name__))
+        self.setLock(Lock())
+        self.setHits(0)
+        self.setMisses(0)
+        if directory is not None and not exists(directory):
+            makedirs(directory, exist_ok=True)
+
+    def getMemory(self) -> Least_Recently_Used_Cache:
+        return self.__memory
+
+    def setMemory(self, memory: Least_Recently_Used_Cache) -> None:
+        self.__memory = memory
+
+    def getDirectory(self) -> Optional[str]:
+        return self.__directory
+
+    def setDirectory(self, directory: Optional[str]) -> None:
+        self.__directory = directory
+
+    def getFieldTimeToLive(self) -> Dict[str, float]:
+        return self.__field_time_to_live
+
+    def setFieldTimeToLive(self, field_time_to_live: Dict[str, float]) -> None:
+        self.__field_time_to_live = field_time_to_live
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    def getLock(self) -> Lock:
+        return self.__lock
+
+    def setLock(self, lock: Lock) -> None:
+        self.__lock = lock
+
+    def getHits(self) -> int:
+        return self.__hits
+
+    def setHits(self, hits: int) -> None:
+        self.__hits = hits
+
+    def getMisses(self) -> int:
+        return self.__misses
+
+    def setMisses(self, misses: int) -> None:
+        self.__misses = misses
+
+    @classmethod
+    def getInstance(cls) -> "Extraction_Cache":
+        """
+        Retrieving the cache shared by the whole process, creating it on the first call with its on-disk tier in the cache directory of the application if `EXTRACTION_CACHE_ON_DISK` is enabled in the environment of the application.
+
+        Returns:
+            Extraction_Cache: The cache shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                ENV: Environment = Environment()
+                is_on_disk: bool = getenv("EXTRACTION_CACHE_ON_DISK", "false").lower() in ("1", "true", "yes")
+                cls.__instance = cls(f"{ENV.getDirectory()}/Cache/Extraction" if is_on_disk else None)
+            return cls.__instance
+
+    def __getFileName(self, identifier: str) -> str:
+        """
+        Building the name of the file of the on-disk tier for a media.
+
+        Args:
+            identifier (str): The sanitized identifier of the media, for example `shorts/<identifier>`.
+
+        Returns:
+            str: The path of the file.
+        """
+        return join(str(self.getDirectory()), f"{identifier.replace('/', '_')}.json")
+
+    def __load(self, identifier: str) -> Dict[str, Tuple[Any, float]]:
+        """
+        Loading the fields of a media from the on-disk tier.
+
+        Args:
+            identifier (str): The sanitized identifier of the media.
+
+        Returns:
+            Dict[str, Tuple[Any, float]]: The fields along with their expiry time, which is empty if the tier is disabled or the file cannot be read.
+        """
+        if self.getDirectory() is None:
+            return {}
+        try:
+            with open(self.__getFileName(identifier), "r") as file:
+                return {field: (entry[0], float(entry[1])) for field, entry in load(file).items()}
+        except (FileNotFoundError, JSONDecodeError, ValueError, TypeError, IndexError, AttributeError):
+            return {}
+
+    def __save(self, identifier: str, fields: Dict[str, Tuple[Any, float]]) -> None:
+        """
+        Writing the fields of a media in the on-disk tier through a temporary file so that the readers never see a partial file.
+
+        Args:
+            identifier (str): The sanitized identifier of the media.
+            fields (Dict[str, Tuple[Any, float]]): The fields along with their expiry time.
+        """
+        if self.getDirectory() is None:
+            return
+        file_name: str = self.__getFileName(identifier)
+        temporary_file_name: str = f"{file_name}.{getpid()}.tmp"
+        try:
+            with open(temporary_file_name, "w") as file:
+                dump({field: [value, expires_at] for field, (value, expires_at) in fields.items()}, file, default=str)
+            replace(temporary_file_name, file_name)
+        except (OSError, TypeError, ValueError) as error:
+            self.getLogger().warn(f"The extracted information cannot be written on the disk. - Identifier: {identifier} - Error: {error}")
+
+    def get(self, identifier: str, fields: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Retrieving the cached information of a media, which is only returned if every requested field is cached and has not expired.
+
+        Args:
+            identifier (str): The sanitized identifier of the media.
+            fields (List[str]): The fields needed by the caller.
+
+        Returns:
+            Optional[Dict[str, Any]]: Every field of the media which has not expired, or None if one of the requested fields is missing.
+        """
+        now: float = time()
+        entries: Dict[str, Tuple[Any, float]] = self.getMemory().get(identifier) or self.__load(identifier)
+        information: Dict[str, Any] = {field: value for field, (value, expires_at) in entries.items() if expires_at > now}
+        is_hit: bool = bool(information) and all(field in information for field in fields)
+        with self.getLock():
+            if is_hit:
+                self.setHits(self.getHits() + 1)
+            else:
+                self.setMisses(self.getMisses() + 1)
+        if not is_hit:
+            return None
+        self.getMemory().set(identifier, entries)
+        return information
+
+    def set(self, identifier: str, information: Dict[str, Any]) -> None:
+        """
+        Caching the fields of the extracted information of a media which are used by the application, each one with its own time to live.
+
+        Args:
+            identifier (str): The sanitized identifier of the media.
+            information (Dict[str, Any]): The information extracted by YoutubeDL.
+        """
+        now: float = time()
+        fields: Dict[str, Tuple[Any, float]] = {
+            field: (information[field], now + time_to_live) for field, time_to_live in self.getFieldTimeToLive().items() if information.get(field) is not None
+        }
+        self.getMemory().set(identifier, fields)
+        self.__save(identifier, fields)
+
+    def invalidate(self, identifier: str) -> None:
+        """
+        Removing the information of a media from both tiers of the cache.
+
+        Args:
+            identifier (str): The sanitized identifier of the media.
+        """
+        self.getMemory().delete(identifier)
+        if self.getDirectory() is None:
+            return
+        try:
+            remove(self.__getFileName(identifier))
+        except FileNotFoundError:
+            pass
+
+    def getStatistics(self) -> Dict[str, Any]:
+        """
+        Retrieving the counters of the cache for monitoring purposes.
+
+        Returns:
+            Dict[str, Any]: The hits, misses and hit rate of the cache along with the statistics of its in-memory tier.
+        """
+        with self.getLock():
+            lookups: int = self.getHits() + self.getMisses()
+            return {
+                "hits": self.getHits(),
+                "misses": self.getMisses(),
+                "hit_rate": self.getHits() / lookups if lookups else 0.0,
+                "memory": self.getMemory().getStatistics()
+            }
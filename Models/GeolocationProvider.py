@@ -0,0 +1,378 @@
+"""
+The module provides the providers of the geolocation of the IP Addresses used by the analytics, which are either a local database of IP ranges, a remote API, or a chain of both.
+
+Author:
+    Darkness4869
+"""
+from Models.LeastRecentlyUsedCache import Least_Recently_Used_Cache
+from Models.Logger import Extractio_Logger
+from Environment import Environment
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from csv import reader
+from ipaddress import ip_address
+from os.path import exists
+from threading import Lock
+from requests import get, Response
+from requests.exceptions import RequestException
+from json import JSONDecodeError
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+class Geolocation_Provider(ABC):
+    """
+    The interface of the providers of the geolocation of an IP Address.
+
+    A geolocation is a dictionary containing the latitude, the longitude, the city, the region, the country and the timezone of the IP Address.
+
+    Attributes:
+        __instance (Optional[Geolocation_Provider]): The provider shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared provider.
+        remote_fallback (bool): Whether the shared provider falls back on the remote API when the local database does not know an IP Address.
+
+    Methods:
+        getInstance() -> Geolocation_Provider: Retrieving the provider shared by the whole process.
+        lookup(address: str) -> Optional[Dict[str, Union[str, float]]]: Retrieving the geolocation of an IP Address.
+    """
+    __instance: Optional["Geolocation_Provider"] = None
+    """
+    The provider shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared provider.
+    """
+    remote_fallback: bool = True
+    """
+    Whether the shared provider falls back on the remote API when the local database does not know an IP Address.
+    """
+
+    @classmethod
+    def getInstance(cls) -> "Geolocation_Provider":
+        """
+        Retrieving the provider shared by the whole process, which looks up the local database of IP ranges of the application if it exists and falls back on the remote API.
+
+        Returns:
+            Geolocation_Provider: The provider shared by the whole process.
+        """
+        if Geolocation_Provider.__instance is not None:
+            return Geolocation_Provider.__instance
+        with Geolocation_Provider.__instance_lock:
+            if Geolocation_Provider.__instance is None:
+                ENV: Environment = Environment()
+                path: str = f"{ENV.getDirectory()}/Cache/Geolocation/IP_Ranges.csv"
+                providers: List[Geolocation_Provider] = [Local_Geolocation_Provider(path)] if exists(path) else []
+                if Geolocation_Provider.remote_fallback or not providers:
+                    providers.append(Remote_Geolocation_Provider())
+                Geolocation_Provider.__instance = providers[0] if len(providers) == 1 else Chained_Geolocation_Provider(providers)
+            return Geolocation_Provider.__instance
+
+    @abstractmethod
+    def lookup(self, address: str) -> Optional[Dict[str, Union[str, float]]]:
+        """
+        Retrieving the geolocation of an IP Address.
+
+        Args:
+            address (str): The IP Address.
+
+        Returns:
+            Optional[Dict[str, Union[str, float]]]: The geolocation, or None if it is unknown.
+        """
+
+
+class Local_Geolocation_Provider(Geolocation_Provider):
+    """
+    A provider which loads a file of IP ranges into sorted arrays and looks an IP Address up with a binary search, without any network access.
+
+    Each row of the file contains the first and the last IP Address of a range, either as addresses or as integers, followed by the country, the region, the city, the latitude, the longitude and the timezone of the range.  The rows starting with `#` and the header are ignored.
+
+    Attributes:
+        __starts (Dict[int, List[int]]): The first address of the ranges for each IP version.
+        __ends (Dict[int, List[int]]): The last address of the ranges for each IP version.
+        __geolocations (Dict[int, List[Dict[str, Union[str, float]]]]): The geolocation of the ranges for each IP version.
+        __logger (Extractio_Logger): The logger of the provider.
+    """
+    __starts: Dict[int, List[int]]
+    """
+    The first address of the ranges for each IP version.
+    """
+    __ends: Dict[int, List[int]]
+    """
+    The last address of the ranges for each IP version.
+    """
+    __geolocations: Dict[int, List[Dict[str, Union[str, float]]]]
+    """
+    The geolocation of the ranges for each IP version.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the provider.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializing the provider by loading the file of IP ranges.
+
+        Args:
+            path (str): The path of the file of IP ranges.
+        """
+        self.setLogger(Extractio_Logger(__name__))
+        self.setStarts({4: [], 6: []})
+        self.setEnds({4: [], 6: []})
+        self.setGeolocations({4: [], 6: []})
+        self.load(path)
+
+    def getStarts(self) -> Dict[int, List[int]]:
+        return self.__starts
+
+    def setStarts(self, starts: Dict[int, List[int]]) -> None:
+        self.__starts = starts
+
+    def getEnds(self) -> Dict[int, List[int]]:
+        return self.__ends
+
+    def setEnds(self, ends: Dict[int, List[int]]) -> None:
+        self.__ends = ends
+
+    def getGeolocations(self) -> Dict[int, List[Dict[str, Union[str, float]]]]:
+        return self.__geolocations
+
+    def setGeolocations(self, geolocations: Dict[int, List[Dict[str, Union[str, float]]]]) -> None:
+        self.__geolocations = geolocations
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    def __parseAddress(self, address: str) -> Tuple[int, int]:
+        """
+        Converting an IP Address written either as an address or as an integer into its version and its integer value.
+
+        Args:
+            address (str): The IP Address.
+
+        Returns:
+            Tuple[int, int]: The version and the integer value of the IP Address.
+
+        Raises:
+            ValueError: If the IP Address is invalid.
+        """
+        address = address.strip()
+        parsed_address = ip_address(int(address) if address.isdigit() else address)
+        return parsed_address.version, int(parsed_address)
+
+    def load(self, path: str) -> int:
+        """
+        Loading the file of IP ranges, the ranges being sorted by their first address.
+
+        Args:
+            path (str): The path of the file of IP ranges.
+
+        Returns:
+            int: The amount of ranges which have been loaded.
+        """
+        ranges: Dict[int, List[Tuple[int, int, Dict[str, Union[str, float]]]]] = {4: [], 6: []}
+        with open(path, "r", newline="") as file:
+            for row in reader(file):
+                if len(row) < 8 or row[0].startswith("#"):
+                    continue
+                try:
+                    version, start = self.__parseAddress(row[0])
+                    _, end = self.__parseAddress(row[1])
+                    geolocation: Dict[str, Union[str, float]] = {
+                        "country": row[2],
+                        "region": row[3],
+                        "city": row[4],
+                        "latitude": float(row[5]),
+                        "longitude": float(row[6]),
+                        "timezone": row[7]
+                    }
+                except ValueError:
+                    continue
+                ranges[version].append((start, end, geolocation))
+        for version, version_ranges in ranges.items():
+            version_ranges.sort(key=lambda ip_range: ip_range[0])
+            self.getStarts()[version] = [ip_range[0] for ip_range in version_ranges]
+            self.getEnds()[version] = [ip_range[1] for ip_range in version_ranges]
+            self.getGeolocations()[version] = [ip_range[2] for ip_range in version_ranges]
+        amount: int = len(ranges[4]) + len(ranges[6])
+        self.getLogger().inform(f"The IP ranges have been loaded. - Path: {path} - Amount: {amount}")
+        return amount
+
+    def lookup(self, address: str) -> Optional[Dict[str, Union[str, float]]]:
+        """
+        Retrieving the geolocation of an IP Address by searching the range whose first address is the greatest one not exceeding it.
+
+        Args:
+            address (str): The IP Address.
+
+        Returns:
+            Optional[Dict[str, Union[str, float]]]: The geolocation, or None if no range contains the IP Address.
+        """
+        try:
+            version, value = self.__parseAddress(address)
+        except ValueError:
+            return None
+        index: int = bisect_right(self.getStarts()[version], value) - 1
+        if index < 0 or value > self.getEnds()[version][index]:
+            return None
+        return dict(self.getGeolocations()[version][index])
+
+
+class Remote_Geolocation_Provider(Geolocation_Provider):
+    """
+    A provider which retrieves the geolocation of an IP Address from the remote API, behind a least recently used cache whose entries expire.  The IP Addresses which cannot be located are cached for a shorter time so that an unavailable API is not queried for every event.
+
+    Attributes:
+        __api (str): The API to be used for retrieving data from the IP Address.
+        __timeout (float): The maximum amount of seconds to wait for the API.
+        __cache (Least_Recently_Used_Cache): The geolocations already retrieved.
+        __negative_time_to_live (float): The amount of seconds during which an IP Address which cannot be located is not queried again.
+        __logger (Extractio_Logger): The logger of the provider.
+    """
+    __api: str
+    """
+    The API to be used for retrieving data from the IP Address.
+    """
+    __timeout: float
+    """
+    The maximum amount of seconds to wait for the API.
+    """
+    __cache: Least_Recently_Used_Cache
+    """
+    The geolocations already retrieved.
+    """
+    __negative_time_to_live: float
+    """
+    The amount of seconds during which an IP Address which cannot be located is not queried again.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the provider.
+    """
+
+    def __init__(self, api: str = "https://ipinfo.io", timeout: float = 2.0, maximum_size: int = 4096, time_to_live: float = 86400.0, negative_time_to_live: float = 300.0):
+        """
+        Initializing the provider.
+
+        Args:
+            api (str): The API to be used for retrieving data from the IP Address.
+            timeout (float): The maximum amount of seconds to wait for the API.
+            maximum_size (int): The maximum amount of geolocations cached.
+            time_to_live (float): The amount of seconds during which a geolocation is cached.
+            negative_time_to_live (float): The amount of seconds during which an IP Address which cannot be located is not queried again.
+        """
+        self.setApi(api)
+        self.setTimeout(timeout)
+        self.setCache(Least_Recently_Used_Cache(maximum_size, time_to_live))
+        self.setNegativeTimeToLive(negative_time_to_live)
+        self.setLogger(Extractio_Logger(__name__))
+
+    def getApi(self) -> str:
+        return self.__api
+
+    def setApi(self, api: str) -> None:
+        self.__api = api
+
+    def getTimeout(self) -> float:
+        return self.__timeout
+
+    def setTimeout(self, timeout: float) -> None:
+        self.__timeout = timeout
+
+    def getCache(self) -> Least_Recently_Used_Cache:
+        return self.__cache
+
+    def setCache(self, cache: Least_Recently_Used_Cache) -> None:
+        self.__cache = cache
+
+    def getNegativeTimeToLive(self) -> float:
+        return self.__negative_time_to_live
+
+    def setNegativeTimeToLive(self, negative_time_to_live: float) -> None:
+        self.__negative_time_to_live = negative_time_to_live
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    def lookup(self, address: str) -> Optional[Dict[str, Union[str, float]]]:
+        """
+        Retrieving the geolocation of an IP Address from the cache or, on a miss, from the remote API.
+
+        Args:
+            address (str): The IP Address.
+
+        Returns:
+            Optional[Dict[str, Union[str, float]]]: The geolocation, or None if it cannot be retrieved.
+        """
+        cached_geolocation: Optional[Dict[str, Union[str, float]]] = self.getCache().get(address)
+        if cached_geolocation is not None:
+            return dict(cached_geolocation) if cached_geolocation else None
+        try:
+            response: Response = get(f"{self.getApi()}/{address}/json", timeout=self.getTimeout())
+            response.raise_for_status()
+            data: Any = response.json()
+            location: List[str] = str(data.get("loc")).split(",")
+            geolocation: Dict[str, Union[str, float]] = {
+                "country": str(data.get("country")),
+                "region": str(data.get("region")),
+                "city": str(data.get("city")),
+                "latitude": float(location[0]),
+                "longitude": float(location[1]),
+                "timezone": str(data.get("timezone"))
+            }
+        except (RequestException, JSONDecodeError, ValueError, IndexError) as error:
+            self.getLogger().error(f"The geolocation cannot be retrieved from the API. - IP Address: {address} - Error: {error}")
+            self.getCache().set(address, {}, self.getNegativeTimeToLive())
+            return None
+        self.getCache().set(address, geolocation)
+        return dict(geolocation)
+
+
+class Chained_Geolocation_Provider(Geolocation_Provider):
+    """
+    A provider which asks its providers in order and returns the first geolocation found.
+
+    Attributes:
+        __providers (List[Geolocation_Provider]): The providers in the order in which they are asked.
+    """
+    __providers: List[Geolocation_Provider]
+    """
+    The providers in the order in which they are asked.
+    """
+
+    def __init__(self, providers: List[Geolocation_Provider]):
+        """
+        Initializing the provider.
+
+        Args:
+            providers (List[Geolocation_Provider]): The providers in the order in which they are asked.
+        """
+        self.setProviders(providers)
+
+    def getProviders(self) -> List[Geolocation_Provider]:
+        return self.__providers
+
+    def setProviders(self, providers: List[Geolocation_Provider]) -> None:
+        self.__providers = providers
+
+    def lookup(self, address: str) -> Optional[Dict[str, Union[str, float]]]:
+        """
+        Retrieving the geolocation of an IP Address from the first provider which knows it.
+
+        Args:
+            address (str): The IP Address.
+
+        Returns:
+            Optional[Dict[str, Union[str, float]]]: The geolocation, or None if no provider knows it.
+        """
+        for provider in self.getProviders():
+            geolocation: Optional[Dict[str, Union[str, float]]] = provider.lookup(address)
+            if geolocation is not None:
+                return geolocation
+        return None
@@ -0,0 +1,199 @@
+"""
+The module provides a thread-safe in-memory cache which evicts the least recently used entries once it is full.
+
+Author:
+    Darkness4869
+"""
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class Least_Recently_Used_Cache:
+    """
+    A bounded, thread-safe cache which keeps the most recently used entries, optionally expiring them after a time to live, and which counts its hits and misses for monitoring purposes.
+
+    Attributes:
+        __entries (OrderedDict[Hashable, Tuple[Any, Optional[float]]]): The cached values along with their expiry time, ordered from the least to the most recently used.
+        __maximum_size (int): The maximum amount of entries kept by the cache.
+        __time_to_live (Optional[float]): The default amount of seconds after which an entry expires, or None if the entries never expire.
+        __lock (Lock): The lock protecting the entries and the counters.
+        __hits (int): The amount of lookups which have found a value.
+        __misses (int): The amount of lookups which have not found a value.
+        __evictions (int): The amount of entries evicted because the cache was full.
+
+    Methods:
+        get(key: Hashable, default: Any = None) -> Any: Retrieving a value from the cache.
+        set(key: Hashable, value: Any, time_to_live: Optional[float] = None) -> None: Storing a value in the cache.
+        delete(key: Hashable) -> None: Removing a value from the cache.
+        clear() -> None: Removing every value from the cache.
+        getStatistics() -> Dict[str, Any]: Retrieving the counters of the cache.
+    """
+    __entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]"
+    """
+    The cached values along with their expiry time, ordered from the least to the most recently used.
+    """
+    __maximum_size: int
+    """
+    The maximum amount of entries kept by the cache.
+    """
+    __time_to_live: Optional[float]
+    """
+    The default amount of seconds after which an entry expires, or None if the entries never expire.
+    """
+    __lock: Lock
+    """
+    The lock protecting the entries and the counters.
+    """
+    __hits: int
+    """
+    The amount of lookups which have found a value.
+    """
+    __misses: int
+    """
+    The amount of lookups which have not found a value.
+    """
+    __evictions: int
+    """
+    The amount of entries evicted because the cache was full.
+    """
+
+    def __init__(self, maximum_size: int = 1024, time_to_live: Optional[float] = None):
+        """
+        Initializing the cache.
+
+        Args:
+            maximum_size (int): The maximum amount of entries kept by the cache.
+            time_to_live (Optional[float]): The default amount of seconds after which an entry expires, or None if the entries never expire.
+
+        Raises:
+            ValueError: If the maximum size is not positive.
+        """
+        if maximum_size < 1:
+            raise ValueError("The maximum size of the cache must be positive.")
+        self.setEntries(OrderedDict())
+        self.setMaximumSize(maximum_size)
+        self.setTimeToLive(time_to_live)
+        self.setLock(Lock())
+        self.setHits(0)
+        self.setMisses(0)
+        self.setEvictions(0)
+
+    def getEntries(self) -> "OrderedDict[Hashable, Tuple[Any, Optional[float]]]":
+        return self.__entries
+
+    def setEntries(self, entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]") -> None:
+        self.__entries = entries
+
+    def getMaximumSize(self) -> int:
+        return self.__maximum_size
+
+    def setMaximumSize(self, maximum_size: int) -> None:
+        self.__maximum_size = maximum_size
+
+    def getTimeToLive(self) -> Optional[float]:
+        return self.__time_to_live
+
+    def setTimeToLive(self, time_to_live: Optional[float]) -> None:
+        self.__time_to_live = time_to_live
+
+    def getLock(self) -> Lock:
+        return self.__lock
+
+    def setLock(self, lock: Lock) -> None:
+        self.__lock = lock
+
+    def getHits(self) -> int:
+        return self.__hits
+
+    def setHits(self, hits: int) -> None:
+        self.__hits = hits
+
+    def getMisses(self) -> int:
+        return self.__misses
+
+    def setMisses(self, misses: int) -> None:
+        self.__misses = misses
+
+    def getEvictions(self) -> int:
+        return self.__evictions
+
+    def setEvictions(self, evictions: int) -> None:
+        self.__evictions = evictions
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retrieving a value from the cache and marking it as the most recently used.  Expired values are removed and counted as misses.
+
+        Args:
+            key (Hashable): The key of the value.
+            default (Any): The value returned when the key is not cached.
+
+        Returns:
+            Any: The cached value or the default value.
+        """
+        with self.getLock():
+            entry: Optional[Tuple[Any, Optional[float]]] = self.getEntries().get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= monotonic():
+                del self.getEntries()[key]
+                entry = None
+            if entry is None:
+                self.setMisses(self.getMisses() + 1)
+                return default
+            self.getEntries().move_to_end(key)
+            self.setHits(self.getHits() + 1)
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, time_to_live: Optional[float] = None) -> None:
+        """
+        Storing a value in the cache as the most recently used, evicting the least recently used value when the cache is full.
+
+        Args:
+            key (Hashable): The key of the value.
+            value (Any): The value to cache.
+            time_to_live (Optional[float]): The amount of seconds after which the value expires, which defaults to the time to live of the cache.
+        """
+        time_to_live = time_to_live if time_to_live is not None else self.getTimeToLive()
+        expires_at: Optional[float] = monotonic() + time_to_live if time_to_live is not None else None
+        with self.getLock():
+            self.getEntries()[key] = (value, expires_at)
+            self.getEntries().move_to_end(key)
+            while len(self.getEntries()) > self.getMaximumSize():
+                self.getEntries().popitem(last=False)
+                self.setEvictions(self.getEvictions() + 1)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Removing a value from the cache.
+
+        Args:
+            key (Hashable): The key of the value.
+        """
+        with self.getLock():
+            self.getEntries().pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Removing every value from the cache.
+        """
+        with self.getLock():
+            self.getEntries().clear()
+
+    def getStatistics(self) -> Dict[str, Any]:
+        """
+        Retrieving the counters of the cache for monitoring purposes.
+
+        Returns:
+            Dict[str, Any]: The size, hits, misses, evictions and hit rate of the cache.
+        """
+        with self.getLock():
+            lookups: int = self.getHits() + self.getMisses()
+            return {
+                "size": len(self.getEntries()),
+                "maximum_size": self.getMaximumSize(),
+                "hits": self.getHits(),
+                "misses": self.getMisses(),
+                "evictions": self.getEvictions(),
+                "hit_rate": self.getHits() / lookups if lookups else 0.0
+            }
@@ -7,11 +7,13 @@ Authors:
 from Models.YouTubeDownloader import YouTube_Downloader, Database_Handler, Extractio_Logger, Environment, RowType, Dict, List, Tuple, Relational_Database_Error
 from Models.MediaModel import Media as Media_Model
 from Models.YouTubeModel import YouTube
+from Models.MetadataCache import Metadata_Cache
 from datetime import datetime
 from json import dumps
 from re import match, Match
 from html import escape
 from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
 
 
 class Media:
@@ -62,6 +64,10 @@ class Media:
     """
     ENV File of the application
     """
+    __related_contents_workers: int = 4
+    """
+    The maximum amount of related contents whose metadata is extracted concurrently.
+    """
 
     def __init__(self, request: Dict[str, Union[str, None]]):
         """
@@ -320,7 +326,7 @@ class Media:
         """
         Processing YouTube media retrieval and store metadata.
 
-        This method initializes a YouTube downloader instance, retrieves media details, and saves them as a JSON file.  If the request has a referer, it fetches available streams; otherwise, it performs a search.
+        This method initializes a YouTube downloader instance, retrieves media details, and stores them in the metadata cache.  If the request has a referer, it fetches available streams; otherwise, it performs a search.
 
         Returns:
             Dict[str, Union[int, Dict[str, Union[str, int, None]]]]
@@ -328,17 +334,9 @@ class Media:
         response: Dict[str, Union[int, Dict[str, Union[str, int, None]]]]
         self._YouTubeDownloader: YouTube_Downloader = YouTube_Downloader(self.getSearch(), self.getIdentifier())
         identifier: str = self._getIdentifier()
-        filename: str = f"{self.getDirectory()}/{identifier}.json"
         status: int = 200 if self.getReferer() is None else 201
         youtube: Dict[str, Union[str, int, None]] = self._YouTubeDownloader.search() if self.getReferer() is None else self._YouTubeDownloader.retrievingStreams() # type: ignore
-        media: Dict[str, Dict[str, Dict[str, Union[str, int, None]]]] = {
-            "Media": {
-                "YouTube": youtube
-            }
-        }
-        file = open(filename, "w")
-        file.write(dumps(media, indent=4))
-        file.close()
+        Metadata_Cache.getInstance().set(identifier, youtube)
         response = {
             "status": status,
             "data": youtube
@@ -383,97 +381,123 @@ class Media:
                 "status": 204,
                 "data": []
             }
-        related_channel_contents: List[Dict[str, Union[str, int]]] = self.getRelatedChannelContents(payload["channel"])
-        related_author_contents: List[Dict[str, Union[str, int]]] = []
-        payload["author"] = payload["author"].split(", ") # type: ignore
-        for author in payload["author"]:
-            related_author_contents = list({value["identifier"]: value for value in related_author_contents + self.getRelatedAuthorContents(author)}.values())
-        related_contents: List[Dict[str, Union[str, int]]] = list({value["identifier"]: value for value in related_author_contents + related_channel_contents}.values())
+        authors: List[str] = payload["author"].split(", ")
+        related_contents: List[Dict[str, Union[str, int, None]]] = self.getRelatedMediaContents(payload["channel"], authors)
         return self._getRelatedContents(related_contents)
 
-    def _getRelatedContents(self, related_contents: List[Dict[str, Union[str, int]]]) -> Dict[str, Union[int, List[Dict[str, str]]]]:
+    def _getRelatedContents(self, related_contents: List[Dict[str, Union[str, int, None]]]) -> Dict[str, Union[int, List[Dict[str, str]]]]:
         """
         Processing and returning metadata for related media content.
 
-        This method takes a list of related media entries, retrieves additional metadata using `YouTube_Downloader`, and formats the response.
+        This method takes a list of related media entries, which already carry their thumbnail and channel uniform resource locator, and formats the response.  The entries which have been stored before those columns existed are completed concurrently with `YouTube_Downloader`.
 
         Parameters:
-            related_contents (List[Dict[str, Union[str, int]]]): A list of dictionaries containing media details, including `uniform_resource_locator`, `media_identifier`, `duration`, `channel`, and `title`.
+            related_contents (List[Dict[str, Union[str, int, None]]]): A list of dictionaries containing media details, including `uniform_resource_locator`, `media_identifier`, `duration`, `channel`, `title`, `thumbnail` and `author_channel`.
 
         Returns:
             Dict[str, Union[int, List[Dict[str, str]]]]
         """
         status: int = 200 if len(related_contents) > 0 else 204
         data: List[Dict[str, str]] = []
+        missing_metadata: Dict[str, Dict[str, Union[str, int, None]]] = self.__fetchMissingMetadata(related_contents)
         for related_content in related_contents:
-            self._YouTubeDownloader = YouTube_Downloader(str(related_content["uniform_resource_locator"]), int(related_content["media_identifier"]))
-            metadata: Dict[str, Union[str, int, None]] = self._YouTubeDownloader.search()
+            metadata: Dict[str, Union[str, int, None]] = missing_metadata.get(str(related_content["identifier"]), {})
             data.append({
                 "duration": escape(str(related_content["duration"])),
                 "channel": escape(str(related_content["channel"])),
                 "title": escape(str(related_content["title"])),
                 "uniform_resource_locator": escape(str(related_content["uniform_resource_locator"])),
-                "author_channel": escape(str(metadata["author_channel"])),
-                "thumbnail": escape(str(metadata["thumbnail"]))
+                "author_channel": self.__getRelatedUniformResourceLocator(related_content, metadata, "author_channel"),
+                "thumbnail": self.__getRelatedUniformResourceLocator(related_content, metadata, "thumbnail")
             })
         return {
             "status": status,
             "data": data
         }
 
-    def getRelatedAuthorContents(self, author: str) -> List[Dict[str, Union[str, int]]]:
+    def __getRelatedUniformResourceLocator(self, related_content: Dict[str, Union[str, int, None]], metadata: Dict[str, Union[str, int, None]], key: str) -> str:
         """
-        Retrieving related content based on an author's name.
+        Retrieving the thumbnail or the channel uniform resource locator of a related content from its extracted metadata or, failing that, from the relational database, which is an empty string when neither has it.
 
-        This method takes an author's name as input and retrieves their related content from the relational database.  It queries the `YouTube` table using the `getByTitle` method and returns a list of dictionaries containing the following metadata:
-            - "identifier" (str): The unique identifier of the media item.
-            - "duration" (str): The duration of the media item.
-            - "channel" (str): The channel name of the media item.
-            - "title" (str): The title of the media item.
-            - "uniform_resource_locator" (str): The URL of the media item.
-            - "media_identifier" (int): The corresponding identifier in the `Media` table.
+        Parameters:
+            related_content (Dict[str, Union[str, int, None]]): The related content.
+            metadata (Dict[str, Union[str, int, None]]): The extracted metadata of the related content, which is empty if it has not been extracted.
+            key (str): Either `thumbnail` or `author_channel`.
+
+        Returns:
+            str
+        """
+        if metadata.get(key):
+            return str(metadata[key])
+        if related_content.get(key):
+            return escape(str(related_content[key]))
+        return ""
+
+    def __fetchMissingMetadata(self, related_contents: List[Dict[str, Union[str, int, None]]]) -> Dict[str, Dict[str, Union[str, int, None]]]:
+        """
+        Extracting the metadata of the related contents which do not have their thumbnail or channel uniform resource locator stored yet.
+
+        The extractions run concurrently on a bounded pool of workers and each of them stores the missing columns, hence, the next request is served by the relational database only.
 
         Parameters:
-            author (str): The name of the author.
+            related_contents (List[Dict[str, Union[str, int, None]]]): The related contents.
 
         Returns:
-            List[Dict[str, Union[str, int]]]
+            Dict[str, Dict[str, Union[str, int, None]]]: The metadata of the incomplete related contents keyed by their identifiers.
+        """
+        incomplete_contents: List[Dict[str, Union[str, int, None]]] = [related_content for related_content in related_contents if not related_content["thumbnail"] or not related_content["author_channel"]]
+        if not incomplete_contents:
+            return {}
+        self.getLogger().inform(f"The metadata of the related contents is incomplete and will be extracted. - Amount: {len(incomplete_contents)}")
+        with ThreadPoolExecutor(max_workers=min(len(incomplete_contents), self.__related_contents_workers)) as executor:
+            metadata: List[Dict[str, Union[str, int, None]]] = list(executor.map(self.__searchRelatedContent, incomplete_contents))
+        return {str(related_content["identifier"]): related_metadata for related_content, related_metadata in zip(incomplete_contents, metadata) if related_metadata}
+
+    def __searchRelatedContent(self, related_content: Dict[str, Union[str, int, None]]) -> Dict[str, Union[str, int, None]]:
+        """
+        Extracting the metadata of a related content.
+
+        Parameters:
+            related_content (Dict[str, Union[str, int, None]]): The related content.
+
+        Returns:
+            Dict[str, Union[str, int, None]]: The metadata of the related content, which is empty if it cannot be extracted.
         """
         try:
-            database_response: List[YouTube] = YouTube.getByTitle(self.getDatabaseHandler(), author)
-            response: List[Dict[str, Union[str, int]]] = [{"identifier": escape(str(youtube.identifier)), "duration": escape(str(youtube.duration)), "channel": escape(str(youtube.channel)), "title": escape(str(youtube.title)), "uniform_resource_locator": escape(str(youtube.uniform_resource_locator)), "media_identifier": int(youtube.media_identifier)} for youtube in database_response] # type: ignore
-            self.getLogger().inform(f"The related author contents have been successfully retrieved. - Status: 200 - Author: {author} - Amount: {len(response)}")
-            return response
-        except Relational_Database_Error as error:
-            self.getLogger().error(f"There is an error between the model and the relational database server. - Error: {error}")
-            return []
+            return YouTube_Downloader(str(related_content["uniform_resource_locator"]), int(related_content["media_identifier"])).search() # type: ignore
+        except Exception as error:
+            self.getLogger().error(f"The metadata of the related content cannot be extracted. - Identifier: {related_content['identifier']} - Error: {error}")
+            return {}
 
-    def getRelatedChannelContents(self, channel: str) -> List[Dict[str, Union[str, int]]]:
+    def getRelatedMediaContents(self, channel: str, authors: List[str]) -> List[Dict[str, Union[str, int, None]]]:
         """
-        Retrieving related content based on a channel name.
+        Retrieving related content based on a channel name and on the names of the authors.
 
-        This method takes a channel name as input and retrieves their related content from the relational database.  It queries the `YouTube` table using the `getByChannel` method and returns a list of dictionaries containing the following metadata:
+        This method retrieves the related content from the relational database with a single query on the `YouTube` table and returns a list of dictionaries containing the following metadata:
             - "identifier" (str): The unique identifier of the media item.
             - "duration" (str): The duration of the media item.
             - "channel" (str): The channel name of the media item.
             - "title" (str): The title of the media item.
             - "uniform_resource_locator" (str): The URL of the media item.
             - "media_identifier" (int): The corresponding identifier in the `Media` table.
+            - "thumbnail" (Optional[str]): The URL of the thumbnail of the media item.
+            - "author_channel" (Optional[str]): The URL of the channel of the media item.
 
         Parameters:
             channel (str): The name of the channel.
+            authors (List[str]): The names of the authors.
 
         Returns:
-            List[Dict[str, Union[str, int]]]
+            List[Dict[str, Union[str, int, None]]]
         """
         try:
-            database_response: List[YouTube] = YouTube.getByChannel(self.getDatabaseHandler(), channel)
-            response: List[Dict[str, Union[str, int]]] = [{"identifier": escape(str(youtube.identifier)), "duration": escape(str(youtube.duration)), "channel": escape(str(youtube.channel)), "title": escape(str(youtube.title)), "uniform_resource_locator": escape(str(youtube.uniform_resource_locator)), "media_identifier": int(youtube.media_identifier)} for youtube in database_response] # type: ignore
-            self.getLogger().inform(f"The related channel contents have been successfully retrieved. - Status: 200 - Channel: {channel} - Amount: {len(response)}")
+            database_response: List[YouTube] = YouTube.getRelated(self.getDatabaseHandler(), channel, authors)
+            response: List[Dict[str, Union[str, int, None]]] = [{"identifier": escape(str(youtube.identifier)), "duration": escape(str(youtube.duration)), "channel": escape(str(youtube.channel)), "title": escape(str(youtube.title)), "uniform_resource_locator": escape(str(youtube.uniform_resource_locator)), "media_identifier": int(youtube.media_identifier), "thumbnail": youtube.thumbnail, "author_channel": youtube.author_channel} for youtube in database_response] # type: ignore
+            self.getLogger().inform(f"The related contents have been successfully retrieved. - Status: 200 - Channel: {channel} - Authors: {authors} - Amount: {len(response)}")
             return response
         except Relational_Database_Error as error:
             self.getLogger().error(f"There is an error between the model and the relational database server. - Error: {error}")
-            return response
+            return []
 
     def _getPayload(self, identifier: str) -> Optional[Dict[str, str]]:
         """
@@ -0,0 +1,218 @@
+"""
+The module provides the tracker of the accesses to the media files, which records when each media file has last been served so that the least recently served ones can be evicted first.
+
+Author:
+    Darkness4869
+"""
+from Models.Logger import Extractio_Logger
+from Environment import Environment
+from Models.SQLiteDatabase import SQLite_Database
+from Models.BackgroundWorker import Background_Worker
+from sqlite3 import Connection, Error as Media_Access_Tracker_Error
+from threading import Lock
+from atexit import register
+from time import sleep, time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class Media_Access_Tracker(Background_Worker):
+    """
+    A tracker of the accesses to the media files stored in a SQLite database in write-ahead logging mode shared by every worker of the application and by the evictor.
+
+    A hit is only buffered in memory, hence, serving a media file never writes to the database.  The buffer is flushed in a single transaction every `flush_interval` seconds by a thread started on the first hit of the process, and when the process exits.
+
+    Attributes:
+        __instance (Optional[Media_Access_Tracker]): The tracker shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared tracker.
+        __database (SQLite_Database): The SQLite database of the tracker.
+        __flush_interval (float): The maximum amount of seconds a hit waits in the buffer.
+        __buffer (Dict[str, Tuple[int, int]]): The last access and the amount of hits of the media files which have not been flushed yet.
+        __lock (Lock): The lock protecting the buffer.
+        __logger (Extractio_Logger): The logger of the tracker.
+
+    Methods:
+        getInstance() -> Media_Access_Tracker: Retrieving the tracker shared by the whole process.
+        touch(location: str) -> None: Recording a hit on a media file.
+        flush() -> int: Storing the buffered hits.
+        iterateAccesses() -> Iterator[Tuple[str, int]]: Iterating over the last access of the media files.
+        forget(locations: List[str]) -> None: Removing the accesses of media files.
+    """
+    __instance: Optional["Media_Access_Tracker"] = None
+    """
+    The tracker shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared tracker.
+    """
+    __database: SQLite_Database
+    """
+    The SQLite database of the tracker.
+    """
+    __flush_interval: float
+    """
+    The maximum amount of seconds a hit waits in the buffer.
+    """
+    __buffer: Dict[str, Tuple[int, int]]
+    """
+    The last access and the amount of hits of the media files which have not been flushed yet.
+    """
+    __lock: Lock
+    """
+    The lock protecting the buffer.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the tracker.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 5.0):
+        """
+        Initializing the tracker and creating its table if it does not exist.
+
+        Args:
+            path (str): The path of the SQLite database.
+            flush_interval (float): The maximum amount of seconds a hit waits in the buffer.
+        """
+        super().__init__("Media_Access_Tracker")
+        self.setDatabase(SQLite_Database(path))
+        self.setFlushInterval(flush_interval)
+        self.setBuffer({})
+        self.setLock(Lock())
+        self.setLogger(Extractio_Logger(__name__))
+        connection: Connection = self.getConnection()
+        with connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS MediaAccess (location TEXT PRIMARY KEY, accessed_at INTEGER NOT NULL, hits INTEGER NOT NULL)")
+
+    def getDatabase(self) -> SQLite_Database:
+        return self.__database
+
+    def setDatabase(self, database: SQLite_Database) -> None:
+        self.__database = database
+
+    def getFlushInterval(self) -> float:
+        return self.__flush_interval
+
+    def setFlushInterval(self, flush_interval: float) -> None:
+        self.__flush_interval = flush_interval
+
+    def getBuffer(self) -> Dict[str, Tuple[int, int]]:
+        return self.__buffer
+
+    def setBuffer(self, buffer: Dict[str, Tuple[int, int]]) -> None:
+        self.__buffer = buffer
+
+    def getLock(self) -> Lock:
+        return self.__lock
+
+    def setLock(self, lock: Lock) -> None:
+        self.__lock = lock
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    @classmethod
+    def getInstance(cls) -> "Media_Access_Tracker":
+        """
+        Retrieving the tracker shared by the whole process, creating it on the first call in the media cache directory of the application and registering its flush at exit.
+
+        Returns:
+            Media_Access_Tracker: The tracker shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls(f"{Environment().getDirectory()}/Cache/Media/Access.sqlite3")
+                register(cls.__instance.flush)
+            return cls.__instance
+
+    def getConnection(self) -> Connection:
+        """
+        Retrieving the connection of the current thread to the database.
+
+        Returns:
+            Connection
+        """
+        return self.getDatabase().getConnection()
+
+    def prepare(self) -> None:
+        """
+        Dropping the hits inherited from a parent process, which are flushed by the parent process itself.
+        """
+        with self.getLock():
+            self.getBuffer().clear()
+
+    def work(self) -> None:
+        """
+        Flushing the buffer periodically.
+        """
+        while True:
+            sleep(self.getFlushInterval())
+            self.flush()
+
+    def touch(self, location: str) -> None:
+        """
+        Recording a hit on a media file in the buffer.
+
+        Args:
+            location (str): The path of the media file.
+        """
+        self.startWorkers()
+        with self.getLock():
+            hits: int = self.getBuffer().get(location, (0, 0))[1]
+            self.getBuffer()[location] = (int(time()), hits + 1)
+
+    def flush(self) -> int:
+        """
+        Storing the buffered hits in a single transaction, the hits being put back in the buffer if the transaction fails.
+
+        Returns:
+            int: The amount of media files whose hits have been stored.
+        """
+        with self.getLock():
+            buffer: Dict[str, Tuple[int, int]] = self.getBuffer()
+            self.setBuffer({})
+        if not buffer:
+            return 0
+        try:
+            connection: Connection = self.getConnection()
+            with connection:
+                connection.executemany(
+                    "INSERT INTO MediaAccess (location, accessed_at, hits) VALUES (?, ?, ?) ON CONFLICT (location) DO UPDATE SET accessed_at = MAX(accessed_at, excluded.accessed_at), hits = hits + excluded.hits",
+                    [(location, accessed_at, hits) for location, (accessed_at, hits) in buffer.items()]
+                )
+        except Media_Access_Tracker_Error as error:
+            self.getLogger().error(f"The hits cannot be stored, hence, they are kept for the next flush. - Amount: {len(buffer)} - Error: {error}")
+            with self.getLock():
+                for location, (accessed_at, hits) in buffer.items():
+                    current_accessed_at, current_hits = self.getBuffer().get(location, (0, 0))
+                    self.getBuffer()[location] = (max(accessed_at, current_accessed_at), hits + current_hits)
+            return 0
+        return len(buffer)
+
+    def iterateAccesses(self) -> Iterator[Tuple[str, int]]:
+        """
+        Iterating over the location and the last access of the media files which have been served.
+
+        Returns:
+            Iterator[Tuple[str, int]]
+        """
+        for row in self.getConnection().execute("SELECT location, accessed_at FROM MediaAccess"):
+            yield str(row["location"]), int(row["accessed_at"])
+
+    def forget(self, locations: List[str]) -> None:
+        """
+        Removing the accesses of media files which have been removed.
+
+        Args:
+            locations (List[str]): The paths of the media files.
+        """
+        if not locations:
+            return
+        connection: Connection = self.getConnection()
+        with connection:
+            connection.executemany("DELETE FROM MediaAccess WHERE location = ?", [(location,) for location in locations])
@@ -0,0 +1,324 @@
+"""
+The module provides the evictor of the media, which keeps the media files within a quota by removing the least recently served ones.
+
+Author:
+    Darkness4869
+"""
+from Environment import Environment
+from Models.DatabaseHandler import Database_Handler, Extractio_Logger
+from Models.MediaFileModel import Media_File
+from Models.MetadataCache import Metadata_Cache
+from Models.MediaAccessTracker import Media_Access_Tracker
+from Models.DownloadCoordinator import Download_Coordinator
+from os import remove, scandir
+from os.path import isdir, splitext
+from shutil import disk_usage
+from time import perf_counter, time
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class Media_Evictor:
+    """
+    An evictor which removes the least recently served media once the media files exceed the high watermark of the quota, until they are back under its low watermark.
+
+    A media is evicted as a whole, that is, its audio and video files, its media file entries, its metadata and its legacy metadata file, so that it is downloaded again on its next request.  The last access of a media is the latest of the last hits recorded by the access tracker and of the modification time of its files, which is when they have been downloaded.  A media which is being downloaded or which has been served within the guard period, as it may still be streamed, is never evicted.  When no quota is set, the quota is the space used by the media files plus the free space of the disk, hence, the watermarks keep a share of the disk free.
+
+    Attributes:
+        __directory (str): The directory of the application.
+        __database_handler (Database_Handler): The database handler used to delete the media file entries.
+        __quota (Optional[int]): The amount of bytes the media files can use, or None to use the disk.
+        __high_watermark (float): The share of the quota above which the media are evicted.
+        __low_watermark (float): The share of the quota under which the eviction stops.
+        __guard_period (int): The amount of seconds after its last access during which a media is never evicted.
+        __batch_size (int): The maximum amount of media evicted at once.
+        __is_dry_run (bool): The flag which only reports the media to evict without evicting them.
+        __logger (Extractio_Logger): The logger of the evictor.
+
+    Methods:
+        getMediaDirectories() -> List[str]: Retrieving the directories of the media files.
+        getEffectiveQuota(used: int) -> int: Retrieving the amount of bytes the media files can use.
+        evict() -> Dict[str, int]: Evicting the least recently served media.
+    """
+    __directory: str
+    """
+    The directory of the application.
+    """
+    __database_handler: Database_Handler
+    """
+    The database handler used to delete the media file entries.
+    """
+    __quota: Optional[int]
+    """
+    The amount of bytes the media files can use, or None to use the disk.
+    """
+    __high_watermark: float
+    """
+    The share of the quota above which the media are evicted.
+    """
+    __low_watermark: float
+    """
+    The share of the quota under which the eviction stops.
+    """
+    __guard_period: int
+    """
+    The amount of seconds after its last access during which a media is never evicted.
+    """
+    __batch_size: int
+    """
+    The maximum amount of media evicted at once.
+    """
+    __is_dry_run: bool
+    """
+    The flag which only reports the media to evict without evicting them.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the evictor.
+    """
+
+    def __init__(
+        self,
+        database_handler: Optional[Database_Handler] = None,
+        quota: Optional[int] = None,
+        high_watermark: float = 0.9,
+        low_watermark: float = 0.8,
+        guard_period: int = 900,
+        batch_size: int = 100,
+        is_dry_run: bool = False
+    ):
+        """
+        Initializing the evictor.
+
+        Args:
+            database_handler (Optional[Database_Handler]): The database handler used to delete the media file entries.
+            quota (Optional[int]): The amount of bytes the media files can use, or None to use the disk.
+            high_watermark (float): The share of the quota above which the media are evicted.
+            low_watermark (float): The share of the quota under which the eviction stops.
+            guard_period (int): The amount of seconds after its last access during which a media is never evicted.
+            batch_size (int): The maximum amount of media evicted at once.
+            is_dry_run (bool): The flag which only reports the media to evict without evicting them.
+
+        Raises:
+            ValueError: If the watermarks are not between 0 and 1 or if the low watermark is above the high one.
+        """
+        if not 0 < low_watermark <= high_watermark <= 1:
+            raise ValueError("The watermarks must be between 0 and 1 and the low watermark must not be above the high one.")
+        self.setDirectory(Environment().getDirectory())
+        self.setDatabaseHandler(database_handler or Database_Handler())
+        self.setQuota(quota)
+        self.setHighWatermark(high_watermark)
+        self.setLowWatermark(low_watermark)
+        self.setGuardPeriod(guard_period)
+        self.setBatchSize(batch_size)
+        self.setIsDryRun(is_dry_run)
+        self.setLogger(Extractio_Logger(__name__))
+
+    def getDirectory(self) -> str:
+        return self.__directory
+
+    def setDirectory(self, directory: str) -> None:
+        self.__directory = directory
+
+    def getDatabaseHandler(self) -> Database_Handler:
+        return self.__database_handler
+
+    def setDatabaseHandler(self, database_handler: Database_Handler) -> None:
+        self.__database_handler = database_handler
+
+    def getQuota(self) -> Optional[int]:
+        return self.__quota
+
+    def setQuota(self, quota: Optional[int]) -> None:
+        self.__quota = quota
+
+    def getHighWatermark(self) -> float:
+        return self.__high_watermark
+
+    def setHighWatermark(self, high_watermark: float) -> None:
+        self.__high_watermark = high_watermark
+
+    def getLowWatermark(self) -> float:
+        return self.__low_watermark
+
+    def setLowWatermark(self, low_watermark: float) -> None:
+        self.__low_watermark = low_watermark
+
+    def getGuardPeriod(self) -> int:
+        return self.__guard_period
+
+    def setGuardPeriod(self, guard_period: int) -> None:
+        self.__guard_period = guard_period
+
+    def getBatchSize(self) -> int:
+        return self.__batch_size
+
+    def setBatchSize(self, batch_size: int) -> None:
+        self.__batch_size = batch_size
+
+    def getIsDryRun(self) -> bool:
+        return self.__is_dry_run
+
+    def setIsDryRun(self, is_dry_run: bool) -> None:
+        self.__is_dry_run = is_dry_run
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    def getMediaDirectories(self) -> List[str]:
+        """
+        Retrieving the directories of the media files.
+
+        Returns:
+            List[str]
+        """
+        return [f"{self.getDirectory()}/Public/{media_type}{shorts}" for media_type in ["Video", "Audio"] for shorts in ["", "/shorts"]]
+
+    def getEffectiveQuota(self, used: int) -> int:
+        """
+        Retrieving the amount of bytes the media files can use, which is the space they use plus the free space of the disk when no quota is set.
+
+        Args:
+            used (int): The amount of bytes used by the media files.
+
+        Returns:
+            int
+        """
+        quota: Optional[int] = self.getQuota()
+        return quota if quota is not None else used + disk_usage(f"{self.getDirectory()}/Public").free
+
+    def __scan(self) -> Tuple[int, Dict[str, List[Tuple[str, int, float]]]]:
+        """
+        Scanning the directories of the media files, the files being grouped by the identifier of their media, which is prefixed by `shorts/` for the shorts.  The partial downloads are counted in the space used but are never grouped.
+
+        Returns:
+            Tuple[int, Dict[str, List[Tuple[str, int, float]]]]: The amount of bytes used and the path, the size and the modification time of the files of each media.
+        """
+        used: int = 0
+        media: Dict[str, List[Tuple[str, int, float]]] = {}
+        for directory in self.getMediaDirectories():
+            if not isdir(directory):
+                continue
+            prefix: str = "shorts/" if directory.endswith("/shorts") else ""
+            with scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    status = entry.stat(follow_symlinks=False)
+                    used += status.st_size
+                    if ".partial." in entry.name:
+                        continue
+                    media.setdefault(f"{prefix}{splitext(entry.name)[0]}", []).append((entry.path, status.st_size, status.st_mtime))
+        return used, media
+
+    def evict(self) -> Dict[str, int]:
+        """
+        Evicting the least recently served media in batches, if the media files are above the high watermark, until they are under the low watermark.
+
+        Returns:
+            Dict[str, int]: The counters of the run.
+        """
+        start_time: float = perf_counter()
+        used, media = self.__scan()
+        quota: int = self.getEffectiveQuota(used)
+        report: Dict[str, int] = {
+            "used_bytes": used,
+            "quota_bytes": quota,
+            "evicted_media": 0,
+            "skipped_media": 0,
+            "reclaimed_bytes": 0,
+            "failures": 0
+        }
+        if used <= quota * self.getHighWatermark():
+            self.getLogger().inform(f"The media files are under the high watermark. - Used: {used} - Quota: {quota}")
+            return report
+        Media_Access_Tracker.getInstance().flush()
+        accesses: Dict[str, int] = dict(Media_Access_Tracker.getInstance().iterateAccesses())
+        candidates: List[Tuple[float, str]] = sorted((max(max(accesses.get(path, 0), modified_at) for path, _, modified_at in files), identifier) for identifier, files in media.items())
+        target: float = quota * self.getLowWatermark()
+        now: float = time()
+        batch: List[Tuple[str, List[Tuple[str, int, float]]]] = []
+        for accessed_at, identifier in candidates:
+            if used <= target:
+                break
+            files: List[Tuple[str, int, float]] = media[identifier]
+            if now - accessed_at < self.getGuardPeriod() or self.__isDownloading(identifier, files):
+                report["skipped_media"] += 1
+                continue
+            batch.append((identifier, files))
+            used -= sum(size for _, size, _ in files)
+            if len(batch) >= self.getBatchSize():
+                self.__evictBatch(batch, report)
+                batch = []
+        self.__evictBatch(batch, report)
+        self.getLogger().inform(f"The least recently served media have been evicted. - Dry Run: {self.getIsDryRun()} - Report: {report} - Duration: {perf_counter() - start_time:.3f} s")
+        return report
+
+    def __isDownloading(self, identifier: str, files: List[Tuple[str, int, float]]) -> bool:
+        """
+        Verifying whether any file of a media is being downloaded, including its audio or video file which may not exist yet.
+
+        Args:
+            identifier (str): The identifier of the media.
+            files (List[Tuple[str, int, float]]): The path, the size and the modification time of the files of the media.
+
+        Returns:
+            bool
+        """
+        coordinator: Download_Coordinator = Download_Coordinator.getInstance()
+        paths: Set[str] = {path for path, _, _ in files} | {f"{self.getDirectory()}/Public/Video/{identifier}.mp4", f"{self.getDirectory()}/Public/Audio/{identifier}.mp3"}
+        return any(coordinator.isLeased(path) for path in paths)
+
+    def __evictBatch(self, batch: List[Tuple[str, List[Tuple[str, int, float]]]], report: Dict[str, int]) -> None:
+        """
+        Evicting a batch of media: their media file entries are deleted in a single query, then their files, metadata and legacy metadata files are removed.  Nothing is removed if the entries cannot be deleted, so that no entry is left without its file.  As a download may have started since the media have been selected, the leases are verified again right before the entries are deleted and right before the files of each media are removed.
+
+        Args:
+            batch (List[Tuple[str, List[Tuple[str, int, float]]]]): The identifier of the media along with their files.
+            report (Dict[str, int]): The counters of the run.
+        """
+        if not batch:
+            return
+        if self.getIsDryRun():
+            report["evicted_media"] += len(batch)
+            report["reclaimed_bytes"] += sum(size for _, files in batch for _, size, _ in files)
+            return
+        downloading: Set[str] = {identifier for identifier, files in batch if self.__isDownloading(identifier, files)}
+        if downloading:
+            self.getLogger().inform(f"The media are being downloaded, hence, they are not evicted. - Amount: {len(downloading)}")
+            report["skipped_media"] += len(downloading)
+            batch = [(identifier, files) for identifier, files in batch if identifier not in downloading]
+        if not batch:
+            return
+        if not Media_File.deleteByYouTubeIdentifiers(self.getDatabaseHandler(), [identifier for identifier, _ in batch]):
+            self.getLogger().error(f"The media file entries cannot be deleted, hence, the media are not evicted. - Amount: {len(batch)}")
+            report["failures"] += 1
+            return
+        removed_paths: List[str] = []
+        for identifier, files in batch:
+            if self.__isDownloading(identifier, files):
+                self.getLogger().warn(f"The media is being downloaded, hence, its files are kept. - Identifier: {identifier}")
+                report["skipped_media"] += 1
+                continue
+            for path, size, _ in files:
+                try:
+                    remove(path)
+                except FileNotFoundError:
+                    continue
+                except OSError as error:
+                    self.getLogger().error(f"The media file cannot be removed. - File Path: {path} - Error: {error}")
+                    report["failures"] += 1
+                    continue
+                removed_paths.append(path)
+                report["reclaimed_bytes"] += size
+            Metadata_Cache.getInstance().delete(identifier)
+            try:
+                remove(f"{self.getDirectory()}/Cache/Media/{identifier}.json")
+            except FileNotFoundError:
+                pass
+            except OSError as error:
+                self.getLogger().warn(f"The metadata file cannot be removed. - Identifier: {identifier} - Error: {error}")
+            report["evicted_media"] += 1
+        Media_Access_Tracker.getInstance().forget(removed_paths)
@@ -1,4 +1,5 @@
 from Models.TableModel import Table_Model, Database_Handler, RowType, List, Tuple
+from typing import Iterator
 
 
 class Media_File(Table_Model):
@@ -57,6 +58,68 @@ class Media_File(Table_Model):
         parameters: Tuple[str] = (identifier,)
         return temporary_instance.getDatabaseHandler().deleteData(query, parameters)
 
+    @classmethod
+    def streamByDirectory(cls, database_handler: Database_Handler, directory: str, prefix: str = "", batch_size: int = 1000) -> Iterator[RowType]:
+        """
+        Streaming the identifier, the location and the YouTube identifier of the media file entries located in a directory, optionally restricted to the file names starting with a prefix.
+
+        The rows of the sub-directories are streamed as well and, under a case-insensitive collation, the rows of the file names starting with the prefix in another case, hence, the caller has to filter them out.
+
+        Args:
+            database_handler (Database_Handler): The database handler instance used to run the query.
+            directory (str): The directory of the media files.
+            prefix (str): The prefix of the file names.
+            batch_size (int): The maximum amount of rows fetched at once.
+
+        Returns:
+            Iterator[RowType]: The rows of the media file entries.
+
+        Raises:
+            Relational_Database_Error: If the rows cannot be streamed.
+        """
+        temporary_instance: "Media_File" = cls(database_handler)
+        pattern: str = f"{directory}/{prefix}".replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        query: str = f"SELECT identifier, location, YouTube FROM {temporary_instance.getTableName()} WHERE location LIKE %s"
+        parameters: Tuple[str] = (f"{pattern}%",)
+        return temporary_instance.getDatabaseHandler().streamData(query, parameters, batch_size)
+
+    @classmethod
+    def deleteByIdentifiers(cls, database_handler: Database_Handler, identifiers: List[int]) -> bool:
+        """
+        Deleting several media file records by their identifiers in a single query.
+
+        Args:
+            database_handler (Database_Handler): The database handler instance used to delete the records.
+            identifiers (List[int]): The identifiers of the records.
+
+        Returns:
+            bool: True if the deletion was successful, False otherwise.
+        """
+        if not identifiers:
+            return True
+        temporary_instance: "Media_File" = cls(database_handler)
+        query: str = f"DELETE FROM {temporary_instance.getTableName()} WHERE identifier IN ({', '.join(['%s'] * len(identifiers))})"
+        parameters: Tuple[str, ...] = tuple(str(identifier) for identifier in identifiers)
+        return temporary_instance.getDatabaseHandler().deleteData(query, parameters)
+
+    @classmethod
+    def deleteByYouTubeIdentifiers(cls, database_handler: Database_Handler, identifiers: List[str]) -> bool:
+        """
+        Deleting the media file records of several YouTube identifiers in a single query.
+
+        Args:
+            database_handler (Database_Handler): The database handler instance used to delete the records.
+            identifiers (List[str]): The YouTube identifiers.
+
+        Returns:
+            bool: True if the deletion was successful, False otherwise.
+        """
+        if not identifiers:
+            return True
+        temporary_instance: "Media_File" = cls(database_handler)
+        query: str = f"DELETE FROM {temporary_instance.getTableName()} WHERE YouTube IN ({', '.join(['%s'] * len(identifiers))})"
+        return temporary_instance.getDatabaseHandler().deleteData(query, tuple(identifiers))
+
     def create(self) -> bool:
         """
         Creating the MediaFile table in the database if it does not already exist.
@@ -0,0 +1,206 @@
+"""
+The module provides the streamer of the media files, which serves them with the byte-range requests and the conditional requests needed by the media players.
+
+Author:
+    Darkness4869
+"""
+from flask import Response, current_app, request, send_file
+from Models.Logger import Extractio_Logger
+from Models.MediaAccessTracker import Media_Access_Tracker
+from threading import Lock
+from os import stat, stat_result
+from os.path import commonpath, normpath, realpath, relpath
+from stat import S_ISREG
+from urllib.parse import quote
+from typing import List, Optional
+
+
+class Media_Streamer:
+    """
+    A streamer of the media files.
+
+    A media file is sent along with a strong entity tag derived from its size and its modification time, hence, a player revalidating it with `If-None-Match` receives a 304 response and a player seeking in it with `Range` receives the 206 response of the requested bytes only, as long as its `If-Range` still matches.  The requests of several ranges are rejected with a 416 response as the players never send them.  The file is sent through the file wrapper of the server, which uses `sendfile` where it supports it.
+
+    The sending of the file can also be offloaded to the front server through the `MEDIA_OFFLOAD` setting of the application: with `x-accel-redirect`, nginx serves the internal location `MEDIA_OFFLOAD_PREFIX` mapped on `MEDIA_OFFLOAD_ROOT`, and with `x-sendfile`, Apache or lighttpd serves the absolute path of the file.  The application then only verifies the file and sends its headers, while the front server handles the bytes and the range requests.
+
+    Attributes:
+        __instance (Optional[Media_Streamer]): The streamer shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared streamer.
+        __max_age (int): The amount of seconds the media files can be cached by the clients.
+        __logger (Extractio_Logger): The logger of the streamer.
+        not_found (int): The status code for not found.
+        range_not_satisfiable (int): The status code for the range not satisfiable.
+        offload_modes (List[str]): The supported offload modes.
+
+    Methods:
+        getInstance() -> Media_Streamer: Retrieving the streamer shared by the whole process.
+        getEntityTag(status: stat_result) -> str: Building the entity tag of a media file.
+        getOffloadMode() -> str: Retrieving the offload mode of the application.
+        serve(file_path: str, mime_type: str, download_name: Optional[str]) -> Response: Sending a media file.
+    """
+    __instance: Optional["Media_Streamer"] = None
+    """
+    The streamer shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared streamer.
+    """
+    __max_age: int
+    """
+    The amount of seconds the media files can be cached by the clients.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the streamer.
+    """
+    not_found: int = 404
+    """
+    The status code for not found.
+    """
+    range_not_satisfiable: int = 416
+    """
+    The status code for the range not satisfiable.
+    """
+    offload_modes: List[str] = ["none", "x-accel-redirect", "x-sendfile"]
+    """
+    The supported offload modes.
+    """
+
+    def __init__(self, max_age: int = 86400):
+        """
+        Initializing the streamer.
+
+        Args:
+            max_age (int): The amount of seconds the media files can be cached by the clients.
+        """
+        self.setMaxAge(max_age)
+        self.setLogger(Extractio_Logger(__name__))
+
+    def getMaxAge(self) -> int:
+        return self.__max_age
+
+    def setMaxAge(self, max_age: int) -> None:
+        self.__max_age = max_age
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    @classmethod
+    def getInstance(cls) -> "Media_Streamer":
+        """
+        Retrieving the streamer shared by the whole process, creating it on the first call.
+
+        Returns:
+            Media_Streamer: The streamer shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls()
+            return cls.__instance
+
+    def getEntityTag(self, status: stat_result) -> str:
+        """
+        Building the strong entity tag of a media file from its size and its modification time, which both change whenever the file is replaced.
+
+        Args:
+            status (stat_result): The status of the media file.
+
+        Returns:
+            str
+        """
+        return f"{status.st_size:x}-{status.st_mtime_ns:x}"
+
+    def getOffloadMode(self) -> str:
+        """
+        Retrieving the offload mode of the application, which is `none` when it is not set or not supported.
+
+        Returns:
+            str
+        """
+        mode: str = str(current_app.config.get("MEDIA_OFFLOAD", "none")).lower()
+        if mode not in self.offload_modes:
+            self.getLogger().warn(f"The offload mode is not supported, hence, the media files are sent by the application. - Mode: {mode}")
+            return "none"
+        return mode
+
+    def __offload(self, file_path: str, mime_type: str, download_name: Optional[str], status: stat_result, mode: str) -> Optional[Response]:
+        """
+        Delegating the sending of a media file to the front server.
+
+        Args:
+            file_path (str): The path of the media file.
+            mime_type (str): The MIME type of the media file.
+            download_name (Optional[str]): The name of the file downloaded as an attachment, or None to send it inline.
+            status (stat_result): The status of the media file.
+            mode (str): The offload mode.
+
+        Returns:
+            Optional[Response]: The response containing the header of the offload mode, or None if the file is outside of the root of the internal location.
+        """
+        response: Response = Response("", 200, mimetype=mime_type)
+        if mode == "x-sendfile":
+            response.headers["X-Sendfile"] = realpath(file_path)
+        else:
+            root: str = realpath(str(current_app.config.get("MEDIA_OFFLOAD_ROOT", current_app.root_path)))
+            real_file_path: str = realpath(file_path)
+            if commonpath([root, real_file_path]) != root:
+                self.getLogger().error(f"The media file is outside of the root of the internal location. - File Path: {file_path} - Root: {root}")
+                return None
+            prefix: str = str(current_app.config.get("MEDIA_OFFLOAD_PREFIX", "/Internal")).rstrip("/")
+            response.headers["X-Accel-Redirect"] = quote(f"{prefix}/{relpath(real_file_path, root)}")
+        if download_name is not None:
+            response.headers["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(download_name)}"
+        response.headers["ETag"] = f'"{self.getEntityTag(status)}"'
+        response.headers["Accept-Ranges"] = "bytes"
+        response.cache_control.max_age = self.getMaxAge()
+        response.cache_control.public = True
+        return response
+
+    def serve(self, file_path: str, mime_type: str, download_name: Optional[str] = None) -> Response:
+        """
+        Sending a media file, in part for a range request and not at all for a conditional request whose entity tag still matches, or delegating it to the front server if an offload mode is set.  Every request is recorded as an access to the media file, so that it is not evicted while it is being played.
+
+        Args:
+            file_path (str): The path of the media file.
+            mime_type (str): The MIME type of the media file.
+            download_name (Optional[str]): The name of the file downloaded as an attachment, or None to send it inline.
+
+        Returns:
+            Response
+        """
+        try:
+            status: stat_result = stat(file_path)
+        except OSError:
+            status = None # type: ignore
+        if status is None or not S_ISREG(status.st_mode):
+            self.getLogger().error(f"The media file does not exist. - File Path: {file_path} - Status: {self.not_found}")
+            return Response("{}", self.not_found, mimetype="application/json")
+        Media_Access_Tracker.getInstance().touch(normpath(file_path))
+        mode: str = self.getOffloadMode()
+        offloaded_response: Optional[Response] = self.__offload(file_path, mime_type, download_name, status, mode) if mode != "none" else None
+        if offloaded_response is not None:
+            return offloaded_response
+        if request.range is not None and len(request.range.ranges) > 1:
+            self.getLogger().warn(f"The request of several ranges has been rejected. - File Path: {file_path} - Range: {request.headers.get('Range')}")
+            response: Response = Response("", self.range_not_satisfiable)
+            response.headers["Content-Range"] = f"bytes */{status.st_size}"
+            response.headers["Accept-Ranges"] = "bytes"
+            return response
+        response = send_file(
+            path_or_file=file_path,
+            mimetype=mime_type,
+            as_attachment=download_name is not None,
+            download_name=download_name,
+            conditional=True,
+            etag=self.getEntityTag(status),
+            last_modified=status.st_mtime,
+            max_age=self.getMaxAge()
+        )
+        response.headers["Accept-Ranges"] = "bytes"
+        return response
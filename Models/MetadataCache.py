@@ -0,0 +1,259 @@
+"""
+The module provides the cache of the metadata of the media, which is a single SQLite database behind an in-process least recently used cache.
+
+Author:
+    Darkness4869
+"""
+from Models.LeastRecentlyUsedCache import Least_Recently_Used_Cache
+from Models.Logger import Extractio_Logger
+from Environment import Environment
+from Models.SQLiteDatabase import SQLite_Database
+from sqlite3 import Connection, Row, Error as Metadata_Cache_Error
+from threading import Lock
+from json import JSONDecodeError, dumps, load, loads
+from os import getpid, listdir, makedirs, replace
+from os.path import exists, isdir, join
+from time import time
+from typing import Any, Dict, List, Optional, Union
+
+
+class Metadata_Cache:
+    """
+    A cache of the metadata of the media keyed by their identifier, which is prefixed by `shorts/` for the shorts.
+
+    The metadata are stored compactly in a single SQLite database in write-ahead logging mode shared by every worker of the application, while the most recently used ones are also kept decoded in memory for a few seconds so that a hit costs neither a read nor a parse.  As the memory of a process is not invalidated by the deletions of the other workers and of the scheduled jobs, its entries expire so that deleted metadata are not served for long.  The JSON files of the previous versions of the application are imported once by `Auto/import_metadata.py` and the cache can be exported back to them.
+
+    Attributes:
+        __instance (Optional[Metadata_Cache]): The cache shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared cache.
+        __database (SQLite_Database): The SQLite database of the cache.
+        __memory (Least_Recently_Used_Cache): The metadata most recently used.
+        __logger (Extractio_Logger): The logger of the cache.
+
+    Methods:
+        getInstance() -> Metadata_Cache: Retrieving the cache shared by the whole process.
+        get(identifier: str) -> Optional[Dict[str, Union[str, int, None]]]: Retrieving the metadata of a media.
+        set(identifier: str, metadata: Dict[str, Union[str, int, None]]) -> None: Storing the metadata of a media.
+        delete(identifier: str) -> None: Removing the metadata of a media.
+        isCached(identifier: str) -> bool: Verifying whether the metadata of a media are stored.
+        count() -> int: Counting the stored metadata.
+        importJsonFiles(directory: str) -> int: Importing the JSON files of the metadata.
+        exportJsonFiles(directory: str) -> int: Exporting the metadata as JSON files.
+        getStatistics() -> Dict[str, Any]: Retrieving the statistics of the in-memory tier.
+    """
+    __instance: Optional["Metadata_Cache"] = None
+    """
+    The cache shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared cache.
+    """
+    __database: SQLite_Database
+    """
+    The SQLite database of the cache.
+    """
+    __memory: Least_Recently_Used_Cache
+    """
+    The metadata most recently used.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the cache.
+    """
+
+    def __init__(self, path: str, maximum_size: int = 2048, time_to_live: float = 30.0, logger: Optional[Extractio_Logger] = None):
+        """
+        Initializing the cache and creating its tables if they do not exist.
+
+        Args:
+            path (str): The path of the SQLite database.
+            maximum_size (int): The maximum amount of metadata kept in memory.
+            time_to_live (float): The amount of seconds the metadata are kept in memory.
+            logger (Optional[Extractio_Logger]): The logger of the cache.
+        """
+        self.setDatabase(SQLite_Database(path))
+        self.setMemory(Least_Recently_Used_Cache(maximum_size, time_to_live))
+        self.setLogger(logger or Extractio_Logger(__name__))
+        connection: Connection = self.getConnection()
+        with connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS Metadata (identifier TEXT PRIMARY KEY, data TEXT NOT NULL, updated_at INTEGER NOT NULL)")
+            connection.execute("CREATE TABLE IF NOT EXISTS Settings (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+
+    def getDatabase(self) -> SQLite_Database:
+        return self.__database
+
+    def setDatabase(self, database: SQLite_Database) -> None:
+        self.__database = database
+
+    def getMemory(self) -> Least_Recently_Used_Cache:
+        return self.__memory
+
+    def setMemory(self, memory: Least_Recently_Used_Cache) -> None:
+        self.__memory = memory
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    @classmethod
+    def getInstance(cls) -> "Metadata_Cache":
+        """
+        Retrieving the cache shared by the whole process, creating it on the first call in the media cache directory of the application.
+
+        Returns:
+            Metadata_Cache: The cache shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls(f"{Environment().getDirectory()}/Cache/Media/Metadata.sqlite3")
+            return cls.__instance
+
+    def getConnection(self) -> Connection:
+        """
+        Retrieving the connection of the current thread to the database.
+
+        Returns:
+            Connection
+        """
+        return self.getDatabase().getConnection()
+
+    def get(self, identifier: str) -> Optional[Dict[str, Union[str, int, None]]]:
+        """
+        Retrieving the metadata of a media from memory or, on a miss, from the database.
+
+        Args:
+            identifier (str): The identifier of the media.
+
+        Returns:
+            Optional[Dict[str, Union[str, int, None]]]: A copy of the metadata, or None if they are not cached.
+        """
+        metadata: Optional[Dict[str, Union[str, int, None]]] = self.getMemory().get(identifier)
+        if metadata is not None:
+            return dict(metadata)
+        row: Optional[Row] = self.getConnection().execute("SELECT data FROM Metadata WHERE identifier = ?", (identifier,)).fetchone()
+        if row is None:
+            return None
+        metadata = loads(row["data"])
+        self.getMemory().set(identifier, metadata)
+        return dict(metadata) # type: ignore
+
+    def set(self, identifier: str, metadata: Dict[str, Union[str, int, None]]) -> None:
+        """
+        Storing the metadata of a media, replacing the previous ones.
+
+        Args:
+            identifier (str): The identifier of the media.
+            metadata (Dict[str, Union[str, int, None]]): The metadata of the media.
+        """
+        connection: Connection = self.getConnection()
+        with connection:
+            connection.execute(
+                "INSERT INTO Metadata (identifier, data, updated_at) VALUES (?, ?, ?) ON CONFLICT (identifier) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                (identifier, dumps(metadata, separators=(",", ":")), int(time()))
+            )
+        self.getMemory().set(identifier, dict(metadata))
+
+    def delete(self, identifier: str) -> None:
+        """
+        Removing the metadata of a media.
+
+        Args:
+            identifier (str): The identifier of the media.
+        """
+        connection: Connection = self.getConnection()
+        with connection:
+            connection.execute("DELETE FROM Metadata WHERE identifier = ?", (identifier,))
+        self.getMemory().delete(identifier)
+
+    def isCached(self, identifier: str) -> bool:
+        """
+        Verifying whether the metadata of a media are stored, without decoding them nor keeping them in memory.
+
+        Args:
+            identifier (str): The identifier of the media.
+
+        Returns:
+            bool
+        """
+        return self.getConnection().execute("SELECT 1 FROM Metadata WHERE identifier = ?", (identifier,)).fetchone() is not None
+
+    def count(self) -> int:
+        """
+        Counting the stored metadata.
+
+        Returns:
+            int
+        """
+        return int(self.getConnection().execute("SELECT COUNT(*) FROM Metadata").fetchone()[0])
+
+    def getStatistics(self) -> Dict[str, Any]:
+        """
+        Retrieving the statistics of the in-memory tier.
+
+        Returns:
+            Dict[str, Any]
+        """
+        return self.getMemory().getStatistics()
+
+    def importJsonFiles(self, directory: str) -> int:
+        """
+        Importing the JSON files of the metadata, which are stored as `<identifier>.json` with the shorts in the `shorts` sub-directory.  The import is only recorded once every file has been read, hence, an interrupted import is resumed on its next run, after which the directory is no longer read.
+
+        Args:
+            directory (str): The directory of the JSON files.
+
+        Returns:
+            int: The amount of metadata which have been imported.
+        """
+        connection: Connection = self.getConnection()
+        is_imported: bool = connection.execute("SELECT 1 FROM Settings WHERE name = 'json_import'").fetchone() is not None
+        if is_imported or not exists(directory):
+            return 0
+        amount: int = 0
+        for prefix in ["", "shorts/"]:
+            current_directory: str = join(directory, prefix)
+            if not isdir(current_directory):
+                continue
+            for file_name in listdir(current_directory):
+                if not file_name.endswith(".json"):
+                    continue
+                try:
+                    with open(join(current_directory, file_name), "r") as file:
+                        metadata: Dict[str, Union[str, int, None]] = load(file)["Media"]["YouTube"]
+                    self.set(f"{prefix}{file_name[:-len('.json')]}", metadata)
+                    amount += 1
+                except (OSError, JSONDecodeError, KeyError, TypeError, Metadata_Cache_Error) as error:
+                    self.getLogger().warn(f"The metadata file cannot be imported. - File Name: {prefix}{file_name} - Error: {error}")
+        with connection:
+            connection.execute("INSERT OR IGNORE INTO Settings (name, value) VALUES ('json_import', 1)")
+        self.getMemory().clear()
+        self.getLogger().inform(f"The metadata files have been imported. - Amount: {amount}")
+        return amount
+
+    def exportJsonFiles(self, directory: str) -> int:
+        """
+        Exporting the metadata as JSON files in the format of the previous versions of the application.
+
+        Args:
+            directory (str): The directory of the JSON files.
+
+        Returns:
+            int: The amount of metadata which have been exported.
+        """
+        makedirs(join(directory, "shorts"), exist_ok=True)
+        amount: int = 0
+        rows: List[Row] = self.getConnection().execute("SELECT identifier, data FROM Metadata").fetchall()
+        for row in rows:
+            file_name: str = join(directory, f"{row['identifier']}.json")
+            temporary_file_name: str = f"{file_name}.{getpid()}.tmp"
+            with open(temporary_file_name, "w") as file:
+                file.write(dumps({"Media": {"YouTube": loads(row["data"])}}, indent=4))
+            replace(temporary_file_name, file_name)
+            amount += 1
+        self.getLogger().inform(f"The metadata have been exported. - Directory: {directory} - Amount: {amount}")
+        return amount
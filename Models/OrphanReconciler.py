@@ -0,0 +1,190 @@
+"""
+The module provides the reconciler of the orphaned media, which removes the records and the files left behind by a missing media file outside of the requests.
+
+Author:
+    Darkness4869
+"""
+from Models.Logger import Extractio_Logger
+from Models.BackgroundWorker import Background_Worker
+from queue import Full, Queue
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+
+class Orphan_Reconciler(Background_Worker):
+    """
+    A bounded queue of the clean-ups of the orphaned media drained by a worker thread.
+
+    A request which finds that a media file is missing only enqueues the clean-up of its records and of its related files, hence, its 404 response is as cheap as a 200 one.  A clean-up which is already waiting is not enqueued again, so that the players retrying a missing file do not pile up the same clean-up.  When the queue is full, the clean-up is dropped as the next request for the same file enqueues it again.
+
+    Attributes:
+        __instance (Optional[Orphan_Reconciler]): The reconciler shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared reconciler.
+        __queue (Queue): The clean-ups waiting to be run along with their key.
+        __pending (Set[str]): The keys of the clean-ups waiting to be run.
+        __lock (Lock): The lock protecting the pending keys and the counters.
+        __statistics (Dict[str, int]): The counters of the reconciler.
+        __logger (Extractio_Logger): The logger of the reconciler.
+        accepted (int): The status code for accepted.
+        service_unavailable (int): The status code for the service unavailable.
+
+    Methods:
+        getInstance() -> Orphan_Reconciler: Retrieving the reconciler shared by the whole process.
+        put(key: str, task: Callable[[], Any]) -> int: Enqueuing a clean-up.
+        getStatistics() -> Dict[str, int]: Retrieving the counters of the reconciler.
+    """
+    __instance: Optional["Orphan_Reconciler"] = None
+    """
+    The reconciler shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared reconciler.
+    """
+    __queue: "Queue[Tuple[str, Callable[[], Any]]]"
+    """
+    The clean-ups waiting to be run along with their key.
+    """
+    __pending: Set[str]
+    """
+    The keys of the clean-ups waiting to be run.
+    """
+    __lock: Lock
+    """
+    The lock protecting the pending keys and the counters.
+    """
+    __statistics: Dict[str, int]
+    """
+    The counters of the reconciler.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the reconciler.
+    """
+    accepted: int = 202
+    """
+    The status code for accepted.
+    """
+    service_unavailable: int = 503
+    """
+    The status code for the service unavailable.
+    """
+
+    def __init__(self, maximum_size: int = 1000):
+        """
+        Initializing the reconciler, the worker thread being started on the first clean-up.
+
+        Args:
+            maximum_size (int): The maximum amount of clean-ups waiting to be run.
+        """
+        super().__init__("Orphan_Reconciler")
+        self.setQueue(Queue(maxsize=maximum_size))
+        self.setPending(set())
+        self.setLock(Lock())
+        self.setStatistics({
+            "enqueued": 0,
+            "deduplicated": 0,
+            "dropped": 0,
+            "reconciled": 0,
+            "failed": 0
+        })
+        self.setLogger(Extractio_Logger(__name__))
+
+    def getQueue(self) -> "Queue[Tuple[str, Callable[[], Any]]]":
+        return self.__queue
+
+    def setQueue(self, queue: "Queue[Tuple[str, Callable[[], Any]]]") -> None:
+        self.__queue = queue
+
+    def getPending(self) -> Set[str]:
+        return self.__pending
+
+    def setPending(self, pending: Set[str]) -> None:
+        self.__pending = pending
+
+    def getLock(self) -> Lock:
+        return self.__lock
+
+    def setLock(self, lock: Lock) -> None:
+        self.__lock = lock
+
+    def getStatistics(self) -> Dict[str, int]:
+        with self.getLock():
+            statistics: Dict[str, int] = dict(self.__statistics)
+        statistics["pending"] = self.getQueue().qsize()
+        return statistics
+
+    def setStatistics(self, statistics: Dict[str, int]) -> None:
+        self.__statistics = statistics
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    @classmethod
+    def getInstance(cls) -> "Orphan_Reconciler":
+        """
+        Retrieving the reconciler shared by the whole process, creating it on the first call.
+
+        Returns:
+            Orphan_Reconciler: The reconciler shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls()
+            return cls.__instance
+
+    def prepare(self) -> None:
+        """
+        Forgetting the pending keys inherited from a parent process, whose clean-ups are not waiting in the current process.
+        """
+        with self.getLock():
+            self.getPending().clear()
+
+    def put(self, key: str, task: Callable[[], Any]) -> int:
+        """
+        Enqueuing the clean-up of an orphaned media without blocking, unless the same clean-up is already waiting.
+
+        Args:
+            key (str): The key of the clean-up, which identifies the orphaned media.
+            task (Callable[[], Any]): The clean-up.
+
+        Returns:
+            int
+        """
+        self.startWorkers()
+        with self.getLock():
+            if key in self.getPending():
+                self.__statistics["deduplicated"] += 1
+                return self.accepted
+            try:
+                self.getQueue().put_nowait((key, task))
+            except Full:
+                self.__statistics["dropped"] += 1
+                self.getLogger().warn(f"The reconciler queue is full, hence, the clean-up has been dropped. - Key: {key}")
+                return self.service_unavailable
+            self.getPending().add(key)
+            self.__statistics["enqueued"] += 1
+        return self.accepted
+
+    def work(self) -> None:
+        """
+        Running the clean-ups one after the other, a failing clean-up never stopping the worker.
+        """
+        while True:
+            key, task = self.getQueue().get()
+            with self.getLock():
+                self.getPending().discard(key)
+            try:
+                task()
+                outcome: str = "reconciled"
+            except Exception as error:
+                self.getLogger().error(f"The orphaned media cannot be reconciled. - Key: {key} - Error: {error}")
+                outcome = "failed"
+            with self.getLock():
+                self.__statistics[outcome] += 1
+            self.getQueue().task_done()
@@ -0,0 +1,103 @@
+"""
+The module provides the SQLite databases shared by the workers of the application, which hand each thread of each process its own connection.
+
+Author:
+    Darkness4869
+"""
+from sqlite3 import Connection, Row, connect
+from threading import local
+from os import getpid, makedirs
+from os.path import dirname, exists
+from typing import Optional
+
+
+class SQLite_Database:
+    """
+    A SQLite database in write-ahead logging mode, hence, the workers of the application read concurrently while one of them writes.
+
+    Each thread of each process uses its own connection, which is opened on its first use.  The connections inherited from a parent process are never reused as SQLite connections cannot be shared across a fork.
+
+    Attributes:
+        __path (str): The path of the SQLite database.
+        __timeout (float): The amount of seconds a connection waits for the lock of the database.
+        __connections (local): The connection of each thread.
+        __process_identifier (int): The identifier of the process which has opened the connections.
+
+    Methods:
+        getConnection() -> Connection: Retrieving the connection of the current thread.
+    """
+    __path: str
+    """
+    The path of the SQLite database.
+    """
+    __timeout: float
+    """
+    The amount of seconds a connection waits for the lock of the database.
+    """
+    __connections: local
+    """
+    The connection of each thread.
+    """
+    __process_identifier: int
+    """
+    The identifier of the process which has opened the connections.
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        """
+        Initializing the database and creating its directory if it does not exist.
+
+        Args:
+            path (str): The path of the SQLite database.
+            timeout (float): The amount of seconds a connection waits for the lock of the database.
+        """
+        self.setPath(path)
+        self.setTimeout(timeout)
+        self.setConnections(local())
+        self.setProcessIdentifier(getpid())
+        if dirname(path) and not exists(dirname(path)):
+            makedirs(dirname(path), exist_ok=True)
+
+    def getPath(self) -> str:
+        return self.__path
+
+    def setPath(self, path: str) -> None:
+        self.__path = path
+
+    def getTimeout(self) -> float:
+        return self.__timeout
+
+    def setTimeout(self, timeout: float) -> None:
+        self.__timeout = timeout
+
+    def getConnections(self) -> local:
+        return self.__connections
+
+    def setConnections(self, connections: local) -> None:
+        self.__connections = connections
+
+    def getProcessIdentifier(self) -> int:
+        return self.__process_identifier
+
+    def setProcessIdentifier(self, process_identifier: int) -> None:
+        self.__process_identifier = process_identifier
+
+    def getConnection(self) -> Connection:
+        """
+        Retrieving the connection of the current thread, opening it on the first call, or on the first call of the current process.
+
+        Returns:
+            Connection
+        """
+        if self.getProcessIdentifier() != getpid():
+            self.setConnections(local())
+            self.setProcessIdentifier(getpid())
+        connection: Optional[Connection] = getattr(self.getConnections(), "connection", None)
+        if connection is not None:
+            return connection
+        connection = connect(self.getPath(), timeout=self.getTimeout())
+        connection.row_factory = Row
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        self.getConnections().connection = connection
+        return connection
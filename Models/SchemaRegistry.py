@@ -0,0 +1,172 @@
+"""
+The module provides a process-wide registry of the table schemas used by the table models so that the structure of a table is only read from the database once.
+
+Author:
+    Darkness4869
+"""
+from Models.DatabaseHandler import Database_Handler, List, RowType, Tuple, Optional
+from threading import Lock
+from time import monotonic
+from typing import Dict
+
+
+class Schema_Registry:
+    """
+    A thread-safe cache of the column names, column types and primary key of the tables of the database.
+
+    A schema is loaded with `SHOW COLUMNS` the first time a table is requested and is then served from memory until it expires or is invalidated.  Tables which do not exist yet are never cached, hence, a table which is created later is picked up on the next request.
+
+    Attributes:
+        __instance (Optional[Schema_Registry]): The registry shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared registry.
+        __schemas (Dict[str, Tuple[List[str], Dict[str, str], str, float]]): The cached schemas keyed by table name along with the time at which they have been loaded.
+        __time_to_live (float): The amount of seconds after which a cached schema is reloaded.
+        __lock (Lock): The lock protecting the cached schemas.
+
+    Methods:
+        getInstance() -> Schema_Registry: Retrieving the registry shared by the whole process.
+        getSchema(database_handler: Database_Handler, table_name: str) -> Tuple[List[str], Dict[str, str], str]: Retrieving the schema of a table.
+        invalidate(table_name: Optional[str] = None) -> None: Removing the schema of a table, or of every table, from the cache.
+        warmUp(database_handler: Database_Handler) -> int: Loading the schemas of every table of the database at once.
+    """
+    __instance: Optional["Schema_Registry"] = None
+    """
+    The registry shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared registry.
+    """
+    __schemas: Dict[str, Tuple[List[str], Dict[str, str], str, float]]
+    """
+    The cached schemas keyed by table name along with the time at which they have been loaded.
+    """
+    __time_to_live: float
+    """
+    The amount of seconds after which a cached schema is reloaded.
+    """
+    __lock: Lock
+    """
+    The lock protecting the cached schemas.
+    """
+
+    def __init__(self, time_to_live: float = 3600.0):
+        """
+        Initializing the schema registry.
+
+        Args:
+            time_to_live (float): The amount of seconds after which a cached schema is reloaded.
+        """
+        self.setSchemas({})
+        self.setTimeToLive(time_to_live)
+        self.setLock(Lock())
+
+    def getSchemas(self) -> Dict[str, Tuple[List[str], Dict[str, str], str, float]]:
+        return self.__schemas
+
+    def setSchemas(self, schemas: Dict[str, Tuple[List[str], Dict[str, str], str, float]]) -> None:
+        self.__schemas = schemas
+
+    def getTimeToLive(self) -> float:
+        return self.__time_to_live
+
+    def setTimeToLive(self, time_to_live: float) -> None:
+        self.__time_to_live = time_to_live
+
+    def getLock(self) -> Lock:
+        return self.__lock
+
+    def setLock(self, lock: Lock) -> None:
+        self.__lock = lock
+
+    @classmethod
+    def getInstance(cls) -> "Schema_Registry":
+        """
+        Retrieving the registry shared by the whole process, creating it on the first call.
+
+        Returns:
+            Schema_Registry: The registry shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls()
+            return cls.__instance
+
+    def getSchema(self, database_handler: Database_Handler, table_name: str) -> Tuple[List[str], Dict[str, str], str]:
+        """
+        Retrieving the column names, the column types and the primary key of a table, loading them from the database when they are not cached or have expired.
+
+        Args:
+            database_handler (Database_Handler): The database handler used to load the schema.
+            table_name (str): The name of the table.
+
+        Returns:
+            Tuple[List[str], Dict[str, str], str]: The names of the columns, their MySQL types and the name of the primary key.
+        """
+        if not table_name:
+            return [], {}, "identifier"
+        with self.getLock():
+            schema: Optional[Tuple[List[str], Dict[str, str], str, float]] = self.getSchemas().get(table_name)
+        if schema is not None and monotonic() - schema[3] < self.getTimeToLive():
+            return list(schema[0]), dict(schema[1]), schema[2]
+        columns: List[RowType] = database_handler.getData(f"SHOW COLUMNS FROM {table_name}")
+        fields: List[str] = [str(column["Field"]) for column in columns] # type: ignore
+        field_types: Dict[str, str] = {str(column["Field"]): str(column["Type"]) for column in columns} # type: ignore
+        primary_field: str = next((str(column["Field"]) for column in columns if str(column["Key"]) == "PRI"), "identifier") # type: ignore
+        if fields:
+            self.__store(table_name, fields, field_types, primary_field)
+        return list(fields), dict(field_types), primary_field
+
+    def __store(self, table_name: str, fields: List[str], field_types: Dict[str, str], primary_field: str) -> None:
+        """
+        Caching the schema of a table.
+
+        Args:
+            table_name (str): The name of the table.
+            fields (List[str]): The names of the columns.
+            field_types (Dict[str, str]): The MySQL types of the columns.
+            primary_field (str): The name of the primary key.
+        """
+        with self.getLock():
+            self.getSchemas()[table_name] = (fields, field_types, primary_field, monotonic())
+
+    def invalidate(self, table_name: Optional[str] = None) -> None:
+        """
+        Removing the schema of a table from the cache, or the schemas of every table when no table is specified.  It has to be called after the structure of a table has been altered.
+
+        Args:
+            table_name (Optional[str]): The name of the table.
+        """
+        with self.getLock():
+            if table_name is None:
+                self.getSchemas().clear()
+                return
+            self.getSchemas().pop(table_name, None)
+
+    def warmUp(self, database_handler: Database_Handler) -> int:
+        """
+        Loading the schemas of every table of the current database with a single query on `information_schema`.
+
+        Args:
+            database_handler (Database_Handler): The database handler used to load the schemas.
+
+        Returns:
+            int: The amount of tables which have been cached.
+        """
+        query: str = "SELECT TABLE_NAME AS table_name, COLUMN_NAME AS field, COLUMN_TYPE AS type, COLUMN_KEY AS `key` FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE() ORDER BY TABLE_NAME, ORDINAL_POSITION"
+        columns: List[RowType] = database_handler.getData(query)
+        schemas: Dict[str, Tuple[List[str], Dict[str, str], str]] = {}
+        for column in columns:
+            table_name: str = str(column["table_name"]) # type: ignore
+            field: str = str(column["field"]) # type: ignore
+            fields, field_types, primary_field = schemas.setdefault(table_name, ([], {}, ""))
+            fields.append(field)
+            field_types[field] = str(column["type"]) # type: ignore
+            if not primary_field and str(column["key"]) == "PRI": # type: ignore
+                schemas[table_name] = (fields, field_types, field)
+        for table_name, (fields, field_types, primary_field) in schemas.items():
+            self.__store(table_name, fields, field_types, primary_field or "identifier")
+        database_handler.getLogger().inform(f"The schema registry has been warmed up. - Tables: {len(schemas)}")
+        return len(schemas)
@@ -15,7 +15,8 @@ from time import time
 from argon2 import PasswordHasher
 from datetime import datetime
 from typing import Union
-from base64 import b64encode
+from secrets import token_urlsafe
+from flask import g
 
 
 class Security_Management_System:
@@ -30,11 +31,11 @@ class Security_Management_System:
         __password_hasher: PasswordHasher
         __date_created: Union[str, int]
         __logger: Extractio_Logger
-        __nonce: str
 
     Methods:
         hash() -> None: Generating, storing, and cleaning up a security hash.
-        generateNonce() -> None: Generating a random nonce that will be used to authenticate the user.
+        getNonce() -> str: Retrieving the nonce of the current request, generating it on the first call.
+        generateNonce() -> str: Generating a random nonce for the current request.
     """
     __Database_Handler: Database_Handler
     """
@@ -65,12 +66,6 @@ class Security_Management_System:
     """
     The logger that will all the action of the application.
     """
-    __nonce: str
-    """
-    It is often a random or pseudo-random number issued in an
-    authentication protocol to ensure that old communications
-    cannot be reused in replay attacks.
-    """
 
     def __init__(self) -> None:
         """
@@ -99,12 +94,6 @@ class Security_Management_System:
         self.getLogger().inform("The Security Management System has been successfully been initialized!")
         self.hash()
 
-    def getNonce(self) -> str:
-        return self.__nonce
-
-    def setNonce(self, nonce: str) -> None:
-        self.__nonce = nonce
-
     def getDatabaseHandler(self) -> Database_Handler:
         return self.__Database_Handler
 
@@ -181,15 +170,26 @@ class Security_Management_System:
             return
         self.getLogger().inform("The older keys are deleted.")
 
-    def generateNonce(self) -> None:
+    def getNonce(self) -> str:
+        """
+        Retrieving the nonce of the content security policy of the current request.
+
+        The nonce is only generated the first time it is requested, hence, only the responses which render a template pay for it.  It is stored in the context of the request so that concurrent requests never share a nonce.
+
+        Returns:
+            str
         """
-        It will generate a random nonce that will be used to authenticate the user.
+        if "nonce" not in g:
+            return self.generateNonce()
+        return str(g.nonce)
+
+    def generateNonce(self) -> str:
+        """
+        Generating a random nonce from the cryptographically secure random number generator of the operating system and storing it in the context of the current request.
 
         Returns:
-            void
+            str
         """
-        self.setPasswordHasher(PasswordHasher())
-        self.setApplicationName(f"{self.getApplicationName()}{int(time())}")
-        self.setHash(self.getPasswordHasher().hash(self.getApplicationName()))
-        self.setNonce(b64encode(self.getHash().encode("utf-8")).decode("utf-8"))
-        self.getLogger().inform("The nonce has been generated!")
+        g.nonce = token_urlsafe(16)
+        self.getLogger().debug("The nonce has been generated!")
+        return str(g.nonce)
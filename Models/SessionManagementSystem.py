@@ -5,23 +5,18 @@ application.
 
 
 from flask.sessions import SessionMixin
-from Models.VisitorModel import Visitor
-from Models.DatabaseHandler import Database_Handler, Extractio_Logger, Environment, List, Tuple
+from Models.DatabaseHandler import Database_Handler, Extractio_Logger, List
+from Models.SessionStore import Session_Store
+from Models.SessionSweeper import Session_Sweeper
 from typing import Dict, Union, Optional
-from json import JSONDecodeError, load, dumps
-from os import remove
+from json import dumps
 from time import time
-import os
 
 
 class Session_Manager:
     """
     It allows the application to manage the session.
     """
-    __directory: str
-    """
-    The directory of the session files.
-    """
     __ip_address: str
     """
     The IP Address of the user.
@@ -38,18 +33,10 @@ class Session_Manager:
     """
     The timestamp at which the session has been created.
     """
-    __session_files: List[str]
-    """
-    The files containing the session of the users.
-    """
     __color_scheme: str
     """
     The color scheme of the application.
     """
-    __length: int
-    """
-    The amount of session files.
-    """
     __session: SessionMixin
     """
     The session of the user.
@@ -67,6 +54,16 @@ class Session_Manager:
     """
     The logger that will all the action of the application.
     """
+    __store: Session_Store
+    """
+    The store of the sessions of the users indexed by their IP
+    Address.
+    """
+    __maximum_age: int = 3600
+    """
+    The amount of seconds after which a session which has not
+    been renewed expires.
+    """
 
     def __init__(self, request: Dict[str, str], session: SessionMixin):
         """
@@ -77,25 +74,17 @@ class Session_Manager:
             request: {ip_address: string, http_client_ip_address: string, proxy_ip_address: string, port: string}: The request from the application.
             session: SessionMixin: The session of the user.
         """
-        ENV: Environment = Environment()
-        self.setDirectory(f"{ENV.getDirectory()}/Cache/Session/Users/")
         self.setLogger(Extractio_Logger(__name__))
         self.setPort(str(request["port"]))
         self.setDatabaseHandler(Database_Handler())
+        self.setStore(Session_Store.getInstance())
         self.setIpAddress(str(request["ip_address"]))
         self.setHttpClientIpAddress(str(request["http_client_ip_address"]))
         self.setProxyIpAddress(str(request["proxy_ip_address"]))
-        self.__maintain()
         self.setSession(session)
         self.getLogger().inform("The Session Management System has been successfully been initialized!")
         self.verifySession()
 
-    def getDirectory(self) -> str:
-        return self.__directory
-
-    def setDirectory(self, directory: str) -> None:
-        self.__directory = directory
-
     def getIpAddress(self) -> str:
         return self.__ip_address
 
@@ -120,24 +109,12 @@ class Session_Manager:
     def setTimestamp(self, timestamp: int) -> None:
         self.__timestamp = timestamp
 
-    def getSessionFiles(self) -> List[str]:
-        return self.__session_files
-
-    def setSessionFiles(self, session_files: List[str]) -> None:
-        self.__session_files = session_files
-
     def getColorScheme(self) -> str:
         return self.__color_scheme
 
     def setColorScheme(self, color_scheme: str) -> None:
         self.__color_scheme = color_scheme
 
-    def getLength(self) -> int:
-        return self.__length
-
-    def setLength(self, length: int) -> None:
-        self.__length = length
-
     def getSession(self) -> SessionMixin:
         return self.__session
 
@@ -162,71 +139,27 @@ class Session_Manager:
     def setLogger(self, logger: Extractio_Logger) -> None:
         self.__logger = logger
 
-    def __maintain(self) -> None:
-        """
-        Maintaining the session files and verifying existing ones.
-
-        It creates the Visitor table if it does not exist and then retrieves the list of session files.  It counts the length
-        of the session files and if it has sessions, it verifies existing ones.
+    def getStore(self) -> Session_Store:
+        return self.__store
 
-        Returns:
-            void
-        """
-        visitor: Visitor = Visitor(self.getDatabaseHandler())
-        response: bool = visitor.create()
-        if not response:
-            self.getLogger().error("The required table cannot be created.")
-            return
-        self.getLogger().inform("The required table has been created.")
-        self.setSessionFiles(os.listdir(self.getDirectory()))
-        self.setLength(len(self.getSessionFiles()))
-        if self.getLength() > 0:
-            self.verifyExistingSessions()
+    def setStore(self, store: Session_Store) -> None:
+        self.__store = store
 
-    def verifyExistingSessions(self) -> None:
+    def __getClient(self) -> Dict[str, Union[str, int]]:
         """
-        Verifying existing sessions to remove expired ones.
+        Building the client data of the session from the current
+        request.
 
         Returns:
-            void
-        """
-        for index in range(0, self.getLength(), 1):
-            file_name: str = f"{self.getDirectory()}{self.getSessionFiles()[index]}"
-            data: Union[Dict[str, Dict[str, Union[str, int]]], None] = self.getData(file_name)
-            age: int = int(time()) - int(data["Client"]["timestamp"]) if data != None else 0
-            self.verifyInactiveSession(age, data, file_name)
-
-    def verifyInactiveSession(
-        self,
-        age: int,
-        session: Optional[Dict[str, Dict[str, Union[str, int]]]],
-        file_name: str
-    ) -> None:
+            {ip_address: string, http_client_ip_address: string, proxy_ip_address: string, timestamp: int, color_scheme: string}
         """
-        Verifying if a session is inactive and processing it accordingly.
-
-        This method checks the age of the session and if it exceeds a certain threshold which is one hour, it considers the session inactive.  If inactive, it saves the visitor information to the database and deletes the session file.  If the session data is None, the method returns immediately.
-
-        Parameters:
-            age (int): The age of the session in seconds.
-            session (Optional[Dict[str, Dict[str, Union[str, int]]]]): The session data containing client information.
-            file_name (str): The name of the file where the session data is stored.
-
-        Returns:
-            None
-        """
-        if age <= 3600 or session == None:
-            return
-        visitor: Visitor = Visitor(
-            database_handler=self.getDatabaseHandler(),
-            timestamp=int(session["Client"]["timestamp"]),
-            client=str(session["Client"]["ip_address"])
-        )
-        response: bool = visitor.save()
-        if not response:
-            self.getLogger().error(f"The data about the visitor cannot be saved. - IP Address: {str(session['Client']['ip_address'])}")
-            return
-        remove(file_name)
+        return {
+            "ip_address": self.getIpAddress(),
+            "http_client_ip_address": self.getHttpClientIpAddress(),
+            "proxy_ip_address": self.getProxyIpAddress(),
+            "timestamp": self.getTimestamp(),
+            "color_scheme": self.getColorScheme()
+        }
 
     def createSession(self) -> SessionMixin:
         """
@@ -238,35 +171,42 @@ class Session_Manager:
         self.getSession().clear()
         self.setTimestamp(int(time()))
         self.setColorScheme("light")
-        data: Dict[str, Union[str, int]] = {
-            "ip_address": self.getIpAddress(),
-            "http_client_ip_address": self.getHttpClientIpAddress(),
-            "proxy_ip_address": self.getProxyIpAddress(),
-            "timestamp": self.getTimestamp(),
-            "color_scheme": self.getColorScheme()
-        }
+        data: Dict[str, Union[str, int]] = self.__getClient()
         self.getSession()['Client'] = data
-        session_data = self.retrieveSession()
-        file_path = f"{self.getDirectory()}{self.getIpAddress()}.json"
-        session_file = open(file_path, 'w')
-        session_file.write(session_data)
-        session_file.close()
+        self.getStore().put(data)
         self.getLogger().inform("The session has been successfully created!")
         return self.getSession()
 
     def verifySession(self) -> None:
         """
-        Verifying that the session is not hijacked
+        Verifying that the session is not hijacked by looking up
+        the session stored for the IP Address of the user, which is
+        renewed if it has not expired and replaced otherwise.  The
+        session is restored from the stored one when the request
+        does not carry it, so that a new browser keeps the color
+        scheme of the user.  An
+        expired session which has not been swept yet is handed over
+        to the session sweeper, which archives it in the background.
 
         Returns:
             void
         """
-        self.setSessionFiles(os.listdir(self.getDirectory()))
-        self.setLength(len(self.getSessionFiles()))
-        if len(self.getSessionFiles()) > 0:
-            self.handleSessionData(self.sessionsLoader(self.getSessionFiles()))
-        else:
+        data: Optional[Dict[str, Union[str, int]]] = self.getStore().get(self.getIpAddress())
+        if data is None:
             self.createSession()
+            return
+        age: int = int(time()) - int(data["timestamp"])
+        status: int = self.handleExpiryTime(age)["status"]
+        if status == 200:
+            if "Client" not in self.getSession():
+                self.getSession()["Client"] = data
+                self.getLogger().inform("The session has been restored from the session stored for the IP Address of the user.")
+            self.handleSessionData({"status": status})
+            return
+        expired_clients: List[Dict[str, Union[str, int]]] = self.getStore().deleteMany([data])
+        self.createSession()
+        for client in expired_clients:
+            Session_Sweeper.getInstance().defer(client)
 
     def retrieveSession(self) -> str:
         """
@@ -289,111 +229,15 @@ class Session_Manager:
         """
         self.setTimestamp(int(time()))
         self.setColorScheme(str(payload["Client"]["color_scheme"]))
-        file_name: str = f"{self.getDirectory()}/{self.getIpAddress()}.json"
-        data: Union[Dict[str, Dict[str, Union[str, int]]], None] = self.getData(file_name)
-        if data != None and self.getIpAddress() == data['Client']['ip_address']:
-            new_data: Dict[str, Union[str, int]] = {
-                "ip_address": self.getIpAddress(),
-                "http_client_ip_address": self.getHttpClientIpAddress(),
-                "proxy_ip_address": self.getProxyIpAddress(),
-                "timestamp": self.getTimestamp(),
-                "color_scheme": self.getColorScheme()
-            }
-            file = open(file_name, "w")
-            self.getSession()["Client"] = new_data
-            file.write(self.retrieveSession())
-            file.close()
-            self.getLogger().inform("The session has been successfully updated!")
-            return self.getSession()
-        self.getSession().clear()
-        new_data: Dict[str, Union[str, int]] = {
-            "ip_address": self.getIpAddress(),
-            "http_client_ip_address": self.getHttpClientIpAddress(),
-            "proxy_ip_address": self.getProxyIpAddress(),
-            "timestamp": self.getTimestamp(),
-            "color_scheme": self.getColorScheme()
-        }
+        data: Optional[Dict[str, Union[str, int]]] = self.getStore().get(self.getIpAddress())
+        new_data: Dict[str, Union[str, int]] = self.__getClient()
+        if data is None:
+            self.getSession().clear()
         self.getSession()["Client"] = new_data
-        file = open(file_name, "w")
-        file.write(self.retrieveSession())
-        file.close()
-        self.getLogger().inform("The session has been successfully created!")
+        self.getStore().put(new_data)
+        self.getLogger().inform("The session has been successfully updated!" if data is not None else "The session has been successfully created!")
         return self.getSession()
 
-    def sessionsLoader(self, sessions: List[str]) -> Dict[str, int]:
-        """
-        Iterating throughout the session files to process them
-        depending on the response from the system.
-
-        Parameters:
-            sessions: [string]: List of session files
-
-        Returns:
-            {status: int}
-        """
-        response = {}
-        for index in range(0, len(sessions), 1):
-            if self.handleFile(sessions[index])["status"] == 200:
-                response = {
-                    "status": self.handleFile(sessions[index])["status"]
-                }
-                break
-            elif self.handleFile(sessions[index])["status"] == 202:
-                self.createSession()
-                response = {
-                    "status": 201
-                }
-                break
-            elif self.handleFile(sessions[index])["status"] == 204:
-                response = {
-                    "status": self.handleFile(sessions[index])["status"]
-                }
-                continue
-        return response
-
-    def handleFile(self, file_name: str) -> Dict[str, int]:
-        """
-        Ensuring that the file is of type JSON in order to process
-        it further more.
-
-        Parameters:
-            file_name: string: File to be loaded
-
-        Returns:
-            {status: int}
-        """
-        no_content: int = 204
-        if file_name.endswith(".json"):
-            file_path: str = f"{self.getDirectory()}/{file_name}"
-            data: Union[Dict[str, Dict[str, Union[str, int]]], None] = self.getData(file_path)
-            return {
-                "status": self.handleSession(self.validateIpAddress(data)["status"], file_name)["status"]
-            }
-        return {
-            "status": no_content
-        }
-
-    def validateIpAddress(self, data: Union[Dict[str, Dict[str, Union[str, int]]], None]) -> Dict[str, int]:
-        """
-        Validating the IP Address against the one stored in the
-        cache file.
-
-        Parameters:
-            data: {Client: {ip_address: string, http_client_ip_address: string, proxy_ip_address: string, timestamp: int, color_scheme: string}} | null: The data in the file
-
-        Return:
-            {status: int}
-        """
-        no_content: int = 204
-        if data != None and self.getIpAddress() == str(data['Client']['ip_address']):
-            age: int = int(time()) - int(data['Client']['timestamp'])
-            return {
-                "status": self.handleExpiryTime(age)["status"]
-            }
-        return {
-            "status": no_content
-        }
-
     def handleExpiryTime(self, expiry_time: int) -> Dict[str, int]:
         """
         Handling the expiry time of the session.
@@ -405,7 +249,7 @@ class Session_Manager:
             {status: int}
         """
         response = {}
-        if expiry_time < 3600:
+        if expiry_time < self.__maximum_age:
             response = {
                 "status": 200
             }
@@ -415,73 +259,6 @@ class Session_Manager:
             }
         return response
 
-    def getData(self, file_path: str) -> Union[Dict[str, Dict[str, Union[str, int]]], None]:
-        """
-        Reading and parsing a JSON file, returning its contents as a dictionary.
-
-        This method attempts to open and load a JSON file. If successful, it logs a success message and returns the parsed data.  If an error occurs, it logs the error and returns None.
-
-        Parameters:
-            file_path (string): The path to the JSON file.
-
-        Returns:
-            Union[Dict[string, Dict[string, Union[string, int]]], None]
-
-        Raises:
-            JSONDecodeError: If the JSON file cannot be decoded.
-            Exception: If an unexpected error occurs.
-        """
-        try:
-            file = open(file_path, "r")
-            data: Dict[str, Dict[str, Union[str, int]]] = load(file)
-            file.close()
-            self.getLogger().inform(f"The file has been successfully read. - File Path: {file_path}")
-            return data
-        except JSONDecodeError as error:
-            self.getLogger().error(f"Failed to decode the JSON file. - File Path: {file_path} - Error: {error}")
-            return None
-        except Exception as error:
-            self.getLogger().error(f"An unexpected error has occurred. - File Path: {file_path} - Error: {error}")
-            return None
-
-    def handleSession(self, status: int, name: str) -> Dict[str, int]:
-        """
-        Handling the session based on the status retrieved from the
-        system.
-
-        Parameters:
-            status: int: HTTP Status Code
-            name: string: File Name
-
-        Returns:
-            {status: int}
-        """
-        ok: int = 200
-        accepted: int = 202
-        no_content: int = 204
-        reset_content: int = 205
-        service_unavailable: int = 503
-        file_path: str = f"{self.getDirectory()}/{name}"
-        data: Union[Dict[str, Dict[str, Union[str, int]]], None] = self.getData(file_path)
-        if status == ok and data != None:
-            self.setSession(data) # type: ignore
-            return {
-                "status": status
-            }
-        if status == no_content:
-            return {
-                "status": status
-            }
-        if status == reset_content:
-            self.getSession().clear()
-            remove(file_path)
-            return {
-                "status": accepted
-            }
-        return {
-            "status": service_unavailable
-        }
-
     def handleSessionData(self, session_data: Dict[str, int]) -> Union[SessionMixin, None]:
         """
         Handling session data based on the provided status code.
@@ -512,16 +289,15 @@ class Session_Manager:
         Returns:
             SessionMixin | void
         """
-        file_path: str = f"{self.getDirectory()}/{self.getIpAddress()}.json"
-        if "Client" in session_data and session_data['Client']['ip_address'] == self.getIpAddress():
+        client: Optional[Dict[str, Union[str, int]]] = session_data.get("Client")
+        if client is not None and client.get("ip_address") == self.getIpAddress():
             self.setTimestamp(int(time()))
-            session_data['Client']['timestamp'] = self.getTimestamp()
-            self.setSession(session_data)
-            file = open(file_path, "w")
-            file.write(dumps(self.getSession()))
-            file.close()
+            data: Dict[str, Union[str, int]] = dict(client)
+            data["timestamp"] = self.getTimestamp()
+            self.getSession()["Client"] = data
+            self.getStore().put(data)
             self.getLogger().inform("The session has been successfully renewed!")
             return self.getSession()
         self.getSession().clear()
-        remove(file_path)
+        self.getStore().delete(self.getIpAddress())
         self.createSession()
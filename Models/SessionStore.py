@@ -0,0 +1,248 @@
+"""
+The module provides the store of the sessions of the users, which is a single SQLite database indexed by IP Address shared by every worker of the application.
+
+Author:
+    Darkness4869
+"""
+from Models.Logger import Extractio_Logger
+from Environment import Environment
+from Models.SQLiteDatabase import SQLite_Database
+from sqlite3 import Connection, Row, Error as Session_Store_Error
+from threading import Lock
+from json import JSONDecodeError, load
+from os import listdir
+from os.path import exists, join
+from typing import Dict, List, Optional, Union
+
+
+class Session_Store:
+    """
+    A store of the sessions of the users keyed by their IP Address so that a session is read or written in constant time regardless of the amount of sessions stored.
+
+    The sessions are stored in a SQLite database in write-ahead logging mode, hence, the workers of the application read concurrently while one of them writes.  Each thread of each process uses its own connection.  The session files of the previous versions of the application are imported once.
+
+    Attributes:
+        __instance (Optional[Session_Store]): The store shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared store.
+        __database (SQLite_Database): The SQLite database of the store.
+        __logger (Extractio_Logger): The logger of the store.
+
+    Methods:
+        getInstance() -> Session_Store: Retrieving the store shared by the whole process.
+        get(ip_address: str) -> Optional[Dict[str, Union[str, int]]]: Retrieving the session of a user.
+        put(client: Dict[str, Union[str, int]]) -> None: Storing the session of a user.
+        delete(ip_address: str, timestamp: Optional[int] = None) -> bool: Removing the session of a user.
+        getExpired(deadline: int, limit: int) -> List[Dict[str, Union[str, int]]]: Retrieving the sessions which have not been renewed since a deadline.
+        count() -> int: Counting the stored sessions.
+        putIfAbsent(client: Dict[str, Union[str, int]]) -> bool: Storing the session of a user unless the user already has one.
+        deleteMany(clients: List[Dict[str, Union[str, int]]]) -> List[Dict[str, Union[str, int]]]: Removing sessions which have not been renewed.
+        importLegacySessions(directory: str) -> int: Importing the session files of the previous versions of the application.
+    """
+    __instance: Optional["Session_Store"] = None
+    """
+    The store shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared store.
+    """
+    __database: SQLite_Database
+    """
+    The SQLite database of the store.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the store.
+    """
+
+    def __init__(self, path: str, logger: Optional[Extractio_Logger] = None):
+        """
+        Initializing the session store and creating its tables if they do not exist.
+
+        Args:
+            path (str): The path of the SQLite database.
+            logger (Optional[Extractio_Logger]): The logger of the store.
+        """
+        self.setDatabase(SQLite_Database(path))
+        self.setLogger(logger or Extractio_Logger(__name__))
+        connection: Connection = self.getConnection()
+        with connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS Sessions (ip_address TEXT PRIMARY KEY, http_client_ip_address TEXT, proxy_ip_address TEXT, timestamp INTEGER NOT NULL, color_scheme TEXT NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS Sessions_timestamp ON Sessions (timestamp)")
+            connection.execute("CREATE TABLE IF NOT EXISTS Metadata (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+
+    def getDatabase(self) -> SQLite_Database:
+        return self.__database
+
+    def setDatabase(self, database: SQLite_Database) -> None:
+        self.__database = database
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    @classmethod
+    def getInstance(cls) -> "Session_Store":
+        """
+        Retrieving the store shared by the whole process, creating it on the first call in the session cache directory of the application and importing the legacy session files.
+
+        Returns:
+            Session_Store: The store shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                ENV: Environment = Environment()
+                store: "Session_Store" = cls(f"{ENV.getDirectory()}/Cache/Session/Sessions.sqlite3")
+                store.importLegacySessions(f"{ENV.getDirectory()}/Cache/Session/Users/")
+                cls.__instance = store
+            return cls.__instance
+
+    def getConnection(self) -> Connection:
+        """
+        Retrieving the connection of the current thread to the database.
+
+        Returns:
+            Connection
+        """
+        return self.getDatabase().getConnection()
+
+    def get(self, ip_address: str) -> Optional[Dict[str, Union[str, int]]]:
+        """
+        Retrieving the session of a user.
+
+        Args:
+            ip_address (str): The IP Address of the user.
+
+        Returns:
+            Optional[Dict[str, Union[str, int]]]: The client data of the session, or None if the user has no session.
+        """
+        row: Optional[Row] = self.getConnection().execute("SELECT ip_address, http_client_ip_address, proxy_ip_address, timestamp, color_scheme FROM Sessions WHERE ip_address = ?", (ip_address,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def put(self, client: Dict[str, Union[str, int]]) -> None:
+        """
+        Storing the session of a user, replacing the previous one.
+
+        Args:
+            client (Dict[str, Union[str, int]]): The client data of the session containing the IP Addresses, the timestamp and the color scheme.
+        """
+        connection: Connection = self.getConnection()
+        with connection:
+            connection.execute(
+                "INSERT INTO Sessions (ip_address, http_client_ip_address, proxy_ip_address, timestamp, color_scheme) VALUES (?, ?, ?, ?, ?) ON CONFLICT (ip_address) DO UPDATE SET http_client_ip_address = excluded.http_client_ip_address, proxy_ip_address = excluded.proxy_ip_address, timestamp = excluded.timestamp, color_scheme = excluded.color_scheme",
+                (str(client["ip_address"]), str(client["http_client_ip_address"]), str(client["proxy_ip_address"]), int(client["timestamp"]), str(client["color_scheme"]))
+            )
+
+    def delete(self, ip_address: str, timestamp: Optional[int] = None) -> bool:
+        """
+        Removing the session of a user.  When a timestamp is given, the session is only removed if it has not been renewed since, so that a concurrent renewal is never lost.
+
+        Args:
+            ip_address (str): The IP Address of the user.
+            timestamp (Optional[int]): The timestamp the session must still have.
+
+        Returns:
+            bool: True if the session has been removed, otherwise False.
+        """
+        connection: Connection = self.getConnection()
+        with connection:
+            if timestamp is None:
+                return connection.execute("DELETE FROM Sessions WHERE ip_address = ?", (ip_address,)).rowcount > 0
+            return connection.execute("DELETE FROM Sessions WHERE ip_address = ? AND timestamp = ?", (ip_address, timestamp)).rowcount > 0
+
+    def getExpired(self, deadline: int, limit: int) -> List[Dict[str, Union[str, int]]]:
+        """
+        Retrieving the oldest sessions which have not been renewed since a deadline by using the index on the timestamp.
+
+        Args:
+            deadline (int): The UNIX time before which a session is expired.
+            limit (int): The maximum amount of sessions to retrieve.
+
+        Returns:
+            List[Dict[str, Union[str, int]]]: The client data of the expired sessions.
+        """
+        rows: List[Row] = self.getConnection().execute("SELECT ip_address, http_client_ip_address, proxy_ip_address, timestamp, color_scheme FROM Sessions WHERE timestamp < ? ORDER BY timestamp LIMIT ?", (deadline, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self) -> int:
+        """
+        Counting the stored sessions.
+
+        Returns:
+            int
+        """
+        return int(self.getConnection().execute("SELECT COUNT(*) FROM Sessions").fetchone()[0])
+
+    def putIfAbsent(self, client: Dict[str, Union[str, int]]) -> bool:
+        """
+        Storing the session of a user unless the user already has one, which allows a session to be restored without overwriting a newer one.
+
+        Args:
+            client (Dict[str, Union[str, int]]): The client data of the session containing the IP Addresses, the timestamp and the color scheme.
+
+        Returns:
+            bool: True if the session has been stored, otherwise False.
+        """
+        connection: Connection = self.getConnection()
+        with connection:
+            return connection.execute(
+                "INSERT OR IGNORE INTO Sessions (ip_address, http_client_ip_address, proxy_ip_address, timestamp, color_scheme) VALUES (?, ?, ?, ?, ?)",
+                (str(client["ip_address"]), str(client["http_client_ip_address"]), str(client["proxy_ip_address"]), int(client["timestamp"]), str(client["color_scheme"]))
+            ).rowcount > 0
+
+    def deleteMany(self, clients: List[Dict[str, Union[str, int]]]) -> List[Dict[str, Union[str, int]]]:
+        """
+        Removing sessions in a single transaction, each of them only if it has not been renewed since its client data has been read.
+
+        Args:
+            clients (List[Dict[str, Union[str, int]]]): The client data of the sessions.
+
+        Returns:
+            List[Dict[str, Union[str, int]]]: The client data of the sessions which have been removed.
+        """
+        removed_clients: List[Dict[str, Union[str, int]]] = []
+        connection: Connection = self.getConnection()
+        with connection:
+            for client in clients:
+                if connection.execute("DELETE FROM Sessions WHERE ip_address = ? AND timestamp = ?", (str(client["ip_address"]), int(client["timestamp"]))).rowcount > 0:
+                    removed_clients.append(client)
+        return removed_clients
+
+    def importLegacySessions(self, directory: str) -> int:
+        """
+        Importing the session files of the previous versions of the application.  The import only happens once, after which the directory is no longer read.
+
+        Args:
+            directory (str): The directory of the session files.
+
+        Returns:
+            int: The amount of sessions which have been imported.
+        """
+        connection: Connection = self.getConnection()
+        with connection:
+            is_claimed: bool = connection.execute("INSERT OR IGNORE INTO Metadata (name, value) VALUES ('legacy_import', 1)").rowcount > 0
+        if not is_claimed or not exists(directory):
+            return 0
+        amount: int = 0
+        for file_name in listdir(directory):
+            if not file_name.endswith(".json"):
+                continue
+            try:
+                with open(join(directory, file_name), "r") as file:
+                    client: Dict[str, Union[str, int]] = load(file)["Client"]
+                self.put({
+                    "ip_address": client["ip_address"],
+                    "http_client_ip_address": client.get("http_client_ip_address", "None"),
+                    "proxy_ip_address": client.get("proxy_ip_address", "None"),
+                    "timestamp": client["timestamp"],
+                    "color_scheme": client.get("color_scheme", "light")
+                })
+                amount += 1
+            except (OSError, JSONDecodeError, KeyError, TypeError, ValueError, Session_Store_Error) as error:
+                self.getLogger().warn(f"The legacy session file cannot be imported. - File Name: {file_name} - Error: {error}")
+        self.getLogger().inform(f"The legacy session files have been imported. - Amount: {amount}")
+        return amount
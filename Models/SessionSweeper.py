@@ -0,0 +1,411 @@
+"""
+The module provides the background sweeper which archives the expired sessions of the users as visitors, so that the requests never have to deal with them.
+
+Author:
+    Darkness4869
+"""
+from Models.SessionStore import Session_Store
+from Models.VisitorModel import Visitor
+from Models.DatabaseHandler import Database_Handler, Extractio_Logger
+from threading import Event, Lock, Thread
+from heapq import heappop, heappush
+from time import perf_counter, time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+class Session_Sweeper:
+    """
+    A sweeper which keeps the sessions that are about to expire in a heap keyed by their expiry time and archives them in batches once they have expired.
+
+    The heap is refilled from the index on the timestamp of the session store.  An entry is revalidated lazily: the session is removed from the store only if it still has the timestamp it had when it was pushed, so a session renewed in the meantime is simply dropped from the heap.  As the removal happens before the archiving, several workers can sweep concurrently without archiving a session twice.
+
+    Attributes:
+        __instance (Optional[Session_Sweeper]): The sweeper shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared sweeper.
+        __store (Session_Store): The store of the sessions.
+        __database_handler (Database_Handler): The database handler used to archive the visitors.
+        __logger (Extractio_Logger): The logger of the sweeper.
+        __maximum_age (int): The amount of seconds after which a session which has not been renewed expires.
+        __interval (float): The maximum amount of seconds between two sweeps.
+        __batch_size (int): The maximum amount of sessions archived per batch.
+        __heap (List[Tuple[int, str, int]]): The expiry time, IP Address and timestamp of the sessions about to expire.
+        __clients (Dict[Tuple[str, int], Dict[str, Union[str, int]]]): The client data of the sessions in the heap.
+        __lock (Lock): The lock serializing the sweeps.
+        __archive_lock (Lock): The lock serializing the use of the database handler, which cannot be shared by concurrent threads.
+        __deferred (List[Dict[str, Union[str, int]]]): The client data of the expired sessions which have already been replaced in the store.
+        __stop_event (Event): The event which stops the thread of the sweeper.
+        __thread (Optional[Thread]): The thread of the sweeper.
+        __statistics (Dict[str, Any]): The counters of the sweeper.
+
+    Methods:
+        getInstance() -> Session_Sweeper: Retrieving the sweeper shared by the whole process.
+        start() -> None: Starting the thread of the sweeper.
+        stop() -> None: Stopping the thread of the sweeper.
+        sweep() -> int: Archiving the sessions which have expired.
+        archive(clients: List[Dict[str, Union[str, int]]]) -> int: Archiving sessions as visitors.
+        defer(client: Dict[str, Union[str, int]]) -> None: Handing over an expired session which has been replaced in the store.
+        getStatistics() -> Dict[str, Any]: Retrieving the counters of the sweeper.
+    """
+    __instance: Optional["Session_Sweeper"] = None
+    """
+    The sweeper shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared sweeper.
+    """
+    __store: Session_Store
+    """
+    The store of the sessions.
+    """
+    __database_handler: Database_Handler
+    """
+    The database handler used to archive the visitors.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the sweeper.
+    """
+    __maximum_age: int
+    """
+    The amount of seconds after which a session which has not been renewed expires.
+    """
+    __interval: float
+    """
+    The maximum amount of seconds between two sweeps.
+    """
+    __batch_size: int
+    """
+    The maximum amount of sessions archived per batch.
+    """
+    __heap: List[Tuple[int, str, int]]
+    """
+    The expiry time, IP Address and timestamp of the sessions about to expire.
+    """
+    __clients: Dict[Tuple[str, int], Dict[str, Union[str, int]]]
+    """
+    The client data of the sessions in the heap.
+    """
+    __lock: Lock
+    """
+    The lock serializing the sweeps.
+    """
+    __archive_lock: Lock
+    """
+    The lock serializing the use of the database handler, which cannot be shared by concurrent threads.
+    """
+    __deferred: List[Dict[str, Union[str, int]]]
+    """
+    The client data of the expired sessions which have already been replaced in the store.
+    """
+    __stop_event: Event
+    """
+    The event which stops the thread of the sweeper.
+    """
+    __thread: Optional[Thread]
+    """
+    The thread of the sweeper.
+    """
+    __statistics: Dict[str, Any]
+    """
+    The counters of the sweeper.
+    """
+
+    def __init__(
+        self,
+        store: Optional[Session_Store] = None,
+        database_handler: Optional[Database_Handler] = None,
+        maximum_age: int = 3600,
+        interval: float = 30.0,
+        batch_size: int = 500
+    ):
+        """
+        Initializing the sweeper and creating the Visitor table if it does not exist.
+
+        Args:
+            store (Optional[Session_Store]): The store of the sessions, which defaults to the store shared by the process.
+            database_handler (Optional[Database_Handler]): The database handler used to archive the visitors.
+            maximum_age (int): The amount of seconds after which a session which has not been renewed expires.
+            interval (float): The maximum amount of seconds between two sweeps.
+            batch_size (int): The maximum amount of sessions archived per batch.
+        """
+        self.setStore(store or Session_Store.getInstance())
+        self.setDatabaseHandler(database_handler or Database_Handler())
+        self.setLogger(Extractio_Logger(__name__))
+        self.setMaximumAge(maximum_age)
+        self.setInterval(interval)
+        self.setBatchSize(batch_size)
+        self.setHeap([])
+        self.setClients({})
+        self.setLock(Lock())
+        self.setArchiveLock(Lock())
+        self.setDeferred([])
+        self.setStopEvent(Event())
+        self.setThread(None)
+        self.setStatistics({
+            "runs": 0,
+            "swept": 0,
+            "last_swept": 0,
+            "last_duration": 0.0,
+            "total_duration": 0.0
+        })
+        if not Visitor(self.getDatabaseHandler()).create():
+            self.getLogger().error("The required table cannot be created.")
+
+    def getStore(self) -> Session_Store:
+        return self.__store
+
+    def setStore(self, store: Session_Store) -> None:
+        self.__store = store
+
+    def getDatabaseHandler(self) -> Database_Handler:
+        return self.__database_handler
+
+    def setDatabaseHandler(self, database_handler: Database_Handler) -> None:
+        self.__database_handler = database_handler
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    def getMaximumAge(self) -> int:
+        return self.__maximum_age
+
+    def setMaximumAge(self, maximum_age: int) -> None:
+        self.__maximum_age = maximum_age
+
+    def getInterval(self) -> float:
+        return self.__interval
+
+    def setInterval(self, interval: float) -> None:
+        self.__interval = interval
+
+    def getBatchSize(self) -> int:
+        return self.__batch_size
+
+    def setBatchSize(self, batch_size: int) -> None:
+        self.__batch_size = batch_size
+
+    def getHeap(self) -> List[Tuple[int, str, int]]:
+        return self.__heap
+
+    def setHeap(self, heap: List[Tuple[int, str, int]]) -> None:
+        self.__heap = heap
+
+    def getClients(self) -> Dict[Tuple[str, int], Dict[str, Union[str, int]]]:
+        return self.__clients
+
+    def setClients(self, clients: Dict[Tuple[str, int], Dict[str, Union[str, int]]]) -> None:
+        self.__clients = clients
+
+    def getLock(self) -> Lock:
+        return self.__lock
+
+    def setLock(self, lock: Lock) -> None:
+        self.__lock = lock
+
+    def getArchiveLock(self) -> Lock:
+        return self.__archive_lock
+
+    def setArchiveLock(self, archive_lock: Lock) -> None:
+        self.__archive_lock = archive_lock
+
+    def getDeferred(self) -> List[Dict[str, Union[str, int]]]:
+        return self.__deferred
+
+    def setDeferred(self, deferred: List[Dict[str, Union[str, int]]]) -> None:
+        self.__deferred = deferred
+
+    def getStopEvent(self) -> Event:
+        return self.__stop_event
+
+    def setStopEvent(self, stop_event: Event) -> None:
+        self.__stop_event = stop_event
+
+    def getThread(self) -> Optional[Thread]:
+        return self.__thread
+
+    def setThread(self, thread: Optional[Thread]) -> None:
+        self.__thread = thread
+
+    def getStatistics(self) -> Dict[str, Any]:
+        with self.getLock():
+            return dict(self.__statistics)
+
+    def setStatistics(self, statistics: Dict[str, Any]) -> None:
+        self.__statistics = statistics
+
+    @classmethod
+    def getInstance(cls) -> "Session_Sweeper":
+        """
+        Retrieving the sweeper shared by the whole process, creating it on the first call.
+
+        Returns:
+            Session_Sweeper: The sweeper shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls()
+            return cls.__instance
+
+    def start(self) -> None:
+        """
+        Starting the thread of the sweeper if it is not already running.
+        """
+        if self.getThread() is not None and self.getThread().is_alive(): # type: ignore
+            return
+        self.getStopEvent().clear()
+        self.setThread(Thread(target=self.__run, name="Session_Sweeper", daemon=True))
+        self.getThread().start() # type: ignore
+        self.getLogger().inform("The session sweeper has been started.")
+
+    def stop(self) -> None:
+        """
+        Stopping the thread of the sweeper.
+        """
+        self.getStopEvent().set()
+        if self.getThread() is not None:
+            self.getThread().join(timeout=self.getInterval()) # type: ignore
+
+    def __run(self) -> None:
+        """
+        Sweeping the expired sessions until the sweeper is stopped, waking up when the next session of the heap expires or when the interval has elapsed, whichever comes first.
+        """
+        while not self.getStopEvent().is_set():
+            delay: float = self.getInterval()
+            try:
+                swept: int = self.sweep()
+                delay = 0.0 if swept >= self.getBatchSize() else self.__getDelay()
+            except Exception as error:
+                self.getLogger().error(f"The session sweeper has failed. - Error: {error}")
+            self.getStopEvent().wait(delay)
+
+    def __getDelay(self) -> float:
+        """
+        Calculating the amount of seconds until the next session of the heap expires, bounded by the interval.
+
+        Returns:
+            float
+        """
+        with self.getLock():
+            if not self.getHeap():
+                return self.getInterval()
+            return max(0.0, min(self.getInterval(), self.getHeap()[0][0] - time()))
+
+    def __refill(self, now: int) -> None:
+        """
+        Pushing into the heap the sessions which expire before the next sweep, read in the order of their timestamp from the index of the store.  It must be called while holding the lock.
+
+        Args:
+            now (int): The current UNIX time.
+        """
+        horizon: int = now - self.getMaximumAge() + int(self.getInterval()) + 1
+        for client in self.getStore().getExpired(horizon, self.getBatchSize()):
+            key: Tuple[str, int] = (str(client["ip_address"]), int(client["timestamp"]))
+            if key in self.getClients():
+                continue
+            self.getClients()[key] = client
+            heappush(self.getHeap(), (key[1] + self.getMaximumAge(), key[0], key[1]))
+
+    def sweep(self) -> int:
+        """
+        Archiving a batch of the sessions of the heap which have expired, along with the expired sessions which have been handed over by the requests.
+
+        Returns:
+            int: The amount of sessions which have been archived.
+        """
+        start: float = perf_counter()
+        with self.getLock():
+            now: int = int(time())
+            self.__refill(now)
+            due_clients: List[Dict[str, Union[str, int]]] = []
+            while self.getHeap() and self.getHeap()[0][0] <= now and len(due_clients) < self.getBatchSize():
+                _, ip_address, timestamp = heappop(self.getHeap())
+                due_clients.append(self.getClients().pop((ip_address, timestamp)))
+            deferred_clients: List[Dict[str, Union[str, int]]] = self.getDeferred()[:self.getBatchSize()]
+            del self.getDeferred()[:len(deferred_clients)]
+        swept: int = self.archive(due_clients) if due_clients else 0
+        swept += self.__archiveDeferred(deferred_clients) if deferred_clients else 0
+        duration: float = perf_counter() - start
+        with self.getLock():
+            self.__statistics["runs"] += 1
+            self.__statistics["swept"] += swept
+            self.__statistics["last_swept"] = swept
+            self.__statistics["last_duration"] = duration
+            self.__statistics["total_duration"] += duration
+        if swept:
+            self.getLogger().inform(f"The expired sessions have been swept. - Swept: {swept} - Duration: {duration:.3f} s")
+        return swept
+
+    def archive(self, clients: List[Dict[str, Union[str, int]]]) -> int:
+        """
+        Archiving expired sessions as visitors.
+
+        The sessions are first removed from the store, only if they have not been renewed since, and the visitors of the removed sessions are then saved in a single transaction.  If the visitors cannot be saved, the sessions are put back into the store.
+
+        Args:
+            clients (List[Dict[str, Union[str, int]]]): The client data of the expired sessions.
+
+        Returns:
+            int: The amount of sessions which have been archived.
+        """
+        removed_clients: List[Dict[str, Union[str, int]]] = self.getStore().deleteMany(clients)
+        if not removed_clients:
+            return 0
+        if not self.__saveVisitors(removed_clients):
+            self.getLogger().error(f"The data about the visitors cannot be saved, hence, the sessions are restored. - Amount: {len(removed_clients)}")
+            for client in removed_clients:
+                self.getStore().putIfAbsent(client)
+            return 0
+        return len(removed_clients)
+
+    def defer(self, client: Dict[str, Union[str, int]]) -> None:
+        """
+        Handing over an expired session which has been replaced in the store by a new session of the same IP Address, so that it is archived by the next sweep instead of by the request.
+
+        Args:
+            client (Dict[str, Union[str, int]]): The client data of the expired session.
+        """
+        with self.getLock():
+            self.getDeferred().append(client)
+
+    def __archiveDeferred(self, clients: List[Dict[str, Union[str, int]]]) -> int:
+        """
+        Archiving the expired sessions which have been handed over by the requests, which are handed over again for the next sweep if the visitors cannot be saved.
+
+        Args:
+            clients (List[Dict[str, Union[str, int]]]): The client data of the expired sessions.
+
+        Returns:
+            int: The amount of sessions which have been archived.
+        """
+        if self.__saveVisitors(clients):
+            return len(clients)
+        self.getLogger().error(f"The data about the visitors cannot be saved, hence, they are kept for the next sweep. - Amount: {len(clients)}")
+        with self.getLock():
+            self.getDeferred().extend(clients)
+        return 0
+
+    def __saveVisitors(self, clients: List[Dict[str, Union[str, int]]]) -> bool:
+        """
+        Saving the visitors of expired sessions in a single transaction, one transaction at a time as the database handler holds the connection and the cursor of its current operation.
+
+        Args:
+            clients (List[Dict[str, Union[str, int]]]): The client data of the expired sessions.
+
+        Returns:
+            bool
+        """
+        with self.getArchiveLock():
+            visitors: List[Visitor] = [
+                Visitor(
+                    database_handler=self.getDatabaseHandler(),
+                    timestamp=int(client["timestamp"]),
+                    client=str(client["ip_address"])
+                ) for client in clients
+            ]
+            return Visitor.saveMany(visitors) is not None # type: ignore
@@ -0,0 +1,322 @@
+"""
+The module provides the coalescing of the concurrent computations of the same key, so that a cache miss is only computed once.
+
+Author:
+    Darkness4869
+"""
+from Models.Logger import Extractio_Logger
+from Environment import Environment
+from threading import Event, Lock
+from time import sleep, time
+from os import fstat, makedirs, remove, stat
+from os.path import exists, join
+from hashlib import sha1
+from typing import Any, Callable, Dict, IO, Optional
+try:
+    from fcntl import flock, LOCK_EX, LOCK_NB, LOCK_UN
+except ImportError:
+    flock = None # type: ignore
+
+
+class Single_Flight:
+    """
+    A coalescer of the concurrent computations of the same key.
+
+    Within a process, the first caller of a key becomes its leader and computes it while the other callers wait for the result of the leader.  Across processes, the leaders of the same key are serialized by an exclusive lock on the lock file of the key, and each leader checks whether the result has been stored by another process before computing it.  Each key has its own lock file, hence, the computations of different keys never wait for each other, and the lock file is removed by its holder before it is unlocked so that the directory does not grow with the amount of keys.
+
+    Attributes:
+        __instance (Optional[Single_Flight]): The coalescer shared by the whole process.
+        __instance_lock (Lock): The lock protecting the creation of the shared coalescer.
+        __flights (Dict[str, Dict[str, Any]]): The computations in progress keyed by their key, along with the event set once they are completed, their result and their error.
+        __lock (Lock): The lock protecting the computations in progress and the counters.
+        __directory (Optional[str]): The directory of the lock files, or None to only coalesce within the process.
+        __timeout (float): The amount of seconds a caller waits for a computation or a lock file before computing the key itself.
+        __leaders (int): The amount of computations.
+        __followers (int): The amount of callers which have waited for the computation of another caller.
+        __logger (Extractio_Logger): The logger of the coalescer.
+
+    Methods:
+        getInstance() -> Single_Flight: Retrieving the coalescer shared by the whole process.
+        do(key: str, function: Callable[[], Any], check: Optional[Callable[[], Any]]) -> Any: Computing a key once for all of its concurrent callers.
+        getStatistics() -> Dict[str, int]: Retrieving the counters of the coalescer.
+    """
+    __instance: Optional["Single_Flight"] = None
+    """
+    The coalescer shared by the whole process.
+    """
+    __instance_lock: Lock = Lock()
+    """
+    The lock protecting the creation of the shared coalescer.
+    """
+    __flights: Dict[str, Dict[str, Any]]
+    """
+    The computations in progress keyed by their key, along with the event set once they are completed, their result and their error.
+    """
+    __lock: Lock
+    """
+    The lock protecting the computations in progress and the counters.
+    """
+    __directory: Optional[str]
+    """
+    The directory of the lock files, or None to only coalesce within the process.
+    """
+    __timeout: float
+    """
+    The amount of seconds a caller waits for a computation or a lock file before computing the key itself.
+    """
+    __leaders: int
+    """
+    The amount of computations.
+    """
+    __followers: int
+    """
+    The amount of callers which have waited for the computation of another caller.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the coalescer.
+    """
+
+    def __init__(self, directory: Optional[str] = None, timeout: float = 120.0):
+        """
+        Initializing the coalescer.
+
+        Args:
+            directory (Optional[str]): The directory of the lock files, or None to only coalesce within the process.
+            timeout (float): The amount of seconds a caller waits for a computation or a lock file before computing the key itself.
+        """
+        self.setFlights({})
+        self.setLock(Lock())
+        self.setDirectory(directory if flock is not None else None)
+        self.setTimeout(timeout)
+        self.setLeaders(0)
+        self.setFollowers(0)
+        self.setLogger(Extractio_Logger(__name__))
+        if self.getDirectory() is not None and not exists(str(self.getDirectory())):
+            makedirs(str(self.getDirectory()), exist_ok=True)
+
+    def getFlights(self) -> Dict[str, Dict[str, Any]]:
+        return self.__flights
+
+    def setFlights(self, flights: Dict[str, Dict[str, Any]]) -> None:
+        self.__flights = flights
+
+    def getLock(self) -> Lock:
+        return self.__lock
+
+    def setLock(self, lock: Lock) -> None:
+        self.__lock = lock
+
+    def getDirectory(self) -> Optional[str]:
+        return self.__directory
+
+    def setDirectory(self, directory: Optional[str]) -> None:
+        self.__directory = directory
+
+    def getTimeout(self) -> float:
+        return self.__timeout
+
+    def setTimeout(self, timeout: float) -> None:
+        self.__timeout = timeout
+
+    def getLeaders(self) -> int:
+        return self.__leaders
+
+    def setLeaders(self, leaders: int) -> None:
+        self.__leaders = leaders
+
+    def getFollowers(self) -> int:
+        return self.__followers
+
+    def setFollowers(self, followers: int) -> None:
+        self.__followers = followers
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    @classmethod
+    def getInstance(cls) -> "Single_Flight":
+        """
+        Retrieving the coalescer shared by the whole process, creating it on the first call with its lock files in the cache directory of the application.
+
+        Returns:
+            Single_Flight: The coalescer shared by the whole process.
+        """
+        if cls.__instance is not None:
+            return cls.__instance
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = cls(f"{Environment().getDirectory()}/Cache/Locks")
+            return cls.__instance
+
+    def do(self, key: str, function: Callable[[], Any], check: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        Computing a key once for all of its concurrent callers.  The callers of a key being computed in the process wait for its result, while the leader only computes it if the check does not find a result stored by another process.
+
+        Args:
+            key (str): The key to compute.
+            function (Callable[[], Any]): The computation of the key.
+            check (Optional[Callable[[], Any]]): The lookup of a stored result, which returns None if the key has not been computed.
+
+        Returns:
+            Any: The result of the computation or of the check.
+
+        Raises:
+            BaseException: The error raised by the computation of the leader.
+        """
+        with self.getLock():
+            flight: Optional[Dict[str, Any]] = self.getFlights().get(key)
+            is_leader: bool = flight is None
+            if flight is None:
+                flight = {"event": Event(), "result": None, "error": None}
+                self.getFlights()[key] = flight
+                self.setLeaders(self.getLeaders() + 1)
+            else:
+                self.setFollowers(self.getFollowers() + 1)
+        if not is_leader:
+            return self.__follow(key, flight, function)
+        try:
+            flight["result"] = self.__lead(key, function, check)
+            return flight["result"]
+        except BaseException as error:
+            flight["error"] = error
+            raise
+        finally:
+            flight["event"].set()
+            with self.getLock():
+                self.getFlights().pop(key, None)
+
+    def __follow(self, key: str, flight: Dict[str, Any], function: Callable[[], Any]) -> Any:
+        """
+        Waiting for the computation of the leader of a key, the key being computed by the caller if the leader takes too long.
+
+        Args:
+            key (str): The key being computed.
+            flight (Dict[str, Any]): The computation of the leader.
+            function (Callable[[], Any]): The computation of the key.
+
+        Returns:
+            Any
+
+        Raises:
+            BaseException: The error raised by the computation of the leader.
+        """
+        if not flight["event"].wait(self.getTimeout()):
+            self.getLogger().warn(f"The computation of the key has timed out and will be done again. - Key: {key} - Timeout: {self.getTimeout()}")
+            return function()
+        if flight["error"] is not None:
+            raise flight["error"]
+        return flight["result"]
+
+    def __lead(self, key: str, function: Callable[[], Any], check: Optional[Callable[[], Any]]) -> Any:
+        """
+        Computing a key under its lock file, unless a result has been stored in the meantime.
+
+        Args:
+            key (str): The key to compute.
+            function (Callable[[], Any]): The computation of the key.
+            check (Optional[Callable[[], Any]]): The lookup of a stored result.
+
+        Returns:
+            Any
+        """
+        lock_file: Optional[IO[str]] = self.__open(key) if self.getDirectory() is not None else None
+        try:
+            result: Any = check() if check is not None else None
+            return result if result is not None else function()
+        finally:
+            if lock_file is not None:
+                self.__release(key, lock_file)
+
+    def __getLockFilePath(self, key: str) -> str:
+        """
+        Retrieving the path of the lock file of a key, which is named after the hash of the key as the keys can contain separators.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            str
+        """
+        return join(str(self.getDirectory()), f"{sha1(key.encode()).hexdigest()}.lock")
+
+    def __open(self, key: str) -> Optional[IO[str]]:
+        """
+        Opening the lock file of a key and acquiring its exclusive lock, waiting at most the timeout of the coalescer.  A lock file which has been removed by its previous holder while its lock was awaited is opened again.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            Optional[IO[str]]: The locked lock file, or None if it has not been locked before the timeout.
+        """
+        lock_file_path: str = self.__getLockFilePath(key)
+        deadline: float = time() + self.getTimeout()
+        while True:
+            lock_file: IO[str] = open(lock_file_path, "a")
+            if not self.__acquire(lock_file.fileno(), deadline):
+                lock_file.close()
+                self.getLogger().warn(f"The lock file cannot be acquired, hence, the key will be computed concurrently. - Key: {key} - Timeout: {self.getTimeout()}")
+                return None
+            try:
+                opened = fstat(lock_file.fileno())
+                current = stat(lock_file_path)
+                if opened.st_ino == current.st_ino and opened.st_dev == current.st_dev:
+                    return lock_file
+            except FileNotFoundError:
+                pass
+            flock(lock_file.fileno(), LOCK_UN)
+            lock_file.close()
+
+    def __release(self, key: str, lock_file: IO[str]) -> None:
+        """
+        Removing the lock file of a key and releasing its lock.
+
+        Args:
+            key (str): The key.
+            lock_file (IO[str]): The locked lock file.
+        """
+        try:
+            remove(self.__getLockFilePath(key))
+        except FileNotFoundError:
+            pass
+        finally:
+            flock(lock_file.fileno(), LOCK_UN)
+            lock_file.close()
+
+    def __acquire(self, file_descriptor: int, deadline: float) -> bool:
+        """
+        Acquiring the exclusive lock of a lock file, waiting until the deadline.
+
+        Args:
+            file_descriptor (int): The file descriptor of the lock file.
+            deadline (float): The UNIX time until which the lock is awaited.
+
+        Returns:
+            bool
+        """
+        while True:
+            try:
+                flock(file_descriptor, LOCK_EX | LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time() >= deadline:
+                    return False
+                sleep(0.05)
+
+    def getStatistics(self) -> Dict[str, int]:
+        """
+        Retrieving the counters of the coalescer.
+
+        Returns:
+            Dict[str, int]
+        """
+        with self.getLock():
+            return {
+                "leaders": self.getLeaders(),
+                "followers": self.getFollowers(),
+                "in_flight": len(self.getFlights())
+            }
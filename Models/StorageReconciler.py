@@ -0,0 +1,356 @@
+"""
+The module provides the reconciler of the storage, which keeps the media file entries of the relational database server consistent with the media files and the metadata files in bulk.
+
+Author:
+    Darkness4869
+"""
+from Environment import Environment
+from Models.DatabaseHandler import Database_Handler, Extractio_Logger, Relational_Database_Error
+from Models.MediaFileModel import Media_File
+from Models.MetadataCache import Metadata_Cache
+from Models.DownloadCoordinator import Download_Coordinator
+from os import lstat, remove, scandir, stat_result
+from os.path import basename, dirname, isdir
+from time import perf_counter, time
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class Storage_Reconciler:
+    """
+    A reconciler which walks the directories of the media files and of the metadata files one shard at a time, a shard being the first character of the file names.
+
+    Each directory is scanned once per run and the names of its files are split by shard.  For each directory of a shard, the locations of its media file entries are streamed from the relational database server and kept in memory, then every file of the shard is crossed off.  A file left without an entry is removed, unless it is a partial download, is still being downloaded or has been modified within the grace period, as its entry may not have been posted yet.  An entry left without a file is removed in batches along with the metadata of its media.  A metadata file whose metadata are no longer cached is removed as well.  The memory used therefore depends on the names of the files of the shards of a run and on the entries of a single shard, and a run can be split across several shards.
+
+    Attributes:
+        __directory (str): The directory of the application.
+        __database_handler (Database_Handler): The database handler used to stream and delete the media file entries.
+        __grace_period (int): The amount of seconds during which a file without an entry is kept.
+        __batch_size (int): The maximum amount of entries deleted by a single query.
+        __is_dry_run (bool): The flag which only reports the discrepancies without fixing them.
+        __logger (Extractio_Logger): The logger of the reconciler.
+        shards (str): The first characters of the file names, which are the characters of the YouTube identifiers.
+
+    Methods:
+        getMediaDirectories() -> List[str]: Retrieving the directories of the media files.
+        getMetadataDirectories() -> List[str]: Retrieving the directories of the metadata files.
+        reconcile(shards: Optional[List[str]]) -> Dict[str, int]: Reconciling the storage.
+        reconcileShard(shard: str, files: Optional[Dict[str, List[str]]]) -> Dict[str, int]: Reconciling the files of a shard.
+    """
+    __directory: str
+    """
+    The directory of the application.
+    """
+    __database_handler: Database_Handler
+    """
+    The database handler used to stream and delete the media file entries.
+    """
+    __grace_period: int
+    """
+    The amount of seconds during which a file without an entry is kept.
+    """
+    __batch_size: int
+    """
+    The maximum amount of entries deleted by a single query.
+    """
+    __is_dry_run: bool
+    """
+    The flag which only reports the discrepancies without fixing them.
+    """
+    __logger: Extractio_Logger
+    """
+    The logger of the reconciler.
+    """
+    shards: str = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_"
+    """
+    The first characters of the file names, which are the characters of the YouTube identifiers.
+    """
+
+    def __init__(
+        self,
+        database_handler: Optional[Database_Handler] = None,
+        grace_period: int = 3600,
+        batch_size: int = 500,
+        is_dry_run: bool = False
+    ):
+        """
+        Initializing the reconciler.
+
+        Args:
+            database_handler (Optional[Database_Handler]): The database handler used to stream and delete the media file entries.
+            grace_period (int): The amount of seconds during which a file without an entry is kept.
+            batch_size (int): The maximum amount of entries deleted by a single query.
+            is_dry_run (bool): The flag which only reports the discrepancies without fixing them.
+        """
+        self.setDirectory(Environment().getDirectory())
+        self.setDatabaseHandler(database_handler or Database_Handler())
+        self.setGracePeriod(grace_period)
+        self.setBatchSize(batch_size)
+        self.setIsDryRun(is_dry_run)
+        self.setLogger(Extractio_Logger(__name__))
+
+    def getDirectory(self) -> str:
+        return self.__directory
+
+    def setDirectory(self, directory: str) -> None:
+        self.__directory = directory
+
+    def getDatabaseHandler(self) -> Database_Handler:
+        return self.__database_handler
+
+    def setDatabaseHandler(self, database_handler: Database_Handler) -> None:
+        self.__database_handler = database_handler
+
+    def getGracePeriod(self) -> int:
+        return self.__grace_period
+
+    def setGracePeriod(self, grace_period: int) -> None:
+        self.__grace_period = grace_period
+
+    def getBatchSize(self) -> int:
+        return self.__batch_size
+
+    def setBatchSize(self, batch_size: int) -> None:
+        self.__batch_size = batch_size
+
+    def getIsDryRun(self) -> bool:
+        return self.__is_dry_run
+
+    def setIsDryRun(self, is_dry_run: bool) -> None:
+        self.__is_dry_run = is_dry_run
+
+    def getLogger(self) -> Extractio_Logger:
+        return self.__logger
+
+    def setLogger(self, logger: Extractio_Logger) -> None:
+        self.__logger = logger
+
+    def getMediaDirectories(self) -> List[str]:
+        """
+        Retrieving the directories of the media files.
+
+        Returns:
+            List[str]
+        """
+        return [f"{self.getDirectory()}/Public/{media_type}{shorts}" for media_type in ["Video", "Audio"] for shorts in ["", "/shorts"]]
+
+    def getMetadataDirectories(self) -> List[str]:
+        """
+        Retrieving the directories of the metadata files.
+
+        Returns:
+            List[str]
+        """
+        return [f"{self.getDirectory()}/Cache/Media", f"{self.getDirectory()}/Cache/Media/shorts"]
+
+    def reconcile(self, shards: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Reconciling the storage, one shard after the other, each directory being scanned once for all of the shards.
+
+        Args:
+            shards (Optional[List[str]]): The shards to reconcile, which defaults to all of them.
+
+        Returns:
+            Dict[str, int]: The counters of the run.
+        """
+        start_time: float = perf_counter()
+        report: Dict[str, int] = self.__createReport()
+        selected_shards: List[str] = shards or list(self.shards)
+        files: Dict[str, Dict[str, List[str]]] = self.__scan(set(selected_shards))
+        for shard in selected_shards:
+            shard_files: Dict[str, List[str]] = {directory: names.pop(shard, []) for directory, names in files.items()}
+            for name, amount in self.reconcileShard(shard, shard_files).items():
+                report[name] += amount
+        self.getLogger().inform(f"The storage has been reconciled. - Dry Run: {self.getIsDryRun()} - Shards: {len(selected_shards)} - Report: {report} - Duration: {perf_counter() - start_time:.3f} s")
+        return report
+
+    def reconcileShard(self, shard: str, files: Optional[Dict[str, List[str]]] = None) -> Dict[str, int]:
+        """
+        Reconciling the media files, the media file entries and the metadata files of a shard.
+
+        Args:
+            shard (str): The first character of the file names.
+            files (Optional[Dict[str, List[str]]]): The names of the files of the shard keyed by their directory, which are scanned if they are not given.
+
+        Returns:
+            Dict[str, int]: The counters of the shard.
+        """
+        report: Dict[str, int] = self.__createReport()
+        if files is None:
+            files = {directory: names.get(shard, []) for directory, names in self.__scan({shard}).items()}
+        for directory in self.getMediaDirectories():
+            self.__reconcileMediaDirectory(directory, shard, files.get(directory, []), report)
+        for directory in self.getMetadataDirectories():
+            self.__reconcileMetadataDirectory(directory, files.get(directory, []), report)
+        return report
+
+    def __scan(self, shards: Set[str]) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Scanning the directories of the media files and of the metadata files once, the names of their files being split by shard.
+
+        Args:
+            shards (Set[str]): The shards to keep.
+
+        Returns:
+            Dict[str, Dict[str, List[str]]]: The names of the files of each shard keyed by their directory.
+        """
+        files: Dict[str, Dict[str, List[str]]] = {}
+        for directory in self.getMediaDirectories() + self.getMetadataDirectories():
+            names: Dict[str, List[str]] = {}
+            files[directory] = names
+            if not isdir(directory):
+                continue
+            with scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name[:1] in shards and entry.is_file(follow_symlinks=False):
+                        names.setdefault(entry.name[:1], []).append(entry.name)
+        return files
+
+    def __createReport(self) -> Dict[str, int]:
+        """
+        Creating the counters of a run.
+
+        Returns:
+            Dict[str, int]
+        """
+        return {
+            "rows": 0,
+            "files": 0,
+            "orphaned_rows": 0,
+            "untracked_files": 0,
+            "stale_metadata_files": 0,
+            "skipped_files": 0,
+            "deleted_rows": 0,
+            "deleted_files": 0,
+            "reclaimed_bytes": 0,
+            "failures": 0
+        }
+
+    def __loadLocations(self, directory: str, shard: str, report: Dict[str, int]) -> Optional[Dict[str, List[Tuple[int, str]]]]:
+        """
+        Loading the identifiers and the YouTube identifiers of the media file entries of a directory and a shard, keyed by their location.  As the collation of the relational database server may be case-insensitive, the file names are matched against the shard case-sensitively once more, otherwise, the entries of another shard would be taken for orphans.
+
+        Args:
+            directory (str): The directory of the media files.
+            shard (str): The first character of the file names.
+            report (Dict[str, int]): The counters of the shard.
+
+        Returns:
+            Optional[Dict[str, List[Tuple[int, str]]]]: The media file entries, or None if they cannot be loaded.
+        """
+        locations: Dict[str, List[Tuple[int, str]]] = {}
+        try:
+            for row in Media_File.streamByDirectory(self.getDatabaseHandler(), directory, shard, self.getBatchSize() * 2):
+                location: str = str(row["location"]) # type: ignore
+                if dirname(location) != directory or not basename(location).startswith(shard):
+                    continue
+                locations.setdefault(location, []).append((int(row["identifier"]), str(row["YouTube"]))) # type: ignore
+                report["rows"] += 1
+        except Relational_Database_Error as error:
+            self.getLogger().error(f"The media file entries cannot be loaded, hence, the directory is not reconciled. - Directory: {directory} - Shard: {shard} - Error: {error}")
+            report["failures"] += 1
+            return None
+        return locations
+
+    def __reconcileMediaDirectory(self, directory: str, shard: str, names: List[str], report: Dict[str, int]) -> None:
+        """
+        Reconciling the media files of a directory and a shard with their media file entries.
+
+        Args:
+            directory (str): The directory of the media files.
+            shard (str): The first character of the file names.
+            names (List[str]): The names of the media files of the shard in the directory.
+            report (Dict[str, int]): The counters of the shard.
+        """
+        locations: Optional[Dict[str, List[Tuple[int, str]]]] = self.__loadLocations(directory, shard, report)
+        if locations is None:
+            return
+        coordinator: Download_Coordinator = Download_Coordinator.getInstance()
+        for name in names:
+            file_path: str = f"{directory}/{name}"
+            report["files"] += 1
+            if locations.pop(file_path, None) is not None:
+                continue
+            try:
+                status: stat_result = lstat(file_path)
+            except FileNotFoundError:
+                continue
+            if ".partial." in name or time() - status.st_mtime < self.getGracePeriod() or coordinator.isLeased(file_path):
+                report["skipped_files"] += 1
+                continue
+            report["untracked_files"] += 1
+            self.__removeFile(file_path, status.st_size, report)
+        orphans: List[Tuple[int, str]] = [orphan for location, entries in locations.items() if basename(location).startswith(shard) and not coordinator.isLeased(location) for orphan in entries]
+        report["orphaned_rows"] += len(orphans)
+        for index in range(0, len(orphans), self.getBatchSize()):
+            self.__removeRows(orphans[index:index + self.getBatchSize()], report)
+
+    def __reconcileMetadataDirectory(self, directory: str, names: List[str], report: Dict[str, int]) -> None:
+        """
+        Removing the metadata files of a directory and a shard whose metadata are no longer cached, as well as the temporary files left by an interrupted export.
+
+        Args:
+            directory (str): The directory of the metadata files.
+            names (List[str]): The names of the files of the shard in the directory.
+            report (Dict[str, int]): The counters of the shard.
+        """
+        prefix: str = "shorts/" if directory.endswith("/shorts") else ""
+        cache: Metadata_Cache = Metadata_Cache.getInstance()
+        for name in names:
+            is_temporary: bool = name.endswith(".tmp")
+            if not is_temporary and not name.endswith(".json"):
+                continue
+            file_path: str = f"{directory}/{name}"
+            report["files"] += 1
+            try:
+                status: stat_result = lstat(file_path)
+            except FileNotFoundError:
+                continue
+            if time() - status.st_mtime < self.getGracePeriod():
+                report["skipped_files"] += 1
+                continue
+            if not is_temporary and cache.isCached(f"{prefix}{name[:-len('.json')]}"):
+                continue
+            report["stale_metadata_files"] += 1
+            self.__removeFile(file_path, status.st_size, report)
+
+    def __removeFile(self, file_path: str, size: int, report: Dict[str, int]) -> None:
+        """
+        Removing a file, which is only reported in a dry run.
+
+        Args:
+            file_path (str): The path of the file.
+            size (int): The size of the file.
+            report (Dict[str, int]): The counters of the shard.
+        """
+        if self.getIsDryRun():
+            report["reclaimed_bytes"] += size
+            return
+        try:
+            remove(file_path)
+        except FileNotFoundError:
+            return
+        except OSError as error:
+            self.getLogger().error(f"The file cannot be removed. - File Path: {file_path} - Error: {error}")
+            report["failures"] += 1
+            return
+        report["deleted_files"] += 1
+        report["reclaimed_bytes"] += size
+
+    def __removeRows(self, orphans: List[Tuple[int, str]], report: Dict[str, int]) -> None:
+        """
+        Removing a batch of media file entries along with the metadata of their media, which is only reported in a dry run.
+
+        Args:
+            orphans (List[Tuple[int, str]]): The identifiers and the YouTube identifiers of the media file entries.
+            report (Dict[str, int]): The counters of the shard.
+        """
+        if self.getIsDryRun():
+            return
+        if not Media_File.deleteByIdentifiers(self.getDatabaseHandler(), [identifier for identifier, _ in orphans]):
+            self.getLogger().error(f"The media file entries cannot be removed. - Amount: {len(orphans)}")
+            report["failures"] += 1
+            return
+        report["deleted_rows"] += len(orphans)
+        media: Set[str] = {youtube for _, youtube in orphans}
+        for identifier in media:
+            Metadata_Cache.getInstance().delete(identifier)
@@ -5,6 +5,7 @@ Author:
     Darkness4869
 """
 from Models.DatabaseHandler import Database_Handler, List, RowType, Tuple, Any, Optional
+from Models.SchemaRegistry import Schema_Registry
 from typing import Dict, Type
 
 
@@ -27,6 +28,7 @@ class Table_Model:
         getById(database_handler: Database_Handler, primary_key: Any) -> Optional["TableModel"]: Retrieves a model instance by its primary key.
         getAll(database_handler: Database_Handler) -> List["TableModel"]: Retrieves all model instances from the table.
         save() -> bool: Saves the model instance to the database.
+        saveMany(instances: List[Table_Model], chunk_size: int = 500) -> Optional[List[int]]: Saves many model instances to the database in a single transaction.
         update() -> bool: Updates the model instance in the database.
         delete() -> bool: Deletes the model instance from the database.
         createModelClass(table_name: str, database_handler: Database_Handler) -> Type["TableModel"]: Dynamically creates a model class for a given table name.
@@ -144,26 +146,25 @@ class Table_Model:
 
     def _getFields(self) -> Tuple[List[str], Dict[str, str], str]:
         """
-        Fetching the column names and types for the table from the database.
+        Fetching the column names and types for the table from the schema registry, which only queries the database the first time the table is requested.
 
         Returns:
             Tuple[List[str], Dict[str, str], str]: A tuple containing a list of field names and a dictionary mapping field names to their MySQL types.
         """
-        database_response: List[RowType] = self.getDatabaseHandler().getData(f"SHOW COLUMNS FROM {self.getTableName()}")
-        fields: List[str] = [str(column["Field"]) for column in database_response] # type: ignore
-        field_types: Dict[str, str] = {str(column["Field"]): str(column["Type"]) for column in database_response} # type: ignore
-        primary_field: str = next((str(column["Field"]) for column in database_response if str(column["Key"]) == "PRI"), "identifier") # type: ignore
-        return fields, field_types, primary_field
+        return Schema_Registry.getInstance().getSchema(self.getDatabaseHandler(), self.getTableName())
 
     def setModelAttributes(self, kwargs: Dict[str, Any]) -> None:
         """
-        Setting the model attributes based on the provided keyword arguments.
+        Setting the model attributes based on the provided keyword arguments.  The arguments which are not fields of the table, such as the aliased columns of a query, are set as well so that they can be read from the model.
 
         Args:
             kwargs (Dict[str, Any]): Keyword arguments containing the attributes to set.
         """
         for field in self.getFields():
             setattr(self, field, kwargs.get(field))
+        for key, value in kwargs.items():
+            if key not in self.getFields():
+                setattr(self, key, value)
 
     def mySqlTypeToPython(self, mysql_type: str) -> type:
         """
@@ -225,6 +226,34 @@ class Table_Model:
         query: str = f"INSERT INTO {self.getTableName()} ({', '.join(fields)}) VALUES ({placeholders})"
         return self.getDatabaseHandler().postData(query, values)
 
+    @classmethod
+    def saveMany(cls, instances: List["Table_Model"], chunk_size: int = 500) -> Optional[List[int]]:
+        """
+        Saving many model instances of the same table to the database with multi-row inserts in a single transaction.
+
+        The primary key is only inserted when every instance has a value for it, otherwise, it is left to the database and the generated identifiers are set on the instances.
+
+        Args:
+            instances (List[Table_Model]): The model instances to save.
+            chunk_size (int): The maximum amount of rows inserted by a single statement.
+
+        Returns:
+            Optional[List[int]]: The generated identifiers in the order of the instances, an empty list if the table does not generate identifiers, or None if the operation failed.
+        """
+        if not instances:
+            return []
+        model: "Table_Model" = instances[0]
+        has_primary_key: bool = all(getattr(instance, model.getPrimaryField(), None) is not None for instance in instances)
+        fields: List[str] = [field for field in model.getFields() if has_primary_key or field != model.getPrimaryField()]
+        rows: List[Tuple[Any, ...]] = [tuple(getattr(instance, field) for field in fields) for instance in instances]
+        placeholders: str = ", ".join(["%s"] * len(fields))
+        query: str = f"INSERT INTO {model.getTableName()} ({', '.join(fields)}) VALUES ({placeholders})"
+        identifiers: Optional[List[int]] = model.getDatabaseHandler().postMany(query, rows, chunk_size)
+        if identifiers and not has_primary_key:
+            for instance, identifier in zip(instances, identifiers):
+                setattr(instance, model.getPrimaryField(), identifier)
+        return identifiers
+
     def update(self) -> bool:
         """
         Updating the model instance in the database.
@@ -267,12 +296,8 @@ class Table_Model:
             Type[Table_Model]: A model class that is a subclass of `Table_Model` with the same name as the table name.
         """
         temporary_instance: "Table_Model" = cls(database_handler)
-        columns: List[RowType] = temporary_instance.getDatabaseHandler().getData(f"SHOW COLUMNS FROM {temporary_instance.getTableName()}")
-        annotations: Dict[str, type] = {}
-        primary_field: str = next((str(column["Field"]) for column in columns if str(column["Key"]) == "PRI"), "identifier") # type: ignore
-        for column in columns:
-            class_type: type = temporary_instance.mySqlTypeToPython(str(column["Type"])) # type: ignore
-            annotations[str(column["Field"])] = class_type # type: ignore
+        fields, field_types, primary_field = Schema_Registry.getInstance().getSchema(database_handler, table_name)
+        annotations: Dict[str, type] = {field: temporary_instance.mySqlTypeToPython(field_types[field]) for field in fields}
 
         def __init__(self, **kwargs):
             """
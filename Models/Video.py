@@ -7,16 +7,25 @@ Authors:
 from Environment import Environment
 from Models.Logger import Extractio_Logger
 from Models.DatabaseHandler import Database_Handler, Relational_Database_Error
-from os.path import exists
-from typing import Tuple
+from Models.LeastRecentlyUsedCache import Least_Recently_Used_Cache
+from Models.OrphanReconciler import Orphan_Reconciler
+from os.path import isfile, normpath
+from typing import Any, Dict, Optional
 from os import remove
 from Models.MediaFileModel import Media_File
+from Models.MetadataCache import Metadata_Cache
+from Models.DownloadCoordinator import Download_Coordinator
 
 
 class Video:
     """
     It will handle any I/O operations that are related with the
-    video contents as well as the databases operations.
+    video contents as well as the databases operations.  The
+    database handler is only created once a database operation
+    needs it, the existence of the files is cached for a few
+    seconds and the clean-up of a missing file is handed over to
+    the reconciler of the orphaned media, hence, serving a video
+    never touches the database server.
     """
     __identifier: str
     """
@@ -30,10 +39,25 @@ class Video:
     """
     The logger that will all the action of the application.
     """
-    __database_handler: Database_Handler
+    __database_handler: Optional[Database_Handler]
     """
     The database handler that will communicate with the database
-    server.
+    server, which is created on its first use.
+    """
+    __existence_cache: Least_Recently_Used_Cache = Least_Recently_Used_Cache(4096)
+    """
+    The existence of the files of the videos, shared by every
+    request of the process.
+    """
+    existence_time_to_live: float = 10.0
+    """
+    The amount of seconds during which a file is known to exist.
+    """
+    absence_time_to_live: float = 2.0
+    """
+    The amount of seconds during which a file is known to be
+    missing, which is kept short as a download can create it at
+    any moment.
     """
     __table_name: str
     """
@@ -66,7 +90,7 @@ class Video:
         """
         ENV: Environment = Environment()
         self.setLogger(Extractio_Logger(__name__))
-        self.setDatabaseHandler(Database_Handler())
+        self.setDatabaseHandler(None)
         self.setDirectory(f"{ENV.getDirectory()}/Public/Video")
         self.setTableName("MediaFile")
         self.setIdentifier(identifier)
@@ -79,11 +103,42 @@ class Video:
         self.__table_name = table_name
 
     def getDatabaseHandler(self) -> Database_Handler:
+        if self.__database_handler is None:
+            self.__database_handler = Database_Handler()
         return self.__database_handler
 
-    def setDatabaseHandler(self, database_handler: Database_Handler) -> None:
+    def setDatabaseHandler(self, database_handler: Optional[Database_Handler]) -> None:
         self.__database_handler = database_handler
 
+    @classmethod
+    def getCacheStatistics(cls) -> Dict[str, Any]:
+        """
+        Retrieving the statistics of the cache of the existence of
+        the files and of the reconciler of the orphaned media.
+
+        Returns:
+            {existence: {hits: int, misses: int, evictions: int, hit_rate: float, ...}, reconciler: {...}}
+        """
+        return {
+            "existence": cls.__existence_cache.getStatistics(),
+            "reconciler": Orphan_Reconciler.getInstance().getStatistics()
+        }
+
+    def refreshFile(self, file_path: str) -> bool:
+        """
+        Checking whether a file exists on the file system and caching
+        the answer for a few seconds.
+
+        Parameters:
+            file_path: string: The path of the file.
+
+        Returns:
+            boolean
+        """
+        is_existing: bool = isfile(file_path)
+        self.__existence_cache.set(file_path, is_existing, self.existence_time_to_live if is_existing else self.absence_time_to_live)
+        return is_existing
+
     def getLogger(self) -> Extractio_Logger:
         return self.__logger
 
@@ -104,7 +159,10 @@ class Video:
 
     def serveFile(self, is_shorts: bool = False) -> int:
         """
-        Serving the file needed by the user-interface.
+        Serving the file needed by the user-interface.  A missing
+        file is only reported to the reconciler of the orphaned
+        media when the file system has been checked, not when its
+        absence has been cached.
 
         Args:
             is_shorts (bool): The flag for checking the type of the video.
@@ -113,19 +171,49 @@ class Video:
             int
         """
         file_path: str = f"{self.getDirectory()}/shorts/{self.getIdentifier()}.mp4" if is_shorts else f"{self.getDirectory()}/{self.getIdentifier()}.mp4"
-        status: int = self.ok if exists(file_path) else self.not_found
+        is_existing: Optional[bool] = self.__existence_cache.get(file_path)
+        is_cached: bool = is_existing is not None
+        is_existing = is_existing if is_cached else self.refreshFile(file_path)
+        status: int = self.ok if is_existing else self.not_found
+        if status != self.ok and is_cached:
+            return status
         if status != self.ok:
+            identifier: str = f"shorts/{self.getIdentifier()}" if is_shorts else self.getIdentifier()
+            Orphan_Reconciler.getInstance().put(identifier, lambda: self.reconcile(is_shorts))
             self.getLogger().error(f"The file {self.getIdentifier()}.mp4 does not exist!  It will be removed from the relational database server. - Identifier: {self.getIdentifier()}")
-            relational_database_status: int = self.removeIdentifierRelationalDatabaseServer(is_shorts)
-            file_server_status: int = self.removeDataFileServer(is_shorts)
-            status = self.not_found if relational_database_status == self.accepted and file_server_status == self.accepted else self.service_unavailable
             return status
         self.getLogger().inform(f"The file {self.getIdentifier()}.mp4 has been served! - Status: {status}")
         return status
 
+    def reconcile(self, is_shorts: bool) -> int:
+        """
+        Removing the records and the related files of a video whose
+        file is missing, unless the file has been created since or
+        the audio or the video is being downloaded, as the records
+        and the audio file then belong to the running download.
+
+        Parameters:
+            is_shorts: bool: The flag for checking the type of the video.
+
+        Returns:
+            int
+        """
+        file_path: str = f"{self.getDirectory()}/shorts/{self.getIdentifier()}.mp4" if is_shorts else f"{self.getDirectory()}/{self.getIdentifier()}.mp4"
+        if self.refreshFile(file_path):
+            self.getLogger().inform(f"The file has been created since, hence, it is not reconciled. - Identifier: {self.getIdentifier()}")
+            return self.ok
+        audio_file_path: str = normpath(f"{self.getDirectory()}/../Audio/shorts/{self.getIdentifier()}.mp3" if is_shorts else f"{self.getDirectory()}/../Audio/{self.getIdentifier()}.mp3")
+        coordinator: Download_Coordinator = Download_Coordinator.getInstance()
+        if coordinator.isLeased(file_path) or coordinator.isLeased(audio_file_path):
+            self.getLogger().inform(f"The media is being downloaded, hence, it is not reconciled. - Identifier: {self.getIdentifier()}")
+            return self.accepted
+        relational_database_status: int = self.removeIdentifierRelationalDatabaseServer(is_shorts)
+        file_server_status: int = self.removeDataFileServer(is_shorts)
+        return self.not_found if relational_database_status == self.accepted and file_server_status == self.accepted else self.service_unavailable
+
     def removeDataFileServer(self, is_shorts: bool) -> int:
         """
-        Removing all of the data from the file servers which are linked to a specific identifier.
+        Removing all of the data from the file servers and the metadata cache which are linked to a specific identifier.
 
         Args:
             is_shorts (bool): The flag for checking the type of the video.
@@ -135,9 +223,8 @@ class Video:
         """
         try:
             audio_file: str = f"{self.getDirectory()}/../Audio/shorts/{self.getIdentifier()}.mp3" if is_shorts else f"{self.getDirectory()}/../Audio/{self.getIdentifier()}.mp3"
-            cache_file: str = f"{self.getDirectory()}/../../Cache/Media/shorts/{self.getIdentifier()}.json" if is_shorts else f"{self.getDirectory()}/../../Cache/Media/{self.getIdentifier()}.json"
             remove(audio_file)
-            remove(cache_file)
+            Metadata_Cache.getInstance().delete(f"shorts/{self.getIdentifier()}" if is_shorts else self.getIdentifier())
             self.getLogger().inform(f"The files related have been deleted from the file servers. - Identifier: {self.getIdentifier()} - Status: {self.accepted}")
             return self.accepted
         except Exception as error:
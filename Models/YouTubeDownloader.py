@@ -3,6 +3,7 @@ from datetime import datetime
 from urllib.error import HTTPError
 from yt_dlp import YoutubeDL
 from typing import Dict, Union, Optional
+from copy import deepcopy
 from time import strftime, gmtime
 from os.path import isfile, exists
 from os import makedirs
@@ -11,6 +12,9 @@ from Errors.ExtractioErrors import NotFoundError
 from yt_dlp.utils import DownloadError, ExtractorError
 from Models.YouTubeModel import YouTube
 from Models.MediaFileModel import Media_File
+from Models.ExtractionCache import Extraction_Cache
+from Models.DownloadCoordinator import Download_Coordinator
+from Models.DownloadProgressRegistry import Download_Progress_Registry
 
 
 class YouTube_Downloader:
@@ -99,6 +103,19 @@ class YouTube_Downloader:
     """
     The video codec of the video.
     """
+    __thumbnail: Optional[str]
+    """
+    The uniform resource locator of the thumbnail of the video.
+    """
+    __author_channel: Optional[str]
+    """
+    The uniform resource locator of the channel of the author.
+    """
+    __information: Dict[str, Any]
+    """
+    The raw information dictionary of the media extracted by
+    YoutubeDL, which is reused by the whole download pipeline.
+    """
 
     def __init__(self, uniform_resource_locator: str, media_identifier: int):
         """
@@ -131,6 +148,9 @@ class YouTube_Downloader:
             self.setVideoCodec("avc")
             self.setUniformResourceLocator(uniform_resource_locator)
             self.setMediaIdentifier(media_identifier)
+            self.setInformation({})
+            self.setThumbnail(None)
+            self.setAuthorChannel(None)
             self.getLogger().inform("The YouTube Downloader has been successfully been initialized!")
         except Relational_Database_Error as error:
             self.getLogger().error(f"The iniatialization of the model has failed. - Error: {error}")
@@ -253,6 +273,24 @@ class YouTube_Downloader:
     def getLogger(self) -> Extractio_Logger:
         return self.__logger
 
+    def getThumbnail(self) -> Optional[str]:
+        return self.__thumbnail
+
+    def setThumbnail(self, thumbnail: Optional[str]) -> None:
+        self.__thumbnail = thumbnail
+
+    def getAuthorChannel(self) -> Optional[str]:
+        return self.__author_channel
+
+    def setAuthorChannel(self, author_channel: Optional[str]) -> None:
+        self.__author_channel = author_channel
+
+    def getInformation(self) -> Dict[str, Any]:
+        return self.__information
+
+    def setInformation(self, information: Dict[str, Any]) -> None:
+        self.__information = information
+
     def setLogger(self, logger: Extractio_Logger) -> None:
         self.__logger = logger
 
@@ -336,14 +374,15 @@ class YouTube_Downloader:
         self.getLogger().error(f"The response is invalid")
         raise ValueError("Invalid Response")
 
-    def __presentGetYouTube(self, status: int) -> None:
+    def __presentGetYouTube(self, status: int, is_complete: bool) -> None:
         """
         Handling the presentation logic after attempting to retrieve YouTube data.
 
-        If the HTTP status code indicates success (200 OK), the method simply returns. Otherwise, it calls `postYouTube()` to perform a fallback or alternative action.
+        If the HTTP status code indicates success (200 OK) and the stored record already has its thumbnail and channel uniform resource locator, the method simply returns. Otherwise, it calls `postYouTube()` to perform a fallback or alternative action.
 
         Args:
             status (int): The HTTP status code returned from a YouTube GET request.
+            is_complete (bool): Whether the stored record has its thumbnail and channel uniform resource locator.
 
         Returns:
             None
@@ -351,7 +390,7 @@ class YouTube_Downloader:
         Side Effects:
             May trigger the `postYouTube()` method if the status code is not 200.
         """
-        if status == 200:
+        if status == 200 and is_complete:
             return
         self.postYouTube()
 
@@ -364,21 +403,9 @@ class YouTube_Downloader:
         Returns:
             Dict[str, Union[int, Dict[str, Union[str, int, None]]]]
         """
-        options: Dict[str, bool] = {
-            "quiet": True,
-            "skip_download": True,
-            "nocheckcertificate": True,
-            "force_generic_extractor": False,
-            "extract_flat": False
-        }
-        self.setVideo(YoutubeDL(options))
         self.setIdentifier(self.sanitizeYouTubeIdentifier())
         try:
-            raw_youtube: Dict[str, Any] = self.getVideo().extract_info(
-                url=self.getUniformResourceLocator(),
-                download=False
-            ) # type: ignore
-            self.__isRawYouTube(raw_youtube)
+            raw_youtube: Dict[str, Any] = self._extractInformation(["duration", "upload_date", "uploader", "title", "uploader_url", "view_count", "thumbnail"])
             youtube: Dict[str, Any] = {
                 key: escape(value) if isinstance(value, str) else value for key, value in raw_youtube.items() # type: ignore
             }
@@ -389,10 +416,13 @@ class YouTube_Downloader:
             self.setAuthor(str(meta_data["data"][0].author) if has_metadata else str(youtube["uploader"])) # type: ignore
             self.setTitle(str(meta_data["data"][0].title) if has_metadata else str(youtube["title"])) # type: ignore
             self.setDuration(strftime("%H:%M:%S", gmtime(self.getLength())))
+            self.setThumbnail(str(raw_youtube["thumbnail"]) if raw_youtube.get("thumbnail") else None)
+            self.setAuthorChannel(str(raw_youtube["uploader_url"]) if raw_youtube.get("uploader_url") else None)
+            is_complete: bool = has_metadata and all(getattr(youtube_model, "thumbnail", None) and getattr(youtube_model, "author_channel", None) for youtube_model in meta_data["data"]) # type: ignore
             file_locations: Dict[str, Union[str, None]] = self._getFileLocations(list(meta_data["data"])) if has_metadata else {} # type: ignore
             audio_file: Union[str, None] = escape(str(file_locations["audio_file"])) if has_metadata else None
             video_file: Union[str, None] = escape(str(file_locations["video_file"])) if has_metadata else None
-            self.__presentGetYouTube(int(str(meta_data["status"])))
+            self.__presentGetYouTube(int(str(meta_data["status"])), is_complete)
             return {
                 "uniform_resource_locator": self.getUniformResourceLocator(),
                 "author": self.getAuthor(),
@@ -410,6 +440,64 @@ class YouTube_Downloader:
             self.getLogger().error(f"There is an error in the search function. - Error: {error}")
             return {}
 
+    def _extractInformation(self, fields: List[str]) -> Dict[str, Any]:
+        """
+        Extracting the information of the media with YoutubeDL without downloading it and keeping it so that the formats and the downloads do not have to extract it again.  The extraction is skipped when the extraction cache still has every needed field of the media.
+
+        Args:
+            fields (List[str]): The fields of the information needed by the caller.
+
+        Returns:
+            Dict[str, Any]: The raw information dictionary of the media.
+
+        Raises:
+            ValueError: If the response of YoutubeDL is empty.
+            DownloadError: If the media cannot be extracted.
+        """
+        cached_information: Optional[Dict[str, Any]] = Extraction_Cache.getInstance().get(self.getIdentifier(), fields)
+        if cached_information is not None:
+            self.setInformation(cached_information)
+            return cached_information
+        options: Dict[str, bool] = {
+            "quiet": True,
+            "skip_download": True,
+            "nocheckcertificate": True,
+            "force_generic_extractor": False,
+            "extract_flat": False
+        }
+        self.setVideo(YoutubeDL(options))
+        raw_youtube: Dict[str, Any] = self.getVideo().extract_info(
+            url=self.getUniformResourceLocator(),
+            download=False
+        ) # type: ignore
+        self.__isRawYouTube(raw_youtube)
+        Extraction_Cache.getInstance().set(self.getIdentifier(), raw_youtube)
+        self.setInformation(raw_youtube)
+        return raw_youtube
+
+    def __download(self, options: Dict[str, Any], file: str) -> None:
+        """
+        Downloading the media from the information which has already been extracted instead of extracting it again.
+
+        The information is sanitized the same way yt-dlp does for `--load-info-json`, so that the selection made during the extraction is discarded and the format requested in the options is selected instead.  The progress of the download and the merge of its streams are published in the progress registry.
+
+        Args:
+            options (Dict[str, Any]): The options of the download, containing the format and the output template.
+            file (str): The file being downloaded, either `audio` or `video`.
+
+        Raises:
+            DownloadError: If there is an error during the download process.
+        """
+        registry: Download_Progress_Registry = Download_Progress_Registry.getInstance()
+        self.setVideo(YoutubeDL({
+            **options,
+            "progress_hooks": [registry.createProgressHook(self.getIdentifier(), file)],
+            "postprocessor_hooks": [registry.createPostprocessorHook(self.getIdentifier(), file)]
+        }))
+        information: Dict[str, Any] = self.getVideo().sanitize_info(deepcopy(self.getInformation()), True) # type: ignore
+        self.getVideo().process_ie_result(information, download=True)
+        registry.finish(self.getIdentifier(), file)
+
     def _getFileLocations(self, result_set: List[Dict[str, Union[str, int]]]) -> Dict[str, Union[str, None]]:
         """
         Extracting the file location of the media content on the
@@ -466,7 +554,7 @@ class YouTube_Downloader:
         """
         Creating a new YouTube video metadata record in the relational database.
 
-        This method takes the current identifier, length, publication date, author, title, and media identifier and uses them to create a new record in the relational database.  If the record is created successfully, it logs an informative message with a status of 201.  If there is an unexpected error, it logs an error message with a status of 503.
+        This method takes the current identifier, length, publication date, author, title, thumbnail, channel uniform resource locator and media identifier and uses them to create a new record in the relational database, or to complete the thumbnail and channel uniform resource locator of an existing record.  If the record is created successfully, it logs an informative message with a status of 201.  If there is an unexpected error, it logs an error message with a status of 503.
 
         Returns:
             None
@@ -482,9 +570,11 @@ class YouTube_Downloader:
                 published_at=self.getPublishedAt(),
                 author=self.getAuthor(),
                 title=self.getTitle(),
-                Media=self.getMediaIdentifier()
+                Media=self.getMediaIdentifier(),
+                thumbnail=self.getThumbnail(),
+                author_channel=self.getAuthorChannel()
             )
-            response: bool = youtube.save()
+            response: bool = youtube.saveMetadata()
             status: int = 201 if response else 503
             message: str = "The data has been inserted successfully." if response else "There is an error between the model and the relational database server."
             if response:
@@ -540,11 +630,7 @@ class YouTube_Downloader:
             self.setIdentifier(str(metadata["identifier"]))
             audio_file_location: str = f"{self.getDirectory()}/Audio/{self.getIdentifier()}.mp3"
             video_file_location: str = f"{self.getDirectory()}/Video/{self.getIdentifier()}.mp4"
-            options: Dict[str, bool] = {
-                "quiet": True,
-                "listformats": True
-            }
-            files: Dict[str, str] = self.__getFiles(audio_file_location, video_file_location, options)
+            files: Dict[str, str] = self.__getFiles(audio_file_location, video_file_location)
             self.getLogger().inform(f"The media content has been downloaded! - Audio: {audio_file_location} - Video: {video_file_location}")
             audio_file_location = files["audio"]
             video_file_location = files["video"]
@@ -565,9 +651,9 @@ class YouTube_Downloader:
             self.getLogger().error(f"There is an error while retrieving the streams. - Error: {error}")
             return {}
 
-    def __getFiles(self, audio: str, video: str, options: Dict[str, bool]) -> Dict[str, str]:
+    def __getFiles(self, audio: str, video: str) -> Dict[str, str]:
         """
-        Retrieving the audio and video files for a given resource.  If the audio and video files already exist, it returns their file paths. Otherwise, it downloads the streams using YoutubeDL and returns the downloaded file paths.
+        Retrieving the audio and video files for a given resource.  If the audio and video files already exist, it returns their file paths. Otherwise, it downloads the streams using YoutubeDL and returns the downloaded file paths.  The formats are taken from the information extracted by the search, which is only extracted again if the search has not been done.
 
         This method performs the following tasks:
             1. Checks if the audio and video files exist.
@@ -578,7 +664,6 @@ class YouTube_Downloader:
         Parameters:
             audio (string): The file path of the audio file.
             video (string): The file path of the video file.
-            options (Dict[string, bool]): A dictionary of options to configure the YoutubeDL download process.
 
         Returns:
             Dict[string, string]
@@ -594,12 +679,8 @@ class YouTube_Downloader:
                 "video": video
             }
         try:
-            self.setVideo(YoutubeDL(options))
-            info = self.getVideo().extract_info(
-                url=self.getUniformResourceLocator(),
-                download=False
-            )
-            self.setStreams(info["formats"]) # type: ignore
+            information: Dict[str, Any] = self.getInformation() if "formats" in self.getInformation() else self._extractInformation(["formats"])
+            self.setStreams(information["formats"])
             return {
                 "audio": self.getAudioFile(audio),
                 "video": self.getVideoFile(video)
@@ -793,8 +874,8 @@ class YouTube_Downloader:
         This method performs the following tasks:
             - Logging the start of the download process.
             - Configuring the download options to merge audio and video streams into an MP4 file.
-            - Initiating the download using the YouTubeDL library.
-            - Saving metadata related to the downloaded file into the relational database.
+            - Initiating the download using the YouTubeDL library under the lease of the file, so that the concurrent requesters attach to a single download written in a partial file and renamed once complete.
+            - Saving metadata related to the downloaded file into the relational database, which is only done by the requester which has downloaded it.
             - Logging the success or failure of saving metadata.
 
         Args:
@@ -806,25 +887,28 @@ class YouTube_Downloader:
             str: The file path to the downloaded and merged video file.
 
         Raises:
-            DownloadError: If there is an error during the download process.
+            DownloadError: If there is an error during the download process or if the download of another requester has timed out.
             Relational_Database_Error: If there is an error saving metadata to the database.
             Relational_Database_Error: If the metadata could not be saved in the database.
         """
         try:
             self.getLogger().inform(f"Downloading the video file. - File Path: {file_path}")
             format_identifier: str = f"{video['format_id']}+{audio['format_id']}" # type: ignore
-            options: Dict[str, str] = {
-                "format": format_identifier,
-                "merge_output_format": "mp4",
-                "outtmpl": file_path
-            }
-            self.setVideo(YoutubeDL(options))
-            self.getVideo().download([self.getUniformResourceLocator()])
-            self.__postVideo(file_path)
-            return file_path
+            return Download_Coordinator.getInstance().download(
+                file_path,
+                lambda partial_file_path: self.__download({
+                    "format": format_identifier,
+                    "merge_output_format": "mp4",
+                    "outtmpl": partial_file_path
+                }, "video"),
+                self.__postVideo
+            )
         except DownloadError as error:
             self.getLogger().error(f"The downloading of the video file has failed. - Error: {error}")
             raise error
+        except TimeoutError as error:
+            self.getLogger().error(f"The downloading of the video file has timed out. - Error: {error}")
+            raise DownloadError(str(error))
         except Relational_Database_Error as error:
             self.getLogger().error(f"There is an issue between the relational database server and the API. - Error: {error}")
             raise error
@@ -901,7 +985,7 @@ class YouTube_Downloader:
         """
         Downloading an audio file from a given media stream and saves it to a specified file path.
 
-        This method configures download options based on the provided stream's format identifier and protocol, initiates the download using the YoutubeDL library, and saves the audio file to the specified path.  It logs the success or failure of the download and attempts to persist metadata in a relational database.
+        This method configures download options based on the provided stream's format identifier and protocol, initiates the download using the YoutubeDL library, and saves the audio file to the specified path.  The download is done under the lease of the file in a partial file renamed once complete, the concurrent requesters attaching to it instead of downloading the file again.  It logs the success or failure of the download and attempts to persist metadata in a relational database.
 
         Args:
             stream (Dict[str, Union[str, int, float, List[Dict[str, Union[str, float]]], None, Dict[str, str]]]): The audio stream information including format ID and protocol.
@@ -911,7 +995,7 @@ class YouTube_Downloader:
             str: The file path to the downloaded audio file.
 
         Raises:
-            DownloadError: If an error occurs during the download process.
+            DownloadError: If an error occurs during the download process or if the download of another requester has timed out.
             Relational_Database_Error: If an error occurs while saving metadata to the database.
             Relational_Database_Error: If there is an issue communicating with the database.
         """
@@ -920,17 +1004,20 @@ class YouTube_Downloader:
             format_identifier: str = stream.get("format_id") # type: ignore
             protocol: str = stream.get("protocol", "") # type: ignore
             format_specification: str = self.getAudioFormatSpecification(format_identifier, protocol)
-            options: Dict[str, str] = {
-                "format": format_specification,
-                "outtmpl": file_path
-            }
-            self.setVideo(YoutubeDL(options))
-            self.getVideo().download([self.getUniformResourceLocator()])
-            self.__postAudio(file_path)
-            return file_path
+            return Download_Coordinator.getInstance().download(
+                file_path,
+                lambda partial_file_path: self.__download({
+                    "format": format_specification,
+                    "outtmpl": partial_file_path
+                }, "audio"),
+                self.__postAudio
+            )
         except DownloadError as error:
             self.getLogger().error(f"The downloading of the audio file has failed. - Error: {error}")
             raise error
+        except TimeoutError as error:
+            self.getLogger().error(f"The downloading of the audio file has timed out. - Error: {error}")
+            raise DownloadError(str(error))
         except Relational_Database_Error as error:
             self.getLogger().error(f"There is an issue between the relational database server and the API. - Error: {error}")
             raise error
@@ -1,4 +1,6 @@
 from Models.TableModel import Table_Model, Database_Handler, RowType, List, Tuple, Any, Optional
+from Models.SchemaRegistry import Schema_Registry
+from typing import Dict
 
 
 class YouTube(Table_Model):
@@ -63,7 +65,7 @@ class YouTube(Table_Model):
             List[YouTube]: A list of YouTube instances with metadata matching the given title pattern.
         """
         temporary_instance: "YouTube" = cls(database_handler)
-        query: str = f"SELECT identifier, CONCAT(LPAD(FLOOR(length / 3600), 2, '0'), ':', LPAD(FLOOR(length / 60), 2, '0'), ':', LPAD(length % 60, 2, '0')) AS duration, author AS channel, title, CONCAT('https://www.youtube.com/watch?v=', identifier) AS uniform_resource_locator, Media AS media_identifier FROM {temporary_instance.getTableName()} WHERE title LIKE %s"
+        query: str = f"SELECT identifier, CONCAT(LPAD(FLOOR(length / 3600), 2, '0'), ':', LPAD(FLOOR(length / 60), 2, '0'), ':', LPAD(length % 60, 2, '0')) AS duration, author AS channel, title, CONCAT('https://www.youtube.com/watch?v=', identifier) AS uniform_resource_locator, Media AS media_identifier, thumbnail, author_channel FROM {temporary_instance.getTableName()} WHERE title LIKE %s"
         parameters: Tuple[str] = (title,)
         response: List[RowType] = temporary_instance.getDatabaseHandler().getData(query, parameters)
         if not response:
@@ -85,7 +87,7 @@ class YouTube(Table_Model):
             List[YouTube]: A list of YouTube instances with metadata matching the given channel name.
         """
         temporary_instance: "YouTube" = cls(database_handler)
-        query: str = f"SELECT identifier, CONCAT(LPAD(FLOOR(length / 3600), 2, '0'), ':', LPAD(FLOOR(length / 60), 2, '0'), ':', LPAD(length % 60, 2, '0')) AS duration, author AS channel, title, CASE WHEN identifier LIKE 'shorts/%' THEN CONCAT('https://www.youtube.com/', identifier) ELSE CONCAT('https://www.youtube.com/watch?v=', identifier) END AS uniform_resource_locator, Media AS media_identifier FROM {temporary_instance.getTableName()} WHERE author = %s"
+        query: str = f"SELECT identifier, CONCAT(LPAD(FLOOR(length / 3600), 2, '0'), ':', LPAD(FLOOR(length / 60), 2, '0'), ':', LPAD(length % 60, 2, '0')) AS duration, author AS channel, title, CASE WHEN identifier LIKE 'shorts/%' THEN CONCAT('https://www.youtube.com/', identifier) ELSE CONCAT('https://www.youtube.com/watch?v=', identifier) END AS uniform_resource_locator, Media AS media_identifier, thumbnail, author_channel FROM {temporary_instance.getTableName()} WHERE author = %s"
         parameters: Tuple[str] = (channel,)
         response: List[RowType] = temporary_instance.getDatabaseHandler().getData(query, parameters)
         if not response:
@@ -107,24 +109,116 @@ class YouTube(Table_Model):
             Optional[YouTube]: A YouTube instance with metadata matching the given identifier, or None if no record is found.
         """
         temporary_instance: "YouTube" = cls(database_handler)
-        query: str = f"SELECT author, title FROM {temporary_instance.getTableName()} WHERE identifier = %s LIMIT 1"
+        query: str = f"SELECT author, author AS channel, title FROM {temporary_instance.getTableName()} WHERE identifier = %s LIMIT 1"
         parameters: Tuple[str] = (identifier,)
         response: List[RowType] = temporary_instance.getDatabaseHandler().getData(query, parameters)
         if not response:
             return None
         return [cls(database_handler, **row) for row in response][0] # type: ignore
 
+    @classmethod
+    def getRelated(cls, database_handler: Database_Handler, channel: str, authors: List[str]) -> List["YouTube"]:
+        """
+        Retrieving the YouTube video records related to a channel and to a list of authors with a single query.
+
+        It combines the criteria of `getByChannel` and `getByTitle` so that the related contents along with their thumbnail and channel uniform resource locator are served by one round trip.
+
+        Args:
+            database_handler (Database_Handler): The database handler instance for executing the query.
+            channel (str): The channel name to search for in the database.
+            authors (List[str]): The title patterns to search for in the database.
+
+        Returns:
+            List[YouTube]: A list of YouTube instances with metadata matching the channel or one of the authors.
+        """
+        temporary_instance: "YouTube" = cls(database_handler)
+        conditions: str = " OR ".join(["author = %s"] + ["title LIKE %s"] * len(authors))
+        query: str = f"SELECT identifier, CONCAT(LPAD(FLOOR(length / 3600), 2, '0'), ':', LPAD(FLOOR(length / 60), 2, '0'), ':', LPAD(length % 60, 2, '0')) AS duration, author AS channel, title, CASE WHEN identifier LIKE 'shorts/%' THEN CONCAT('https://www.youtube.com/', identifier) ELSE CONCAT('https://www.youtube.com/watch?v=', identifier) END AS uniform_resource_locator, Media AS media_identifier, thumbnail, author_channel FROM {temporary_instance.getTableName()} WHERE {conditions}"
+        parameters: Tuple[str, ...] = (channel, *authors)
+        response: List[RowType] = temporary_instance.getDatabaseHandler().getData(query, parameters)
+        if not response:
+            return []
+        return [cls(database_handler, **row) for row in response] # type: ignore
+
+    @classmethod
+    def getIncomplete(cls, database_handler: Database_Handler, limit: int) -> List["YouTube"]:
+        """
+        Retrieving the YouTube video records which do not have their thumbnail or channel uniform resource locator yet.
+
+        Args:
+            database_handler (Database_Handler): The database handler instance for executing the query.
+            limit (int): The maximum amount of records to retrieve.
+
+        Returns:
+            List[YouTube]: A list of YouTube instances containing the identifier, the uniform resource locator and the media identifier of the incomplete records.
+        """
+        temporary_instance: "YouTube" = cls(database_handler)
+        query: str = f"SELECT identifier, CASE WHEN identifier LIKE 'shorts/%' THEN CONCAT('https://www.youtube.com/', identifier) ELSE CONCAT('https://www.youtube.com/watch?v=', identifier) END AS uniform_resource_locator, Media AS media_identifier FROM {temporary_instance.getTableName()} WHERE thumbnail IS NULL OR author_channel IS NULL LIMIT %s"
+        parameters: Tuple[int] = (limit,)
+        response: List[RowType] = temporary_instance.getDatabaseHandler().getData(query, parameters)
+        if not response:
+            return []
+        return [cls(database_handler, **row) for row in response] # type: ignore
+
+    def saveMetadata(self) -> bool:
+        """
+        Saving the YouTube video record, or completing the thumbnail and the channel uniform resource locator of the existing record without overwriting them.
+
+        Returns:
+            bool: True if the record has been saved, otherwise False.
+        """
+        query: str = f"INSERT INTO {self.getTableName()} (identifier, `length`, published_at, author, title, `Media`, thumbnail, author_channel) VALUES (%s, %s, %s, %s, %s, %s, %s, %s) ON DUPLICATE KEY UPDATE thumbnail = COALESCE(thumbnail, VALUES(thumbnail)), author_channel = COALESCE(author_channel, VALUES(author_channel))"
+        parameters: Tuple[Any, ...] = (self.identifier, self.length, self.published_at, self.author, self.title, self.Media, self.thumbnail, self.author_channel) # type: ignore
+        return self.getDatabaseHandler().postData(query, parameters)
+
     def create(self) -> bool:
         """
         Creating the YouTube table in the database if it does not already exist.
 
-        This method constructs and executes a SQL query to create the `YouTube` table with columns for identifier, length, publication date, author, title, and a foreign key reference to the `Media` table.
+        This method constructs and executes a SQL query to create the `YouTube` table with columns for identifier, length, publication date, author, title, thumbnail, channel uniform resource locator and a foreign key reference to the `Media` table.  The statement is skipped when the schema registry already knows the complete table.
 
         Returns:
             bool: True if the table was created or already exists, False otherwise.
         """
-        query: str = f"CREATE TABLE IF NOT EXISTS `{self.getTableName()}` (identifier VARCHAR(16) PRIMARY KEY, `length` INT, published_at VARCHAR(32), author VARCHAR(64), title VARCHAR(128), `Media` INT, CONSTRAINT fk_Media_type FOREIGN KEY (`Media`) REFERENCES `Media` (identifier))"
-        return self.getDatabaseHandler().createTable(query)
+        if self.getFields() and not self.__getMissingColumns(self.getFields()):
+            return True
+        query: str = f"CREATE TABLE IF NOT EXISTS `{self.getTableName()}` (identifier VARCHAR(16) PRIMARY KEY, `length` INT, published_at VARCHAR(32), author VARCHAR(64), title VARCHAR(128), `Media` INT, thumbnail VARCHAR(512), author_channel VARCHAR(256), CONSTRAINT fk_Media_type FOREIGN KEY (`Media`) REFERENCES `Media` (identifier))"
+        if not self.getDatabaseHandler().createTable(query):
+            return False
+        return self.__addMissingColumns()
+
+    def __getMissingColumns(self, fields: List[str]) -> Dict[str, str]:
+        """
+        Retrieving the columns which have been added to the table after its creation and which are missing from the given fields.
+
+        Args:
+            fields (List[str]): The fields of the table.
+
+        Returns:
+            Dict[str, str]: The definitions of the missing columns keyed by their names.
+        """
+        columns: Dict[str, str] = {
+            "thumbnail": "VARCHAR(512)",
+            "author_channel": "VARCHAR(256)"
+        }
+        return {column: definition for column, definition in columns.items() if column not in fields}
+
+    def __addMissingColumns(self) -> bool:
+        """
+        Adding the columns which are missing from a table created by a previous version of the application.
+
+        Returns:
+            bool: True if the table has every column, otherwise False.
+        """
+        registry: Schema_Registry = Schema_Registry.getInstance()
+        registry.invalidate(self.getTableName())
+        missing_columns: Dict[str, str] = self.__getMissingColumns(registry.getSchema(self.getDatabaseHandler(), self.getTableName())[0])
+        if not missing_columns:
+            return True
+        query: str = f"ALTER TABLE `{self.getTableName()}` {', '.join([f'ADD COLUMN {column} {definition}' for column, definition in missing_columns.items()])}"
+        self.getDatabaseHandler().createTable(query)
+        registry.invalidate(self.getTableName())
+        return not self.__getMissingColumns(registry.getSchema(self.getDatabaseHandler(), self.getTableName())[0])
 
     @classmethod
     def getYouTubeDataByIdentifier(
@@ -147,7 +241,7 @@ class YouTube(Table_Model):
             Optional[List[YouTube]]: A list of YouTube instances containing the fetched metadata, or None if no data exists.
         """
         temporary_instance: "YouTube" = cls(database_handler)
-        query: str = f"SELECT author, title, {temporary_instance.getTableName()}.identifier, published_at, length, location FROM {temporary_instance.getTableName()} LEFT JOIN {join_table} ON {join_table}.YouTube = {temporary_instance.getTableName()}.identifier WHERE {temporary_instance.getTableName()}.identifier = %s LIMIT 2"
+        query: str = f"SELECT author, title, {temporary_instance.getTableName()}.identifier, published_at, length, location, thumbnail, author_channel FROM {temporary_instance.getTableName()} LEFT JOIN {join_table} ON {join_table}.YouTube = {temporary_instance.getTableName()}.identifier WHERE {temporary_instance.getTableName()}.identifier = %s LIMIT 2"
         parameters: Tuple[str] = (identifier,)
         response: List[RowType] = temporary_instance.getDatabaseHandler().getData(query, parameters)
         if not response or len(response) < 2:
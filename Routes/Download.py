@@ -5,9 +5,11 @@ Link:
     https://omnitechbros.ddns.net:591/Download
     http://omnitechbros.ddns.net:5000/Download
 """
-from flask import Blueprint, Response, render_template, request, send_file, Request
+from flask import Blueprint, Response, render_template, request, Request
 from Models.SecurityManagementSystem import Security_Management_System, Union, Environment
+from Models.MediaStreamer import Media_Streamer
 from typing import Dict
+from os.path import commonpath, realpath
 from urllib.parse import urlparse, ParseResult
 
 
@@ -24,16 +26,6 @@ ENV: Environment = Environment()
 ENV File of the application
 """
 
-@Download_Portal.before_request
-def before_request() -> None:
-    """
-    Preparing the data before the request is made.
-
-    Returns:
-        void
-    """
-    SecurityManagementSystem.generateNonce()
-
 @Download_Portal.route('/YouTube/<string:identifier>', methods=['GET'])
 def downloadPage(identifier: str) -> Response:
     """
@@ -158,19 +150,39 @@ def isEmbeddedRequest(request: Request) -> bool:
 def downloadFile() -> Response:
     """
     Downloading the file from the file location that is sent
-    from the view.
+    from the view, supporting the byte-range requests so that an
+    interrupted download can be resumed.  The location must be
+    in the directories of the media files, as the front server
+    sends the file itself when the sending is offloaded to it.
 
     Returns:
         Response
     """
-    request_json: Dict[str, str] = request.json # type: ignore
-    file_path: str = request_json['file']
-    file_name: str = request_json['file_name']
+    request_json: Dict[str, str] = request.get_json(silent=True) or {}
+    file_path: str = str(request_json.get("file", ""))
+    file_name: str = str(request_json.get("file_name", ""))
+    if not file_path or not file_name:
+        return Response("{}", 400, mimetype="application/json")
+    if not isMediaFilePath(file_path):
+        return Response("{}", 403, mimetype="application/json")
     mime_type: str = "audio/mp3" if "Audio" in file_path else ""
     mime_type = "video/mp4" if "Video" in file_path else mime_type
-    return send_file(
-        path_or_file=file_path,
-        mimetype=mime_type,
-        as_attachment=True,
-        download_name=file_name
-    )
+    return Media_Streamer.getInstance().serve(file_path, mime_type, file_name)
+
+def isMediaFilePath(file_path: str) -> bool:
+    """
+    Checking that the file is in one of the directories of the
+    media files once its symbolic links are resolved.
+
+    Parameters:
+        file_path (str): The path of the file.
+
+    Returns:
+        boolean
+    """
+    real_file_path: str = realpath(file_path)
+    for directory in [f"{ENV.getDirectory()}/Public/Audio", f"{ENV.getDirectory()}/Public/Video"]:
+        real_directory: str = realpath(directory)
+        if real_file_path != real_directory and commonpath([real_directory, real_file_path]) == real_directory:
+            return True
+    return False
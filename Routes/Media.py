@@ -4,14 +4,17 @@ The Endpoint for the Media Management System.
 Authors:
     Darkness4869
 """
-from flask import Blueprint, Response, request
+from flask import Blueprint, Response, request, stream_with_context
 from Models.Media import Media, Extractio_Logger, Environment, Dict, Union, List, dumps
-from json import loads
-from os.path import join, realpath
+from Models.MetadataCache import Metadata_Cache
+from Models.SingleFlight import Single_Flight
+from Models.DownloadJobQueue import Download_Job_Queue
+from Models.DownloadProgressRegistry import Download_Progress_Registry
 from html import escape
 from index import limiter
-from re import fullmatch
-from typing import Any
+from re import Match, fullmatch, match
+from time import monotonic, sleep
+from typing import Any, Iterator, Optional
 
 
 Media_Portal: Blueprint = Blueprint("Media", __name__)
@@ -26,68 +29,74 @@ ENV: Environment = Environment()
 """
 ENV File of the application.
 """
-def getMetaData(file_name: str) -> Dict[str, Union[int, Dict[str, Union[str, int, None]]]]:
+def getMetaData(identifier: str) -> Dict[str, Union[int, Dict[str, Union[str, int, None]]]]:
     """
-    Retrieving metadata from a JSON file while ensuring security measures.
+    Retrieving the metadata of a media from the metadata cache while ensuring security measures.
 
-    This function checks the validity of the file name, prevents path traversal, and attempts to read metadata from the specified JSON file.  If the file is missing, it attempts to fetch data using the `Media` class.
+    This function checks the validity of the identifier, which is prefixed by `shorts/` for the shorts, and retrieves the metadata from the metadata cache.  If the metadata are not cached, it attempts to fetch them using the `Media` class, the concurrent requests of the same media waiting for a single extraction.
 
     Parameters:
-        file_name (string): The name of the metadata file (expected to be a JSON file).
+        identifier (string): The identifier of the media.
 
     Returns:
         Dict[string, Union[int, Dict[string, Union[string, int, None]]]]
     """
-    allowed_directory: str = f"{ENV.getDirectory()}/Cache/Media/shorts" if "shorts/" in file_name else f"{ENV.getDirectory()}/Cache/Media"
-    file_name = file_name.replace("shorts/", "") if "shorts/" in file_name else file_name
-    identifier: str = r"^[a-zA-Z0-9\-_]+$"
-    file_name = escape(file_name)
-    if not fullmatch(identifier, file_name.replace(".json", "").replace(f"{allowed_directory}/", "")):
-        Routing_Logger.error(f"The file name is invalid.\nFile Name: {file_name}")
+    is_shorts: bool = identifier.startswith("shorts/")
+    media_identifier: str = identifier[len("shorts/"):] if is_shorts else identifier
+    if not fullmatch(r"^[a-zA-Z0-9\-_]+$", media_identifier):
+        Routing_Logger.error(f"The identifier is invalid.\nIdentifier: {escape(identifier)}")
         return {
             "status": 400,
             "data": {}
         }
-    file_name = join(allowed_directory, file_name)
-    file_path: str = realpath(file_name)
-    if not file_path.startswith(realpath(allowed_directory)):
-        Routing_Logger.error(f"Path traversal has been detected.\nFile Name: {file_name}")
-        return {
-            "status": 403,
-            "data": {}
-        }
     try:
-        file = open(file_name, "r")
-        contents: str = file.read().strip()
-        file_data: Dict[str, Dict[str, Dict[str, Union[str, int, None]]]] = loads(contents)
-        status: int = 200
-        data = sanitizeStringData(file_data["Media"]["YouTube"])
-        return {
-            "status": status,
-            "data": data
-        }
-    except FileNotFoundError as error:
-        Routing_Logger.error(f"The file is not found.\nFile Name: {file_name}\nError: {error}")
-        identifier: str = file_name.replace(f"{ENV.getDirectory()}/Cache/Media/", "").replace(".json", "")
-        user_request: Dict[str, Union[str, None]] = {
-            "referer": None,
-            "search": f"https://www.youtube.com/watch?v={identifier}",
-            "platform": "youtube",
-            "ip_address": str(request.environ.get("REMOTE_ADDR")),
-            "port": str(request.environ.get("SERVER_PORT"))
-        }
-        media: Media = Media(user_request)
-        model_response: Dict[str, Union[int, Dict[str, Union[str, int, None]]]] = media.verifyPlatform()
-        return {
-            "status": int(str(model_response["status"])),
-            "data": model_response["data"]
-        }
+        metadata: Optional[Dict[str, Union[str, int, None]]] = Metadata_Cache.getInstance().get(identifier)
     except Exception as error:
-        Routing_Logger.error(f"The metadata cannot be retrieved.\nFile Name: {file_name}\nError: {error}")
+        Routing_Logger.error(f"The metadata cannot be retrieved.\nIdentifier: {identifier}\nError: {error}")
         return {
             "status": 503,
             "data": {}
         }
+    if metadata is not None:
+        return {
+            "status": 200,
+            "data": sanitizeStringData(metadata)
+        }
+    Routing_Logger.warn(f"The metadata are not cached.\nIdentifier: {identifier}")
+    user_request: Dict[str, Union[str, None]] = {
+        "referer": None,
+        "search": f"https://www.youtube.com/shorts/{media_identifier}" if is_shorts else f"https://www.youtube.com/watch?v={media_identifier}",
+        "platform": "youtube",
+        "ip_address": str(request.environ.get("REMOTE_ADDR")),
+        "port": str(request.environ.get("SERVER_PORT"))
+    }
+    model_response: Dict[str, Union[int, Dict[str, Union[str, int, None]]]] = Single_Flight.getInstance().do(
+        identifier,
+        lambda: Media(user_request).verifyPlatform(),
+        lambda: getCachedMetaData(identifier)
+    )
+    return {
+        "status": int(str(model_response["status"])),
+        "data": model_response["data"]
+    }
+
+def getCachedMetaData(identifier: str) -> Optional[Dict[str, Union[int, Dict[str, Union[str, int, None]]]]]:
+    """
+    Retrieving the metadata of a media which have been stored in the metadata cache while its extraction was awaited.
+
+    Parameters:
+        identifier (string): The identifier of the media.
+
+    Returns:
+        Optional[Dict[string, Union[int, Dict[string, Union[string, int, None]]]]]
+    """
+    metadata: Optional[Dict[str, Union[str, int, None]]] = Metadata_Cache.getInstance().get(identifier)
+    if metadata is None:
+        return None
+    return {
+        "status": 200,
+        "data": sanitizeStringData(metadata)
+    }
 
 def sanitizeStringData(data: Dict[str, Any]):
     """
@@ -196,7 +205,7 @@ def getMedia(identifier: str) -> Response:
     """
     Retrieving media metadata based on a unique identifier.
 
-    This function processes a GET request to fetch metadata for a specific media entry.  It verifies the identifier format, ensuring it contains only alphanumeric characters, dashes, or underscores. If valid, it retrieves metadata from a JSON file.
+    This function processes a GET request to fetch metadata for a specific media entry.  It verifies the identifier format, ensuring it contains only alphanumeric characters, dashes, or underscores. If valid, it retrieves metadata from the metadata cache.
 
     Routes:
         - GET /
@@ -228,8 +237,7 @@ def getMedia(identifier: str) -> Response:
             status=400,
             mimetype=mime_type
         )
-    file_name: str = f"{identifier}.json"
-    response: Dict[str, Union[int, Dict[str, Union[str, int, None]]]] = getMetaData(file_name)
+    response: Dict[str, Union[int, Dict[str, Union[str, int, None]]]] = getMetaData(identifier)
     return Response(
         response=dumps(
             obj=response["data"],
@@ -245,15 +253,15 @@ def retrieveMedia() -> Response:
     """
     Handling media retrieval requests.
 
-    This function processes a POST request to download media.  It expects a JSON payload containing media information, verifies the request parameters, and checks if the specified platform is supported.
+    This function processes a POST request to download media.  It expects a JSON payload containing media information, verifies the request parameters, and queues a download job whose state can be retrieved from the uniform resource locator returned.
 
     Routes:
         - POST /Download
 
     Response Codes:
-        - 201: Successful response with file downloaded on the server.
+        - 202: Successful response with the download job queued.
         - 400: Bad request due to missing or invalid parameters.
-        - 503: Service unavailable due to platform verification failure.
+        - 503: Service unavailable due to the download job not being queued.
         - 429: Rate limit exceeded.
 
     Returns:
@@ -277,25 +285,221 @@ def retrieveMedia() -> Response:
         )
     uniform_resource_locator: str = escape(data["uniform_resource_locator"])
     platform: str = escape(data["platform"])
-    user_request: Dict[str, str] = {
+    user_request: Dict[str, Union[str, None]] = {
         "referer": request.referrer,
         "search": uniform_resource_locator,
         "platform": platform,
         "ip_address": str(request.environ.get("REMOTE_ADDR")),
         "port": str(request.environ.get("SERVER_PORT"))
     }
-    media: Media = Media(user_request) # type: ignore
-    model_response: Dict[str, Union[int, Dict[str, Union[str, int, None]]]] = media.verifyPlatform()
-    status: int = 201 if int(str(model_response["status"])) >= 200 and int(str(model_response["status"])) <= 299 else 503
+    try:
+        job: Dict[str, Any] = Download_Job_Queue.getInstance().submit(user_request)
+    except Exception as error:
+        Routing_Logger.error(f"The download job cannot be queued.\nError: {error}")
+        return Response(
+            response=dumps(
+                obj={
+                    "error": "The download job cannot be queued."
+                },
+                indent=4
+            ),
+            status=503,
+            mimetype=mime_type
+        )
+    status_uniform_resource_locator: str = f"/Media/Download/{job['identifier']}"
+    response: Response = Response(
+        response=dumps(
+            obj={
+                "identifier": job["identifier"],
+                "status": job["status"],
+                "uniform_resource_locator": status_uniform_resource_locator
+            },
+            indent=4
+        ),
+        status=Download_Job_Queue.accepted,
+        mimetype=mime_type
+    )
+    response.headers["Location"] = status_uniform_resource_locator
+    return response
+
+def getMediaIdentifier(search: str) -> Optional[str]:
+    """
+    Extracting the identifier of a media from its uniform resource locator, which is prefixed by `shorts/` for the shorts as the progress of its download is keyed by it.
+
+    Parameters:
+        search (string): The uniform resource locator of the media.
+
+    Returns:
+        Optional[string]
+    """
+    identifier: Optional[Match[str]] = match(r"(?:https?:\/\/)?(?:www\.)?(?:youtube\.com\/(?:watch\?v=|embed\/|v\/|shorts\/)|youtu\.be\/)([a-zA-Z0-9_-]{11})", search)
+    if identifier is None:
+        return None
+    return f"shorts/{identifier.group(1)}" if "/shorts/" in search else identifier.group(1)
+
+def formatDownloadJob(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Formatting the state of a download job along with the progress of its download while it is running.
+
+    Parameters:
+        job (Dict[str, Any]): The download job.
+
+    Returns:
+        Dict[string, Any]
+    """
+    result: Dict[str, Any] = job["result"] or {}
+    media_identifier: Optional[str] = getMediaIdentifier(str(job["search"]))
+    progress: Optional[Dict[str, Any]] = Download_Progress_Registry.getInstance().get(media_identifier) if job["status"] == "running" and media_identifier else None
+    is_progressing: bool = progress is not None and float(progress["updated_at"]) >= float(job["created_at"])
+    return {
+        "identifier": job["identifier"],
+        "status": job["status"],
+        "attempts": job["attempts"],
+        "phase": progress["phase"] if is_progressing else None, # type: ignore
+        "file": progress["file"] if is_progressing else None, # type: ignore
+        "downloaded_bytes": progress["downloaded_bytes"] if is_progressing else job["downloaded_bytes"], # type: ignore
+        "total_bytes": progress["total_bytes"] if is_progressing else job["total_bytes"], # type: ignore
+        "speed": progress["speed"] if is_progressing else None, # type: ignore
+        "eta": progress["eta"] if is_progressing else None, # type: ignore
+        "audio": result.get("audio"),
+        "video": result.get("video"),
+        "error": job["error"],
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"]
+    }
+
+def streamDownloadJob(identifier: str, interval: float = 0.5, keep_alive: float = 15.0, duration: float = 45.0) -> Iterator[str]:
+    """
+    Streaming the state of a download job as server-sent events until it is completed or failed.  A `progress` event is sent whenever the state changes and a `done` event is sent once the download job is over, while a comment is sent regularly so that the proxies keep the connection open.  The stream is closed after less than a minute so that it does not hold a worker of the application for the whole download, the client reconnecting to it after the `retry` delay.
+
+    Parameters:
+        identifier (string): The identifier of the download job.
+        interval (float): The amount of seconds between two reads of the state.
+        keep_alive (float): The amount of seconds after which a comment is sent if the state has not changed.
+        duration (float): The maximum amount of seconds of the stream.
+
+    Returns:
+        Iterator[string]
+    """
+    yield "retry: 2000\n\n"
+    last_state: Optional[Dict[str, Any]] = None
+    last_sent: float = monotonic()
+    deadline: float = monotonic() + duration
+    while monotonic() < deadline:
+        job: Optional[Dict[str, Any]] = Download_Job_Queue.getInstance().getJob(identifier)
+        if job is None:
+            yield f"event: error\ndata: {dumps({'error': 'The download job does not exist.'})}\n\n"
+            return
+        state: Dict[str, Any] = formatDownloadJob(job)
+        if state != last_state:
+            yield f"event: progress\ndata: {dumps(state)}\n\n"
+            last_state = state
+            last_sent = monotonic()
+        if job["status"] in ("completed", "failed"):
+            yield f"event: done\ndata: {dumps(state)}\n\n"
+            return
+        if monotonic() - last_sent >= keep_alive:
+            yield ": keep-alive\n\n"
+            last_sent = monotonic()
+        sleep(interval)
+
+@Media_Portal.route('/Download/<string:identifier>', methods=['GET'])
+@limiter.limit("60 per minute", error_message="Rate Limit Exceeded")
+def getDownloadJob(identifier: str) -> Response:
+    """
+    Retrieving the state of a download job.
+
+    Routes:
+        - GET /Download/<identifier>
+
+    Parameters:
+        identifier (string): The identifier of the download job.
+
+    Response Codes:
+        - 200: Successful response with the state, the progress and, once completed, the locations of the files.
+        - 400: Bad request due to invalid identifier format.
+        - 404: Not found if the download job does not exist.
+        - 429: Rate limit exceeded.
+
+    Returns:
+        Response
+    """
+    mime_type: str = "application/json"
+    if not fullmatch(r"^[a-f0-9]{32}$", identifier):
+        Routing_Logger.error(f"The identifier is invalid.\nIdentifier: {escape(identifier)}")
+        return Response(
+            response=dumps(
+                obj={
+                    "error": "The identifier is invalid."
+                },
+                indent=4
+            ),
+            status=400,
+            mimetype=mime_type
+        )
+    job: Optional[Dict[str, Any]] = Download_Job_Queue.getInstance().getJob(identifier)
+    if job is None:
+        return Response(
+            response=dumps(
+                obj={
+                    "error": "The download job does not exist."
+                },
+                indent=4
+            ),
+            status=404,
+            mimetype=mime_type
+        )
     return Response(
         response=dumps(
-            obj=model_response["data"],
+            obj=formatDownloadJob(job),
             indent=4
         ),
-        status=status,
+        status=200,
         mimetype=mime_type
     )
 
+@Media_Portal.route('/Download/<string:identifier>/Events', methods=['GET'])
+@limiter.limit("60 per hour", error_message="Rate Limit Exceeded")
+def getDownloadJobEvents(identifier: str) -> Response:
+    """
+    Streaming the progress of a download job as server-sent events.
+
+    Routes:
+        - GET /Download/<identifier>/Events
+
+    Parameters:
+        identifier (string): The identifier of the download job.
+
+    Response Codes:
+        - 200: Successful response with the stream of the state of the download job.
+        - 400: Bad request due to invalid identifier format.
+        - 404: Not found if the download job does not exist.
+        - 429: Rate limit exceeded.
+
+    Returns:
+        Response
+    """
+    if not fullmatch(r"^[a-f0-9]{32}$", identifier) or Download_Job_Queue.getInstance().getJob(identifier) is None:
+        Routing_Logger.error(f"The download job is invalid.\nIdentifier: {escape(identifier)}")
+        return Response(
+            response=dumps(
+                obj={
+                    "error": "The download job does not exist."
+                },
+                indent=4
+            ),
+            status=404 if fullmatch(r"^[a-f0-9]{32}$", identifier) else 400,
+            mimetype="application/json"
+        )
+    response: Response = Response(
+        response=stream_with_context(streamDownloadJob(identifier)),
+        status=200,
+        mimetype="text/event-stream"
+    )
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
 @Media_Portal.route('/RelatedContents/<string:identifier>', methods=["GET"])
 @limiter.limit("100 per day", error_message="Rate Limit Exceeded")
 def getRelatedContents(identifier: str) -> Response:
@@ -399,7 +603,7 @@ def getMediaShorts(identifier: str) -> Response:
     """
     Retrieving metadata for a specific media short by identifier.
 
-    This endpoint handles a GET request to fetch metadata associated with a media short.  It validates the identifier format and returns metadata from a corresponding JSON file if found.
+    This endpoint handles a GET request to fetch metadata associated with a media short.  It validates the identifier format and returns metadata from the metadata cache if found.
 
     URL Pattern:
         GET /Shorts/<identifier>
@@ -434,8 +638,7 @@ def getMediaShorts(identifier: str) -> Response:
             status=400,
             mimetype=mime_type
         )
-    file_name: str = f"shorts/{identifier}.json"
-    response: Dict[str, Union[int, Dict[str, Union[str, int, None]]]] = getMetaData(file_name)
+    response: Dict[str, Union[int, Dict[str, Union[str, int, None]]]] = getMetaData(f"shorts/{identifier}")
     return Response(
         response=dumps(
             obj=response["data"],
@@ -23,17 +23,6 @@ ENV: Environment = Environment()
 ENV File of the application
 """
 
-@Search_Portal.before_request
-def before_request() -> None:
-    """
-    Preparing the data before the request is made.
-
-    Returns:
-        void
-    """
-    SecurityManagementSystem.generateNonce()
-
-
 @Search_Portal.route('/<string:identifier>', methods=['GET'])
 def searchPage(identifier: str) -> Response:
     """
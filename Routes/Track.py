@@ -3,7 +3,11 @@ The module that has the routing for the analytics.
 """
 from flask import Blueprint, Response, request
 from Models.AnalyticalManagementSystem import AnalyticalManagementSystem, Dict, Union, Extractio_Logger
-from json import JSONDecodeError
+from Models.AnalyticsQueue import Analytics_Queue
+from Models.AnalyticsRollup import Analytics_Rollup
+from json import JSONDecodeError, dumps
+from time import time
+from typing import Any, List
 
 
 Track_Portal: Blueprint = Blueprint("Track", __name__)
@@ -20,14 +24,14 @@ The logger that will all the action of the application.
 @Track_Portal.route('/', methods=['POST'])
 def postEvent() -> Response:
     """
-    Handling an incoming HTTP POST request to process an event.
+    Handling an incoming HTTP POST request to track an event.
 
     This function:
     - Extracts JSON data from the request body.
-    - Logs an error and returns a `400 Bad Request` response if the payload is empty.
+    - Logs an error and returns a `400 Bad Request` response if the payload is empty or malformed.
     - Adds the client's IP address to the extracted data.
-    - Processes the event using an `AnalyticalManagementSystem` instance.
-    - Returns an HTTP response with the appropriate status.
+    - Validates the event and enqueues it into the analytics queue, which processes it in the background.
+    - Returns `202 Accepted` once the event is queued, or `503 Service Unavailable` if it is invalid or the queue is full.
 
     Returns:
         Response
@@ -40,8 +44,8 @@ def postEvent() -> Response:
         data: Dict[str, Union[str, float]] = request.get_json()
         isEmpty(data)
         data["ip_address"] = request.environ.get('REMOTE_ADDR', request.remote_addr)
-        system: AnalyticalManagementSystem = AnalyticalManagementSystem()
-        status: int = system.processEvent(data)
+        status: int = AnalyticalManagementSystem.validateEvent(data, Logger)
+        status = Analytics_Queue.getInstance().put(data) if status == AnalyticalManagementSystem.ok else status
         return Response(
             response=None,
             status=status,
@@ -55,6 +59,44 @@ def postEvent() -> Response:
             mimetype=mime_type
         )
 
+@Track_Portal.route('/Report', methods=['GET'])
+def getReport() -> Response:
+    """
+    Handling an incoming HTTP GET request to report the analytics from their rollups.
+
+    This function:
+    - Reads the granularity (`hour` or `day`, by default `day`), the period (`start` and `end` as UNIX times, by default the last seven days), the dimensions to group by (`group_by`, a comma-separated list among `event_type`, `page`, `device` and `country`), whether it is a timeline (`timeline`) and the maximum amount of rows (`limit`, at most 1000) from the query string.
+    - Returns the amount of events and the average loading time of each group as JSON.
+    - Returns a `400 Bad Request` response if the parameters are invalid.
+
+    Returns:
+        Response
+    """
+    mime_type: str = "application/json"
+    try:
+        now: int = int(time())
+        group_by: List[str] = [dimension for dimension in request.args.get("group_by", "").split(",") if dimension]
+        report: List[Dict[str, Any]] = Analytics_Rollup().getReport(
+            granularity=request.args.get("granularity", "day"),
+            start=int(request.args.get("start", now - 7 * 86400)),
+            end=int(request.args.get("end", now + 1)),
+            group_by=group_by,
+            is_timeline=request.args.get("timeline", "false").lower() == "true",
+            limit=max(1, min(1000, int(request.args.get("limit", 100))))
+        )
+        return Response(
+            response=dumps({"data": report}, indent=4),
+            status=200,
+            mimetype=mime_type
+        )
+    except ValueError as error:
+        Logger.error(f"The parameters of the report are invalid. - Error: {error}")
+        return Response(
+            response=None,
+            status=400,
+            mimetype=mime_type
+        )
+
 def isEmpty(data: Union[Dict[str, Union[str, float]], None]) -> None:
     """
     Checking if the provided data is empty and logs an error if so.
@@ -1,5 +1,7 @@
 from flask import Blueprint, Response
 from Models.Video import Video
+from Models.MediaStreamer import Media_Streamer
+from re import fullmatch
 
 
 Video_Portal: Blueprint = Blueprint("Video", __name__, "../Public/Video/")
@@ -11,7 +13,7 @@ The Routing for all the videos.
 @Video_Portal.route("/<string:name>", methods=['GET'])
 def serveVideo(name: str) -> Response:
     """
-    Sending the static file from the server.
+    Sending the video from the server, supporting the byte-range and conditional requests of the media players.
 
     Parameters:
         name: string: The name of the video
@@ -20,15 +22,17 @@ def serveVideo(name: str) -> Response:
         Response
     """
     ok: int = 200
+    if not fullmatch(r"^[a-zA-Z0-9\-_]+\.mp4$", name):
+        return Response({}, 400, mimetype="application/json")
     identifier: str = name.replace(".mp4", "")
     video_management_system: Video = Video(identifier)
     status: int = video_management_system.serveFile(False)
-    return Video_Portal.send_static_file(name) if status == ok else Response({}, status, mimetype="application/json")
+    return Media_Streamer.getInstance().serve(f"{video_management_system.getDirectory()}/{name}", "video/mp4") if status == ok else Response({}, status, mimetype="application/json")
 
 @Video_Portal.route("/Shorts/<string:name>", methods=['GET'])
 def serveShortsVideo(name: str) -> Response:
     """
-    Sending the static file from the server.
+    Sending the video from the server, supporting the byte-range and conditional requests of the media players.
 
     Parameters:
         name: string: The name of the video
@@ -37,7 +41,9 @@ def serveShortsVideo(name: str) -> Response:
         Response
     """
     ok: int = 200
+    if not fullmatch(r"^[a-zA-Z0-9\-_]+\.mp4$", name):
+        return Response({}, 400, mimetype="application/json")
     identifier: str = name.replace(".mp4", "")
     video_management_system: Video = Video(identifier)
     status: int = video_management_system.serveFile(True)
-    return Video_Portal.send_static_file(f"shorts/{name}") if status == ok else Response({}, status, mimetype="application/json")
+    return Media_Streamer.getInstance().serve(f"{video_management_system.getDirectory()}/shorts/{name}", "video/mp4") if status == ok else Response({}, status, mimetype="application/json")
@@ -11,7 +11,13 @@ from flask import Flask, render_template, Request, Response, send_from_directory
 from flask_compress import Compress
 from flask_cors import CORS
 from Models.SecurityManagementSystem import Security_Management_System, Database_Handler, Environment, Session
+from Models.SchemaRegistry import Schema_Registry
+from Models.SessionSweeper import Session_Sweeper
+from Models.DownloadJobQueue import Download_Job_Queue
+from Models.DimensionResolver import Dimension_Resolver
+from Models.EventTypesModel import Event_Types
 from re import match
+from os import getenv
 from os.path import join, exists, isfile, normpath, relpath, splitext
 from typing import List, Union
 from urllib.parse import ParseResult, urlparse
@@ -37,6 +43,26 @@ DatabaseHandler: Database_Handler = Database_Handler()
 The database handler that will communicate with the database
 server.
 """
+Schema_Registry.getInstance().warmUp(DatabaseHandler)
+"""
+Loading the structure of every table once so that the models
+do not have to query it on each instantiation.
+"""
+Dimension_Resolver.getInstance().prefetch(Event_Types(DatabaseHandler), ("name",))
+"""
+Caching the identifiers of the event types so that the
+analytics never have to query them.
+"""
+Session_Sweeper.getInstance().start()
+"""
+Archiving the expired sessions in the background so that the
+requests never have to deal with them.
+"""
+Download_Job_Queue.getInstance().start()
+"""
+Running the download jobs in the background, including the
+ones which have been queued before the application restarted.
+"""
 session: Session = Session.getTodaySession(DatabaseHandler)
 key: str = str(session.hash) # type: ignore
 """
@@ -70,6 +96,9 @@ Application.config["COMPRESS_LEVEL"] = 6
 Application.config["COMPRESS_MIN_SIZE"] = 500
 Application.config["COMPRESS_MIMETYPES"] = ["text/html", "text/css", "text/javascript", "application/json", "text/babel"]
 Application.config["MAX_CONTENT_LENGTH"] = 256 * 1024 * 1024
+Application.config["MEDIA_OFFLOAD"] = getenv("MEDIA_OFFLOAD", "none")
+Application.config["MEDIA_OFFLOAD_ROOT"] = getenv("MEDIA_OFFLOAD_ROOT", f"{ENV.getDirectory()}/Public")
+Application.config["MEDIA_OFFLOAD_PREFIX"] = getenv("MEDIA_OFFLOAD_PREFIX", "/Internal")
 Application.register_blueprint(Session_Portal, url_prefix="/Session")
 Application.register_blueprint(Search_Portal, url_prefix="/Search")
 Application.register_blueprint(Media_Portal, url_prefix="/Media")
@@ -82,16 +111,6 @@ CORS(Application, origins=ENV.getAllowedOrigins())
 limiter.init_app(Application)
 
 
-@Application.before_request
-def before_request() -> None:
-    """
-    Preparing the data before the request is made.
-
-    Returns:
-        void
-    """
-    SecurityManagementSystem.generateNonce()
-
 @Application.route('/', methods=['GET'])
 def homepage() -> Response:
     """
@@ -187,7 +187,7 @@ class Main extends Application {
     /**
      * Sending a POST request to the server to initiate the download of a media file.
      * 
-     * Constructs the YouTube media uniform resource locator based on the media type and sends it to the backend endpoint with metadata.  Returns a simplified object containing the HTTP status code and the uniform resource locator to which the user can be redirected to access the media.
+     * Constructs the YouTube media uniform resource locator based on the media type and sends it to the backend endpoint with metadata.  The backend queues a download job whose state is followed until it is completed or failed.  Returns a simplified object containing the HTTP status code and the uniform resource locator to which the user can be redirected to access the media.
      * @param {string} platform - The supported platform.
      * @param {string} type - The type of media.
      * @param {string} identifier - The unique media identifier.
@@ -213,9 +213,10 @@ class Main extends Application {
                 },
             });
             const data = await response.json();
-            const is_content_downloaded = Boolean(response.status == 201 && data.uniform_resource_locator);
+            const job = (response.status == 202 && data.uniform_resource_locator) ? await this.followDownloadJob(data.uniform_resource_locator) : null;
+            const is_content_downloaded = Boolean(job && job.status == "completed" && job.video);
             const uniform_resource_locator = (is_content_downloaded) ? ((type == "Shorts") ? `/Download/YouTube/Shorts/${identifier}` : `/Download/YouTube/${identifier}`) : window.location.href;
-            const status = (is_content_downloaded) ? response.status : 503;
+            const status = (is_content_downloaded) ? 201 : 503;
             return {
                 status: status,
                 uniform_resource_locator: uniform_resource_locator,
@@ -226,6 +227,64 @@ class Main extends Application {
         }
     }
 
+    /**
+     * Following the state of a download job until it is completed or failed.
+     * 
+     * The state is streamed through server-sent events when the browser supports them, each progress being dispatched as a `download_progress` event on the window.  Otherwise, or if the stream fails, the state is polled.
+     * @param {string} query - The uniform resource locator of the state of the download job.
+     * @returns {Promise<{identifier: string, status: string, phase: ?string, downloaded_bytes: number, total_bytes: ?number, speed: ?number, eta: ?number, audio: ?string, video: ?string, error: ?string}>} A promise that resolves with the final state of the download job.
+     * @throws {Error} Throws an error if the state of the download job cannot be retrieved.
+     */
+    async followDownloadJob(query) {
+        if (!window.EventSource) {
+            return this.pollDownloadJob(query);
+        }
+        try {
+            return await new Promise((resolve, reject) => {
+                const events = new EventSource(`${query}/Events`);
+                events.addEventListener("progress", (event) => window.dispatchEvent(new CustomEvent("download_progress", {detail: JSON.parse(event.data)})));
+                events.addEventListener("done", (event) => {
+                    events.close();
+                    resolve(JSON.parse(event.data));
+                });
+                events.addEventListener("error", (event) => {
+                    if (event.data || events.readyState == EventSource.CLOSED) {
+                        events.close();
+                        reject(new Error("The stream of the download job has failed."));
+                    }
+                });
+            });
+        } catch (error) {
+            console.error(`The progress of the download cannot be streamed.\nError: ${error.message}`);
+            return this.pollDownloadJob(query);
+        }
+    }
+
+    /**
+     * Polling the state of a download job until it is completed or failed.
+     * @param {string} query - The uniform resource locator of the state of the download job.
+     * @param {number} interval - The delay (in milliseconds) between two polls.
+     * @returns {Promise<{identifier: string, status: string, downloaded_bytes: number, total_bytes: ?number, audio: ?string, video: ?string, error: ?string}>} A promise that resolves with the final state of the download job.
+     * @throws {Error} Throws an error if the state of the download job cannot be retrieved.
+     */
+    async pollDownloadJob(query, interval = 2000) {
+        while (true) {
+            const response = await fetch(query);
+            if (response.status == 429) {
+                await new Promise((resolve) => setTimeout(resolve, interval * 5));
+                continue;
+            }
+            if (response.status != 200) {
+                throw new Error(`The state of the download job cannot be retrieved.\nStatus: ${response.status}`);
+            }
+            const job = await response.json();
+            if (job.status == "completed" || job.status == "failed") {
+                return job;
+            }
+            await new Promise((resolve) => setTimeout(resolve, interval));
+        }
+    }
+
     /**
      * Retrieving related content metadata from `localStorage`.
      * 
@@ -0,0 +1,11 @@
+"""
+The configuration of the tests, which makes the modules of the application importable from the tests.
+
+Author:
+    Darkness4869
+"""
+from sys import path
+from os.path import abspath, dirname, join
+
+
+path.insert(0, abspath(join(dirname(__file__), "../")))
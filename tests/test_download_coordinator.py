@@ -0,0 +1,72 @@
+"""
+The tests of the coordinator of the downloads, the requesters of different processes being simulated by coordinators sharing the same directory of lease files.
+
+Author:
+    Darkness4869
+"""
+from Models.DownloadCoordinator import Download_Coordinator
+from threading import Event, Thread
+from os import listdir
+from os.path import isfile
+from typing import List
+from pytest import raises
+
+
+def test_concurrent_downloads_of_the_same_media_file_are_done_once(tmp_path) -> None:
+    lease_directory: str = str(tmp_path / "Leases")
+    file_path: str = str(tmp_path / "aaaaaaaaaaa.mp4")
+    coordinators: List[Download_Coordinator] = [Download_Coordinator(lease_directory, timeout=10.0, poll_interval=0.01) for _ in range(2)]
+    is_started: Event = Event()
+    leases: List[bool] = []
+    downloads: List[str] = []
+
+    def download(partial_file_path: str) -> None:
+        is_started.set()
+        leases.append(coordinators[1].isLeased(file_path))
+        downloads.append(partial_file_path)
+        with open(partial_file_path, "w") as file:
+            file.write("media")
+
+    first_thread: Thread = Thread(target=coordinators[0].download, args=(file_path, download))
+    first_thread.start()
+    is_started.wait(5.0)
+    second_thread: Thread = Thread(target=coordinators[1].download, args=(file_path, download))
+    second_thread.start()
+    first_thread.join()
+    second_thread.join()
+    assert len(downloads) == 1
+    assert leases == [True]
+    assert isfile(file_path)
+    assert coordinators[0].getStatistics()["downloads"] + coordinators[1].getStatistics()["downloads"] == 1
+    assert coordinators[0].getStatistics()["attachments"] + coordinators[1].getStatistics()["attachments"] == 1
+    assert listdir(lease_directory) == []
+    assert not coordinators[0].isLeased(file_path)
+
+
+def test_a_failed_download_is_done_again_by_the_next_requester(tmp_path) -> None:
+    coordinator: Download_Coordinator = Download_Coordinator(str(tmp_path / "Leases"), timeout=10.0, poll_interval=0.01)
+    file_path: str = str(tmp_path / "aaaaaaaaaaa.mp3")
+
+    def fail(partial_file_path: str) -> None:
+        with open(partial_file_path, "w") as file:
+            file.write("partial")
+        raise RuntimeError("The download has failed.")
+
+    def download(partial_file_path: str) -> None:
+        with open(partial_file_path, "w") as file:
+            file.write("media")
+
+    with raises(RuntimeError):
+        coordinator.download(file_path, fail)
+    assert not isfile(file_path)
+    assert coordinator.download(file_path, download) == file_path
+    with open(file_path) as file:
+        assert file.read() == "media"
+    assert not isfile(coordinator.getPartialFilePath(file_path))
+
+
+def test_is_leased_does_not_create_the_lease_file(tmp_path) -> None:
+    lease_directory: str = str(tmp_path / "Leases")
+    coordinator: Download_Coordinator = Download_Coordinator(lease_directory)
+    assert not coordinator.isLeased(str(tmp_path / "aaaaaaaaaaa.mp4"))
+    assert listdir(lease_directory) == []
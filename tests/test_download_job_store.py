@@ -0,0 +1,113 @@
+"""
+The tests of the persistent store of the download jobs, which run against a temporary SQLite database.
+
+Author:
+    Darkness4869
+"""
+from Models.DownloadJobStore import Download_Job_Store
+from typing import Any, Dict, Optional, Union
+from time import sleep
+from pytest import fixture
+
+
+@fixture
+def store(tmp_path) -> Download_Job_Store:
+    """
+    Creating a store of the download jobs in a temporary directory.
+
+    Returns:
+        Download_Job_Store
+    """
+    return Download_Job_Store(str(tmp_path / "DownloadJobs.sqlite3"))
+
+
+def buildRequest(search: str) -> Dict[str, Union[str, None]]:
+    """
+    Building the request of a download.
+
+    Parameters:
+        search (str): The uniform resource locator of the media.
+
+    Returns:
+        Dict[str, Union[str, None]]
+    """
+    return {
+        "referer": None,
+        "search": search,
+        "platform": "youtube",
+        "ip_address": "127.0.0.1",
+        "port": "5000"
+    }
+
+
+def test_enqueue_returns_the_job_already_queued_for_the_same_media(store: Download_Job_Store) -> None:
+    first_job: Dict[str, Any] = store.enqueue(buildRequest("https://www.youtube.com/watch?v=aaaaaaaaaaa"), "www.youtube.com")
+    second_job: Dict[str, Any] = store.enqueue(buildRequest("https://www.youtube.com/watch?v=aaaaaaaaaaa"), "www.youtube.com")
+    assert first_job["identifier"] == second_job["identifier"]
+    assert first_job["status"] == "queued"
+
+
+def test_claim_takes_the_oldest_queued_job(store: Download_Job_Store) -> None:
+    first_job: Dict[str, Any] = store.enqueue(buildRequest("https://www.youtube.com/watch?v=aaaaaaaaaaa"), "www.youtube.com")
+    store.enqueue(buildRequest("https://www.youtube.com/watch?v=bbbbbbbbbbb"), "www.youtube.com")
+    job: Optional[Dict[str, Any]] = store.claim("owner", 60.0, 10, 10, 3)
+    assert job is not None
+    assert job["identifier"] == first_job["identifier"]
+    assert job["status"] == "running"
+    assert job["owner"] == "owner"
+    assert job["attempts"] == 1
+
+
+def test_claim_enforces_the_maximum_amount_of_running_jobs(store: Download_Job_Store) -> None:
+    for index in range(3):
+        store.enqueue(buildRequest(f"https://www.youtube.com/watch?v={index}aaaaaaaaaa"), f"host-{index}")
+    assert store.claim("owner", 60.0, 2, 10, 3) is not None
+    assert store.claim("owner", 60.0, 2, 10, 3) is not None
+    assert store.claim("owner", 60.0, 2, 10, 3) is None
+
+
+def test_claim_enforces_the_maximum_amount_of_running_jobs_per_host(store: Download_Job_Store) -> None:
+    store.enqueue(buildRequest("https://www.youtube.com/watch?v=aaaaaaaaaaa"), "www.youtube.com")
+    store.enqueue(buildRequest("https://www.youtube.com/watch?v=bbbbbbbbbbb"), "www.youtube.com")
+    other_job: Dict[str, Any] = store.enqueue(buildRequest("https://vimeo.com/1"), "vimeo.com")
+    assert store.claim("owner", 60.0, 10, 1, 3) is not None
+    job: Optional[Dict[str, Any]] = store.claim("owner", 60.0, 10, 1, 3)
+    assert job is not None
+    assert job["identifier"] == other_job["identifier"]
+    assert store.claim("owner", 60.0, 10, 1, 3) is None
+
+
+def test_claim_queues_again_a_job_whose_lease_has_expired(store: Download_Job_Store) -> None:
+    queued_job: Dict[str, Any] = store.enqueue(buildRequest("https://www.youtube.com/watch?v=aaaaaaaaaaa"), "www.youtube.com")
+    assert store.claim("dead-owner", 0.01, 10, 10, 3) is not None
+    sleep(0.05)
+    job: Optional[Dict[str, Any]] = store.claim("owner", 60.0, 10, 10, 3)
+    assert job is not None
+    assert job["identifier"] == queued_job["identifier"]
+    assert job["owner"] == "owner"
+    assert job["attempts"] == 2
+    assert not store.complete(queued_job["identifier"], "dead-owner", {}, 0)
+
+
+def test_claim_fails_a_job_whose_lease_has_expired_once_it_has_run_out_of_attempts(store: Download_Job_Store) -> None:
+    queued_job: Dict[str, Any] = store.enqueue(buildRequest("https://www.youtube.com/watch?v=aaaaaaaaaaa"), "www.youtube.com")
+    assert store.claim("dead-owner", 0.01, 10, 10, 1) is not None
+    sleep(0.05)
+    assert store.claim("owner", 60.0, 10, 10, 1) is None
+    job: Optional[Dict[str, Any]] = store.get(queued_job["identifier"])
+    assert job is not None
+    assert job["status"] == "failed"
+
+
+def test_renew_extends_the_lease_of_the_running_jobs_of_the_owner(store: Download_Job_Store) -> None:
+    store.enqueue(buildRequest("https://www.youtube.com/watch?v=aaaaaaaaaaa"), "www.youtube.com")
+    job: Optional[Dict[str, Any]] = store.claim("owner", 0.01, 10, 10, 3)
+    assert job is not None
+    store.renew([job["identifier"]], "owner", 60.0)
+    sleep(0.05)
+    assert store.claim("other-owner", 60.0, 10, 10, 3) is None
+    assert store.complete(job["identifier"], "owner", {"title": "Title"}, 10)
+    completed_job: Optional[Dict[str, Any]] = store.get(job["identifier"])
+    assert completed_job is not None
+    assert completed_job["status"] == "completed"
+    assert completed_job["result"] == {"title": "Title"}